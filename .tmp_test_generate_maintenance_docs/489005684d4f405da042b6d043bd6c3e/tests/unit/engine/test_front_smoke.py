@@ -0,0 +1,2 @@
+def test_front_prefix():
+    assert True
@@ -0,0 +1,2 @@
+def test_routing_exact():
+    assert True
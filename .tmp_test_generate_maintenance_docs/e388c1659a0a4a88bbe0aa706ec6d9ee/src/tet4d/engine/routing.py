@@ -0,0 +1,8 @@
+def route_event(board, piece, *, strict=False):
+    return board, piece, strict
+
+
+class Router:
+    def __init__(self, board, *, strict=False):
+        self.board = board
+        self.strict = strict
@@ -0,0 +1,2 @@
+def main(argv=None):
+    return argv
@@ -88,12 +88,13 @@ if [[ -d "$TOOLS_BENCHMARKS_DIR" ]]; then
   benchmark_ui_lines="$(collect_matches '^\s*(import|from)\s+tet4d\.ui(\.|(\s|$))' "$TOOLS_BENCHMARKS_DIR")"
   if [[ -n "$benchmark_ui_lines" ]]; then
     benchmark_ui_disallowed="$(printf '%s\n' "$benchmark_ui_lines" | grep -Ev \
-      '^tools/benchmarks/profile_4d_render\.py:[0-9]+:\s*(import|from)\s+tet4d\.ui\.pygame(\.|(\s|$))' \
+      -e '^tools/benchmarks/profile_4d_render\.py:[0-9]+:\s*(import|from)\s+tet4d\.ui\.pygame(\.|(\s|$))' \
+      -e '^tools/benchmarks/bench_explosion_collisions\.py:[0-9]+:\s*(import|from)\s+tet4d\.ui\.pygame\.locked_cell_explosion(\.|(\s|$))' \
       || true)"
     if [[ -n "$benchmark_ui_disallowed" ]]; then
       echo "Architecture violation: benchmark tools import unsupported UI modules." >&2
       printf '%s\n' "$benchmark_ui_disallowed" >&2
-      fail "Architecture violation: tools/benchmarks may only use tet4d.ui.pygame for renderer profiling."
+      fail "Architecture violation: tools/benchmarks may only use tet4d.ui.pygame for renderer profiling and the explosion collision bench."
     fi
   fi
 fi
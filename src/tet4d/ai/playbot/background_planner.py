@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import copy
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Generic, TypeVar
+
+from tet4d.engine.core.model import BoardND
+
+PlanT = TypeVar("PlanT")
+StateT = TypeVar("StateT")
+
+
+def planning_snapshot(state: StateT) -> StateT:
+    """Copy of ``state`` the planner thread can read while the frame loop moves on."""
+    snapshot = copy.copy(state)
+    board = state.board
+    snapshot.board = BoardND(board.dims, cells=board.cells, storage=board.storage)
+    snapshot.next_bag = list(state.next_bag)
+    return snapshot
+
+
+class BackgroundPlanService(Generic[PlanT]):
+    """
+    Single planner thread fed with state snapshots.
+    Each request is keyed by the piece token it was made for; ``poll`` only
+    hands back a plan for the token it is asked about, so a plan that finishes
+    after its piece locked is dropped instead of steering the next piece.
+    """
+
+    def __init__(self) -> None:
+        self._executor: ThreadPoolExecutor | None = None
+        self._future: Future[PlanT] | None = None
+        self._token: object = None
+
+    def submit(
+        self,
+        token: object,
+        fn: Callable[..., PlanT],
+        /,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        self.cancel()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="playbot-planner"
+            )
+        self._token = token
+        self._future = self._executor.submit(fn, *args, **kwargs)
+
+    def pending(self, token: object) -> bool:
+        return self._future is not None and self._token == token
+
+    def poll(self, token: object) -> tuple[bool, PlanT | None]:
+        future = self._future
+        if future is None or self._token != token or not future.done():
+            return False, None
+        self._future = None
+        self._token = None
+        return True, future.result()
+
+    def cancel(self) -> None:
+        # A plan already running finishes on the worker; its result is dropped.
+        if self._future is not None:
+            self._future.cancel()
+        self._future = None
+        self._token = None
+
+    def shutdown(self) -> None:
+        self.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from collections import deque
-from collections.abc import Iterable
 from dataclasses import dataclass, field
 
-from tet4d.ai.playbot.planner_2d import plan_best_2d_move
-from tet4d.ai.playbot.planner_nd import plan_best_nd_move
+from tet4d.ai.playbot.background_planner import (
+    BackgroundPlanService,
+    planning_snapshot,
+)
+from tet4d.ai.playbot.planner_2d import BotPlan2D, plan_best_2d_move
+from tet4d.ai.playbot.planner_nd import BotPlanND, plan_best_nd_move
 from tet4d.ai.playbot.types import (
     BOT_MODE_OPTIONS,
     BotMode,
@@ -21,20 +23,17 @@ from tet4d.ai.playbot.types import (
     playbot_learning_mode_enabled,
     playbot_learning_review_pieces,
 )
-from tet4d.engine.core.piece_transform import (
-    canonicalize_blocks_nd,
-    rotate_blocks_nd,
-    rotation_planes_nd,
-)
+from tet4d.engine.core.orientation_table import RotationStep, orientation_table
+from tet4d.engine.core.piece_transform import canonicalize_blocks_nd
 from tet4d.engine.gameplay.game2d import GameState
 from tet4d.engine.gameplay.game_nd import GameStateND
 from tet4d.engine.gameplay.pieces_nd import ActivePieceND
 from tet4d.engine.runtime.runtime_config import (
+    playbot_background_planning_enabled,
     playbot_default_hard_drop_after_soft_drops,
 )
 
 _canonical_blocks = canonicalize_blocks_nd
-rotation_planes = rotation_planes_nd
 
 
 def _next_mode(mode: BotMode) -> BotMode:
@@ -67,7 +66,6 @@ def _profile_shift(
     return _PROFILE_PROGRESS[max(0, index - 1)]
 
 
-RotationStep = tuple[int, int, int]
 RelBlocks = tuple[tuple[int, ...], ...]
 
 
@@ -78,66 +76,9 @@ def _rotation_sequence_nd(
     ndim: int,
     gravity_axis: int,
 ) -> list[RotationStep]:
-    if start_blocks == target_blocks:
-        return []
-
-    planes = rotation_planes(ndim, gravity_axis)
-    max_depth = 8 if ndim == 3 else 7
-    max_states = 240
-
-    queue: deque[tuple[RelBlocks, int]] = deque([(start_blocks, 0)])
-    parent: dict[RelBlocks, tuple[RelBlocks, RotationStep] | None] = {
-        start_blocks: None
-    }
-
-    while queue and len(parent) < max_states:
-        blocks, depth = queue.popleft()
-        if depth >= max_depth:
-            continue
-
-        for rotated, step in _rotation_neighbors(blocks, planes):
-            if rotated in parent:
-                continue
-            parent[rotated] = (blocks, step)
-            if rotated == target_blocks:
-                return _trace_rotation_path(parent, rotated)
-            queue.append((rotated, depth + 1))
-            if len(parent) >= max_states:
-                break
-    return []
-
-
-def _rotation_neighbors(
-    blocks: RelBlocks,
-    planes: tuple[tuple[int, int], ...],
-) -> Iterable[tuple[RelBlocks, RotationStep]]:
-    for axis_a, axis_b in planes:
-        for delta in (1, -1):
-            rotated = _canonical_blocks(
-                rotate_blocks_nd(
-                    blocks,
-                    axis_a=axis_a,
-                    axis_b=axis_b,
-                    quarter_turns=delta,
-                )
-            )
-            yield rotated, (axis_a, axis_b, delta)
-
-
-def _trace_rotation_path(
-    parent: dict[RelBlocks, tuple[RelBlocks, RotationStep] | None],
-    target: RelBlocks,
-) -> list[RotationStep]:
-    path: list[RotationStep] = []
-    curr = target
-    while True:
-        prev = parent[curr]
-        if prev is None:
-            break
-        curr, step = prev
-        path.append(step)
-    path.reverse()
-    return path
+    return orientation_table(ndim, gravity_axis).rotation_path(
+        start_blocks, target_blocks
+    )
 
 
 @dataclass
@@ -151,6 +92,9 @@ class PlayBotController:
     hard_drop_after_soft_drops: int = field(
         default_factory=playbot_default_hard_drop_after_soft_drops
     )
+    background_planning: bool = field(
+        default_factory=playbot_background_planning_enabled
+    )
     _accumulator_ms: int = 0
     _step_requested: bool = False
     _piece_token: tuple[object, ...] | None = None
@@ -167,6 +111,9 @@ class PlayBotController:
     _learn_window_pieces: int = 0
     _learn_window_clears: int = 0
     _learn_last_lines_cleared: int | None = None
+    _planner_service: BackgroundPlanService = field(
+        default_factory=BackgroundPlanService, repr=False, compare=False
+    )
 
     @property
     def user_gameplay_enabled(self) -> bool:
@@ -217,6 +164,7 @@ class PlayBotController:
         self._accumulator_ms = 0
         self._step_requested = False
         self._piece_token = None
+        self._planner_service.cancel()
         self._assist_preview_cells = ()
         self._target_rot_2d = None
         self._target_x_2d = None
@@ -229,6 +177,14 @@ class PlayBotController:
         self._learn_window_clears = 0
         self._learn_last_lines_cleared = None
 
+    def shutdown(self) -> None:
+        """Stop the background planner thread (the controller stays usable)."""
+        self._planner_service.shutdown()
+
+    @property
+    def plan_pending(self) -> bool:
+        return self._planner_service.pending(self._piece_token)
+
     def request_step(self) -> None:
         self._step_requested = True
 
@@ -344,10 +300,17 @@ class PlayBotController:
         gravity_axis = state.config.gravity_axis
         return all(coord[gravity_axis] >= 0 for coord in piece.cells())
 
-    def _update_assist_2d(self, state: GameState) -> None:
+    def _plan_kwargs(self) -> dict[str, object]:
+        return {
+            "profile": self.planner_profile,
+            "budget_ms": self.planning_budget_ms,
+            "algorithm": self.planner_algorithm,
+        }
+
+    def _enter_piece_2d(self, state: GameState) -> bool:
         token = self._piece_token_2d(state)
         if token == self._piece_token:
-            return
+            return False
         self._learn_on_piece_transition(
             lines_cleared=state.lines_cleared,
             ndim=2,
@@ -355,17 +318,43 @@ class PlayBotController:
         )
         self._soft_drop_count_2d = 0
         self._piece_token = token
-        plan = plan_best_2d_move(
-            state,
-            profile=self.planner_profile,
-            budget_ms=self.planning_budget_ms,
-            algorithm=self.planner_algorithm,
-        )
+        return True
+
+    def _update_assist_2d(self, state: GameState) -> None:
+        if not self._enter_piece_2d(state):
+            return
+        self._planner_service.cancel()
+        self._apply_plan_2d(plan_best_2d_move(state, **self._plan_kwargs()))
+
+    def _update_assist_background_2d(self, state: GameState) -> None:
+        # Plan on a snapshot off-frame; apply the result on a later tick.
+        if self._enter_piece_2d(state):
+            self._clear_plan_2d()
+            self._planner_service.submit(
+                self._piece_token,
+                plan_best_2d_move,
+                planning_snapshot(state),
+                **self._plan_kwargs(),
+            )
+        ready, plan = self._planner_service.poll(self._piece_token)
+        if ready:
+            self._apply_plan_2d(plan)
+
+    def _refresh_plan_2d(self, state: GameState, *, background: bool) -> None:
+        if background:
+            self._update_assist_background_2d(state)
+        else:
+            self._update_assist_2d(state)
+
+    def _clear_plan_2d(self) -> None:
+        self._assist_preview_cells = ()
+        self._target_rot_2d = None
+        self._target_x_2d = None
+
+    def _apply_plan_2d(self, plan: BotPlan2D | None) -> None:
         if plan is None:
             self.last_error = "no valid plan"
-            self._assist_preview_cells = ()
-            self._target_rot_2d = None
-            self._target_x_2d = None
+            self._clear_plan_2d()
             return
         self.last_stats = plan.stats
         self.last_error = ""
@@ -375,10 +364,10 @@ class PlayBotController:
             tuple(cell) for cell in plan.final_piece.cells()
         )
 
-    def _update_assist_nd(self, state: GameStateND) -> None:
+    def _enter_piece_nd(self, state: GameStateND) -> bool:
         token = self._piece_token_nd(state)
         if token == self._piece_token:
-            return
+            return False
         self._learn_on_piece_transition(
             lines_cleared=state.lines_cleared,
             ndim=state.config.ndim,
@@ -386,18 +375,43 @@ class PlayBotController:
         )
         self._soft_drop_count_nd = 0
         self._piece_token = token
-        plan = plan_best_nd_move(
-            state,
-            profile=self.planner_profile,
-            budget_ms=self.planning_budget_ms,
-            algorithm=self.planner_algorithm,
-        )
+        return True
+
+    def _update_assist_nd(self, state: GameStateND) -> None:
+        if not self._enter_piece_nd(state):
+            return
+        self._planner_service.cancel()
+        self._apply_plan_nd(state, plan_best_nd_move(state, **self._plan_kwargs()))
+
+    def _update_assist_background_nd(self, state: GameStateND) -> None:
+        if self._enter_piece_nd(state):
+            self._clear_plan_nd()
+            self._planner_service.submit(
+                self._piece_token,
+                plan_best_nd_move,
+                planning_snapshot(state),
+                **self._plan_kwargs(),
+            )
+        ready, plan = self._planner_service.poll(self._piece_token)
+        if ready:
+            self._apply_plan_nd(state, plan)
+
+    def _refresh_plan_nd(self, state: GameStateND, *, background: bool) -> None:
+        if background:
+            self._update_assist_background_nd(state)
+        else:
+            self._update_assist_nd(state)
+
+    def _clear_plan_nd(self) -> None:
+        self._assist_preview_cells = ()
+        self._target_blocks_nd = None
+        self._target_lateral_nd = ()
+        self._rotation_plan_nd = []
+
+    def _apply_plan_nd(self, state: GameStateND, plan: BotPlanND | None) -> None:
         if plan is None:
             self.last_error = "no valid plan"
-            self._assist_preview_cells = ()
-            self._target_blocks_nd = None
-            self._target_lateral_nd = ()
-            self._rotation_plan_nd = []
+            self._clear_plan_nd()
             return
 
         gravity_axis = state.config.gravity_axis
@@ -437,7 +451,8 @@ class PlayBotController:
             self._soft_drop_count_2d = 0
             return True
         before_pos = piece.pos
-        state.try_soft_drop()
+        if state.landing_distance() != 0:
+            state.try_soft_drop()
         moved_piece = state.current_piece
         if moved_piece is not None and moved_piece.pos != before_pos:
             if allow_hard_drop:
@@ -452,14 +467,16 @@ class PlayBotController:
         self._soft_drop_count_2d = 0
         return True
 
-    def _step_piece_2d(self, state: GameState) -> bool:
+    def _step_piece_2d(self, state: GameState, *, background: bool = False) -> bool:
         if state.current_piece is None or state.game_over:
             return False
 
         if not self._piece_fully_visible_2d(state):
             return self._soft_drop_or_lock_2d(state, allow_hard_drop=False)
 
-        self._update_assist_2d(state)
+        self._refresh_plan_2d(state, background=background)
+        if self.plan_pending:
+            return False
         piece = state.current_piece
         if piece is None:
             return False
@@ -468,26 +485,8 @@ class PlayBotController:
             self._target_rot_2d if self._target_rot_2d is not None else piece.rotation
         )
         if piece.rotation != target_rot:
-            diff = (target_rot - piece.rotation) % 4
-            primary = 1 if diff in (1, 2) else -1
-            before = piece.rotation
-            state.try_rotate(primary)
-            if (
-                state.current_piece is not None
-                and state.current_piece.rotation != before
-            ):
+            if self._apply_rotation_step_2d(state, piece.rotation, target_rot):
                 return True
-            if diff == 2:
-                piece_after = state.current_piece
-                before_retry = (
-                    piece_after.rotation if piece_after is not None else before
-                )
-                state.try_rotate(-primary)
-                if (
-                    state.current_piece is not None
-                    and state.current_piece.rotation != before_retry
-                ):
-                    return True
             return self._soft_drop_or_lock_2d(state, allow_hard_drop=False)
 
         target_x = self._target_x_2d if self._target_x_2d is not None else piece.pos[0]
@@ -504,6 +503,27 @@ class PlayBotController:
 
         return self._soft_drop_or_lock_2d(state, allow_hard_drop=True)
 
+    @staticmethod
+    def _apply_rotation_step_2d(
+        state: GameState, current_rot: int, target_rot: int
+    ) -> bool:
+        diff = (target_rot - current_rot) % 4
+        primary = 1 if diff in (1, 2) else -1
+        before = current_rot
+        state.try_rotate(primary)
+        if state.current_piece is not None and state.current_piece.rotation != before:
+            return True
+        if diff == 2:
+            piece_after = state.current_piece
+            before_retry = piece_after.rotation if piece_after is not None else before
+            state.try_rotate(-primary)
+            if (
+                state.current_piece is not None
+                and state.current_piece.rotation != before_retry
+            ):
+                return True
+        return False
+
     def _soft_drop_or_lock_nd(
         self, state: GameStateND, *, allow_hard_drop: bool
     ) -> bool:
@@ -513,7 +533,8 @@ class PlayBotController:
             self._piece_token = None
             self._soft_drop_count_nd = 0
             return True
-        if state.try_soft_drop():
+        # A piece already at rest locks without probing a failing soft drop.
+        if state.landing_distance() != 0 and state.try_soft_drop():
             if allow_hard_drop:
                 self._soft_drop_count_nd += 1
             else:
@@ -526,14 +547,16 @@ class PlayBotController:
         self._soft_drop_count_nd = 0
         return True
 
-    def _step_piece_nd(self, state: GameStateND) -> bool:
+    def _step_piece_nd(self, state: GameStateND, *, background: bool = False) -> bool:
         if state.current_piece is None or state.game_over:
             return False
 
         if not self._piece_fully_visible_nd(state):
             return self._soft_drop_or_lock_nd(state, allow_hard_drop=False)
 
-        self._update_assist_nd(state)
+        self._refresh_plan_nd(state, background=background)
+        if self.plan_pending:
+            return False
         piece = state.current_piece
         if piece is None:
             return False
@@ -636,8 +659,9 @@ class PlayBotController:
     def tick_2d(self, state: GameState, dt_ms: int) -> None:
         if self.mode == BotMode.OFF:
             return
+        background = self.background_planning
         if self.mode == BotMode.ASSIST:
-            self._update_assist_2d(state)
+            self._refresh_plan_2d(state, background=background)
             return
         if self.mode == BotMode.STEP:
             if not self._step_requested:
@@ -646,13 +670,14 @@ class PlayBotController:
             self._step_piece_2d(state)
             return
         if self._should_auto_step(dt_ms):
-            self._step_piece_2d(state)
+            self._step_piece_2d(state, background=background)
 
     def tick_nd(self, state: GameStateND, dt_ms: int) -> None:
         if self.mode == BotMode.OFF:
             return
+        background = self.background_planning
         if self.mode == BotMode.ASSIST:
-            self._update_assist_nd(state)
+            self._refresh_plan_nd(state, background=background)
             return
         if self.mode == BotMode.STEP:
             if not self._step_requested:
@@ -661,4 +686,4 @@ class PlayBotController:
             self._step_piece_nd(state)
             return
         if self._should_auto_step(dt_ms):
-            self._step_piece_nd(state)
+            self._step_piece_nd(state, background=background)
@@ -8,7 +8,6 @@ from tet4d.ai.playbot.types import (
     DryRunReport,
     default_planning_budget_ms,
 )
-from tet4d.engine.core.model import BoardND
 from tet4d.engine.core.rng import coerce_random
 from tet4d.engine.gameplay.challenge_mode import (
     apply_challenge_prefill_2d,
@@ -83,9 +82,7 @@ def _run_dry_run_nd_once(
     budget: int,
     algorithm: BotPlannerAlgorithm,
 ) -> DryRunReport:
-    state = GameStateND(
-        config=cfg, board=BoardND(cfg.dims), rng=coerce_random(seed=seed)
-    )
+    state = GameStateND(config=cfg, board=cfg.new_board(), rng=coerce_random(seed=seed))
     apply_challenge_prefill_nd(state, layers=cfg.challenge_layers)
     clears_observed = 0
     pieces_dropped = 0
@@ -140,9 +137,7 @@ def run_dry_run_2d(
     planning_budget_ms: int | None = None,
     planner_algorithm: BotPlannerAlgorithm = BotPlannerAlgorithm.AUTO,
 ) -> DryRunReport:
-    state = GameState(
-        config=cfg, board=BoardND((cfg.width, cfg.height)), rng=coerce_random(seed=seed)
-    )
+    state = GameState(config=cfg, board=cfg.new_board(), rng=coerce_random(seed=seed))
     apply_challenge_prefill_2d(state, layers=cfg.challenge_layers)
     clears_observed = 0
     pieces_dropped = 0
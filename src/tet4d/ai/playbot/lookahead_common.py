@@ -1,33 +1,36 @@
 from __future__ import annotations
 
 import time
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterable, Sequence
 from typing import TypeVar
 
 CandidateT = TypeVar("CandidateT")
 
 
-def choose_best_with_followup(
-    *,
+def _rank_candidates(
     candidates: Sequence[CandidateT],
+    *,
+    score_of: Callable[[CandidateT], float],
+    cleared_of: Callable[[CandidateT], int],
+) -> list[CandidateT]:
+    return sorted(
+        candidates, key=lambda item: (score_of(item), cleared_of(item)), reverse=True
+    )
+
+
+def _pick_best_combined(
+    scored: Iterable[tuple[CandidateT, float]],
+    *,
     base_candidate: CandidateT,
     score_of: Callable[[CandidateT], float],
     cleared_of: Callable[[CandidateT], int],
-    followup_score_of: Callable[[CandidateT], float],
-    deadline_s: float,
     followup_weight: float,
 ) -> tuple[CandidateT, float]:
-    ranked = sorted(
-        candidates, key=lambda item: (score_of(item), cleared_of(item)), reverse=True
-    )
     final_candidate = base_candidate
     best_combined = float("-inf")
     evaluated = False
 
-    for candidate in ranked:
-        if time.perf_counter() >= deadline_s:
-            break
-        followup_score = followup_score_of(candidate)
+    for candidate, followup_score in scored:
         combined = score_of(candidate) + followup_weight * followup_score
         evaluated = True
         if combined > best_combined or (
@@ -40,3 +43,59 @@ def choose_best_with_followup(
     if not evaluated:
         return base_candidate, score_of(base_candidate)
     return final_candidate, best_combined
+
+
+def choose_best_with_followup(
+    *,
+    candidates: Sequence[CandidateT],
+    base_candidate: CandidateT,
+    score_of: Callable[[CandidateT], float],
+    cleared_of: Callable[[CandidateT], int],
+    followup_score_of: Callable[[CandidateT], float],
+    deadline_s: float,
+    followup_weight: float,
+) -> tuple[CandidateT, float]:
+    ranked = _rank_candidates(candidates, score_of=score_of, cleared_of=cleared_of)
+
+    def _scored() -> Iterable[tuple[CandidateT, float]]:
+        for candidate in ranked:
+            if time.perf_counter() >= deadline_s:
+                return
+            yield candidate, followup_score_of(candidate)
+
+    return _pick_best_combined(
+        _scored(),
+        base_candidate=base_candidate,
+        score_of=score_of,
+        cleared_of=cleared_of,
+        followup_weight=followup_weight,
+    )
+
+
+def choose_best_with_followup_batch(
+    *,
+    candidates: Sequence[CandidateT],
+    base_candidate: CandidateT,
+    score_of: Callable[[CandidateT], float],
+    cleared_of: Callable[[CandidateT], int],
+    followup_scores_of: Callable[[Sequence[CandidateT]], Sequence[float | None]],
+    followup_weight: float,
+) -> tuple[CandidateT, float]:
+    """
+    Like ``choose_best_with_followup`` but scores every follow-up in one call
+    (e.g. fanned out to workers). ``None`` marks a follow-up that missed the
+    deadline; those candidates are skipped as the serial loop would skip them.
+    """
+    ranked = _rank_candidates(candidates, score_of=score_of, cleared_of=cleared_of)
+    followups = followup_scores_of(ranked)
+    return _pick_best_combined(
+        (
+            (candidate, followup)
+            for candidate, followup in zip(ranked, followups)
+            if followup is not None
+        ),
+        base_candidate=base_candidate,
+        score_of=score_of,
+        cleared_of=cleared_of,
+        followup_weight=followup_weight,
+    )
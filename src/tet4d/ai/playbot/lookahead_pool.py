@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import atexit
+import multiprocessing
+import os
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from math import prod
+from typing import TypeVar
+
+from tet4d.ai.playbot.types import playbot_parallel_lookahead_policy
+
+Coord = tuple[int, ...]
+TaskT = TypeVar("TaskT")
+
+# Follow-up scores only read occupancy, so workers get one bit per cell.
+_OCCUPIED_CELL_ID = 1
+
+_pool: ProcessPoolExecutor | None = None
+_pool_workers = 0
+
+
+def pack_occupancy(cells: Iterable[Coord], dims: Sequence[int]) -> bytes:
+    """Row-major occupancy bitset (bit ``i`` = flat cell ``i``) as bytes."""
+    strides = _row_major_strides(dims)
+    packed = bytearray((prod(dims) + 7) // 8)
+    for coord in cells:
+        flat = sum(value * stride for value, stride in zip(coord, strides))
+        packed[flat >> 3] |= 1 << (flat & 7)
+    return bytes(packed)
+
+
+def unpack_occupancy(packed: bytes, dims: Sequence[int]) -> dict[Coord, int]:
+    bits = int.from_bytes(packed, "little")
+    strides = _row_major_strides(dims)
+    cells: dict[Coord, int] = {}
+    while bits:
+        low = bits & -bits
+        flat = low.bit_length() - 1
+        bits ^= low
+        coord = []
+        for stride in strides:
+            value, flat = divmod(flat, stride)
+            coord.append(value)
+        cells[tuple(coord)] = _OCCUPIED_CELL_ID
+    return cells
+
+
+def _row_major_strides(dims: Sequence[int]) -> tuple[int, ...]:
+    strides = [1] * len(dims)
+    for axis in range(len(dims) - 2, -1, -1):
+        strides[axis] = strides[axis + 1] * dims[axis + 1]
+    return tuple(strides)
+
+
+def _resolve_worker_count(max_workers: int) -> int:
+    if max_workers > 0:
+        return max_workers
+    return max(1, (os.cpu_count() or 1) - 1)
+
+
+def parallel_lookahead_workers(candidate_count: int) -> int:
+    """Worker count for ``candidate_count`` follow-ups; 0 keeps scoring serial."""
+    enabled, max_workers, min_candidates = playbot_parallel_lookahead_policy()
+    if not enabled or candidate_count < min_candidates:
+        return 0
+    workers = _resolve_worker_count(max_workers)
+    return workers if workers > 1 else 0
+
+
+def _lookahead_pool(workers: int) -> ProcessPoolExecutor:
+    global _pool, _pool_workers
+    if _pool is None or _pool_workers != workers:
+        shutdown_lookahead_pool()
+        # Spawned workers avoid inheriting the render loop's threads and state.
+        _pool = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        _pool_workers = workers
+    return _pool
+
+
+def shutdown_lookahead_pool() -> None:
+    global _pool, _pool_workers
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+    _pool = None
+    _pool_workers = 0
+
+
+atexit.register(shutdown_lookahead_pool)
+
+
+def map_until_deadline(
+    fn: Callable[[TaskT], float],
+    tasks: Sequence[TaskT],
+    *,
+    workers: int,
+    timeout_s: float,
+) -> list[float | None]:
+    """
+    Run ``fn`` over ``tasks`` on the shared pool. Results still pending when
+    ``timeout_s`` elapses are cancelled and reported as ``None``; so are tasks
+    whose worker raised. A broken pool is dropped so the next call starts a
+    fresh one.
+    """
+    pool = _lookahead_pool(workers)
+    try:
+        futures: Mapping[int, Future[float]] = {
+            index: pool.submit(fn, task) for index, task in enumerate(tasks)
+        }
+    except BrokenProcessPool:
+        shutdown_lookahead_pool()
+        return [None] * len(tasks)
+    done, pending = wait(futures.values(), timeout=max(0.0, timeout_s))
+    for future in pending:
+        future.cancel()
+    results: list[float | None] = []
+    broken = False
+    for index in range(len(tasks)):
+        future = futures[index]
+        if future not in done:
+            results.append(None)
+            continue
+        try:
+            results.append(future.result())
+        except Exception as exc:  # noqa: BLE001 - scored like a missed deadline.
+            broken = broken or isinstance(exc, BrokenProcessPool)
+            results.append(None)
+    if broken:
+        shutdown_lookahead_pool()
+    return results
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import time
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 
 from tet4d.ai.playbot.lookahead_common import choose_best_with_followup
@@ -17,6 +17,13 @@ from tet4d.ai.playbot.types import (
     planning_lookahead_top_k,
 )
 from tet4d.engine.core.model import BoardND
+from tet4d.engine.core.model.bitboard import (
+    drop_masks,
+    lock_masks,
+    masks_fit,
+    placed_level_masks,
+)
+from tet4d.engine.core.model.board import BOARD_STORAGE_BITBOARD
 from tet4d.engine.core.piece_transform import canonicalize_blocks_2d, rotate_blocks_2d
 from tet4d.engine.gameplay.game2d import GameState
 from tet4d.engine.gameplay.pieces2d import ActivePiece2D, PieceShape2D
@@ -28,12 +35,16 @@ class BotPlan2D:
     stats: PlanStats
 
 
+# Sparse boards plan on cell dicts; bitboard boards plan on row ints.
+_Board2D = dict[tuple[int, int], int] | tuple[int, ...]
+
+
 @dataclass(frozen=True)
 class _Candidate2D:
     piece: ActivePiece2D
     score: float
     cleared: int
-    cells_after: dict[tuple[int, int], int]
+    board_after: _Board2D
     game_over: bool
 
 
@@ -98,6 +109,25 @@ def _column_heights_holes(
     return heights, holes
 
 
+def _row_heights_holes(
+    rows: tuple[int, ...],
+    width: int,
+    height: int,
+) -> tuple[list[int], int]:
+    heights: list[int] = [0] * width
+    holes = 0
+    covered = 0
+    for y, row in enumerate(rows):
+        holes += (covered & ~row).bit_count()
+        new_tops = row & ~covered
+        while new_tops:
+            low_bit = new_tops & -new_tops
+            heights[low_bit.bit_length() - 1] = height - y
+            new_tops ^= low_bit
+        covered |= row
+    return heights, holes
+
+
 def _evaluate_2d_board(
     cells: dict[tuple[int, int], int],
     width: int,
@@ -106,6 +136,16 @@ def _evaluate_2d_board(
     game_over: bool,
 ) -> float:
     heights, holes = _column_heights_holes(cells, width, height)
+    return _score_2d_features(heights, holes, width, cleared, game_over)
+
+
+def _score_2d_features(
+    heights: list[int],
+    holes: int,
+    width: int,
+    cleared: int,
+    game_over: bool,
+) -> float:
     aggregate_height = sum(heights)
     bumpiness = sum(abs(heights[i] - heights[i + 1]) for i in range(max(0, width - 1)))
     max_height = max(heights) if heights else 0
@@ -157,19 +197,11 @@ def _simulate_lock_result(
     return score, cleared, cells_after, game_over
 
 
-def _enumerate_candidates_2d(
-    *,
+def _orientations_2d(
     shape: PieceShape2D,
-    board_cells: dict[tuple[int, int], int],
-    width: int,
-    height: int,
-    gravity_axis: int,
-    deadline_s: float,
-    candidate_cap: int,
-) -> tuple[list[_Candidate2D], bool]:
-    candidates: list[_Candidate2D] = []
+) -> Iterator[tuple[int, tuple[tuple[int, int], ...], int, int, int]]:
+    """(rotation, blocks, min_x, max_x, spawn_y) per distinct orientation."""
     orientation_seen: set[tuple[tuple[int, int], ...]] = set()
-
     for rotation in range(4):
         orient = canonicalize_blocks_2d(rotate_blocks_2d(shape.blocks, rotation))
         if orient in orientation_seen:
@@ -178,8 +210,30 @@ def _enumerate_candidates_2d(
         min_x = min(x for x, _y in orient)
         max_x = max(x for x, _y in orient)
         min_y = min(y for _x, y in orient)
-        spawn_y = -2 - min_y
+        yield rotation, orient, min_x, max_x, -2 - min_y
+
 
+def _enumerate_candidates_2d(
+    *,
+    shape: PieceShape2D,
+    board: _Board2D,
+    width: int,
+    height: int,
+    gravity_axis: int,
+    deadline_s: float,
+    candidate_cap: int,
+) -> tuple[list[_Candidate2D], bool]:
+    if isinstance(board, tuple):
+        return _enumerate_candidates_2d_bitboard(
+            shape=shape,
+            rows=board,
+            width=width,
+            height=height,
+            deadline_s=deadline_s,
+            candidate_cap=candidate_cap,
+        )
+    candidates: list[_Candidate2D] = []
+    for rotation, _orient, min_x, max_x, spawn_y in _orientations_2d(shape):
         for target_x in range(-min_x, width - max_x):
             if candidates and time.perf_counter() >= deadline_s:
                 return candidates, True
@@ -190,15 +244,15 @@ def _enumerate_candidates_2d(
                 shape=shape, pos=(target_x, spawn_y), rotation=rotation
             )
             if not _can_exist_on_cells(
-                candidate, cells=board_cells, width=width, height=height
+                candidate, cells=board, width=width, height=height
             ):
                 continue
 
             settled = _drop_piece_on_cells(
-                candidate, cells=board_cells, width=width, height=height
+                candidate, cells=board, width=width, height=height
             )
             score, cleared, cells_after, game_over = _simulate_lock_result(
-                board_cells=board_cells,
+                board_cells=board,
                 width=width,
                 height=height,
                 gravity_axis=gravity_axis,
@@ -209,7 +263,46 @@ def _enumerate_candidates_2d(
                     piece=settled,
                     score=score,
                     cleared=cleared,
-                    cells_after=cells_after,
+                    board_after=cells_after,
+                    game_over=game_over,
+                )
+            )
+
+    return candidates, False
+
+
+def _enumerate_candidates_2d_bitboard(
+    *,
+    shape: PieceShape2D,
+    rows: tuple[int, ...],
+    width: int,
+    height: int,
+    deadline_s: float,
+    candidate_cap: int,
+) -> tuple[list[_Candidate2D], bool]:
+    candidates: list[_Candidate2D] = []
+    full_mask = (1 << width) - 1
+    for rotation, orient, min_x, max_x, spawn_y in _orientations_2d(shape):
+        for target_x in range(-min_x, width - max_x):
+            if candidates and time.perf_counter() >= deadline_s:
+                return candidates, True
+            if len(candidates) >= candidate_cap:
+                return candidates, True
+
+            masks = placed_level_masks(orient, (target_x, 0), (width, height))
+            if not masks_fit(rows, masks, spawn_y):
+                continue
+            rest_y = drop_masks(rows, masks, spawn_y)
+            rows_after, cleared, game_over = lock_masks(rows, masks, rest_y, full_mask)
+            heights, holes = _row_heights_holes(rows_after, width, height)
+            candidates.append(
+                _Candidate2D(
+                    piece=ActivePiece2D(
+                        shape=shape, pos=(target_x, rest_y), rotation=rotation
+                    ),
+                    score=_score_2d_features(heights, holes, width, cleared, game_over),
+                    cleared=cleared,
+                    board_after=rows_after,
                     game_over=game_over,
                 )
             )
@@ -258,7 +351,7 @@ def _followup_score_for_candidate(
 
     followup_candidates, _budget_hit = _enumerate_candidates_2d(
         shape=next_shape,
-        board_cells=candidate.cells_after,
+        board=candidate.board_after,
         width=width,
         height=height,
         gravity_axis=gravity_axis,
@@ -318,6 +411,12 @@ def _pick_with_optional_lookahead(
     )
 
 
+def _planning_board_2d(state: GameState) -> _Board2D:
+    if state.config.board_storage == BOARD_STORAGE_BITBOARD:
+        return state.board.level_masks()
+    return state.board.cells
+
+
 def plan_best_2d_move(
     state: GameState,
     *,
@@ -349,7 +448,7 @@ def plan_best_2d_move(
 
     candidates, _budget_hit = _enumerate_candidates_2d(
         shape=piece.shape,
-        board_cells=state.board.cells,
+        board=_planning_board_2d(state),
         width=width,
         height=height,
         gravity_axis=gravity_axis,
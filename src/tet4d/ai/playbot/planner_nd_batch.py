@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from itertools import product
+from math import prod
+
+from tet4d.ai.playbot.planner_nd_core import (
+    RelBlocks,
+    candidate_from_lateral_values,
+    iter_lateral_columns,
+    lateral_ranges_for_blocks,
+    lock_piece_on_board,
+    nd_board_score,
+    spawn_pose_checker,
+)
+from tet4d.ai.playbot.transposition import cached_height_features
+from tet4d.engine.core.model import BoardND
+from tet4d.engine.gameplay.game_nd import GameStateND
+from tet4d.engine.gameplay.pieces_nd import ActivePieceND
+
+Column = tuple[int, ...]
+ScoredCandidate = tuple[ActivePieceND, float, int, bool]
+
+
+@dataclass(frozen=True)
+class BoardColumnBase:
+    """Per-column board features shared by every candidate of one search."""
+
+    heights: dict[Column, int]
+    counts: dict[Column, int]
+    neighbors: dict[Column, tuple[Column, ...]]
+    level_counts: tuple[int, ...]
+    plane_size: int
+    has_full_levels: bool
+    aggregate_height: int
+    holes: int
+    roughness: int
+    max_height: int
+
+
+def build_column_base(
+    board: BoardND,
+    *,
+    dims: tuple[int, ...],
+    gravity_axis: int,
+    lateral_axes: tuple[int, ...],
+) -> BoardColumnBase:
+    g_size = dims[gravity_axis]
+    column_levels = board.column_levels(gravity_axis)
+    heights: dict[Column, int] = {}
+    counts: dict[Column, int] = {}
+    neighbors: dict[Column, tuple[Column, ...]] = {}
+    holes = 0
+    for column in iter_lateral_columns(dims, lateral_axes):
+        levels = column_levels.get(column)
+        height = g_size - levels[0] if levels else 0
+        count = len(levels) if levels else 0
+        heights[column] = height
+        counts[column] = count
+        holes += height - count
+        adjacent: list[Column] = []
+        for idx, axis in enumerate(lateral_axes):
+            for step in (-1, 1):
+                value = column[idx] + step
+                if 0 <= value < dims[axis]:
+                    adjacent.append(column[:idx] + (value,) + column[idx + 1 :])
+        neighbors[column] = tuple(adjacent)
+    roughness = sum(
+        abs(heights[column] - heights[other])
+        for column, adjacent in neighbors.items()
+        for other in adjacent
+        if other > column
+    )
+    return BoardColumnBase(
+        heights=heights,
+        counts=counts,
+        neighbors=neighbors,
+        level_counts=board.level_counts(gravity_axis),
+        plane_size=prod(dims[axis] for axis in lateral_axes),
+        has_full_levels=bool(board.full_levels(gravity_axis)),
+        aggregate_height=sum(heights.values()),
+        holes=holes,
+        roughness=roughness,
+        max_height=max(heights.values(), default=0),
+    )
+
+
+def _landing_drop(
+    blocks: RelBlocks,
+    *,
+    pos: tuple[int, ...],
+    g_size: int,
+    gravity_axis: int,
+    lateral_axes: tuple[int, ...],
+    column_levels: Mapping[Column, list[int]],
+) -> int:
+    # Same bound as ``drop_piece_fast`` without building the moved piece.
+    drop_limit: int | None = None
+    for block in blocks:
+        curr_g = pos[gravity_axis] + block[gravity_axis]
+        max_drop = g_size - 1 - curr_g
+        levels = column_levels.get(
+            tuple(pos[axis] + block[axis] for axis in lateral_axes)
+        )
+        if levels:
+            idx = bisect_right(levels, curr_g)
+            if idx < len(levels):
+                max_drop = min(max_drop, levels[idx] - 1 - curr_g)
+        drop_limit = max_drop if drop_limit is None else min(drop_limit, max_drop)
+        if drop_limit <= 0:
+            return 0
+    return drop_limit or 0
+
+
+def _score_without_clear(
+    base: BoardColumnBase,
+    touched: dict[Column, tuple[int, int]],
+    *,
+    g_size: int,
+    game_over: bool,
+) -> float:
+    heights = base.heights
+    new_heights: dict[Column, int] = {}
+    aggregate_height = base.aggregate_height
+    holes = base.holes
+    max_height = base.max_height
+    for column, (top, added) in touched.items():
+        old_height = heights[column]
+        new_height = max(old_height, g_size - top)
+        new_heights[column] = new_height
+        aggregate_height += new_height - old_height
+        # Holes per column are empty cells under the top: height - count.
+        holes += new_height - old_height - added
+        max_height = max(max_height, new_height)
+    roughness = base.roughness
+    for column, new_height in new_heights.items():
+        old_height = heights[column]
+        for other in base.neighbors[column]:
+            if other in new_heights and other < column:
+                continue
+            other_old = heights[other]
+            other_new = new_heights.get(other, other_old)
+            roughness += abs(new_height - other_new) - abs(old_height - other_old)
+    return nd_board_score(aggregate_height, holes, roughness, max_height, 0, game_over)
+
+
+def _score_orientation(
+    state: GameStateND,
+    *,
+    piece: ActivePieceND,
+    blocks: RelBlocks,
+    base: BoardColumnBase,
+    scratch: BoardND,
+    column_levels: Mapping[Column, list[int]],
+    lateral_axes: tuple[int, ...],
+    pose_legal: Callable[[ActivePieceND], bool],
+) -> list[ScoredCandidate]:
+    cfg = state.config
+    dims = cfg.dims
+    gravity_axis = cfg.gravity_axis
+    g_size = dims[gravity_axis]
+    ranges, mins = lateral_ranges_for_blocks(
+        blocks, ndim=cfg.ndim, dims=dims, lateral_axes=lateral_axes
+    )
+    if not ranges:
+        return []
+    spawn_g = -2 - mins[gravity_axis]
+    block_columns = [tuple(block[axis] for axis in lateral_axes) for block in blocks]
+    block_levels = [block[gravity_axis] for block in blocks]
+    scored: list[ScoredCandidate] = []
+    for lateral_values in product(*ranges):
+        spawned = candidate_from_lateral_values(
+            shape=piece.shape,
+            blocks=blocks,
+            ndim=cfg.ndim,
+            gravity_axis=gravity_axis,
+            lateral_axes=lateral_axes,
+            lateral_values=lateral_values,
+            spawn_g=spawn_g,
+        )
+        if not pose_legal(spawned):
+            continue
+        drop = _landing_drop(
+            blocks,
+            pos=spawned.pos,
+            g_size=g_size,
+            gravity_axis=gravity_axis,
+            lateral_axes=lateral_axes,
+            column_levels=column_levels,
+        )
+        base_g = spawn_g + drop
+        touched: dict[Column, tuple[int, int]] = {}
+        level_adds: dict[int, int] = {}
+        game_over = False
+        for rel_column, rel_g in zip(block_columns, block_levels):
+            g_val = base_g + rel_g
+            if g_val < 0:
+                game_over = True
+                continue
+            column = tuple(v + r for v, r in zip(lateral_values, rel_column))
+            top, added = touched.get(column, (g_size, 0))
+            touched[column] = (min(top, g_val), added + 1)
+            level_adds[g_val] = level_adds.get(g_val, 0) + 1
+        settled = spawned.moved(_gravity_delta(len(dims), gravity_axis, drop))
+        completes_plane = base.has_full_levels or any(
+            base.level_counts[level] + added == base.plane_size
+            for level, added in level_adds.items()
+        )
+        if completes_plane:
+            # Plane clears reshape the stack; score those exactly.
+            delta, game_over = lock_piece_on_board(scratch, settled, gravity_axis)
+            features = cached_height_features(scratch, gravity_axis)
+            score = nd_board_score(*features, delta.cleared, game_over)
+            scratch.undo_lock(delta)
+            scored.append((settled, score, delta.cleared, game_over))
+            continue
+        score = _score_without_clear(base, touched, g_size=g_size, game_over=game_over)
+        scored.append((settled, score, 0, game_over))
+    return scored
+
+
+def _gravity_delta(ndim: int, gravity_axis: int, drop: int) -> tuple[int, ...]:
+    delta = [0] * ndim
+    delta[gravity_axis] = drop
+    return tuple(delta)
+
+
+def iter_batch_scored_candidates(
+    state: GameStateND,
+    *,
+    piece: ActivePieceND,
+    orientations: tuple[RelBlocks, ...],
+    scratch: BoardND,
+    lateral_axes: tuple[int, ...],
+) -> Iterable[ScoredCandidate]:
+    """
+    Score every (orientation, lateral offset) placement against shared column
+    features. Non-clearing placements update only the touched columns; scores
+    match ``evaluate_nd_board`` exactly.
+    """
+    gravity_axis = state.config.gravity_axis
+    column_levels = state.board.column_levels(gravity_axis)
+    base = build_column_base(
+        state.board,
+        dims=state.config.dims,
+        gravity_axis=gravity_axis,
+        lateral_axes=lateral_axes,
+    )
+    pose_legal = spawn_pose_checker(state)
+    for blocks in orientations:
+        yield from _score_orientation(
+            state,
+            piece=piece,
+            blocks=blocks,
+            base=base,
+            scratch=scratch,
+            column_levels=column_levels,
+            lateral_axes=lateral_axes,
+            pose_legal=pose_legal,
+        )
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
 from bisect import bisect_right
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from itertools import product
-
-from tet4d.engine.core.model import BoardND
+from math import prod
+
+from tet4d.engine.core.model import BoardLockDelta, BoardND
+from tet4d.engine.core.model.bitboard import (
+    LEVEL_AXIS,
+    lateral_strides,
+    masks_fit,
+    placed_level_masks,
+)
+from tet4d.engine.core.model.board import BOARD_STORAGE_BITBOARD
 from tet4d.engine.core.piece_transform import block_axis_bounds
 from tet4d.engine.gameplay.api import piece_pose_legal_gameplay
 from tet4d.engine.gameplay.game_nd import GameStateND
@@ -36,7 +44,7 @@ def drop_piece_fast(
     dims: tuple[int, ...],
     gravity_axis: int,
     lateral_axes: tuple[int, ...],
-    column_levels: dict[tuple[int, ...], list[int]],
+    column_levels: Mapping[tuple[int, ...], list[int]],
 ) -> ActivePieceND:
     drop_limit = 10**9
     for block in piece.rel_blocks:
@@ -168,6 +176,36 @@ def height_features(
     return aggregate_height, holes, roughness, max_height
 
 
+def level_height_features(
+    levels: Sequence[int],
+    dims: tuple[int, ...],
+) -> tuple[int, int, int, int]:
+    """``height_features`` for gravity along ``LEVEL_AXIS``, from level masks."""
+    g_size = dims[LEVEL_AXIS]
+    lateral_axes = [axis for axis in range(len(dims)) if axis != LEVEL_AXIS]
+    heights = [0] * prod(dims[axis] for axis in lateral_axes)
+    holes = 0
+    covered = 0
+    for g_val, level in enumerate(levels):
+        holes += (covered & ~level).bit_count()
+        new_tops = level & ~covered
+        while new_tops:
+            low_bit = new_tops & -new_tops
+            heights[low_bit.bit_length() - 1] = g_size - g_val
+            new_tops ^= low_bit
+        covered |= level
+
+    strides = lateral_strides(dims)
+    roughness = 0
+    for axis in lateral_axes:
+        stride = strides[axis]
+        size = dims[axis]
+        for index in range(len(heights)):
+            if (index // stride) % size + 1 < size:
+                roughness += abs(heights[index] - heights[index + stride])
+    return sum(heights), holes, roughness, max(heights, default=0)
+
+
 def evaluate_nd_board(
     cells: dict[tuple[int, ...], int],
     dims: tuple[int, ...],
@@ -178,6 +216,19 @@ def evaluate_nd_board(
     aggregate_height, holes, roughness, max_height = height_features(
         cells, dims, gravity_axis
     )
+    return nd_board_score(
+        aggregate_height, holes, roughness, max_height, cleared, game_over
+    )
+
+
+def nd_board_score(
+    aggregate_height: int,
+    holes: int,
+    roughness: int,
+    max_height: int,
+    cleared: int,
+    game_over: bool,
+) -> float:
     score = (
         cleared * 12000
         - aggregate_height * 3.8
@@ -190,19 +241,25 @@ def evaluate_nd_board(
     return score
 
 
+def lock_piece_on_board(
+    board: BoardND,
+    piece: ActivePieceND,
+    gravity_axis: int,
+) -> tuple[BoardLockDelta, bool]:
+    game_over = any(coord[gravity_axis] < 0 for coord in piece.cells())
+    delta = board.apply_lock(piece.cells(), piece.shape.color_id, gravity_axis)
+    return delta, game_over
+
+
 def simulate_lock_board(
     state: GameStateND,
     piece: ActivePieceND,
 ) -> tuple[dict[tuple[int, ...], int], int, bool]:
-    dims = state.config.dims
-    gravity_axis = state.config.gravity_axis
-    game_over = any(coord[gravity_axis] < 0 for coord in piece.cells())
-    board = BoardND(dims, cells=dict(state.board.cells))
-    for coord in piece.cells():
-        if board.inside_bounds(coord):
-            board.cells[coord] = piece.shape.color_id
-    cleared = board.clear_planes(gravity_axis)
-    return dict(board.cells), cleared, game_over
+    board = BoardND(
+        state.config.dims, cells=state.board.cells, storage=state.board.storage
+    )
+    delta, game_over = lock_piece_on_board(board, piece, state.config.gravity_axis)
+    return dict(board.cells), delta.cleared, game_over
 
 
 def level_completion_score(
@@ -210,11 +267,14 @@ def level_completion_score(
     *,
     dims: tuple[int, ...],
     gravity_axis: int,
+    level_counts: Sequence[int] | None = None,
 ) -> int:
-    counts = [0] * dims[gravity_axis]
-    for coord in cells:
-        counts[coord[gravity_axis]] += 1
-    return sum(count * count for count in counts)
+    if level_counts is None:
+        counts = [0] * dims[gravity_axis]
+        for coord in cells:
+            counts[coord[gravity_axis]] += 1
+        level_counts = counts
+    return sum(count * count for count in level_counts)
 
 
 def hole_count(
@@ -250,9 +310,18 @@ def greedy_key_4d(
     gravity_axis: int,
     cleared: int,
     game_over: bool,
+    level_counts: Sequence[int] | None = None,
 ) -> tuple[int, int, int, int]:
-    completion = level_completion_score(cells, dims=dims, gravity_axis=gravity_axis)
+    completion = level_completion_score(
+        cells, dims=dims, gravity_axis=gravity_axis, level_counts=level_counts
+    )
     holes = hole_count(cells, dims=dims, gravity_axis=gravity_axis)
+    return greedy_key_from_features(completion, holes, cleared, game_over)
+
+
+def greedy_key_from_features(
+    completion: int, holes: int, cleared: int, game_over: bool
+) -> tuple[int, int, int, int]:
     return (
         0 if game_over else 1,
         cleared,
@@ -289,6 +358,31 @@ def lateral_ranges_for_blocks(
     return ranges, mins
 
 
+def spawn_pose_checker(state: GameStateND) -> Callable[[ActivePieceND], bool]:
+    """
+    Legality test for laterally in-bounds spawn poses. Bitboard boards on
+    fully bounded topologies probe level masks; any other setup maps the pose
+    through the game's topology-aware validator.
+    """
+    cfg = state.config
+    board = state.board
+    if (
+        board.storage != BOARD_STORAGE_BITBOARD
+        or cfg.gravity_axis != LEVEL_AXIS
+        or cfg.explorer_topology_profile is not None
+        or not state.topology_policy.fully_bounded
+    ):
+        return lambda candidate: piece_pose_legal_gameplay(state, candidate)
+    levels = board.level_masks()
+    dims = cfg.dims
+
+    def fits(candidate: ActivePieceND) -> bool:
+        masks = placed_level_masks(candidate.rel_blocks, candidate.pos, dims)
+        return masks_fit(levels, masks, candidate.pos[LEVEL_AXIS])
+
+    return fits
+
+
 def candidate_from_lateral_values(
     *,
     shape: PieceShapeND,
@@ -319,8 +413,9 @@ def iter_settled_candidates(
     dims: tuple[int, ...],
     gravity_axis: int,
     lateral_axes: tuple[int, ...],
-    column_levels: dict[tuple[int, ...], list[int]],
+    column_levels: Mapping[tuple[int, ...], list[int]],
 ) -> Iterable[ActivePieceND]:
+    pose_legal = spawn_pose_checker(state)
     for blocks in orientations:
         ranges, mins = lateral_ranges_for_blocks(
             blocks,
@@ -341,7 +436,7 @@ def iter_settled_candidates(
                 lateral_values=lateral_values,
                 spawn_g=spawn_g,
             )
-            if not piece_pose_legal_gameplay(state, candidate):
+            if not pose_legal(candidate):
                 continue
             yield drop_piece_fast(
                 candidate,
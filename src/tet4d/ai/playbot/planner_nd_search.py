@@ -2,16 +2,31 @@ from __future__ import annotations
 
 import random
 import time
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 
-from tet4d.ai.playbot.lookahead_common import choose_best_with_followup
+from tet4d.ai.playbot.lookahead_common import (
+    choose_best_with_followup,
+    choose_best_with_followup_batch,
+)
+from tet4d.ai.playbot.lookahead_pool import (
+    map_until_deadline,
+    pack_occupancy,
+    parallel_lookahead_workers,
+    unpack_occupancy,
+)
+from tet4d.ai.playbot.planner_nd_batch import iter_batch_scored_candidates
 from tet4d.ai.playbot.planner_nd_core import (
-    build_column_levels,
-    evaluate_nd_board,
-    greedy_key_4d,
+    greedy_key_from_features,
     greedy_score_4d,
     iter_settled_candidates,
-    simulate_lock_board,
+    lock_piece_on_board,
+    nd_board_score,
+)
+from tet4d.ai.playbot.transposition import (
+    cached_greedy_features,
+    cached_height_features,
+    transposition_counters,
 )
 from tet4d.ai.playbot.types import (
     BotPlannerAlgorithm,
@@ -25,16 +40,16 @@ from tet4d.ai.playbot.types import (
     resolve_auto_planner_algorithm,
 )
 from tet4d.engine.core.model import BoardND
-from tet4d.engine.core.piece_transform import (
-    canonicalize_blocks_nd,
-    normalize_blocks_nd,
-    rotate_blocks_nd,
-    rotation_planes_nd,
-)
+from tet4d.engine.core.orientation_table import orientation_table
+from tet4d.engine.core.piece_transform import canonicalize_blocks_nd
 from tet4d.engine.gameplay.game_nd import GameConfigND, GameStateND
 from tet4d.engine.gameplay.pieces_nd import ActivePieceND, PieceShapeND
 
 canonical_blocks = canonicalize_blocks_nd
+# BATCH scores match HEURISTIC, so both may spend budget on lookahead.
+_LOOKAHEAD_ALGORITHMS = frozenset(
+    (BotPlannerAlgorithm.HEURISTIC, BotPlannerAlgorithm.BATCH)
+)
 
 
 def enumerate_orientations(
@@ -42,44 +57,7 @@ def enumerate_orientations(
     ndim: int,
     gravity_axis: int,
 ) -> tuple[tuple[tuple[int, ...], ...], ...]:
-    planes = rotation_planes_nd(ndim, gravity_axis)
-    max_depth = 8 if ndim == 3 else 7
-    max_states = 240
-    queue: list[tuple[tuple[tuple[int, ...], ...], int]] = [(start_blocks, 0)]
-    seen: set[tuple[tuple[int, ...], ...]] = {start_blocks}
-    seen_shapes: set[tuple[tuple[int, ...], ...]] = {
-        canonical_blocks(normalize_blocks_nd(start_blocks))
-    }
-    ordered: list[tuple[tuple[int, ...], ...]] = [start_blocks]
-    index = 0
-    while index < len(queue) and len(seen) < max_states:
-        blocks, depth = queue[index]
-        index += 1
-        if depth >= max_depth:
-            continue
-        for axis_a, axis_b in planes:
-            for delta in (1, -1):
-                rotated = canonical_blocks(
-                    rotate_blocks_nd(
-                        blocks,
-                        axis_a=axis_a,
-                        axis_b=axis_b,
-                        quarter_turns=delta,
-                    )
-                )
-                if rotated in seen:
-                    continue
-                seen.add(rotated)
-                shape_key = canonical_blocks(normalize_blocks_nd(rotated))
-                if shape_key not in seen_shapes:
-                    seen_shapes.add(shape_key)
-                    ordered.append(rotated)
-                queue.append((rotated, depth + 1))
-                if len(seen) >= max_states:
-                    break
-            if len(seen) >= max_states:
-                break
-    return tuple(ordered)
+    return orientation_table(ndim, gravity_axis).orientations(start_blocks)
 
 
 @dataclass(frozen=True)
@@ -93,7 +71,6 @@ class _CandidateND:
     piece: ActivePieceND
     score: float
     cleared: int
-    cells_after: dict[tuple[int, ...], int]
     game_over: bool
 
 
@@ -130,33 +107,75 @@ def _push_top_candidates(
 def _build_candidate(
     *,
     settled: ActivePieceND,
-    cells_after: dict[tuple[int, ...], int],
+    board_after: BoardND,
     cleared: int,
     game_over: bool,
-    dims: tuple[int, ...],
     gravity_axis: int,
     algorithm: BotPlannerAlgorithm,
 ) -> _CandidateND:
     if algorithm == BotPlannerAlgorithm.GREEDY_LAYER:
-        greedy = greedy_key_4d(
-            cells_after,
-            dims=dims,
-            gravity_axis=gravity_axis,
-            cleared=cleared,
-            game_over=game_over,
+        completion, holes = cached_greedy_features(board_after, gravity_axis)
+        score = greedy_score_4d(
+            greedy_key_from_features(completion, holes, cleared, game_over)
         )
-        score = greedy_score_4d(greedy)
     else:
-        score = evaluate_nd_board(cells_after, dims, gravity_axis, cleared, game_over)
+        features = cached_height_features(board_after, gravity_axis)
+        score = nd_board_score(*features, cleared, game_over)
     return _CandidateND(
         piece=settled,
         score=score,
         cleared=cleared,
-        cells_after=cells_after,
         game_over=game_over,
     )
 
 
+def _iter_scored_candidates(
+    state: GameStateND,
+    *,
+    piece: ActivePieceND,
+    orientations: tuple[tuple[tuple[int, ...], ...], ...],
+    lateral_axes: tuple[int, ...],
+    scratch: BoardND,
+    algorithm: BotPlannerAlgorithm,
+) -> Iterable[_CandidateND]:
+    if algorithm == BotPlannerAlgorithm.BATCH:
+        for settled, score, cleared, game_over in iter_batch_scored_candidates(
+            state,
+            piece=piece,
+            orientations=orientations,
+            scratch=scratch,
+            lateral_axes=lateral_axes,
+        ):
+            yield _CandidateND(
+                piece=settled, score=score, cleared=cleared, game_over=game_over
+            )
+        return
+
+    cfg = state.config
+    gravity_axis = cfg.gravity_axis
+    for settled in iter_settled_candidates(
+        state,
+        piece=piece,
+        orientations=orientations,
+        ndim=cfg.ndim,
+        dims=cfg.dims,
+        gravity_axis=gravity_axis,
+        lateral_axes=lateral_axes,
+        column_levels=state.board.column_levels(gravity_axis),
+    ):
+        delta, game_over = lock_piece_on_board(scratch, settled, gravity_axis)
+        candidate = _build_candidate(
+            settled=settled,
+            board_after=scratch,
+            cleared=delta.cleared,
+            game_over=game_over,
+            gravity_axis=gravity_axis,
+            algorithm=algorithm,
+        )
+        scratch.undo_lock(delta)
+        yield candidate
+
+
 def _deadline_candidate_floor(ndim: int, candidate_cap: int) -> int:
     _per_ms, cap_min, _cap_max = playbot_adaptive_candidate_cap_for_ndim(ndim)
     return min(int(candidate_cap), max(1, int(cap_min)))
@@ -177,10 +196,12 @@ def _better_candidate(
 def _spawn_followup_state_nd(
     cfg: GameConfigND,
     *,
-    cells_after: dict[tuple[int, ...], int],
+    board_cells: dict[tuple[int, ...], int],
+    piece: ActivePieceND,
     next_shape: PieceShapeND,
 ) -> GameStateND:
-    board = BoardND(cfg.dims, cells=dict(cells_after))
+    board = BoardND(cfg.dims, cells=board_cells, storage=cfg.board_storage)
+    lock_piece_on_board(board, piece, cfg.gravity_axis)
     return GameStateND(
         config=cfg,
         board=board,
@@ -191,8 +212,10 @@ def _spawn_followup_state_nd(
 
 def _followup_score_nd(
     *,
-    candidate: _CandidateND,
+    piece: ActivePieceND,
+    game_over: bool,
     cfg: GameConfigND,
+    board_cells: dict[tuple[int, ...], int],
     next_shape: PieceShapeND,
     profile: BotPlannerProfile,
     depth: int,
@@ -200,12 +223,13 @@ def _followup_score_nd(
     algorithm: BotPlannerAlgorithm,
     planning_budget_ms: int,
 ) -> float:
-    if candidate.game_over or time.perf_counter() >= deadline_s:
+    if game_over or time.perf_counter() >= deadline_s:
         return float("-inf")
 
     follow_state = _spawn_followup_state_nd(
         cfg,
-        cells_after=candidate.cells_after,
+        board_cells=board_cells,
+        piece=piece,
         next_shape=next_shape,
     )
     if follow_state.game_over or follow_state.current_piece is None:
@@ -224,6 +248,78 @@ def _followup_score_nd(
     return follow_plan.stats.heuristic_score
 
 
+@dataclass(frozen=True)
+class _FollowupTaskND:
+    cfg: GameConfigND
+    packed_board: bytes
+    piece: ActivePieceND
+    next_shape: PieceShapeND
+    profile: BotPlannerProfile
+    depth: int
+    remaining_s: float
+    algorithm: BotPlannerAlgorithm
+    planning_budget_ms: int
+
+
+def _score_followup_task_nd(task: _FollowupTaskND) -> float:
+    """Worker entry point: rebuild the parent board and score one follow-up."""
+    return _followup_score_nd(
+        piece=task.piece,
+        game_over=False,
+        cfg=task.cfg,
+        board_cells=unpack_occupancy(task.packed_board, task.cfg.dims),
+        next_shape=task.next_shape,
+        profile=task.profile,
+        depth=task.depth,
+        deadline_s=time.perf_counter() + task.remaining_s,
+        algorithm=task.algorithm,
+        planning_budget_ms=task.planning_budget_ms,
+    )
+
+
+def _parallel_followup_scores_nd(
+    ranked: Sequence[_CandidateND],
+    *,
+    workers: int,
+    state: GameStateND,
+    next_shape: PieceShapeND,
+    profile: BotPlannerProfile,
+    depth: int,
+    deadline_s: float,
+    algorithm: BotPlannerAlgorithm,
+    planning_budget_ms: int,
+) -> list[float | None]:
+    cfg = state.config
+    board = state.board
+    packed_board = pack_occupancy(
+        (coord for coord in board.cells if board.inside_bounds(coord)), cfg.dims
+    )
+    remaining_s = deadline_s - time.perf_counter()
+    tasks = [
+        _FollowupTaskND(
+            cfg=cfg,
+            packed_board=packed_board,
+            piece=candidate.piece,
+            next_shape=next_shape,
+            profile=profile,
+            depth=depth,
+            remaining_s=remaining_s,
+            algorithm=algorithm,
+            planning_budget_ms=planning_budget_ms,
+        )
+        for candidate in ranked
+        if not candidate.game_over
+    ]
+    scores = iter(
+        map_until_deadline(
+            _score_followup_task_nd, tasks, workers=workers, timeout_s=remaining_s
+        )
+    )
+    return [
+        float("-inf") if candidate.game_over else next(scores) for candidate in ranked
+    ]
+
+
 def _apply_optional_lookahead(
     *,
     state: GameStateND,
@@ -234,10 +330,11 @@ def _apply_optional_lookahead(
     deadline_s: float,
     algorithm: BotPlannerAlgorithm,
     planning_budget_ms: int,
+    parallel: bool,
 ) -> tuple[_CandidateND, float]:
     safety_window = adaptive_deadline_safety_ms() / 1000.0
     can_lookahead = (
-        algorithm == BotPlannerAlgorithm.HEURISTIC
+        algorithm in _LOOKAHEAD_ALGORITHMS
         and depth > 1
         and time.perf_counter() < deadline_s - safety_window
     )
@@ -248,14 +345,36 @@ def _apply_optional_lookahead(
     ranked = sorted(
         top_candidates, key=lambda item: (item.score, item.cleared), reverse=True
     )
+    workers = parallel_lookahead_workers(len(ranked)) if parallel else 0
+    if workers:
+        return choose_best_with_followup_batch(
+            candidates=ranked,
+            base_candidate=best_candidate,
+            score_of=lambda candidate: candidate.score,
+            cleared_of=lambda candidate: candidate.cleared,
+            followup_scores_of=lambda ordered: _parallel_followup_scores_nd(
+                ordered,
+                workers=workers,
+                state=state,
+                next_shape=next_shape,
+                profile=profile,
+                depth=depth - 1,
+                deadline_s=deadline_s,
+                algorithm=algorithm,
+                planning_budget_ms=planning_budget_ms,
+            ),
+            followup_weight=0.30,
+        )
     return choose_best_with_followup(
         candidates=ranked,
         base_candidate=best_candidate,
         score_of=lambda candidate: candidate.score,
         cleared_of=lambda candidate: candidate.cleared,
         followup_score_of=lambda candidate: _followup_score_nd(
-            candidate=candidate,
+            piece=candidate.piece,
+            game_over=candidate.game_over,
             cfg=state.config,
+            board_cells=state.board.cells,
             next_shape=next_shape,
             profile=profile,
             depth=depth - 1,
@@ -276,12 +395,14 @@ def _plan_best_nd_with_deadline(
     deadline_s: float,
     algorithm: BotPlannerAlgorithm,
     planning_budget_ms: int,
+    parallel_lookahead: bool = False,
 ) -> SearchPlanND | None:
     piece = state.current_piece
     if piece is None:
         return None
 
     t0 = time.perf_counter()
+    hits_before, misses_before = transposition_counters()
     cfg = state.config
     ndim = cfg.ndim
     gravity_axis = cfg.gravity_axis
@@ -295,11 +416,8 @@ def _plan_best_nd_with_deadline(
         ndim,
         gravity_axis,
     )
-    column_levels = build_column_levels(
-        state.board.cells,
-        lateral_axes=lateral_axes,
-        gravity_axis=gravity_axis,
-    )
+    # One scratch board per search: each candidate locks, is scored, and undoes.
+    scratch = BoardND(dims, cells=state.board.cells, storage=state.board.storage)
 
     best_candidate: _CandidateND | None = None
     candidate_count = 0
@@ -309,15 +427,13 @@ def _plan_best_nd_with_deadline(
     deadline_candidate_floor = _deadline_candidate_floor(ndim, candidate_cap)
     deadline_safety_s = adaptive_deadline_safety_ms() / 1000.0
 
-    for settled in iter_settled_candidates(
+    for candidate in _iter_scored_candidates(
         state,
         piece=piece,
         orientations=orientations,
-        ndim=ndim,
-        dims=dims,
-        gravity_axis=gravity_axis,
         lateral_axes=lateral_axes,
-        column_levels=column_levels,
+        scratch=scratch,
+        algorithm=active_algorithm,
     ):
         if (
             candidate_count >= deadline_candidate_floor
@@ -328,19 +444,8 @@ def _plan_best_nd_with_deadline(
             break
 
         candidate_count += 1
-        cells_after, cleared, game_over = simulate_lock_board(state, settled)
-        candidate = _build_candidate(
-            settled=settled,
-            cells_after=cells_after,
-            cleared=cleared,
-            game_over=game_over,
-            dims=dims,
-            gravity_axis=gravity_axis,
-            algorithm=active_algorithm,
-        )
-
         best_candidate = _better_candidate(best_candidate, candidate)
-        if depth > 1 and active_algorithm == BotPlannerAlgorithm.HEURISTIC:
+        if depth > 1 and active_algorithm in _LOOKAHEAD_ALGORITHMS:
             _push_top_candidates(top_candidates, candidate, top_k)
 
     if best_candidate is None:
@@ -355,9 +460,11 @@ def _plan_best_nd_with_deadline(
         deadline_s=deadline_s,
         algorithm=active_algorithm,
         planning_budget_ms=planning_budget_ms,
+        parallel=parallel_lookahead,
     )
 
     elapsed_ms = (time.perf_counter() - t0) * 1000.0
+    hits_after, misses_after = transposition_counters()
     return SearchPlanND(
         final_piece=final_candidate.piece,
         stats=PlanStats(
@@ -365,6 +472,8 @@ def _plan_best_nd_with_deadline(
             expected_clears=final_candidate.cleared,
             heuristic_score=final_score,
             planning_ms=elapsed_ms,
+            transposition_hits=hits_after - hits_before,
+            transposition_misses=misses_after - misses_before,
         ),
     )
 
@@ -389,4 +498,5 @@ def plan_best_nd_with_budget(
         deadline_s=deadline_s,
         algorithm=algorithm,
         planning_budget_ms=planning_budget_ms,
+        parallel_lookahead=True,
     )
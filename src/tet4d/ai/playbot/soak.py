@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import statistics
+import time
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+from tet4d.ai.playbot.planner_2d import plan_best_2d_move
+from tet4d.ai.playbot.planner_nd import plan_best_nd_move
+from tet4d.ai.playbot.types import BotPlannerAlgorithm, BotPlannerProfile
+from tet4d.engine.core.rng import coerce_random
+from tet4d.engine.gameplay.game2d import GameConfig, GameState
+from tet4d.engine.gameplay.game_nd import GameConfigND, GameStateND
+from tet4d.engine.runtime.score_analyzer import set_score_analyzer_logging_enabled
+
+
+@dataclass(frozen=True)
+class SoakCase:
+    dims: tuple[int, ...]
+    piece_set: str
+    profile: BotPlannerProfile
+    algorithm: BotPlannerAlgorithm
+    budget_ms: int
+
+    @property
+    def key(self) -> str:
+        dims = "x".join(str(size) for size in self.dims)
+        return f"{dims}/{self.piece_set}/{self.profile.value}/{self.algorithm.value}"
+
+
+@dataclass(frozen=True)
+class SoakGame:
+    case: SoakCase
+    seed: int
+    max_pieces: int
+
+
+@dataclass(frozen=True)
+class SoakGameResult:
+    case: SoakCase
+    seed: int
+    pieces: int
+    lines_cleared: int
+    clear_events: int
+    score: int
+    game_over: bool
+    elapsed_s: float
+
+    def to_json(self) -> dict[str, object]:
+        return {
+            "record": "game",
+            "case": self.case.key,
+            "seed": self.seed,
+            "pieces": self.pieces,
+            "lines_cleared": self.lines_cleared,
+            "clear_events": self.clear_events,
+            "score": self.score,
+            "game_over": self.game_over,
+            "elapsed_s": round(self.elapsed_s, 6),
+        }
+
+
+def _new_soak_state(case: SoakCase, seed: int) -> GameState | GameStateND:
+    rng = coerce_random(seed=seed)
+    if len(case.dims) == 2:
+        cfg = GameConfig(
+            width=case.dims[0], height=case.dims[1], piece_set=case.piece_set
+        )
+        return GameState(config=cfg, board=cfg.new_board(), rng=rng)
+    cfg_nd = GameConfigND(dims=case.dims, gravity_axis=1, piece_set_id=case.piece_set)
+    return GameStateND(config=cfg_nd, board=cfg_nd.new_board(), rng=rng)
+
+
+def play_soak_game(game: SoakGame) -> SoakGameResult:
+    """One seeded bot game, planned and locked like the dry run, no rendering."""
+    case = game.case
+    state = _new_soak_state(case, game.seed)
+    plan_move = plan_best_2d_move if len(case.dims) == 2 else plan_best_nd_move
+    pieces = 0
+    clear_events = 0
+    started = time.perf_counter()
+    for _ in range(max(1, game.max_pieces)):
+        if state.game_over:
+            break
+        plan = plan_move(
+            state,
+            profile=case.profile,
+            budget_ms=case.budget_ms,
+            algorithm=case.algorithm,
+        )
+        if plan is None:
+            break
+        before_clears = state.lines_cleared
+        state.current_piece = plan.final_piece
+        state.lock_current_piece()
+        if not state.game_over:
+            state.spawn_new_piece()
+        pieces += 1
+        if state.lines_cleared > before_clears:
+            clear_events += 1
+    return SoakGameResult(
+        case=case,
+        seed=game.seed,
+        pieces=pieces,
+        lines_cleared=int(state.lines_cleared),
+        clear_events=clear_events,
+        score=int(state.score),
+        game_over=bool(state.game_over),
+        elapsed_s=time.perf_counter() - started,
+    )
+
+
+def _init_soak_worker() -> None:
+    # Nobody reads lock analyses in a soak run; never log them either.
+    set_score_analyzer_logging_enabled(False)
+
+
+def soak_worker_count(workers: int) -> int:
+    if workers > 0:
+        return workers
+    return max(1, (os.cpu_count() or 1) - 1)
+
+
+def run_soak_games(
+    games: Sequence[SoakGame], *, workers: int = 0, chunksize: int = 4
+) -> Iterator[SoakGameResult]:
+    """
+    Play ``games`` and yield results in input order as they complete. More
+    than one worker plays them on a spawned process pool; one worker plays
+    them in this process.
+    """
+    worker_count = soak_worker_count(workers)
+    if worker_count <= 1:
+        _init_soak_worker()
+        for game in games:
+            yield play_soak_game(game)
+        return
+    with ProcessPoolExecutor(
+        max_workers=worker_count,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_soak_worker,
+    ) as pool:
+        yield from pool.map(play_soak_game, games, chunksize=max(1, chunksize))
+
+
+def soak_games(
+    cases: Iterable[SoakCase], *, games_per_case: int, seed_start: int, max_pieces: int
+) -> list[SoakGame]:
+    """Every case plays the same seeds so cases compare game for game."""
+    return [
+        SoakGame(case=case, seed=seed_start + index, max_pieces=max_pieces)
+        for case in cases
+        for index in range(max(1, games_per_case))
+    ]
+
+
+def _quantiles(values: list[int]) -> dict[str, float]:
+    if not values:
+        return {}
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        p10 = p50 = p90 = float(ordered[0])
+    else:
+        deciles = statistics.quantiles(ordered, n=10, method="inclusive")
+        p10, p50, p90 = deciles[0], deciles[4], deciles[8]
+    return {
+        "min": float(ordered[0]),
+        "p10": round(p10, 3),
+        "p50": round(p50, 3),
+        "p90": round(p90, 3),
+        "max": float(ordered[-1]),
+    }
+
+
+def summarize_soak_case(
+    case: SoakCase, results: Sequence[SoakGameResult]
+) -> dict[str, object]:
+    pieces = sum(result.pieces for result in results)
+    elapsed = sum(result.elapsed_s for result in results)
+    game_overs = [result.pieces for result in results if result.game_over]
+    games = len(results)
+    return {
+        "record": "summary",
+        "case": case.key,
+        "dims": list(case.dims),
+        "piece_set": case.piece_set,
+        "profile": case.profile.value,
+        "algorithm": case.algorithm.value,
+        "budget_ms": case.budget_ms,
+        "games": games,
+        "pieces": pieces,
+        "pieces_per_sec": round(pieces / elapsed, 3) if elapsed > 0 else 0.0,
+        "lines_cleared": _quantiles([result.lines_cleared for result in results]),
+        "clear_events": _quantiles([result.clear_events for result in results]),
+        "game_over_rate": round(len(game_overs) / games, 4) if games else 0.0,
+        "game_over_pieces": _quantiles(game_overs),
+    }
+
+
+def run_soak(
+    games: Sequence[SoakGame],
+    *,
+    workers: int = 0,
+    on_result: Callable[[SoakGameResult], None] | None = None,
+) -> list[dict[str, object]]:
+    """Play ``games``, stream each result to ``on_result``; one summary per case."""
+    by_case: dict[SoakCase, list[SoakGameResult]] = {}
+    for result in run_soak_games(games, workers=workers):
+        by_case.setdefault(result.case, []).append(result)
+        if on_result is not None:
+            on_result(result)
+    return [summarize_soak_case(case, results) for case, results in by_case.items()]
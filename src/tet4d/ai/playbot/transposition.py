@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import TypeVar
+
+from tet4d.ai.playbot.planner_nd_core import (
+    height_features,
+    hole_count,
+    level_completion_score,
+    level_height_features,
+)
+from tet4d.ai.playbot.types import playbot_transposition_policy
+from tet4d.engine.core.model import BoardND
+from tet4d.engine.core.model.bitboard import LEVEL_AXIS
+from tet4d.engine.core.model.board import BOARD_STORAGE_BITBOARD
+
+ValueT = TypeVar("ValueT")
+
+HeightFeatures = tuple[int, int, int, int]
+GreedyFeatures = tuple[int, int]
+
+_MISSING = object()
+
+
+class TranspositionTable:
+    """
+    Bounded LRU of board evaluations keyed by ``BoardND.zobrist_hash``.
+    Hit/miss counters are per thread so a plan can report its own probes
+    while the background planner shares the table.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self._entries: OrderedDict[Hashable, object] = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def counters(self) -> tuple[int, int]:
+        """(hits, misses) recorded by the calling thread."""
+        local = self._local
+        return getattr(local, "hits", 0), getattr(local, "misses", 0)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], ValueT]) -> ValueT:
+        local = self._local
+        with self._lock:
+            value = self._entries.get(key, _MISSING)
+            if value is not _MISSING:
+                self._entries.move_to_end(key)
+        if value is not _MISSING:
+            local.hits = getattr(local, "hits", 0) + 1
+            return value  # type: ignore[return-value]
+        local.misses = getattr(local, "misses", 0) + 1
+        value = compute()
+        with self._lock:
+            self._entries[key] = value
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_table: TranspositionTable | None = None
+
+
+def planner_transposition_table() -> TranspositionTable | None:
+    """Shared planner table, or ``None`` when disabled in the playbot policy."""
+    global _table
+    enabled, max_entries = playbot_transposition_policy()
+    if not enabled:
+        return None
+    if _table is None or _table.max_entries != max_entries:
+        _table = TranspositionTable(max_entries)
+    return _table
+
+
+def transposition_counters() -> tuple[int, int]:
+    table = planner_transposition_table()
+    return (0, 0) if table is None else table.counters()
+
+
+def _board_key(kind: str, board: BoardND, gravity_axis: int) -> tuple[object, ...]:
+    # Cell count guards against out-of-bounds cells the hash does not cover.
+    return (kind, board.dims, gravity_axis, board.zobrist_hash, len(board.cells))
+
+
+def cached_height_features(board: BoardND, gravity_axis: int) -> HeightFeatures:
+    """``height_features`` for ``board``, served from the table when possible."""
+
+    def compute() -> HeightFeatures:
+        if board.storage == BOARD_STORAGE_BITBOARD and gravity_axis == LEVEL_AXIS:
+            return level_height_features(board.level_masks(), board.dims)
+        return height_features(board.cells, board.dims, gravity_axis)
+
+    table = planner_transposition_table()
+    if table is None:
+        return compute()
+    return table.get_or_compute(_board_key("height", board, gravity_axis), compute)
+
+
+def cached_greedy_features(board: BoardND, gravity_axis: int) -> GreedyFeatures:
+    """(level completion, holes) inputs of ``greedy_key_4d`` for ``board``."""
+
+    def compute() -> GreedyFeatures:
+        completion = level_completion_score(
+            board.cells,
+            dims=board.dims,
+            gravity_axis=gravity_axis,
+            level_counts=board.level_counts(gravity_axis),
+        )
+        holes = hole_count(board.cells, dims=board.dims, gravity_axis=gravity_axis)
+        return completion, holes
+
+    table = planner_transposition_table()
+    if table is None:
+        return compute()
+    return table.get_or_compute(_board_key("greedy", board, gravity_axis), compute)
@@ -55,6 +55,14 @@ def playbot_lookahead_top_k(ndim: int, profile: str, depth: int) -> int:
     return _runtime_config.playbot_lookahead_top_k(ndim, profile, depth)
 
 
+def playbot_parallel_lookahead_policy() -> tuple[bool, int, int]:
+    return _runtime_config.playbot_parallel_lookahead_policy()
+
+
+def playbot_transposition_policy() -> tuple[bool, int]:
+    return _runtime_config.playbot_transposition_policy()
+
+
 class BotMode(str, Enum):
     OFF = "off"
     ASSIST = "assist"
@@ -91,12 +99,14 @@ class BotPlannerAlgorithm(str, Enum):
     AUTO = "auto"
     HEURISTIC = "heuristic"
     GREEDY_LAYER = "greedy_layer"
+    BATCH = "batch"
 
 
 BOT_PLANNER_ALGORITHM_OPTIONS: tuple[BotPlannerAlgorithm, ...] = (
     BotPlannerAlgorithm.AUTO,
     BotPlannerAlgorithm.HEURISTIC,
     BotPlannerAlgorithm.GREEDY_LAYER,
+    BotPlannerAlgorithm.BATCH,
 )
 
 
@@ -315,6 +325,8 @@ class PlanStats:
     expected_clears: int
     heuristic_score: float
     planning_ms: float
+    transposition_hits: int = 0
+    transposition_misses: int = 0
 
 
 @dataclass(frozen=True)
@@ -44,7 +44,7 @@ def new_game_state_2d(
 ) -> GameState:
     rng = coerce_random(rng=rng, seed=seed)
     if board is None:
-        board = BoardND((config.width, config.height))
+        board = config.new_board()
     return GameState(config=config, board=board, rng=rng)
 
 
@@ -57,7 +57,7 @@ def new_game_state_nd(
 ) -> GameStateND:
     rng = coerce_random(rng=rng, seed=seed)
     if board is None:
-        board = BoardND(config.dims)
+        board = config.new_board()
     return GameStateND(config=config, board=board, rng=rng)
 
 
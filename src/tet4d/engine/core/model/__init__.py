@@ -1,4 +1,4 @@
-from .board import BoardND
+from .board import BoardLockDelta, BoardND
 from .game2d_types import Action
 from .game2d_views import GameConfig2DCoreView, GameState2DCoreView
 from .game_nd_views import GameConfigNDCoreView, GameStateNDCoreView
@@ -7,6 +7,7 @@ Coord = tuple[int, ...]
 
 __all__ = [
     "Action",
+    "BoardLockDelta",
     "BoardND",
     "Coord",
     "GameConfig2DCoreView",
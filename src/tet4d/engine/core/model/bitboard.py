@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from functools import lru_cache
+
+Coord = tuple[int, ...]
+LevelMasks = tuple[tuple[int, int], ...]
+
+# Levels run along axis 1 (y), the gravity axis of every shipped mode.
+LEVEL_AXIS = 1
+
+
+@lru_cache(maxsize=32)
+def lateral_strides(dims: Coord) -> Coord:
+    """
+    Bit stride per axis within one level's cross-section (row-major over the
+    non-level axes; the level axis itself gets stride 0). In 2D bit ``x`` is
+    cell ``(x, y)``.
+    """
+    strides = [0] * len(dims)
+    stride = 1
+    for axis in range(len(dims) - 1, -1, -1):
+        if axis == LEVEL_AXIS:
+            continue
+        strides[axis] = stride
+        stride *= dims[axis]
+    return tuple(strides)
+
+
+def lateral_bit_index(coord: Coord, strides: Coord) -> int:
+    return sum(value * stride for value, stride in zip(coord, strides))
+
+
+class LevelBitboard:
+    """
+    Occupancy as one int per level along ``LEVEL_AXIS``: each level's
+    cross-section is packed into the bits of ``levels[y]``. A level is full
+    when it equals ``full_mask``; clears drop levels and pad empty ones at the
+    top, matching ``collapse_cleared_levels``.
+    """
+
+    __slots__ = ("dims", "full_mask", "levels", "strides")
+
+    def __init__(self, dims: Sequence[int]) -> None:
+        self.dims: Coord = tuple(int(size) for size in dims)
+        if len(self.dims) <= LEVEL_AXIS:
+            raise ValueError("level bitboards require at least two axes")
+        self.strides = lateral_strides(self.dims)
+        cross_section = 1
+        for axis, size in enumerate(self.dims):
+            if axis != LEVEL_AXIS:
+                cross_section *= size
+        self.full_mask = (1 << cross_section) - 1
+        self.levels = [0] * self.dims[LEVEL_AXIS]
+
+    def set_occupied(self, coord: Coord, occupied: bool) -> None:
+        bit = 1 << lateral_bit_index(coord, self.strides)
+        if occupied:
+            self.levels[coord[LEVEL_AXIS]] |= bit
+        else:
+            self.levels[coord[LEVEL_AXIS]] &= ~bit
+
+    def is_occupied(self, coord: Coord) -> bool:
+        level = self.levels[coord[LEVEL_AXIS]]
+        return bool(level >> lateral_bit_index(coord, self.strides) & 1)
+
+    def reset(self, coords: Iterable[Coord]) -> None:
+        levels = [0] * len(self.levels)
+        strides = self.strides
+        for coord in coords:
+            levels[coord[LEVEL_AXIS]] |= 1 << lateral_bit_index(coord, strides)
+        self.levels = levels
+
+    def full_levels(self) -> list[int]:
+        full = self.full_mask
+        return [y for y, level in enumerate(self.levels) if level == full]
+
+    def collapse(self, levels: Iterable[int]) -> None:
+        self.levels = collapse_levels(self.levels, levels)
+
+
+def collapse_levels(levels: Sequence[int], cleared: Iterable[int]) -> list[int]:
+    dropped = set(cleared)
+    kept = [level for y, level in enumerate(levels) if y not in dropped]
+    return [0] * (len(levels) - len(kept)) + kept
+
+
+@lru_cache(maxsize=2048)
+def _anchored_level_masks(
+    blocks: tuple[Coord, ...], dims: Coord
+) -> tuple[LevelMasks, Coord]:
+    lateral_mins = [
+        0 if axis == LEVEL_AXIS else min(block[axis] for block in blocks)
+        for axis in range(len(dims))
+    ]
+    strides = lateral_strides(dims)
+    masks: dict[int, int] = {}
+    for block in blocks:
+        anchored = tuple(value - low for value, low in zip(block, lateral_mins))
+        bit = 1 << lateral_bit_index(anchored, strides)
+        masks[block[LEVEL_AXIS]] = masks.get(block[LEVEL_AXIS], 0) | bit
+    return tuple(sorted(masks.items())), tuple(lateral_mins)
+
+
+def placed_level_masks(
+    blocks: tuple[Coord, ...], offset: Coord, dims: Coord
+) -> LevelMasks:
+    """
+    ``(dy, mask)`` per occupied level of ``blocks`` translated laterally by
+    ``offset`` (its level component is ignored), in ascending ``dy``.
+    Translated blocks must stay inside the lateral bounds: in-bounds moves
+    are pure shifts of the masks cached per orientation.
+    """
+    masks, lateral_mins = _anchored_level_masks(blocks, dims)
+    strides = lateral_strides(dims)
+    shift = lateral_bit_index(
+        tuple(value + low for value, low in zip(offset, lateral_mins)), strides
+    )
+    if not shift:
+        return masks
+    return tuple((dy, mask << shift) for dy, mask in masks)
+
+
+def masks_fit(levels: Sequence[int], masks: LevelMasks, y: int) -> bool:
+    """Levels above the board (negative ``y + dy``) are open, like spawn space."""
+    height = len(levels)
+    for dy, mask in masks:
+        level = y + dy
+        if level >= height:
+            return False
+        if level >= 0 and levels[level] & mask:
+            return False
+    return True
+
+
+def drop_masks(levels: Sequence[int], masks: LevelMasks, y: int) -> int:
+    """Lowest resting ``y`` reached by stepping down from a fitting ``y``."""
+    while masks_fit(levels, masks, y + 1):
+        y += 1
+    return y
+
+
+def lock_masks(
+    levels: Sequence[int], masks: LevelMasks, y: int, full_mask: int
+) -> tuple[tuple[int, ...], int, bool]:
+    """(levels after the lock and clears, cleared levels, piece above the board)."""
+    locked = list(levels)
+    height = len(locked)
+    above = False
+    for dy, mask in masks:
+        level = y + dy
+        if level < 0:
+            above = True
+        elif level < height:
+            locked[level] |= mask
+    full = [level for level, bits in enumerate(locked) if bits == full_mask]
+    if full:
+        locked = collapse_levels(locked, full)
+    return tuple(locked), len(full), above
+
+
+__all__ = [
+    "LEVEL_AXIS",
+    "LevelBitboard",
+    "LevelMasks",
+    "collapse_levels",
+    "drop_masks",
+    "lateral_bit_index",
+    "lateral_strides",
+    "lock_masks",
+    "masks_fit",
+    "placed_level_masks",
+]
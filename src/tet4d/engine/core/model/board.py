@@ -1,22 +1,196 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from bisect import bisect_right
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass, field
+from typing import Any, Self
+
+from .bitboard import LEVEL_AXIS, LevelBitboard
+from .board_health import BoardHealthTracker
+from .board_index import BoardLevelIndex
+from .dense_grid import DenseOccupancyGrid
 
 Coord = tuple[int, ...]
 
+BOARD_STORAGE_SPARSE = "sparse"
+BOARD_STORAGE_DENSE = "dense"
+BOARD_STORAGE_BITBOARD = "bitboard"
+BOARD_STORAGE_MODES: tuple[str, ...] = (
+    BOARD_STORAGE_SPARSE,
+    BOARD_STORAGE_DENSE,
+    BOARD_STORAGE_BITBOARD,
+)
+
+_MISSING = object()
+
+
+def normalize_board_storage(value: object) -> str:
+    if not isinstance(value, str) or value not in BOARD_STORAGE_MODES:
+        raise ValueError(f"unsupported board storage: {value!r}")
+    return value
+
+
+@dataclass(frozen=True)
+class BoardLockDelta:
+    """Undo record returned by ``BoardND.apply_lock``."""
+
+    placed: tuple[Coord, ...]
+    replaced: tuple[tuple[Coord, int], ...]
+    cleared_levels: tuple[int, ...]
+    cells_before_clear: dict[Coord, int] | None
+    prior_cleared_levels: list[int]
+    prior_cleared_cells: list[tuple[Coord, int]]
+
+    @property
+    def cleared(self) -> int:
+        return len(self.cleared_levels)
+
+
+class BoardCells(dict[Coord, int]):
+    """
+    Occupied-cell dict owned by one board.
+    Reads stay plain dict operations; writes are reported back to the owner so
+    any derived storage (dense grid, indexes) stays in sync with legacy callers
+    that mutate ``board.cells`` directly.
+    """
+
+    __slots__ = ("_owner",)
+
+    def __init__(self, owner: BoardND, cells: Mapping[Coord, int] = ()) -> None:
+        super().__init__(cells)
+        self._owner = owner
+
+    def __setitem__(self, coord: Coord, cell_id: int) -> None:
+        added = coord not in self
+        dict.__setitem__(self, coord, cell_id)
+        if added:
+            self._owner._note_cell_added(coord)
+
+    def __delitem__(self, coord: Coord) -> None:
+        dict.__delitem__(self, coord)
+        self._owner._note_cell_removed(coord)
+
+    def pop(self, coord: Coord, default: Any = _MISSING) -> Any:
+        if coord not in self:
+            if default is _MISSING:
+                raise KeyError(coord)
+            return default
+        cell_id = dict.pop(self, coord)
+        self._owner._note_cell_removed(coord)
+        return cell_id
+
+    def popitem(self) -> tuple[Coord, int]:
+        coord, cell_id = dict.popitem(self)
+        self._owner._note_cell_removed(coord)
+        return coord, cell_id
+
+    def setdefault(self, coord: Coord, default: int) -> int:
+        if coord not in self:
+            self[coord] = default
+        return dict.__getitem__(self, coord)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for coord, cell_id in dict(*args, **kwargs).items():
+            self[coord] = cell_id
+
+    def __ior__(self, other: Any) -> Self:
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        dict.clear(self)
+        self._owner._note_cells_reset()
+
+    def __reduce__(self) -> tuple[type, tuple[dict[Coord, int]]]:
+        return dict, (dict(self),)
+
 
 @dataclass
 class BoardND:
     """
     ND board. For 2D, dims = (width, height) and coords are (x, y).
     We only store *occupied* cells in a dict: coord -> cell_id (e.g. color).
+    Per-level counters and per-column level indexes are kept in step with
+    every write, so full-level checks cost O(levels) instead of O(cells).
+    ``storage="dense"`` additionally mirrors occupancy in a flat byte grid so
+    plane clears and placement checks avoid per-cell dict walks; ``cells``
+    stays the authoritative dict view either way. ``storage="bitboard"``
+    packs each y-level cross-section into one int so collision probes,
+    full-level checks and y-level clears are integer operations.
     """
 
     dims: Coord
     cells: dict[Coord, int] = field(default_factory=dict)
     last_cleared_levels: list[int] = field(default_factory=list)
     last_cleared_cells: list[tuple[Coord, int]] = field(default_factory=list)
+    storage: str = field(default=BOARD_STORAGE_SPARSE, compare=False)
+
+    def __post_init__(self) -> None:
+        normalize_board_storage(self.storage)
+        self._init_derived_storage()
+        self._reindex()
+
+    def _init_derived_storage(self) -> None:
+        grid: DenseOccupancyGrid | LevelBitboard | None = None
+        if self.storage == BOARD_STORAGE_DENSE:
+            grid = DenseOccupancyGrid(self.dims)
+        elif self.storage == BOARD_STORAGE_BITBOARD:
+            grid = LevelBitboard(self.dims)
+        self._grid = grid
+        self._index = BoardLevelIndex(self.dims)
+        self._health: dict[int, BoardHealthTracker] = {}
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "cells":
+            value = BoardCells(self, value)
+        object.__setattr__(self, name, value)
+        if name == "cells" and "_index" in self.__dict__:
+            self._reindex()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Derived storage is rebuilt per instance so copies never share it.
+        state = dict(self.__dict__)
+        for name in ("_grid", "_index", "_health"):
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._init_derived_storage()
+        self.cells = state["cells"]
+
+    # --- Derived storage sync (called by BoardCells) ---
+
+    def _reindex(self) -> None:
+        coords = [coord for coord in self.cells if self.inside_bounds(coord)]
+        self._index.reset(coords)
+        if self._grid is not None:
+            self._grid.reset(coords)
+        for tracker in self._health.values():
+            tracker.note_reset()
+
+    def _note_cell_added(self, coord: Coord) -> None:
+        if not self.inside_bounds(coord):
+            return
+        self._index.add(coord)
+        if self._grid is not None:
+            self._grid.set_occupied(coord, True)
+        for tracker in self._health.values():
+            tracker.note_added(coord)
+
+    def _note_cell_removed(self, coord: Coord) -> None:
+        if not self.inside_bounds(coord):
+            return
+        self._index.remove(coord)
+        if self._grid is not None:
+            self._grid.set_occupied(coord, False)
+        for tracker in self._health.values():
+            tracker.note_removed(coord)
+
+    def _note_cells_reset(self) -> None:
+        self._reindex()
+
+    # --- Queries ---
 
     def inside_bounds(self, coord: Coord) -> bool:
         if len(coord) != len(self.dims):
@@ -27,6 +201,7 @@ class BoardND:
         return coord in self.cells
 
     def can_place(self, coords: Iterable[Coord]) -> bool:
+        occupied = self.cells if self._grid is None else None
         seen: set[Coord] = set()
         for c in coords:
             if c in seen:
@@ -34,27 +209,192 @@ class BoardND:
             seen.add(c)
             if not self.inside_bounds(c):
                 return False
-            if self.is_occupied(c):
+            if occupied is not None:
+                if c in occupied:
+                    return False
+            elif self._grid.is_occupied(c):
                 return False
         return True
 
-    def full_levels(self, gravity_axis: int) -> list[int]:
-        from ..rules.board_rules import full_levels as full_levels_rule
+    def level_masks(self) -> tuple[int, ...]:
+        """
+        Occupancy as one int per y-level (see ``LevelBitboard``; in 2D bit
+        ``x`` is cell ``(x, y)``). Bitboard storage serves its mirror; other
+        layouts pack the cells on demand.
+        """
+        if isinstance(self._grid, LevelBitboard):
+            return tuple(self._grid.levels)
+        bits = LevelBitboard(self.dims)
+        bits.reset(coord for coord in self.cells if self.inside_bounds(coord))
+        return tuple(bits.levels)
 
-        return full_levels_rule(self.dims, self.cells, gravity_axis)
+    @property
+    def zobrist_hash(self) -> int:
+        """
+        Order-independent 64-bit hash of in-bounds occupancy (cell ids are not
+        hashed). Locks update it in O(piece cells); clears rehash the survivors.
+        """
+        return self._index.zobrist
+
+    def level_counts(self, axis: int) -> tuple[int, ...]:
+        self._require_axis(axis)
+        return tuple(self._index.level_counts[axis])
+
+    def column_levels(self, gravity_axis: int) -> Mapping[Coord, list[int]]:
+        """
+        Sorted occupied gravity levels per lateral column (read-only view).
+        Column keys list the non-gravity coordinates in axis order.
+        """
+        self._require_axis(gravity_axis)
+        return self._index.columns(
+            gravity_axis, (coord for coord in self.cells if self.inside_bounds(coord))
+        )
+
+    def column_top(self, gravity_axis: int, column: Coord) -> int | None:
+        levels = self.column_levels(gravity_axis).get(column)
+        return levels[0] if levels else None
+
+    def landing_distance(self, coords: Iterable[Coord], gravity_axis: int) -> int:
+        """
+        Steps ``coords`` can fall along ``gravity_axis`` before one of them
+        rests on the floor or an occupied cell, read from the column index
+        in one pass. Coords above the board fall through open space.
+        """
+        columns = self.column_levels(gravity_axis)
+        floor = self.dims[gravity_axis] - 1
+        distance: int | None = None
+        for coord in coords:
+            level = coord[gravity_axis]
+            reach = floor - level
+            levels = columns.get(coord[:gravity_axis] + coord[gravity_axis + 1 :])
+            if levels:
+                below = bisect_right(levels, level)
+                if below < len(levels):
+                    reach = min(reach, levels[below] - 1 - level)
+            if distance is None or reach < distance:
+                distance = reach
+            if distance <= 0:
+                return 0
+        return distance or 0
+
+    def health_tracker(self, gravity_axis: int) -> BoardHealthTracker:
+        """
+        Board-health aggregates for ``gravity_axis``, attached on first
+        request and then updated with every write and clear.
+        """
+        self._require_axis(gravity_axis)
+        tracker = self._health.get(gravity_axis)
+        if tracker is None:
+            tracker = BoardHealthTracker(self, gravity_axis)
+            self._health[gravity_axis] = tracker
+        return tracker
+
+    def full_levels(self, gravity_axis: int) -> list[int]:
+        self._require_axis(gravity_axis)
+        if gravity_axis == LEVEL_AXIS and isinstance(self._grid, LevelBitboard):
+            return self._grid.full_levels()
+        return self._index.full_levels(gravity_axis)
 
     def clear_planes(self, gravity_axis: int) -> int:
-        from ..rules.board_rules import clear_planes as clear_planes_rule
+        from ..rules.board_rules import collapse_cleared_levels
 
-        cleared, new_cells, cleared_levels, cleared_cells = clear_planes_rule(
-            self.dims,
+        levels = self.full_levels(gravity_axis)
+        if not levels:
+            self.last_cleared_levels = []
+            self.last_cleared_cells = []
+            return 0
+        new_cells, cleared_cells = collapse_cleared_levels(
             self.cells,
-            gravity_axis,
+            axis_size=self.dims[gravity_axis],
+            gravity_axis=gravity_axis,
+            levels=levels,
+        )
+        self._index.apply_clear(
+            gravity_axis, levels, (coord for coord, _cell_id in cleared_cells)
         )
-        self.cells = new_cells
-        self.last_cleared_levels = cleared_levels
+        dict.clear(self.cells)
+        dict.update(self.cells, new_cells)
+        self._clear_grid_levels(gravity_axis, levels)
+        self._index.rehash(coord for coord in new_cells if self.inside_bounds(coord))
+        for tracker in self._health.values():
+            tracker.note_cleared(gravity_axis, len(levels))
+        self.last_cleared_levels = levels
         self.last_cleared_cells = cleared_cells
-        return cleared
+        return len(levels)
+
+    def _clear_grid_levels(self, gravity_axis: int, levels: list[int]) -> None:
+        grid = self._grid
+        if isinstance(grid, LevelBitboard):
+            if gravity_axis == LEVEL_AXIS:
+                grid.collapse(levels)
+            else:
+                grid.reset(coord for coord in self.cells if self.inside_bounds(coord))
+        elif grid is not None:
+            grid.clear_levels(gravity_axis, levels)
+
+    # --- Reversible locks (planner simulation) ---
+
+    def apply_lock(
+        self, coords: Iterable[Coord], cell_id: int, gravity_axis: int
+    ) -> BoardLockDelta:
+        """
+        Write ``coords`` (in-bounds only), clear full planes, and return the
+        delta that ``undo_lock`` reverts. Only a clearing lock copies the board.
+        """
+        self._require_axis(gravity_axis)
+        cells = self.cells
+        placed: list[Coord] = []
+        replaced: list[tuple[Coord, int]] = []
+        for coord in coords:
+            if not self.inside_bounds(coord):
+                continue
+            prior = cells.get(coord)
+            if prior is None:
+                placed.append(coord)
+            else:
+                replaced.append((coord, prior))
+            cells[coord] = cell_id
+        prior_levels = self.last_cleared_levels
+        prior_cells = self.last_cleared_cells
+        cells_before_clear = None
+        if self._index.full_levels(gravity_axis):
+            cells_before_clear = dict(cells)
+        self.clear_planes(gravity_axis)
+        return BoardLockDelta(
+            placed=tuple(placed),
+            replaced=tuple(replaced),
+            cleared_levels=tuple(self.last_cleared_levels),
+            cells_before_clear=cells_before_clear,
+            prior_cleared_levels=prior_levels,
+            prior_cleared_cells=prior_cells,
+        )
+
+    def undo_lock(self, delta: BoardLockDelta) -> None:
+        """Revert the most recent ``apply_lock`` (deltas undo in LIFO order)."""
+        cells = self.cells
+        if delta.cells_before_clear is not None:
+            dict.clear(cells)
+            dict.update(cells, delta.cells_before_clear)
+            self._reindex()
+        for coord, cell_id in delta.replaced:
+            cells[coord] = cell_id
+        for coord in delta.placed:
+            del cells[coord]
+        self.last_cleared_levels = delta.prior_cleared_levels
+        self.last_cleared_cells = delta.prior_cleared_cells
+
+    def _require_axis(self, gravity_axis: int) -> None:
+        if not (0 <= gravity_axis < len(self.dims)):
+            raise ValueError("Invalid gravity_axis")
 
 
-__all__ = ["BoardND"]
+__all__ = [
+    "BOARD_STORAGE_BITBOARD",
+    "BOARD_STORAGE_DENSE",
+    "BOARD_STORAGE_MODES",
+    "BOARD_STORAGE_SPARSE",
+    "BoardCells",
+    "BoardLockDelta",
+    "BoardND",
+    "normalize_board_storage",
+]
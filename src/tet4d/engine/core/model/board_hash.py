@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from math import prod
+
+Coord = tuple[int, ...]
+
+_MASK64 = (1 << 64) - 1
+
+
+def _splitmix64(value: int) -> int:
+    value = (value + 0x9E3779B97F4A7C15) & _MASK64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return value ^ (value >> 31)
+
+
+@lru_cache(maxsize=32)
+def zobrist_keys(dims: Coord) -> tuple[int, ...]:
+    """
+    Fixed 64-bit key per cell (row-major flat index) for boards of ``dims``.
+    Keys are derived, not drawn, so hashes agree across processes and runs.
+    """
+    return tuple(_splitmix64(flat) for flat in range(prod(dims)))
+
+
+__all__ = ["zobrist_keys"]
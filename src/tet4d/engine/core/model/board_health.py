@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import product
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .board import BoardND
+
+Coord = tuple[int, ...]
+ColumnStats = tuple[int, int, int]
+
+_EMPTY_COLUMN: ColumnStats = (0, 0, 0)
+
+
+@dataclass(frozen=True)
+class BoardHealthTotals:
+    """Raw aggregates behind the score analyzer's board-health features."""
+
+    occupied: int
+    columns: int
+    height_sum: int
+    max_height: int
+    holes: int
+    holes_depth: int
+    roughness: int
+    roughness_edges: int
+    components: int
+
+
+def column_health(levels: list[int] | None, gravity_size: int) -> ColumnStats:
+    """
+    (height, holes, depth-weighted holes) of one column from its sorted
+    occupied levels; a hole at level ``g`` weighs ``g - top + 1``.
+    """
+    if not levels:
+        return _EMPTY_COLUMN
+    top = levels[0]
+    height = gravity_size - top
+    occupied_depth = sum(levels) - len(levels) * (top - 1)
+    return (
+        height,
+        height - len(levels),
+        height * (height + 1) // 2 - occupied_depth,
+    )
+
+
+class BoardHealthTracker:
+    """
+    Board-health aggregates for one gravity axis, kept in step with board
+    writes. A write re-walks only its column and the roughness edges to the
+    lateral neighbours; a plane clear shifts every height by the cleared
+    count and re-walks only columns holding holes. Connected components
+    live in a union-find that grows with added cells and is rebuilt lazily
+    after removals and clears.
+    """
+
+    def __init__(self, board: BoardND, gravity_axis: int) -> None:
+        self._board = board
+        self.gravity_axis = gravity_axis
+        self._gravity_size = board.dims[gravity_axis]
+        self._lateral_dims = tuple(
+            size for axis, size in enumerate(board.dims) if axis != gravity_axis
+        )
+        self._stats: dict[Coord, ColumnStats] = {}
+        self._height_counts: list[int] = []
+        self._height_sum = 0
+        self._holes = 0
+        self._holes_depth = 0
+        self._roughness = 0
+        self._roughness_edges = 0
+        self._parents: dict[Coord, Coord] = {}
+        self._components = 0
+        self._columns_dirty = True
+        self._components_dirty = True
+
+    # --- Board hooks ---
+
+    def note_added(self, coord: Coord) -> None:
+        if not self._columns_dirty:
+            self._refresh_column(self._column_key(coord))
+        if not self._components_dirty:
+            self._union_cell(coord)
+
+    def note_removed(self, coord: Coord) -> None:
+        if not self._columns_dirty:
+            self._refresh_column(self._column_key(coord))
+        self._components_dirty = True
+
+    def note_reset(self) -> None:
+        self._columns_dirty = True
+        self._components_dirty = True
+
+    def note_cleared(self, axis: int, cleared: int) -> None:
+        """
+        Shift for ``cleared`` full planes along ``axis``. Every column holds
+        a cell on each full plane, so a gap-free column drops by exactly the
+        cleared count; columns with holes may drop further and are re-walked
+        against the shifted neighbours. Clears along another axis rebuild
+        lazily.
+        """
+        self._components_dirty = True
+        if axis != self.gravity_axis:
+            self._columns_dirty = True
+        if self._columns_dirty or cleared <= 0:
+            return
+        self._height_counts = self._height_counts[cleared:] + [0] * cleared
+        self._height_sum -= cleared * len(self._stats)
+        stats = self._stats
+        hole_columns = []
+        for column, (height, holes, depth) in stats.items():
+            stats[column] = (height - cleared, holes, depth)
+            if holes:
+                hole_columns.append(column)
+        for column in hole_columns:
+            self._refresh_column(column)
+
+    # --- Queries ---
+
+    def totals(self) -> BoardHealthTotals:
+        if self._columns_dirty:
+            self._rebuild_columns()
+        if self._components_dirty:
+            self._rebuild_components()
+        counts = self._height_counts
+        max_height = next(
+            (height for height in range(len(counts) - 1, -1, -1) if counts[height]),
+            0,
+        )
+        return BoardHealthTotals(
+            occupied=len(self._board.cells),
+            columns=len(self._stats),
+            height_sum=self._height_sum,
+            max_height=max_height,
+            holes=self._holes,
+            holes_depth=self._holes_depth,
+            roughness=self._roughness,
+            roughness_edges=self._roughness_edges,
+            components=self._components,
+        )
+
+    # --- Columns ---
+
+    def _column_key(self, coord: Coord) -> Coord:
+        axis = self.gravity_axis
+        return coord[:axis] + coord[axis + 1 :]
+
+    def _neighbor_columns(self, column: Coord):
+        for index, size in enumerate(self._lateral_dims):
+            value = column[index]
+            if value > 0:
+                yield column[:index] + (value - 1,) + column[index + 1 :]
+            if value + 1 < size:
+                yield column[:index] + (value + 1,) + column[index + 1 :]
+
+    def _refresh_column(self, column: Coord) -> None:
+        stats = self._stats
+        height, holes, depth = stats[column]
+        levels = self._board.column_levels(self.gravity_axis).get(column)
+        updated = column_health(levels, self._gravity_size)
+        stats[column] = updated
+        self._holes += updated[1] - holes
+        self._holes_depth += updated[2] - depth
+        new_height = updated[0]
+        if new_height == height:
+            return
+        self._height_counts[height] -= 1
+        self._height_counts[new_height] += 1
+        self._height_sum += new_height - height
+        for neighbor in self._neighbor_columns(column):
+            other = stats[neighbor][0]
+            self._roughness += abs(new_height - other) - abs(height - other)
+
+    def _rebuild_columns(self) -> None:
+        columns = self._board.column_levels(self.gravity_axis)
+        size = self._gravity_size
+        stats = {
+            column: column_health(columns.get(column), size)
+            for column in product(*(range(extent) for extent in self._lateral_dims))
+        }
+        counts = [0] * (size + 1)
+        roughness = 0
+        edges = 0
+        for column, (height, _holes, _depth) in stats.items():
+            counts[height] += 1
+            for index, extent in enumerate(self._lateral_dims):
+                if column[index] + 1 >= extent:
+                    continue
+                neighbor = column[:index] + (column[index] + 1,) + column[index + 1 :]
+                roughness += abs(height - stats[neighbor][0])
+                edges += 1
+        self._stats = stats
+        self._height_counts = counts
+        self._height_sum = sum(height for height, _holes, _depth in stats.values())
+        self._holes = sum(holes for _height, holes, _depth in stats.values())
+        self._holes_depth = sum(depth for _height, _holes, depth in stats.values())
+        self._roughness = roughness
+        self._roughness_edges = edges
+        self._columns_dirty = False
+
+    # --- Components ---
+
+    def _find(self, coord: Coord) -> Coord:
+        parents = self._parents
+        while parents[coord] != coord:
+            parents[coord] = parents[parents[coord]]
+            coord = parents[coord]
+        return coord
+
+    def _union_cell(self, coord: Coord) -> None:
+        parents = self._parents
+        if coord in parents:
+            return
+        parents[coord] = coord
+        self._components += 1
+        root = coord
+        for axis in range(len(coord)):
+            for delta in (-1, 1):
+                neighbor = coord[:axis] + (coord[axis] + delta,) + coord[axis + 1 :]
+                if neighbor not in parents:
+                    continue
+                other = self._find(neighbor)
+                if other != root:
+                    parents[other] = root
+                    self._components -= 1
+
+    def _rebuild_components(self) -> None:
+        self._parents = {}
+        self._components = 0
+        board = self._board
+        for coord in board.cells:
+            if board.inside_bounds(coord):
+                self._union_cell(coord)
+        self._components_dirty = False
+
+
+__all__ = ["BoardHealthTotals", "BoardHealthTracker", "column_health"]
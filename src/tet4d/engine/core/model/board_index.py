@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections.abc import Iterable, Sequence
+
+from .board_hash import zobrist_keys
+from .dense_grid import _row_major_strides
+
+Coord = tuple[int, ...]
+
+
+def _lateral_axes(ndim: int, gravity_axis: int) -> tuple[int, ...]:
+    return tuple(axis for axis in range(ndim) if axis != gravity_axis)
+
+
+def _level_shift(axis_size: int, cleared: set[int]) -> list[int]:
+    shift = [0] * axis_size
+    below = 0
+    for level in range(axis_size - 1, -1, -1):
+        shift[level] = below
+        if level in cleared:
+            below += 1
+    return shift
+
+
+class BoardLevelIndex:
+    """
+    Incrementally maintained occupancy counters for one board.
+    ``level_counts[axis][level]`` counts occupied cells on each level of every
+    axis. Column indexes (sorted occupied levels per lateral column) are built
+    on first request for a gravity axis and then kept current.
+    ``zobrist`` is the XOR of the per-cell keys of every occupied cell.
+    """
+
+    __slots__ = ("_columns", "_keys", "_strides", "dims", "level_counts", "zobrist")
+
+    def __init__(self, dims: Sequence[int]) -> None:
+        self.dims: Coord = tuple(int(size) for size in dims)
+        self.level_counts: list[list[int]] = [[0] * size for size in self.dims]
+        self._columns: dict[int, dict[Coord, list[int]]] = {}
+        self._keys = zobrist_keys(self.dims)
+        self._strides = _row_major_strides(self.dims)
+        self.zobrist = 0
+
+    def reset(self, coords: Iterable[Coord]) -> None:
+        self.level_counts = [[0] * size for size in self.dims]
+        self._columns.clear()
+        self.zobrist = 0
+        for coord in coords:
+            self.add(coord)
+
+    def rehash(self, coords: Iterable[Coord]) -> None:
+        """Recompute ``zobrist`` after a plane clear shifted cells down."""
+        keys = self._keys
+        strides = self._strides
+        zobrist = 0
+        for coord in coords:
+            zobrist ^= keys[sum(v * s for v, s in zip(coord, strides))]
+        self.zobrist = zobrist
+
+    def _key(self, coord: Coord) -> int:
+        return self._keys[sum(v * s for v, s in zip(coord, self._strides))]
+
+    def add(self, coord: Coord) -> None:
+        self.zobrist ^= self._key(coord)
+        for axis, value in enumerate(coord):
+            self.level_counts[axis][value] += 1
+        for gravity_axis, columns in self._columns.items():
+            column = tuple(v for axis, v in enumerate(coord) if axis != gravity_axis)
+            insort(columns.setdefault(column, []), coord[gravity_axis])
+
+    def remove(self, coord: Coord) -> None:
+        self.zobrist ^= self._key(coord)
+        for axis, value in enumerate(coord):
+            self.level_counts[axis][value] -= 1
+        for gravity_axis, columns in self._columns.items():
+            column = tuple(v for axis, v in enumerate(coord) if axis != gravity_axis)
+            levels = columns[column]
+            del levels[bisect_left(levels, coord[gravity_axis])]
+            if not levels:
+                del columns[column]
+
+    def columns(
+        self, gravity_axis: int, coords: Iterable[Coord]
+    ) -> dict[Coord, list[int]]:
+        columns = self._columns.get(gravity_axis)
+        if columns is None:
+            lateral_axes = _lateral_axes(len(self.dims), gravity_axis)
+            columns = {}
+            for coord in coords:
+                column = tuple(coord[axis] for axis in lateral_axes)
+                columns.setdefault(column, []).append(coord[gravity_axis])
+            for levels in columns.values():
+                levels.sort()
+            self._columns[gravity_axis] = columns
+        return columns
+
+    def full_levels(self, gravity_axis: int) -> list[int]:
+        counts = self.level_counts[gravity_axis]
+        plane_size = 1
+        for axis, size in enumerate(self.dims):
+            if axis != gravity_axis:
+                plane_size *= size
+        return [level for level, count in enumerate(counts) if count == plane_size]
+
+    def apply_clear(
+        self,
+        gravity_axis: int,
+        levels: Iterable[int],
+        cleared_coords: Iterable[Coord],
+    ) -> None:
+        """Shift counters for a plane clear instead of recounting the board."""
+        cleared = set(levels)
+        for coord in cleared_coords:
+            for axis, value in enumerate(coord):
+                self.level_counts[axis][value] -= 1
+        axis_size = self.dims[gravity_axis]
+        shift = _level_shift(axis_size, cleared)
+        shifted = [0] * axis_size
+        for level, count in enumerate(self.level_counts[gravity_axis]):
+            if level not in cleared:
+                shifted[level + shift[level]] = count
+        self.level_counts[gravity_axis] = shifted
+
+        columns = self._columns.get(gravity_axis)
+        # Other gravity axes key their columns by this axis; rebuild lazily.
+        self._columns.clear()
+        if columns is None:
+            return
+        for column, column_levels in list(columns.items()):
+            kept = [
+                value + shift[value] for value in column_levels if value not in cleared
+            ]
+            if kept:
+                columns[column] = kept
+            else:
+                del columns[column]
+        self._columns[gravity_axis] = columns
+
+
+__all__ = ["BoardLevelIndex"]
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from math import prod
+
+Coord = tuple[int, ...]
+
+_EMPTY = 0
+_OCCUPIED = 1
+
+
+def _row_major_strides(dims: Coord) -> Coord:
+    strides = [1] * len(dims)
+    for axis in range(len(dims) - 2, -1, -1):
+        strides[axis] = strides[axis + 1] * dims[axis + 1]
+    return tuple(strides)
+
+
+class DenseOccupancyGrid:
+    """Row-major ``bytearray`` occupancy mirror (one byte per board cell)."""
+
+    __slots__ = ("data", "dims", "strides")
+
+    def __init__(self, dims: Sequence[int]) -> None:
+        self.dims: Coord = tuple(int(size) for size in dims)
+        self.strides: Coord = _row_major_strides(self.dims)
+        self.data = bytearray(prod(self.dims))
+
+    def index(self, coord: Coord) -> int:
+        return sum(value * stride for value, stride in zip(coord, self.strides))
+
+    def set_occupied(self, coord: Coord, occupied: bool) -> None:
+        self.data[self.index(coord)] = _OCCUPIED if occupied else _EMPTY
+
+    def is_occupied(self, coord: Coord) -> bool:
+        return self.data[self.index(coord)] != _EMPTY
+
+    def reset(self, coords: Iterable[Coord]) -> None:
+        self.data[:] = bytes(len(self.data))
+        for coord in coords:
+            self.data[self.index(coord)] = _OCCUPIED
+
+    def clear_levels(self, axis: int, levels: Iterable[int]) -> None:
+        """Drop ``levels`` along ``axis`` and shift lower-index levels up."""
+        cleared = set(levels)
+        if not cleared:
+            return
+        inner = self.strides[axis]
+        size = self.dims[axis]
+        block = size * inner
+        padding = bytes(len(cleared) * inner)
+        data = self.data
+        for base in range(0, len(data), block):
+            kept = b"".join(
+                data[base + level * inner : base + (level + 1) * inner]
+                for level in range(size)
+                if level not in cleared
+            )
+            data[base : base + block] = padding + kept
+
+
+__all__ = ["DenseOccupancyGrid"]
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from .piece_transform import (
+    BlocksND,
+    canonicalize_blocks_nd,
+    normalize_blocks_nd,
+    rotate_blocks_nd,
+    rotation_planes_nd,
+)
+
+RotationStep = tuple[int, int, int]
+
+_MAX_STATES = 240
+_MAX_3D_DEPTH = 8
+_MAX_4D_DEPTH = 7
+
+
+@dataclass(frozen=True)
+class OrientationGraph:
+    """
+    Capped breadth-first rotation graph of one start orientation.
+    ``nodes`` are canonical block sets in discovery order; ``edges[i]`` lists
+    the explored ``(step, node)`` moves out of node ``i``; ``parents`` is the
+    BFS tree used for shortest rotation paths; ``distinct`` indexes the first
+    node of each distinct shape (up to translation).
+    """
+
+    nodes: tuple[BlocksND, ...]
+    edges: tuple[tuple[tuple[RotationStep, int], ...], ...]
+    parents: tuple[tuple[int, RotationStep] | None, ...]
+    distinct: tuple[int, ...]
+    _index: dict[BlocksND, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        index = {blocks: position for position, blocks in enumerate(self.nodes)}
+        object.__setattr__(self, "_index", index)
+
+    @property
+    def start(self) -> BlocksND:
+        return self.nodes[0]
+
+    def orientations(self) -> tuple[BlocksND, ...]:
+        return tuple(self.nodes[index] for index in self.distinct)
+
+    def path_to(self, target: BlocksND) -> list[RotationStep]:
+        index = self._index.get(target)
+        if index is None:
+            return []
+        path: list[RotationStep] = []
+        link = self.parents[index]
+        while link is not None:
+            index, step = link
+            path.append(step)
+            link = self.parents[index]
+        path.reverse()
+        return path
+
+
+def build_orientation_graph(
+    start: BlocksND, ndim: int, gravity_axis: int
+) -> OrientationGraph:
+    planes = rotation_planes_nd(ndim, gravity_axis)
+    max_depth = _MAX_3D_DEPTH if ndim == 3 else _MAX_4D_DEPTH
+    nodes: list[BlocksND] = [start]
+    index_of: dict[BlocksND, int] = {start: 0}
+    depths = [0]
+    edges: list[list[tuple[RotationStep, int]]] = [[]]
+    parents: list[tuple[int, RotationStep] | None] = [None]
+    distinct = [0]
+    seen_shapes = {canonicalize_blocks_nd(normalize_blocks_nd(start))}
+    head = 0
+    while head < len(nodes) and len(nodes) < _MAX_STATES:
+        current = head
+        head += 1
+        if depths[current] >= max_depth:
+            continue
+        for axis_a, axis_b in planes:
+            for delta in (1, -1):
+                step = (axis_a, axis_b, delta)
+                rotated = canonicalize_blocks_nd(
+                    rotate_blocks_nd(
+                        nodes[current],
+                        axis_a=axis_a,
+                        axis_b=axis_b,
+                        quarter_turns=delta,
+                    )
+                )
+                known = index_of.get(rotated)
+                if known is not None:
+                    edges[current].append((step, known))
+                    continue
+                index_of[rotated] = len(nodes)
+                edges[current].append((step, len(nodes)))
+                nodes.append(rotated)
+                depths.append(depths[current] + 1)
+                edges.append([])
+                parents.append((current, step))
+                shape_key = canonicalize_blocks_nd(normalize_blocks_nd(rotated))
+                if shape_key not in seen_shapes:
+                    seen_shapes.add(shape_key)
+                    distinct.append(len(nodes) - 1)
+                if len(nodes) >= _MAX_STATES:
+                    break
+            if len(nodes) >= _MAX_STATES:
+                break
+    return OrientationGraph(
+        nodes=tuple(nodes),
+        edges=tuple(tuple(node_edges) for node_edges in edges),
+        parents=tuple(parents),
+        distinct=tuple(distinct),
+    )
+
+
+class OrientationTable:
+    """
+    Rotation graphs for one ``(ndim, gravity_axis)``, built once per start
+    orientation and then shared by every planner call and controller path.
+    """
+
+    __slots__ = ("_graphs", "gravity_axis", "ndim")
+
+    def __init__(self, ndim: int, gravity_axis: int) -> None:
+        self.ndim = ndim
+        self.gravity_axis = gravity_axis
+        self._graphs: dict[BlocksND, OrientationGraph] = {}
+
+    def __len__(self) -> int:
+        return len(self._graphs)
+
+    def graph(self, start: BlocksND) -> OrientationGraph:
+        graph = self._graphs.get(start)
+        if graph is None:
+            graph = build_orientation_graph(start, self.ndim, self.gravity_axis)
+            self._graphs[start] = graph
+        return graph
+
+    def prime(self, starts: tuple[BlocksND, ...]) -> None:
+        for start in starts:
+            self.graph(start)
+
+    def orientations(self, start: BlocksND) -> tuple[BlocksND, ...]:
+        return self.graph(start).orientations()
+
+    def rotation_path(self, start: BlocksND, target: BlocksND) -> list[RotationStep]:
+        if start == target:
+            return []
+        return self.graph(start).path_to(target)
+
+
+@lru_cache(maxsize=32)
+def orientation_table(ndim: int, gravity_axis: int) -> OrientationTable:
+    return OrientationTable(ndim, gravity_axis)
+
+
+__all__ = [
+    "OrientationGraph",
+    "OrientationTable",
+    "RotationStep",
+    "build_orientation_graph",
+    "orientation_table",
+]
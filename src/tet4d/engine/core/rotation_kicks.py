@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Sequence
+from functools import lru_cache
 from typing import TypeVar
 
 Coord = tuple[int, ...]
@@ -55,6 +56,25 @@ def kick_candidate_vectors(
     gravity_axis: int,
     plane_offsets: Sequence[PlaneOffset],
 ) -> tuple[Coord, ...]:
+    return _kick_candidate_vectors(
+        ndim,
+        axis_a,
+        axis_b,
+        gravity_axis,
+        tuple(tuple(int(value) for value in offset) for offset in plane_offsets),
+    )
+
+
+@lru_cache(maxsize=256)
+def _kick_candidate_vectors(
+    ndim: int,
+    axis_a: int,
+    axis_b: int,
+    gravity_axis: int,
+    plane_offsets: tuple[tuple[int, ...], ...],
+) -> tuple[Coord, ...]:
+    # Kick vectors depend only on the plane and the configured offsets, so
+    # each rotation plane is projected once per process.
     if not (0 <= gravity_axis < ndim):
         raise ValueError("gravity_axis out of bounds")
     candidates: list[Coord] = []
@@ -27,24 +27,13 @@ def full_levels(dims: Coord, cells: dict[Coord, int], gravity_axis: int) -> list
     return [level for level, count in enumerate(level_counts) if count == max_per_level]
 
 
-def clear_planes(
-    dims: Coord,
+def collapse_cleared_levels(
     cells: dict[Coord, int],
+    *,
+    axis_size: int,
     gravity_axis: int,
-) -> tuple[int, dict[Coord, int], list[int], list[tuple[Coord, int]]]:
-    n_dims = len(dims)
-    if not (0 <= gravity_axis < n_dims):
-        raise ValueError("Invalid gravity_axis")
-
-    if not cells:
-        return 0, {}, [], []
-
-    axis_size = dims[gravity_axis]
-    levels = full_levels(dims, cells, gravity_axis)
-    if not levels:
-        return 0, dict(cells), [], []
-
-    levels = sorted(set(levels))
+    levels: list[int],
+) -> tuple[dict[Coord, int], list[tuple[Coord, int]]]:
     full_set = set(levels)
     cleared_cells = [
         (coord, cell_id)
@@ -54,7 +43,7 @@ def clear_planes(
 
     shift = [0] * axis_size
     for g_val in range(axis_size):
-        shift[g_val] = sum(1 for lvl in levels if lvl > g_val)
+        shift[g_val] = sum(1 for lvl in full_set if lvl > g_val)
 
     new_cells: dict[Coord, int] = {}
     for coord, cell_id in cells.items():
@@ -68,7 +57,67 @@ def clear_planes(
         new_coord[gravity_axis] = new_g
         new_cells[tuple(new_coord)] = cell_id
 
+    return new_cells, cleared_cells
+
+
+def restore_cleared_levels(
+    cells: dict[Coord, int],
+    *,
+    axis_size: int,
+    gravity_axis: int,
+    levels: list[int],
+    cleared_cells: list[tuple[Coord, int]],
+) -> dict[Coord, int]:
+    """Inverse of ``collapse_cleared_levels``: the cells before the clear."""
+    full_set = set(levels)
+    source: dict[int, int] = {}
+    for g_val in range(axis_size):
+        if g_val not in full_set:
+            source[g_val + sum(1 for lvl in full_set if lvl > g_val)] = g_val
+
+    restored: dict[Coord, int] = {}
+    for coord, cell_id in cells.items():
+        g_val = coord[gravity_axis]
+        old_g = source.get(g_val, g_val)
+        if old_g == g_val:
+            restored[coord] = cell_id
+            continue
+        old_coord = list(coord)
+        old_coord[gravity_axis] = old_g
+        restored[tuple(old_coord)] = cell_id
+    restored.update(cleared_cells)
+    return restored
+
+
+def clear_planes(
+    dims: Coord,
+    cells: dict[Coord, int],
+    gravity_axis: int,
+) -> tuple[int, dict[Coord, int], list[int], list[tuple[Coord, int]]]:
+    n_dims = len(dims)
+    if not (0 <= gravity_axis < n_dims):
+        raise ValueError("Invalid gravity_axis")
+
+    if not cells:
+        return 0, {}, [], []
+
+    levels = full_levels(dims, cells, gravity_axis)
+    if not levels:
+        return 0, dict(cells), [], []
+
+    levels = sorted(set(levels))
+    new_cells, cleared_cells = collapse_cleared_levels(
+        cells,
+        axis_size=dims[gravity_axis],
+        gravity_axis=gravity_axis,
+        levels=levels,
+    )
     return len(levels), new_cells, list(levels), cleared_cells
 
 
-__all__ = ["clear_planes", "full_levels"]
+__all__ = [
+    "clear_planes",
+    "collapse_cleared_levels",
+    "full_levels",
+    "restore_cleared_levels",
+]
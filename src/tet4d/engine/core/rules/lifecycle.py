@@ -41,14 +41,20 @@ def run_hard_drop(
     state: Any,
     *,
     try_advance: Callable[[], bool],
+    try_land: Callable[[], bool] | None = None,
 ) -> None:
+    """
+    Drop and lock the current piece. ``try_land`` moves it to its resting
+    pose in one shot when it can; otherwise the drop steps ``try_advance``.
+    """
     if state.current_piece is None:
         return
     if state.config.exploration_mode:
         state.spawn_new_piece()
         return
-    while try_advance():
-        pass
+    if try_land is None or not try_land():
+        while try_advance():
+            pass
     lock_and_respawn(state)
 
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Mapping, Sequence
+from collections.abc import Callable, Container, Iterable, Mapping, Sequence
 from dataclasses import dataclass
 from typing import Generic, TypeVar
 
@@ -43,9 +43,11 @@ def build_candidate_piece_placement(
 
 def _occupied_coords(
     board_cells: Mapping[Sequence[int], object] | Iterable[Sequence[int]],
-) -> set[Coord]:
-    if isinstance(board_cells, Mapping):
-        return {_normalize_coord(coord) for coord in board_cells}
+) -> Container[Coord]:
+    if isinstance(board_cells, dict):
+        # Board dicts are already keyed by int tuples; probe them directly
+        # instead of rebuilding a set of every occupied cell per pose check.
+        return board_cells
     return {_normalize_coord(coord) for coord in board_cells}
 
 
@@ -10,7 +10,7 @@ from ..runtime.runtime_config import (
     assist_speed_formula,
     kick_default_level,
 )
-from ..runtime.score_analyzer import hud_analysis_lines
+from ..runtime.score_analyzer import ScoreAnalysis, hud_analysis_lines
 from .game2d import GameState
 from .game_nd import GameStateND
 from .leveling import compute_speed_level
@@ -116,8 +116,10 @@ def compute_speed_level_runtime(*args: Any, **kwargs: Any) -> int:
     return int(compute_speed_level(*args, **kwargs))
 
 
-def hud_analysis_lines_runtime(event: dict[str, object] | None) -> tuple[str, ...]:
-    return hud_analysis_lines(event)
+def hud_analysis_lines_runtime(
+    analysis: ScoreAnalysis | None,
+) -> tuple[str, ...]:
+    return hud_analysis_lines(analysis)
 
 
 def piece_pose_legal_gameplay(
@@ -3,6 +3,7 @@ import random
 from dataclasses import dataclass, field
 
 from ..core.model import Action, BoardND, GameConfig2DCoreView, GameState2DCoreView
+from ..core.model.board import BOARD_STORAGE_SPARSE, normalize_board_storage
 from ..core.rng import RNG_MODE_FIXED_SEED, normalize_rng_mode
 from ..core.rotation_kicks import resolve_and_commit_rotated_piece
 from ..core.rules.lifecycle import (
@@ -20,7 +21,7 @@ from ..runtime.runtime_config import (
     normalize_kick_level_name,
     rotation_kick_candidate_offsets,
 )
-from ..runtime.score_analyzer import new_analysis_session_id
+from ..runtime.score_analyzer import ScoreAnalysis, new_analysis_session_id
 from ..runtime.topology_playability_signal import resolve_rigid_play_enabled
 from ..topology_explorer import ExplorerTopologyProfile, MoveStep
 from ..topology_explorer.domain_validation import (
@@ -146,6 +147,7 @@ class GameConfig:
     explorer_rigid_play_enabled: bool | None = None
     rng_mode: str = RNG_MODE_FIXED_SEED
     rng_seed: int = 1337
+    board_storage: str = BOARD_STORAGE_SPARSE
 
     def __post_init__(self):
         self.width = require_non_negative_integral(self.width, "width")
@@ -232,6 +234,10 @@ class GameConfig:
             minimum=0,
             maximum=999_999_999,
         )
+        self.board_storage = normalize_board_storage(self.board_storage)
+
+    def new_board(self) -> BoardND:
+        return BoardND((self.width, self.height), storage=self.board_storage)
 
     def topology_policy(self) -> TopologyPolicy:
         return TopologyPolicy(
@@ -276,13 +282,13 @@ class GameState:
     analysis_grid_mode: str = "full"
     analysis_session_id: str = field(default_factory=new_analysis_session_id)
     analysis_seq: int = 0
-    last_score_analysis: dict[str, object] | None = None
+    last_score_analysis: ScoreAnalysis | None = None
     _pending_translation_animation: bool = field(default=False, init=False, repr=False)
 
     def __post_init__(self):
         self.topology_policy = self.config.topology_policy()
         if self.board is None:
-            self.board = BoardND((self.config.width, self.config.height))
+            self.board = self.config.new_board()
         if not self.next_bag:
             self._refill_bag()
         if self.current_piece is None:
@@ -558,6 +564,29 @@ class GameState:
             commit_piece=self._try_commit_candidate_piece,
         )
 
+    def landing_distance(self) -> int | None:
+        """
+        Rows the current piece can still fall, from one column-index query.
+        ``None`` when only stepping can tell (explorer or wrapping topologies).
+        """
+        if self.current_piece is None:
+            return None
+        if _uses_explorer_piece_transport_2d(self.config):
+            return None
+        if not self.topology_policy.fully_bounded:
+            return None
+        return self.board.landing_distance(
+            self.current_piece.cells(), self.config.gravity_axis
+        )
+
+    def _drop_to_landing(self) -> bool:
+        distance = None if self.game_over else self.landing_distance()
+        if distance is None:
+            return False
+        if distance:
+            self.current_piece = self.current_piece.moved(0, distance)
+        return True
+
     def hard_drop(self):
         run_hard_drop(
             self,
@@ -566,6 +595,7 @@ class GameState:
                 1,
                 intent=HARD_DROP_INTENT,
             ),
+            try_land=self._drop_to_landing,
         )
 
     def step_gravity(self) -> None:
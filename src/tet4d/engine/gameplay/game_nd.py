@@ -4,6 +4,7 @@ from collections.abc import Sequence
 from dataclasses import dataclass, field
 
 from ..core.model import BoardND, Coord, GameConfigNDCoreView, GameStateNDCoreView
+from ..core.model.board import BOARD_STORAGE_SPARSE, normalize_board_storage
 from ..core.rng import RNG_MODE_FIXED_SEED, normalize_rng_mode
 from ..core.rotation_kicks import resolve_and_commit_rotated_piece
 from ..core.rules.lifecycle import (
@@ -21,7 +22,7 @@ from ..runtime.runtime_config import (
     normalize_kick_level_name,
     rotation_kick_candidate_offsets,
 )
-from ..runtime.score_analyzer import new_analysis_session_id
+from ..runtime.score_analyzer import ScoreAnalysis, new_analysis_session_id
 from ..runtime.topology_playability_signal import resolve_rigid_play_enabled
 from ..topology_explorer import ExplorerTopologyProfile, MoveStep
 from ..topology_explorer.domain_validation import (
@@ -271,6 +272,7 @@ def _normalize_game_config_nd_named_fields(config) -> None:
     if config.piece_set_id is not None:
         config.piece_set_id = require_string(config.piece_set_id, "piece_set_id")
     config.piece_set_4d = require_string(config.piece_set_4d, "piece_set_4d")
+    config.board_storage = normalize_board_storage(config.board_storage)
 
 
 @dataclass
@@ -293,6 +295,7 @@ class GameConfigND:
     exploration_mode: bool = False
     rng_mode: str = RNG_MODE_FIXED_SEED
     rng_seed: int = 1337
+    board_storage: str = BOARD_STORAGE_SPARSE
 
     def __post_init__(self) -> None:
         _normalize_game_config_nd_scalars(self)
@@ -313,6 +316,9 @@ class GameConfigND:
     def ndim(self) -> int:
         return len(self.dims)
 
+    def new_board(self) -> BoardND:
+        return BoardND(self.dims, storage=self.board_storage)
+
     def topology_policy(self) -> TopologyPolicy:
         return TopologyPolicy(
             dims=self.dims,
@@ -355,7 +361,7 @@ class GameStateND:
     analysis_grid_mode: str = "full"
     analysis_session_id: str = field(default_factory=new_analysis_session_id)
     analysis_seq: int = 0
-    last_score_analysis: dict[str, object] | None = None
+    last_score_analysis: ScoreAnalysis | None = None
     _pending_translation_animation: bool = field(default=False, init=False, repr=False)
     _piece_frame_permutation: tuple[int, ...] = field(
         default=(), init=False, repr=False
@@ -365,7 +371,7 @@ class GameStateND:
     def __post_init__(self) -> None:
         self.topology_policy = self.config.topology_policy()
         if self.board is None:
-            self.board = BoardND(self.config.dims)
+            self.board = self.config.new_board()
         if self.board.dims != self.config.dims:
             raise ValueError("board dims must match config dims")
         self._reset_piece_frame()
@@ -707,6 +713,32 @@ class GameStateND:
             commit_piece=self._try_commit_candidate_piece,
         )
 
+    def landing_distance(self) -> int | None:
+        """
+        Gravity steps the current piece can still fall, from one column-index
+        query. ``None`` when only stepping can tell: explorer topologies
+        resolve seams per move and wrapping topologies remap falling cells.
+        """
+        if self.current_piece is None:
+            return None
+        if _uses_explorer_piece_transport_nd(self.config):
+            return None
+        if not self.topology_policy.fully_bounded:
+            return None
+        return self.board.landing_distance(
+            self.current_piece.cells(), self.config.gravity_axis
+        )
+
+    def _drop_to_landing(self) -> bool:
+        distance = None if self.game_over else self.landing_distance()
+        if distance is None:
+            return False
+        if distance:
+            vector = [0] * self.config.ndim
+            vector[self.config.gravity_axis] = distance
+            self.current_piece = self.current_piece.moved(vector)
+        return True
+
     def hard_drop(self) -> None:
         run_hard_drop(
             self,
@@ -715,6 +747,7 @@ class GameStateND:
                 1,
                 intent=HARD_DROP_INTENT,
             ),
+            try_land=self._drop_to_landing,
         )
 
     # --- Time step ---
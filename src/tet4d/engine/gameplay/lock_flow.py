@@ -5,8 +5,16 @@ from dataclasses import dataclass
 from typing import Any
 
 from ..core.model import BoardND, Coord
+from ..core.rules.board_rules import restore_cleared_levels
 from ..core.rules.locking import apply_lock_and_score
-from ..runtime.score_analyzer import analyze_lock_event, record_score_analysis_event
+from ..runtime.score_analyzer import (
+    LazyScoreAnalysis,
+    ScoreAnalysis,
+    analyze_lock_event,
+    record_score_analysis_event,
+    score_analysis_logged,
+    score_analysis_sampled,
+)
 from .scoring_bonus import plane_cell_count_for_dims, score_with_clear_bonuses
 
 
@@ -15,7 +23,7 @@ class LockFlowResult:
     cleared: int
     raw_points: int
     awarded_points: int
-    analysis: dict[str, object]
+    analysis: ScoreAnalysis | None
 
 
 def visible_locked_cells(
@@ -30,10 +38,86 @@ def has_cells_above_gravity(
     return any(coord[gravity_axis] < 0 for coord in mapped_cells)
 
 
+def _pre_lock_cells(
+    board: BoardND,
+    *,
+    locked_cells: Sequence[Coord],
+    gravity_axis: int,
+    cleared_levels: list[int],
+    cleared_cells: list[tuple[Coord, int]],
+) -> dict[Coord, int]:
+    if cleared_levels:
+        cells = restore_cleared_levels(
+            board.cells,
+            axis_size=board.dims[gravity_axis],
+            gravity_axis=gravity_axis,
+            levels=cleared_levels,
+            cleared_cells=cleared_cells,
+        )
+    else:
+        cells = dict(board.cells)
+    for coord in locked_cells:
+        cells.pop(coord, None)
+    return cells
+
+
+def _lazy_lock_analysis(
+    *,
+    board: BoardND,
+    dims: Coord,
+    gravity_axis: int,
+    locked_cells: tuple[Coord, ...],
+    cleared: int,
+    raw_points: int,
+    final_points: int,
+    board_pre_plane_counts: Sequence[int] | None,
+    board_pre_hash: int | None,
+    event_fields: dict[str, Any],
+) -> LazyScoreAnalysis:
+    """
+    Analysis of the lock just applied to ``board``, rebuilt from the live
+    board on first read: the pre-lock cells are the post-lock cells with the
+    clear undone and the piece lifted, so nothing is copied unless someone
+    reads it. It resolves to ``None`` once the board has changed again.
+    """
+    cleared_levels = board.last_cleared_levels
+    cleared_cells = board.last_cleared_cells
+    post_hash = board.zobrist_hash
+    post_count = len(board.cells)
+
+    def compute() -> dict[str, object] | None:
+        if board.zobrist_hash != post_hash or len(board.cells) != post_count:
+            return None
+        board_pre = _pre_lock_cells(
+            board,
+            locked_cells=locked_cells,
+            gravity_axis=gravity_axis,
+            cleared_levels=cleared_levels,
+            cleared_cells=cleared_cells,
+        )
+        return analyze_lock_event(
+            board_pre=board_pre,
+            board_post=board.cells,
+            dims=dims,
+            gravity_axis=gravity_axis,
+            locked_cells=locked_cells,
+            cleared=cleared,
+            raw_points=raw_points,
+            final_points=final_points,
+            board_pre_plane_counts=board_pre_plane_counts,
+            board_post_plane_counts=board.level_counts(gravity_axis),
+            board_pre_hash=board_pre_hash,
+            board_post_hash=post_hash,
+            post_board=board,
+            **event_fields,
+        )
+
+    return LazyScoreAnalysis(compute)
+
+
 def apply_lock_flow(
     *,
     board: BoardND,
-    board_pre: dict[Coord, int],
     dims: Coord,
     gravity_axis: int,
     visible_piece_cells: Sequence[Coord],
@@ -47,7 +131,14 @@ def apply_lock_flow(
     speed_level: int,
     session_id: str,
     seq: int,
+    board_pre_plane_counts: Sequence[int] | None = None,
+    board_pre_hash: int | None = None,
 ) -> LockFlowResult:
+    """
+    Lock, clear and score. Locks picked by the score-analyzer sampling get a
+    lazy analysis; it is resolved (and logged) right away only when logging
+    wants it, otherwise on first read by the HUD.
+    """
     lock_result = apply_lock_and_score(
         board=board,
         visible_piece_cells=visible_piece_cells,
@@ -66,24 +157,32 @@ def apply_lock_flow(
         board_cell_count_after_clear=len(board.cells),
         score_multiplier=score_multiplier,
     )
-    analysis = analyze_lock_event(
-        board_pre=board_pre,
-        board_post=dict(board.cells),
-        dims=dims,
-        gravity_axis=gravity_axis,
-        locked_cells=visible_piece_cells,
-        cleared=lock_result.cleared,
-        piece_id=piece_id,
-        actor_mode=actor_mode,
-        bot_mode=bot_mode,
-        grid_mode=grid_mode,
-        speed_level=speed_level,
-        raw_points=raw_points,
-        final_points=awarded_points,
-        session_id=session_id,
-        seq=seq,
-    )
-    record_score_analysis_event(analysis)
+    analysis = None
+    if score_analysis_sampled(seq):
+        analysis = _lazy_lock_analysis(
+            board=board,
+            dims=dims,
+            gravity_axis=gravity_axis,
+            locked_cells=tuple(visible_piece_cells),
+            cleared=lock_result.cleared,
+            raw_points=raw_points,
+            final_points=awarded_points,
+            board_pre_plane_counts=board_pre_plane_counts,
+            board_pre_hash=board_pre_hash,
+            event_fields={
+                "piece_id": piece_id,
+                "actor_mode": actor_mode,
+                "bot_mode": bot_mode,
+                "grid_mode": grid_mode,
+                "speed_level": speed_level,
+                "session_id": session_id,
+                "seq": seq,
+            },
+        )
+        if score_analysis_logged():
+            event = analysis.resolve()
+            if event is not None:
+                record_score_analysis_event(event)
     return LockFlowResult(
         cleared=lock_result.cleared,
         raw_points=raw_points,
@@ -106,7 +205,8 @@ def apply_current_piece_lock_flow(
     if piece is None:
         return 0
 
-    board_pre = dict(state.board.cells)
+    board_pre_plane_counts = state.board.level_counts(gravity_axis)
+    board_pre_hash = state.board.zobrist_hash
     visible_piece_cells = visible_locked_cells(
         mapped_cells,
         gravity_axis=gravity_axis,
@@ -117,7 +217,6 @@ def apply_current_piece_lock_flow(
     state.analysis_seq += 1
     lock_flow = apply_lock_flow(
         board=state.board,
-        board_pre=board_pre,
         dims=dims,
         gravity_axis=gravity_axis,
         visible_piece_cells=visible_piece_cells,
@@ -131,8 +230,11 @@ def apply_current_piece_lock_flow(
         speed_level=state.config.speed_level,
         session_id=state.analysis_session_id,
         seq=state.analysis_seq,
+        board_pre_plane_counts=board_pre_plane_counts,
+        board_pre_hash=board_pre_hash,
     )
     state.lines_cleared += lock_flow.cleared
     state.score += lock_flow.awarded_points
-    state.last_score_analysis = lock_flow.analysis
+    if lock_flow.analysis is not None:
+        state.last_score_analysis = lock_flow.analysis
     return lock_flow.cleared
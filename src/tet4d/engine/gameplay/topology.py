@@ -170,6 +170,11 @@ class TopologyPolicy:
             )
         object.__setattr__(self, "edge_rules", normalized_rules)
 
+    @property
+    def fully_bounded(self) -> bool:
+        """Every edge is bounded, so in-bounds cells map to themselves."""
+        return not self._wrap_axes()
+
     def _wrap_axes(self) -> tuple[int, ...]:
         assert self.edge_rules is not None
         return tuple(
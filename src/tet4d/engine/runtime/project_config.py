@@ -58,6 +58,7 @@ _DEFAULT_IO_PATHS = {
         "explorer_topology_profiles_file_default": "state/topology/explorer_profiles.json",
         "explorer_topology_preview_file_default": "state/topology/explorer_preview.json",
         "explorer_topology_preview_cache_dir": "state/topology/cache/explorer_preview",
+        "sfx_cache_dir": "state/audio/cache/sfx",
         "explorer_topology_experiments_file_default": "state/topology/explorer_experiments.json",
         "tutorial_progress_file_default": "state/tutorial/progress.json",
     },
@@ -129,6 +130,9 @@ _DEFAULT_CONSTANTS = {
             "collision_separation_bias": 1.0,
             "collision_max_relics": 96,
             "collision_velocity_sample_ms": 18.0,
+            "simulation_mode": "threaded",
+            "simulation_fixed_step_ms": 16.0,
+            "simulation_max_catch_up_steps": 8,
             "path_family_weights": {
                 "ellipse": 4,
                 "helix": 3,
@@ -239,6 +243,10 @@ _DEFAULT_CONSTANTS = {
             "3d": [4, 4, 4],
             "4d": [4, 4, 4, 4],
         },
+        "playability_scan": {
+            "workers": 0,
+            "parallel_min_pairs": 4096,
+        },
     },
 }
 
@@ -668,6 +676,23 @@ def explorer_topology_preview_cache_dir_path(*, root_dir: Path | None = None) ->
     )
 
 
+def sfx_cache_dir_relative() -> str:
+    return _path_value(
+        "sfx_cache_dir",
+        default_relative="state/audio/cache/sfx",
+        required_prefix=state_dir_relative(),
+    )
+
+
+def sfx_cache_dir_path(*, root_dir: Path | None = None) -> Path:
+    root = WRITABLE_ROOT if root_dir is None else root_dir
+    return _resolve_state_path_for_root(
+        sfx_cache_dir_relative(),
+        default_relative="state/audio/cache/sfx",
+        root_dir=root,
+    )
+
+
 def explorer_topology_experiments_file_default_relative() -> str:
     return _path_value(
         "explorer_topology_experiments_file_default",
@@ -261,6 +261,20 @@ def playbot_deadline_safety_ms() -> float:
     return float(_playbot_policy()["adaptive_fallback"]["deadline_safety_ms"])
 
 
+def playbot_parallel_lookahead_policy() -> tuple[bool, int, int]:
+    parallel = _playbot_policy()["parallel_lookahead"]
+    return (
+        bool(parallel["enabled"]),
+        int(parallel["max_workers"]),
+        int(parallel["min_candidates"]),
+    )
+
+
+def playbot_transposition_policy() -> tuple[bool, int]:
+    table = _playbot_policy()["transposition"]
+    return bool(table["enabled"]), int(table["max_entries"])
+
+
 def playbot_auto_algorithm_policy_for_ndim(
     ndim: int,
 ) -> tuple[float, float, float, float]:
@@ -299,6 +313,10 @@ def playbot_default_hard_drop_after_soft_drops() -> int:
     return int(_playbot_policy()["controller"]["hard_drop_after_soft_drops"])
 
 
+def playbot_background_planning_enabled() -> bool:
+    return bool(_playbot_policy()["controller"]["background_planning"])
+
+
 def playbot_learning_mode_policy() -> tuple[bool, int, float, float]:
     learning = _playbot_policy()["learning_mode"]
     return (
@@ -324,3 +342,13 @@ def audio_event_specs() -> dict[str, tuple[float, int, float]]:
             float(spec["amplitude"]),
         )
     return specs
+
+
+def audio_event_voice_limits() -> dict[str, int]:
+    """Concurrent-play caps for events that set ``max_voices``."""
+    events = _audio_sfx()["events"]
+    return {
+        event_name: int(spec["max_voices"])
+        for event_name, spec in events.items()
+        if "max_voices" in spec
+    }
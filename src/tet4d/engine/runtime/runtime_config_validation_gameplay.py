@@ -23,7 +23,7 @@ def validate_audio_sfx_payload(payload: dict[str, Any]) -> dict[str, Any]:
         if not isinstance(event_name, str) or not event_name.strip():
             raise RuntimeError("audio.events keys must be non-empty strings")
         spec = require_object(raw_spec, path=f"audio.events.{event_name}")
-        events[event_name] = {
+        validated_spec: dict[str, float | int] = {
             "frequency_hz": require_number(
                 spec.get("frequency_hz"),
                 path=f"audio.events.{event_name}.frequency_hz",
@@ -41,6 +41,13 @@ def validate_audio_sfx_payload(payload: dict[str, Any]) -> dict[str, Any]:
                 max_value=1.0,
             ),
         }
+        if "max_voices" in spec:
+            validated_spec["max_voices"] = require_int(
+                spec.get("max_voices"),
+                path=f"audio.events.{event_name}.max_voices",
+                min_value=1,
+            )
+        events[event_name] = validated_spec
     return {"version": payload["version"], "events": events}
 
 
@@ -248,6 +248,42 @@ def _validate_adaptive_fallback(raw_adaptive: object) -> dict[str, Any]:
     }
 
 
+def _validate_parallel_lookahead(raw_parallel: object) -> dict[str, Any]:
+    parallel_obj = require_object(raw_parallel, path="playbot.parallel_lookahead")
+    enabled = parallel_obj.get("enabled")
+    if not isinstance(enabled, bool):
+        raise RuntimeError("playbot.parallel_lookahead.enabled must be a boolean")  # noqa: TRY004 - preserve the established validation contract.
+    return {
+        "enabled": enabled,
+        # 0 sizes the pool from the machine: one worker per spare core.
+        "max_workers": require_int(
+            parallel_obj.get("max_workers"),
+            path="playbot.parallel_lookahead.max_workers",
+            min_value=0,
+        ),
+        "min_candidates": require_int(
+            parallel_obj.get("min_candidates"),
+            path="playbot.parallel_lookahead.min_candidates",
+            min_value=1,
+        ),
+    }
+
+
+def _validate_transposition(raw_transposition: object) -> dict[str, Any]:
+    table_obj = require_object(raw_transposition, path="playbot.transposition")
+    enabled = table_obj.get("enabled")
+    if not isinstance(enabled, bool):
+        raise RuntimeError("playbot.transposition.enabled must be a boolean")  # noqa: TRY004 - preserve the established validation contract.
+    return {
+        "enabled": enabled,
+        "max_entries": require_int(
+            table_obj.get("max_entries"),
+            path="playbot.transposition.max_entries",
+            min_value=1,
+        ),
+    }
+
+
 def _validate_auto_algorithm(raw_auto: object) -> dict[str, Any]:
     auto_obj = require_object(raw_auto, path="playbot.auto_algorithm")
     greedy_bias_obj = require_object(
@@ -318,14 +354,18 @@ def _validate_benchmark(raw_benchmark: object) -> dict[str, Any]:
     }
 
 
-def _validate_controller(raw_controller: object) -> dict[str, int]:
+def _validate_controller(raw_controller: object) -> dict[str, Any]:
     controller_obj = require_object(raw_controller, path="playbot.controller")
+    background_planning = controller_obj.get("background_planning")
+    if not isinstance(background_planning, bool):
+        raise RuntimeError("playbot.controller.background_planning must be a boolean")  # noqa: TRY004 - preserve the established validation contract.
     return {
         "hard_drop_after_soft_drops": require_int(
             controller_obj.get("hard_drop_after_soft_drops"),
             path="playbot.controller.hard_drop_after_soft_drops",
             min_value=0,
         ),
+        "background_planning": background_planning,
     }
 
 
@@ -386,6 +426,8 @@ def validate_playbot_policy_payload(payload: dict[str, Any]) -> dict[str, Any]:
     clamp = _validate_clamp(payload.get("clamp"))
     lookahead = _validate_lookahead(payload.get("lookahead"))
     adaptive_fallback = _validate_adaptive_fallback(payload.get("adaptive_fallback"))
+    parallel_lookahead = _validate_parallel_lookahead(payload.get("parallel_lookahead"))
+    transposition = _validate_transposition(payload.get("transposition"))
     auto_algorithm = _validate_auto_algorithm(payload.get("auto_algorithm"))
     benchmark = _validate_benchmark(payload.get("benchmark"))
     controller = _validate_controller(payload.get("controller"))
@@ -399,6 +441,8 @@ def validate_playbot_policy_payload(payload: dict[str, Any]) -> dict[str, Any]:
         "clamp": clamp,
         "lookahead": lookahead,
         "adaptive_fallback": adaptive_fallback,
+        "parallel_lookahead": parallel_lookahead,
+        "transposition": transposition,
         "auto_algorithm": auto_algorithm,
         "benchmark": benchmark,
         "controller": controller,
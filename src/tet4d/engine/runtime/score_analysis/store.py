@@ -24,6 +24,13 @@ def default_config(config_path: Path) -> dict[str, Any]:
             "enabled": False,
             "events_file": "state/analytics/score_events.jsonl",
             "summary_file": "state/analytics/score_summary.json",
+            "batch_events": 64,
+            "flush_interval_ms": 250,
+            "queue_capacity": 4096,
+        },
+        "sampling": {
+            "mode": "every_lock",
+            "every_nth": 4,
         },
         "scores": {
             "board_health": {"bias": 0.62, "weights": {}},
@@ -53,10 +60,12 @@ def atomic_write_summary_json(path: Path, payload: dict[str, Any]) -> None:
     temp_path.replace(path)
 
 
-def append_json_line(path: Path, payload: dict[str, Any]) -> None:
+def append_json_lines(path: Path, payloads: list[dict[str, Any]]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("a", encoding="utf-8") as handle:
-        handle.write(json.dumps(payload, sort_keys=True) + "\n")
+        handle.write(
+            "".join(json.dumps(payload, sort_keys=True) + "\n" for payload in payloads)
+        )
 
 
 def load_summary(
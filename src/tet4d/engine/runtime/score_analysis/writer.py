@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from .store import append_json_lines, atomic_write_summary_json
+
+SummaryUpdate = Callable[[Path, list[dict[str, object]]], dict[str, object]]
+SummaryCommit = Callable[[Path, dict[str, object]], None]
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ScoreEventRecord:
+    events_path: Path
+    summary_path: Path
+    event: dict[str, object]
+
+
+class ScoreAnalysisWriter:
+    """
+    Background sink for score-analysis events.
+    ``submit`` appends to a bounded buffer (blocking when it is full); one
+    worker appends event lines once per ``batch_events`` events or
+    ``flush_interval_ms`` after a partial batch starts waiting, whichever
+    comes first. Each touched summary is rebuilt once per batch through
+    ``update_summary``, written, and only then handed to ``commit_summary``.
+    A failing batch is logged once and dropped; the worker keeps running.
+    """
+
+    def __init__(
+        self,
+        *,
+        update_summary: SummaryUpdate,
+        batch_events: int,
+        flush_interval_ms: int,
+        queue_capacity: int,
+        commit_summary: SummaryCommit | None = None,
+    ) -> None:
+        self.batch_events = max(1, int(batch_events))
+        self.flush_interval_ms = max(0, int(flush_interval_ms))
+        self._update_summary = update_summary
+        self._commit_summary = commit_summary
+        self._capacity = max(1, int(queue_capacity))
+        self._condition = threading.Condition()
+        self._records: list[ScoreEventRecord] = []
+        self._flush_waiters: list[threading.Event] = []
+        self._stopping = False
+        self._failure_logged = False
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def submit(self, record: ScoreEventRecord) -> None:
+        self._ensure_started()
+        with self._condition:
+            self._condition.wait_for(lambda: len(self._records) < self._capacity)
+            self._records.append(record)
+            self._condition.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Write everything submitted so far; False if ``timeout`` expired."""
+        if not self.running:
+            return True
+        done = threading.Event()
+        with self._condition:
+            self._flush_waiters.append(done)
+            self._condition.notify_all()
+        return done.wait(timeout)
+
+    def close(self) -> None:
+        with self._condition:
+            thread = self._thread
+            if thread is None:
+                return
+            self._thread = None
+            self._stopping = True
+            self._condition.notify_all()
+        atexit.unregister(self.close)
+        thread.join()
+        with self._condition:
+            self._stopping = False
+
+    def _ensure_started(self) -> None:
+        with self._condition:
+            if self.running:
+                return
+            self._thread = threading.Thread(
+                target=self._run,
+                name="tet4d-score-analysis-writer",
+                daemon=True,
+            )
+            self._thread.start()
+        atexit.register(self.close)
+
+    def _batch_ready(self) -> bool:
+        return (
+            len(self._records) >= self.batch_events
+            or bool(self._flush_waiters)
+            or self._stopping
+        )
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._records or self._batch_ready())
+                if not self._batch_ready():
+                    self._condition.wait_for(
+                        self._batch_ready, self.flush_interval_ms / 1000.0
+                    )
+                batch = self._records[: self.batch_events]
+                del self._records[: self.batch_events]
+                waiters: list[threading.Event] = []
+                if not self._records:
+                    waiters, self._flush_waiters = self._flush_waiters, []
+                stopping = self._stopping and not self._records
+                self._condition.notify_all()
+            if batch:
+                self._write_batch_guarded(batch)
+            for waiter in waiters:
+                waiter.set()
+            if stopping:
+                return
+
+    def _write_batch_guarded(self, records: list[ScoreEventRecord]) -> None:
+        try:
+            self._write_batch(records)
+        except Exception:
+            if not self._failure_logged:
+                self._failure_logged = True
+                logger.exception("score analysis writer dropped a batch")
+
+    def _write_batch(self, records: list[ScoreEventRecord]) -> None:
+        by_events_path: dict[Path, list[ScoreEventRecord]] = {}
+        for record in records:
+            by_events_path.setdefault(record.events_path, []).append(record)
+        by_summary_path: dict[Path, list[dict[str, object]]] = {}
+        for events_path, batch in by_events_path.items():
+            try:
+                append_json_lines(events_path, [record.event for record in batch])
+            except OSError:
+                continue
+            for record in batch:
+                by_summary_path.setdefault(record.summary_path, []).append(record.event)
+        for summary_path, events in by_summary_path.items():
+            try:
+                summary = self._update_summary(summary_path, events)
+                atomic_write_summary_json(summary_path, summary)
+            except OSError:
+                continue
+            if self._commit_summary is not None:
+                self._commit_summary(summary_path, summary)
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import threading
 import uuid
+from collections.abc import Callable, Sequence
 from copy import deepcopy
 from datetime import UTC, datetime
 from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+from ..core.model import BoardND
 from .project_config import (
     PROJECT_ROOT,
     resolve_state_relative_path,
@@ -14,12 +17,6 @@ from .project_config import (
     score_events_file_default_relative,
     score_summary_file_default_relative,
 )
-from .score_analysis.store import (
-    append_json_line as _append_json_line,
-)
-from .score_analysis.store import (
-    atomic_write_summary_json as _atomic_write_summary_json,
-)
 from .score_analysis.store import (
     default_config as _default_config_from_store,
 )
@@ -33,9 +30,11 @@ from .score_analysis.validate import (
     validate_score_analysis_event,
     validate_score_analysis_summary,
 )
+from .score_analysis.writer import ScoreAnalysisWriter, ScoreEventRecord
 from .score_analyzer_features import (
     board_health_features,
     placement_features,
+    tracked_board_health_features,
     weighted_score,
 )
 
@@ -45,6 +44,12 @@ _DEFAULT_EVENTS_PATH = score_events_file_default_relative()
 _DEFAULT_SUMMARY_PATH = score_summary_file_default_relative()
 _LOGGING_ENABLED_OVERRIDE: bool | None = None
 _SUMMARY_CACHE: dict[str, dict[str, object]] = {}
+# Summaries are updated on the writer thread and read by snapshots.
+_SUMMARY_LOCK = threading.Lock()
+_WRITER: ScoreAnalysisWriter | None = None
+_FLUSH_TIMEOUT_S = 5.0
+# One lock's post board is the next lock's pre board; keyed by board hash.
+_LAST_BOARD_FEATURES: tuple[tuple[object, ...], dict[str, float]] | None = None
 
 
 def new_analysis_session_id() -> str:
@@ -73,9 +78,14 @@ def reload_score_analyzer_config() -> None:
 
 
 def reset_score_analyzer_runtime_state() -> None:
-    global _LOGGING_ENABLED_OVERRIDE
+    global _LOGGING_ENABLED_OVERRIDE, _LAST_BOARD_FEATURES, _WRITER
+    if _WRITER is not None:
+        _WRITER.close()
+        _WRITER = None
     _LOGGING_ENABLED_OVERRIDE = None
-    _SUMMARY_CACHE.clear()
+    _LAST_BOARD_FEATURES = None
+    with _SUMMARY_LOCK:
+        _SUMMARY_CACHE.clear()
     reload_score_analyzer_config()
 
 
@@ -87,6 +97,20 @@ def _resolve_output_path(raw_path: object, default_relative: str) -> Path:
     return resolve_state_relative_path(raw_path, default_relative=default_relative)
 
 
+_DEFAULT_WRITER_SETTINGS: dict[str, int] = {
+    "batch_events": 64,
+    "flush_interval_ms": 250,
+    "queue_capacity": 4096,
+}
+
+
+def _writer_setting(logging_obj: dict[str, object], key: str) -> int:
+    value = logging_obj.get(key)
+    if isinstance(value, int) and not isinstance(value, bool) and value >= 0:
+        return value
+    return _DEFAULT_WRITER_SETTINGS[key]
+
+
 def _logging_config() -> dict[str, object]:
     cfg = _score_analyzer_config()
     logging_obj = cfg.get("logging", {})
@@ -95,6 +119,7 @@ def _logging_config() -> dict[str, object]:
             "enabled": False,
             "events_file": _DEFAULT_EVENTS_PATH,
             "summary_file": _DEFAULT_SUMMARY_PATH,
+            **_DEFAULT_WRITER_SETTINGS,
         }
     return {
         "enabled": bool(logging_obj.get("enabled", False)),
@@ -106,6 +131,7 @@ def _logging_config() -> dict[str, object]:
             logging_obj.get("summary_file"),
             _DEFAULT_SUMMARY_PATH,
         ),
+        **{key: _writer_setting(logging_obj, key) for key in _DEFAULT_WRITER_SETTINGS},
     }
 
 
@@ -125,6 +151,118 @@ def score_analyzer_logging_enabled() -> bool:
     return bool(_LOGGING_ENABLED_OVERRIDE)
 
 
+SCORE_ANALYSIS_EVERY_LOCK = "every_lock"
+SCORE_ANALYSIS_EVERY_NTH = "every_nth"
+SCORE_ANALYSIS_HUD_ONLY = "hud_only"
+_SAMPLING_MODES = (
+    SCORE_ANALYSIS_EVERY_LOCK,
+    SCORE_ANALYSIS_EVERY_NTH,
+    SCORE_ANALYSIS_HUD_ONLY,
+)
+
+
+def score_analysis_sampling() -> tuple[str, int]:
+    """(mode, every_nth) from the ``sampling`` config block."""
+    sampling_obj = _score_analyzer_config().get("sampling", {})
+    if not isinstance(sampling_obj, dict):
+        return SCORE_ANALYSIS_EVERY_LOCK, 1
+    mode = sampling_obj.get("mode", SCORE_ANALYSIS_EVERY_LOCK)
+    if mode not in _SAMPLING_MODES:
+        mode = SCORE_ANALYSIS_EVERY_LOCK
+    every_nth = sampling_obj.get("every_nth", 1)
+    if not isinstance(every_nth, int) or isinstance(every_nth, bool):
+        every_nth = 1
+    return str(mode), max(1, every_nth)
+
+
+def score_analysis_sampled(seq: int) -> bool:
+    """Whether lock ``seq`` gets an analysis at all."""
+    mode, every_nth = score_analysis_sampling()
+    if mode == SCORE_ANALYSIS_EVERY_NTH:
+        return int(seq) % every_nth == 0
+    return True
+
+
+def score_analysis_logged() -> bool:
+    """Whether sampled locks are analyzed eagerly and written to the log."""
+    mode, _every_nth = score_analysis_sampling()
+    return mode != SCORE_ANALYSIS_HUD_ONLY and score_analyzer_logging_enabled()
+
+
+class LazyScoreAnalysis:
+    """
+    A lock's analysis event, computed by ``compute`` on the first
+    ``resolve``. ``compute`` returns ``None`` when its source board has
+    moved on before anyone read the analysis.
+    """
+
+    __slots__ = ("_compute", "_event")
+
+    def __init__(self, compute: Callable[[], dict[str, object] | None]) -> None:
+        self._compute: Callable[[], dict[str, object] | None] | None = compute
+        self._event: dict[str, object] | None = None
+
+    @property
+    def resolved(self) -> bool:
+        return self._compute is None
+
+    def resolve(self) -> dict[str, object] | None:
+        compute = self._compute
+        if compute is not None:
+            self._compute = None
+            self._event = compute()
+        return self._event
+
+
+ScoreAnalysis = dict[str, object] | LazyScoreAnalysis
+
+
+def resolve_score_analysis(
+    analysis: ScoreAnalysis | None,
+) -> dict[str, object] | None:
+    if isinstance(analysis, LazyScoreAnalysis):
+        return analysis.resolve()
+    return analysis
+
+
+def _board_features_by_hash(
+    cells: dict[tuple[int, ...], int],
+    *,
+    board_hash: int | None,
+    dims: tuple[int, ...],
+    gravity_axis: int,
+    near_threshold: float,
+    top_layers: int,
+    plane_counts: Sequence[int] | None,
+    board: BoardND | None = None,
+) -> dict[str, float]:
+    global _LAST_BOARD_FEATURES
+    key = None
+    if board_hash is not None:
+        key = (board_hash, len(cells), dims, gravity_axis, near_threshold, top_layers)
+        if _LAST_BOARD_FEATURES is not None and _LAST_BOARD_FEATURES[0] == key:
+            return dict(_LAST_BOARD_FEATURES[1])
+    if board is not None:
+        features = tracked_board_health_features(
+            board,
+            gravity_axis=gravity_axis,
+            near_threshold=near_threshold,
+            top_layers=top_layers,
+        )
+    else:
+        features = board_health_features(
+            cells,
+            dims=dims,
+            gravity_axis=gravity_axis,
+            near_threshold=near_threshold,
+            top_layers=top_layers,
+            plane_counts=plane_counts,
+        )
+    if key is not None:
+        _LAST_BOARD_FEATURES = (key, dict(features))
+    return features
+
+
 def analyze_lock_event(
     *,
     board_pre: dict[tuple[int, ...], int],
@@ -142,7 +280,17 @@ def analyze_lock_event(
     final_points: int,
     session_id: str,
     seq: int,
+    board_pre_plane_counts: Sequence[int] | None = None,
+    board_post_plane_counts: Sequence[int] | None = None,
+    board_pre_hash: int | None = None,
+    board_post_hash: int | None = None,
+    post_board: BoardND | None = None,
 ) -> dict[str, object]:
+    """
+    Score one lock. ``post_board`` (the live board holding ``board_post``)
+    serves post-lock health from its incremental tracker; pre-lock health
+    is normally the previous lock's post features, matched by board hash.
+    """
     cfg = _score_analyzer_config()
     board_obj = cfg.get("board", {})
     near_threshold = (
@@ -154,19 +302,24 @@ def analyze_lock_event(
         int(board_obj.get("top_zone_layers", 3)) if isinstance(board_obj, dict) else 3
     )
 
-    board_pre_features = board_health_features(
+    board_pre_features = _board_features_by_hash(
         board_pre,
+        board_hash=board_pre_hash,
         dims=dims,
         gravity_axis=gravity_axis,
         near_threshold=near_threshold,
         top_layers=top_layers,
+        plane_counts=board_pre_plane_counts,
     )
-    board_post_features = board_health_features(
+    board_post_features = _board_features_by_hash(
         board_post,
+        board_hash=board_post_hash,
         dims=dims,
         gravity_axis=gravity_axis,
         near_threshold=near_threshold,
         top_layers=top_layers,
+        plane_counts=board_post_plane_counts,
+        board=post_board,
     )
     placement = placement_features(
         board_pre=board_pre,
@@ -252,10 +405,6 @@ def _load_summary(path: Path) -> dict[str, object]:
     )
 
 
-def _atomic_write_json(path: Path, payload: dict[str, object]) -> None:
-    _atomic_write_summary_json(path, payload)
-
-
 def _increment_counter(target: dict[str, object], key: str, amount: int = 1) -> None:
     current = target.get(key, 0)
     count = (
@@ -332,19 +481,60 @@ def _update_summary(
 
 
 def score_analysis_summary_snapshot() -> dict[str, object]:
+    flush_score_analysis_events()
     logging_cfg = _logging_config()
     raw_summary = str(logging_cfg.get("summary_file", _DEFAULT_SUMMARY_PATH))
     summary_path = _resolve_output_path(raw_summary, _DEFAULT_SUMMARY_PATH)
     cache_key = str(summary_path)
-    summary = _SUMMARY_CACHE.get(cache_key)
-    if summary is not None:
+    with _SUMMARY_LOCK:
+        summary = _SUMMARY_CACHE.get(cache_key)
+        if summary is None:
+            summary = _load_summary(summary_path)
+            _SUMMARY_CACHE[cache_key] = summary
         return deepcopy(summary)
-    loaded = _load_summary(summary_path)
-    _SUMMARY_CACHE[cache_key] = loaded
-    return deepcopy(loaded)
+
+
+def _apply_summary_events(
+    summary_path: Path, events: list[dict[str, object]]
+) -> dict[str, object]:
+    with _SUMMARY_LOCK:
+        cached = _SUMMARY_CACHE.get(str(summary_path))
+    summary = _load_summary(summary_path) if cached is None else deepcopy(cached)
+    for event in events:
+        summary = _update_summary(summary, event)
+    return summary
+
+
+def _commit_summary(summary_path: Path, summary: dict[str, object]) -> None:
+    with _SUMMARY_LOCK:
+        _SUMMARY_CACHE[str(summary_path)] = summary
+
+
+def _score_analysis_writer() -> ScoreAnalysisWriter:
+    global _WRITER
+    if _WRITER is None:
+        logging_cfg = _logging_config()
+        _WRITER = ScoreAnalysisWriter(
+            update_summary=_apply_summary_events,
+            commit_summary=_commit_summary,
+            batch_events=int(logging_cfg["batch_events"]),
+            flush_interval_ms=int(logging_cfg["flush_interval_ms"]),
+            queue_capacity=int(logging_cfg["queue_capacity"]),
+        )
+    return _WRITER
+
+
+def flush_score_analysis_events() -> None:
+    """Block until queued events and summaries are on disk (exit, pause)."""
+    if _WRITER is not None:
+        _WRITER.flush(timeout=_FLUSH_TIMEOUT_S)
 
 
 def record_score_analysis_event(event: dict[str, object]) -> None:
+    """
+    Queue one event for the background writer, which appends event lines
+    in batches and coalesces summary rewrites.
+    """
     valid, _msg = validate_score_analysis_event(event)
     if not valid:
         return
@@ -354,27 +544,17 @@ def record_score_analysis_event(event: dict[str, object]) -> None:
     logging_cfg = _logging_config()
     raw_events = str(logging_cfg.get("events_file", _DEFAULT_EVENTS_PATH))
     raw_summary = str(logging_cfg.get("summary_file", _DEFAULT_SUMMARY_PATH))
-    events_path = _resolve_output_path(raw_events, _DEFAULT_EVENTS_PATH)
-    summary_path = _resolve_output_path(raw_summary, _DEFAULT_SUMMARY_PATH)
-    summary_cache_key = str(summary_path)
-
-    try:
-        _append_json_line(events_path, event)
-    except OSError:
-        return
-
-    try:
-        summary = _SUMMARY_CACHE.get(summary_cache_key)
-        if summary is None:
-            summary = _load_summary(summary_path)
-        updated = _update_summary(summary, event)
-        _atomic_write_json(summary_path, updated)
-        _SUMMARY_CACHE[summary_cache_key] = updated
-    except OSError:
-        return
+    _score_analysis_writer().submit(
+        ScoreEventRecord(
+            events_path=_resolve_output_path(raw_events, _DEFAULT_EVENTS_PATH),
+            summary_path=_resolve_output_path(raw_summary, _DEFAULT_SUMMARY_PATH),
+            event=event,
+        )
+    )
 
 
-def hud_analysis_lines(event: dict[str, object] | None) -> tuple[str, ...]:
+def hud_analysis_lines(analysis: ScoreAnalysis | None) -> tuple[str, ...]:
+    event = resolve_score_analysis(analysis)
     if not isinstance(event, dict):
         return ()
     raw_quality = event.get("placement_quality_score")
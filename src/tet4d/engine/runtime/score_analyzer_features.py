@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import math
+from collections.abc import Sequence
 from itertools import product
 from statistics import pstdev
 from typing import Any
 
+from tet4d.engine.core.model import BoardND
 from tet4d.shared.nd_coords import coord_from_column
 
 
@@ -68,12 +70,13 @@ def _top_columns_and_plane_counts(
     lateral_axes: tuple[int, ...],
     gravity_axis: int,
     gravity_size: int,
+    count_planes: bool = True,
 ) -> tuple[dict[tuple[int, ...], int], list[int]]:
     top_per_column: dict[tuple[int, ...], int] = {}
     plane_counts = [0] * gravity_size
     for coord in cells:
         g_val = coord[gravity_axis]
-        if 0 <= g_val < gravity_size:
+        if count_planes and 0 <= g_val < gravity_size:
             plane_counts[g_val] += 1
         column = tuple(coord[axis] for axis in lateral_axes)
         prev = top_per_column.get(column)
@@ -119,13 +122,12 @@ def _height_hole_features(
     return heights, holes_count, holes_depth_weighted
 
 
-def _surface_roughness_norm(
+def _surface_roughness(
     heights: dict[tuple[int, ...], int],
     *,
     dims: tuple[int, ...],
     lateral_axes: tuple[int, ...],
-    gravity_size: int,
-) -> float:
+) -> tuple[float, int]:
     roughness = 0.0
     roughness_edges = 0
     for column, value in heights.items():
@@ -138,13 +140,11 @@ def _surface_roughness_norm(
             column_list[axis_idx] -= 1
             roughness += abs(value - heights.get(neighbor, 0))
             roughness_edges += 1
-    if roughness_edges == 0:
-        return 0.0
-    return _clamp01(roughness / (roughness_edges * gravity_size))
+    return roughness, roughness_edges
 
 
 def _completion_ratios(
-    plane_counts: list[int],
+    plane_counts: Sequence[int],
     *,
     gravity_size: int,
     plane_size: int,
@@ -164,24 +164,19 @@ def _completion_ratios(
 
 
 def _top_zone_risk_norm(
-    cells: set[tuple[int, ...]],
+    top_count: int,
     *,
-    gravity_axis: int,
     gravity_size: int,
     plane_size: int,
     top_layers: int,
 ) -> float:
     safe_top_layers = max(1, min(gravity_size, top_layers))
-    top_count = sum(1 for coord in cells if coord[gravity_axis] < safe_top_layers)
     return _clamp01(top_count / max(1, safe_top_layers * plane_size))
 
 
-def _slice_balance_norm(cells: set[tuple[int, ...]], dims: tuple[int, ...]) -> float:
-    if len(dims) < 4 or dims[3] <= 1:
+def _slice_balance_norm(per_w: Sequence[int]) -> float:
+    if len(per_w) <= 1:
         return 1.0
-    per_w = [0] * dims[3]
-    for coord in cells:
-        per_w[coord[3]] += 1
     mean_w = sum(per_w) / len(per_w)
     if mean_w <= 0:
         return 1.0
@@ -189,46 +184,44 @@ def _slice_balance_norm(cells: set[tuple[int, ...]], dims: tuple[int, ...]) -> f
     return _clamp01(1.0 - coeff_var)
 
 
-def board_health_features(
-    cells_map: dict[tuple[int, ...], int],
+def _slice_counts(cells: set[tuple[int, ...]], dims: tuple[int, ...]) -> list[int]:
+    if len(dims) < 4:
+        return []
+    per_w = [0] * dims[3]
+    for coord in cells:
+        per_w[coord[3]] += 1
+    return per_w
+
+
+def _assemble_board_health(
     *,
     dims: tuple[int, ...],
     gravity_axis: int,
-    near_threshold: float = 0.8,
-    top_layers: int = 3,
+    near_threshold: float,
+    top_layers: int,
+    occupied_count: int,
+    column_count: int,
+    height_sum: int,
+    max_height: int,
+    roughness: float,
+    roughness_edges: int,
+    holes_count: int,
+    holes_depth_weighted: float,
+    plane_counts: Sequence[int],
+    components: int,
+    slice_counts: Sequence[int],
 ) -> dict[str, float]:
     total_cells = max(1, math.prod(max(1, axis) for axis in dims))
     gravity_size = max(1, dims[gravity_axis])
     plane_size = _plane_size(dims, gravity_axis)
-    lateral_axes = _lateral_axes(dims, gravity_axis)
 
-    cells = set(cells_map.keys())
-    occupied_count = len(cells)
     occupied_ratio = occupied_count / total_cells
-
-    top_per_column, plane_counts = _top_columns_and_plane_counts(
-        cells,
-        lateral_axes=lateral_axes,
-        gravity_axis=gravity_axis,
-        gravity_size=gravity_size,
-    )
-    heights, holes_count, holes_depth_weighted = _height_hole_features(
-        cells,
-        dims=dims,
-        gravity_axis=gravity_axis,
-        gravity_size=gravity_size,
-        lateral_axes=lateral_axes,
-        top_per_column=top_per_column,
-    )
-
-    max_height_norm = max(heights.values(), default=0) / gravity_size
-    mean_height_norm = (sum(heights.values()) / max(1, len(heights))) / gravity_size
-
-    surface_roughness_norm = _surface_roughness_norm(
-        heights,
-        dims=dims,
-        lateral_axes=lateral_axes,
-        gravity_size=gravity_size,
+    max_height_norm = max_height / gravity_size
+    mean_height_norm = (height_sum / max(1, column_count)) / gravity_size
+    surface_roughness_norm = (
+        _clamp01(roughness / (roughness_edges * gravity_size))
+        if roughness_edges
+        else 0.0
     )
 
     holes_count_norm = holes_count / total_cells
@@ -242,17 +235,16 @@ def board_health_features(
         near_threshold=near_threshold,
     )
 
+    safe_top_layers = max(1, min(gravity_size, top_layers))
     top_zone_risk_norm = _top_zone_risk_norm(
-        cells,
-        gravity_axis=gravity_axis,
+        sum(plane_counts[:safe_top_layers]),
         gravity_size=gravity_size,
         plane_size=plane_size,
         top_layers=top_layers,
     )
 
-    components = _connected_components(cells)
     fragmentation_norm = components / max(1, occupied_count)
-    slice_balance_norm = _slice_balance_norm(cells, dims)
+    slice_balance_norm = _slice_balance_norm(slice_counts)
 
     return {
         "occupied_ratio": _clamp01(occupied_ratio),
@@ -270,6 +262,91 @@ def board_health_features(
     }
 
 
+def board_health_features(
+    cells_map: dict[tuple[int, ...], int],
+    *,
+    dims: tuple[int, ...],
+    gravity_axis: int,
+    near_threshold: float = 0.8,
+    top_layers: int = 3,
+    plane_counts: Sequence[int] | None = None,
+) -> dict[str, float]:
+    """Board-health features; ``plane_counts`` may come from board counters."""
+    gravity_size = max(1, dims[gravity_axis])
+    lateral_axes = _lateral_axes(dims, gravity_axis)
+
+    cells = set(cells_map.keys())
+    top_per_column, counted_planes = _top_columns_and_plane_counts(
+        cells,
+        lateral_axes=lateral_axes,
+        gravity_axis=gravity_axis,
+        gravity_size=gravity_size,
+        count_planes=plane_counts is None,
+    )
+    if plane_counts is None:
+        plane_counts = counted_planes
+    heights, holes_count, holes_depth_weighted = _height_hole_features(
+        cells,
+        dims=dims,
+        gravity_axis=gravity_axis,
+        gravity_size=gravity_size,
+        lateral_axes=lateral_axes,
+        top_per_column=top_per_column,
+    )
+    roughness, roughness_edges = _surface_roughness(
+        heights, dims=dims, lateral_axes=lateral_axes
+    )
+    return _assemble_board_health(
+        dims=dims,
+        gravity_axis=gravity_axis,
+        near_threshold=near_threshold,
+        top_layers=top_layers,
+        occupied_count=len(cells),
+        column_count=len(heights),
+        height_sum=sum(heights.values()),
+        max_height=max(heights.values(), default=0),
+        roughness=roughness,
+        roughness_edges=roughness_edges,
+        holes_count=holes_count,
+        holes_depth_weighted=holes_depth_weighted,
+        plane_counts=plane_counts,
+        components=_connected_components(cells),
+        slice_counts=_slice_counts(cells, dims),
+    )
+
+
+def tracked_board_health_features(
+    board: BoardND,
+    *,
+    gravity_axis: int,
+    near_threshold: float = 0.8,
+    top_layers: int = 3,
+) -> dict[str, float]:
+    """
+    ``board_health_features`` of ``board`` served from its incremental
+    ``BoardHealthTracker`` and level counters instead of a full-board walk.
+    """
+    totals = board.health_tracker(gravity_axis).totals()
+    dims = board.dims
+    return _assemble_board_health(
+        dims=dims,
+        gravity_axis=gravity_axis,
+        near_threshold=near_threshold,
+        top_layers=top_layers,
+        occupied_count=totals.occupied,
+        column_count=totals.columns,
+        height_sum=totals.height_sum,
+        max_height=totals.max_height,
+        roughness=totals.roughness,
+        roughness_edges=totals.roughness_edges,
+        holes_count=totals.holes,
+        holes_depth_weighted=float(totals.holes_depth),
+        plane_counts=board.level_counts(gravity_axis),
+        components=totals.components,
+        slice_counts=board.level_counts(3) if len(dims) >= 4 else [],
+    )
+
+
 def placement_features(
     *,
     board_pre: dict[tuple[int, ...], int],
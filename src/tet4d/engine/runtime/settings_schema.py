@@ -32,7 +32,7 @@ GRID_MODE_NAMES = (
 )
 BOT_MODE_NAMES = ("off", "assist", "auto", "learn", "step")
 BOT_PROFILE_NAMES = ("fast", "balanced", "deep", "ultra")
-BOT_ALGORITHM_NAMES = ("auto", "heuristic", "greedy_layer")
+BOT_ALGORITHM_NAMES = ("auto", "heuristic", "greedy_layer", "batch")
 KICK_LEVEL_IDS = ("off", "light", "standard", "forgiving")
 ROTATION_ANIMATION_MODE_NAMES = (
     "cellwise_sliding",
@@ -599,6 +599,13 @@ def atomic_write_json(
     temp_path.replace(path)
 
 
+def atomic_write_bytes(path: Path, payload: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(path.suffix + ".tmp")
+    temp_path.write_bytes(payload)
+    temp_path.replace(path)
+
+
 def copy_text_file(src_path: Path, dst_path: Path) -> None:
     dst_path.parent.mkdir(parents=True, exist_ok=True)
     dst_path.write_text(src_path.read_text(encoding="utf-8"), encoding="utf-8")
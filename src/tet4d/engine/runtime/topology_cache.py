@@ -5,7 +5,6 @@ import json
 import math
 import shutil
 from dataclasses import asdict
-from itertools import product
 from pathlib import Path
 from typing import Any
 
@@ -13,6 +12,7 @@ from tet4d.engine.runtime.project_config import (
     explorer_topology_preview_cache_dir_path,
 )
 from tet4d.engine.runtime.settings_schema import (
+    atomic_write_bytes,
     atomic_write_json,
     read_file_bytes,
     read_json_value_or_raise,
@@ -33,28 +33,21 @@ from tet4d.engine.topology_explorer.domain_validation import (
     require_integral,
     require_integral_sequence,
 )
-from tet4d.engine.topology_explorer.glue_model import MoveStep
-from tet4d.engine.topology_explorer.glue_validate import (
-    validate_explorer_topology_profile,
-)
 from tet4d.engine.topology_explorer.movement_graph import (
     MOVEMENT_GRAPH_ALGORITHM_VERSION,
-    MovementEdge,
-    deserialize_movement_graph_rows,
-    movement_graph_rows,  # noqa: F401 - cold-read tests instrument the actual cache-module boundary.
-    serialize_movement_graph_rows,
-)
-from tet4d.engine.topology_explorer.transport_resolver import (
-    build_explorer_transport_resolver,
+    MovementGraphCSR,
+    decode_movement_graph_csr,
+    encode_movement_graph_csr,
 )
 
-TOPOLOGY_CACHE_VERSION = 4
+TOPOLOGY_CACHE_VERSION = 5
 _CACHE_DATA_FIELDS = frozenset(
     {
         "graph_directed_edge_count",
         "graph_row_count",
-        "graph_rows",
+        "graph_sha256",
         "playability_analysis",
+        "rigid_transport_scan",
     }
 )
 _CACHE_METADATA_FIELDS = frozenset(
@@ -165,6 +158,10 @@ def _cache_digest_file_path(cache_path: Path) -> Path:
     return cache_path.with_suffix(cache_path.suffix + ".sha256")
 
 
+def _cache_graph_file_path(cache_path: Path) -> Path:
+    return cache_path.with_suffix(".graph")
+
+
 def _cache_entry_metadata_matches(
     payload: object,
     *,
@@ -321,13 +318,17 @@ def merge_topology_cache_entry(
     )
 
 
-def read_cached_graph_rows(
+def read_cached_movement_graph(
     profile: ExplorerTopologyProfile,
     *,
     dims: tuple[int, ...],
     cache_version: int = TOPOLOGY_CACHE_VERSION,
     root_dir: Path | None = None,
-):
+) -> MovementGraphCSR | None:
+    """
+    The binary graph next to the JSON entry, accepted only when its digest
+    matches the one the entry recorded; arrays are views over the file.
+    """
     entry = read_topology_cache_entry(
         profile,
         dims=dims,
@@ -336,79 +337,48 @@ def read_cached_graph_rows(
     )
     if entry is None:
         return None
-    cached_rows = deserialize_movement_graph_rows(
-        entry.get("graph_rows"),
-        dims=dims,
-    )
-    if cached_rows is None:
+    graph_digest = entry.get("graph_sha256")
+    if type(graph_digest) is not str:
+        return None
+    cache_path = topology_cache_file_path(profile, dims=dims, root_dir=root_dir)
+    try:
+        encoded = read_file_bytes(_cache_graph_file_path(cache_path))
+    except OSError:
+        return None
+    if hashlib.sha256(encoded).hexdigest() != graph_digest:
+        return None
+    graph = decode_movement_graph_csr(encoded, profile, dims=dims)
+    if graph is None:
         return None
     row_count = entry.get("graph_row_count")
-    if type(row_count) is not int or row_count != len(cached_rows):
+    if type(row_count) is not int or row_count != graph.cell_count:
         return None
     directed_edge_count = entry.get("graph_directed_edge_count")
-    actual_edge_count = sum(len(edges) for _, edges in cached_rows)
-    if type(directed_edge_count) is not int or directed_edge_count != actual_edge_count:
+    if type(directed_edge_count) is not int or directed_edge_count != graph.edge_count:
         return None
-    if not _cached_boundary_rows_match_profile(
-        profile,
-        dims=dims,
-        cached_rows=cached_rows,
-    ):
-        return None
-    return cached_rows
+    return graph
 
 
-def _cached_boundary_rows_match_profile(
-    profile: ExplorerTopologyProfile,
-    *,
-    dims: tuple[int, ...],
-    cached_rows: tuple[tuple[tuple[int, ...], tuple[MovementEdge, ...]], ...],
-) -> bool:
-    validated_profile = validate_explorer_topology_profile(profile, dims=dims)
-    resolver = build_explorer_transport_resolver(validated_profile, dims)
-    edges_by_coord = {
-        coord: {edge.step: edge for edge in edges} for coord, edges in cached_rows
-    }
-    for axis, size in enumerate(dims):
-        for boundary_value, delta in ((0, -1), (size - 1, 1)):
-            step = MoveStep(axis=axis, delta=delta)
-            face_ranges = [range(value) for value in dims]
-            face_ranges[axis] = (boundary_value,)
-            for raw_coord in product(*face_ranges):
-                coord = tuple(raw_coord)
-                result = resolver.resolve_cell_step(coord, step)
-                actual = edges_by_coord[coord].get(step)
-                expected = (
-                    None
-                    if result.target is None
-                    else MovementEdge(
-                        step=step,
-                        target=result.target,
-                        traversal=result.traversal,
-                    )
-                )
-                if actual != expected:
-                    return False
-    return True
-
-
-def write_cached_graph_rows(
+def write_cached_movement_graph(
     profile: ExplorerTopologyProfile,
     *,
     dims: tuple[int, ...],
-    graph_rows,
+    graph: MovementGraphCSR,
     cache_version: int = TOPOLOGY_CACHE_VERSION,
     root_dir: Path | None = None,
 ) -> None:
-    serialized_rows = serialize_movement_graph_rows(graph_rows, dims=dims)
+    encoded = encode_movement_graph_csr(graph)
+    cache_path = topology_cache_file_path(profile, dims=dims, root_dir=root_dir)
+    # Graph first: an entry never records the digest of a graph not yet written.
+    atomic_write_bytes(_cache_graph_file_path(cache_path), encoded)
     merge_topology_cache_entry(
         profile,
         dims=dims,
         cache_version=cache_version,
         root_dir=root_dir,
-        graph_rows=serialized_rows,
-        graph_row_count=len(serialized_rows),
-        graph_directed_edge_count=sum(len(row["edges"]) for row in serialized_rows),
+        graph_sha256=hashlib.sha256(encoded).hexdigest(),
+        graph_row_count=graph.cell_count,
+        graph_directed_edge_count=graph.edge_count,
     )
 
 
@@ -517,6 +487,34 @@ def write_cached_playability_analysis(
     )
 
 
+def read_cached_rigid_transport_scan(
+    profile: ExplorerTopologyProfile,
+    *,
+    dims: tuple[int, ...],
+    root_dir: Path | None = None,
+) -> dict[str, object] | None:
+    entry = read_topology_cache_entry(profile, dims=dims, root_dir=root_dir)
+    if entry is None:
+        return None
+    scan = entry.get("rigid_transport_scan")
+    return scan if type(scan) is dict else None
+
+
+def write_cached_rigid_transport_scan(
+    profile: ExplorerTopologyProfile,
+    *,
+    dims: tuple[int, ...],
+    scan: dict[str, object],
+    root_dir: Path | None = None,
+) -> None:
+    merge_topology_cache_entry(
+        profile,
+        dims=dims,
+        root_dir=root_dir,
+        rigid_transport_scan=scan,
+    )
+
+
 def topology_cache_usage(*, root_dir: Path | None = None) -> tuple[int, int]:
     cache_dir = topology_cache_dir_path(root_dir=root_dir)
     if not cache_dir.exists():
@@ -3,7 +3,7 @@ from __future__ import annotations
 from collections.abc import Iterator
 from contextlib import contextmanager
 from contextvars import ContextVar
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from timeit import default_timer
 
 
@@ -214,6 +214,35 @@ def record_active_interaction_phase(
         )
 
 
+@contextmanager
+def capture_interaction_phases(action: str) -> Iterator[ExplorerInteractionAudit]:
+    """
+    Record active phases into a fresh audit under ``action``, for work that
+    runs away from the state (a worker thread); see ``merge_interaction_audit``.
+    """
+    audit = ExplorerInteractionAudit(action_stack=[str(action)])
+    token = _ACTIVE_AUDIT.set(audit)
+    try:
+        yield audit
+    finally:
+        _ACTIVE_AUDIT.reset(token)
+
+
+def merge_interaction_audit(
+    state: object,
+    captured: ExplorerInteractionAudit,
+) -> None:
+    audit = _audit_for_state(state)
+    if audit is None:
+        return
+    offset_ms = (captured.started_at - audit.started_at) * 1000.0
+    audit.events.extend(
+        replace(event, elapsed_ms=event.elapsed_ms + offset_ms)
+        for event in captured.events
+    )
+    audit.spans.extend(captured.spans)
+
+
 def latest_span_for_phase(
     state: object,
     *,
@@ -233,8 +262,10 @@ __all__ = [
     "ExplorerInteractionAudit",
     "ExplorerInteractionAuditEvent",
     "ExplorerInteractionAuditSpan",
+    "capture_interaction_phases",
     "current_audit_action",
     "latest_span_for_phase",
+    "merge_interaction_audit",
     "record_active_interaction_phase",
     "record_interaction_handler",
     "record_interaction_phase",
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections import Counter, deque
+from collections import Counter
 from pathlib import Path
 
 from tet4d.engine.runtime.project_config import (
@@ -14,8 +14,8 @@ from tet4d.engine.runtime.settings_schema import (
 )
 from tet4d.engine.runtime.topology_cache import (
     TOPOLOGY_CACHE_VERSION,
-    read_cached_graph_rows,
-    write_cached_graph_rows,
+    read_cached_movement_graph,
+    write_cached_movement_graph,
 )
 from tet4d.engine.runtime.topology_explorer_audit import record_active_interaction_phase
 from tet4d.engine.topology_explorer import (
@@ -31,8 +31,8 @@ from tet4d.engine.topology_explorer.domain_validation import (
     require_integral_sequence,
 )
 from tet4d.engine.topology_explorer.movement_graph import (
-    movement_graph_from_rows,
-    movement_graph_rows,
+    MovementGraphCSR,
+    movement_graph_csr,
 )
 from tet4d.engine.topology_explorer.transport_resolver import (
     CellStepResult,
@@ -298,20 +298,24 @@ def basis_arrow_payload(profile: ExplorerTopologyProfile) -> list[dict[str, obje
     return rows
 
 
-def _component_count(graph: dict[tuple[int, ...], tuple[object, ...]]) -> int:
-    remaining = set(graph)
+def _component_count(graph: MovementGraphCSR) -> int:
+    offsets = graph.offsets
+    targets = graph.targets
+    seen = bytearray(graph.cell_count)
     components = 0
-    while remaining:
+    for start in range(graph.cell_count):
+        if seen[start]:
+            continue
         components += 1
-        start = remaining.pop()
-        queue = deque([start])
-        while queue:
-            node = queue.popleft()
-            for edge in graph.get(node, ()):
-                target = edge.target
-                if target in remaining:
-                    remaining.remove(target)
-                    queue.append(target)
+        seen[start] = 1
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for edge in range(offsets[node], offsets[node + 1]):
+                target = targets[edge]
+                if not seen[target]:
+                    seen[target] = 1
+                    stack.append(target)
     return components
 
 
@@ -333,20 +337,23 @@ def _preview_warnings(
 
 
 def _sample_traversals(
-    graph: dict[tuple[int, ...], tuple[object, ...]],
+    graph: MovementGraphCSR,
     *,
     limit: int = 8,
 ) -> list[dict[str, object]]:
     samples: list[dict[str, object]] = []
-    for coord, edges in graph.items():
-        for edge in edges:
-            traversal = edge.traversal
-            if traversal is None:
+    coords = graph.coords
+    offsets = graph.offsets
+    for index, coord in enumerate(coords):
+        for edge in range(offsets[index], offsets[index + 1]):
+            traversal_id = graph.traversal_ids[edge]
+            if traversal_id < 0:
                 continue
+            traversal = graph.traversals[traversal_id]
             samples.append(
                 {
                     "from": list(coord),
-                    "to": list(edge.target),
+                    "to": list(coords[graph.targets[edge]]),
                     "step": traversal.exit_step.label,
                     "source_boundary": boundary_label(traversal.source_boundary),
                     "target_boundary": boundary_label(traversal.target_boundary),
@@ -357,19 +364,19 @@ def _sample_traversals(
     return samples
 
 
-def _write_cached_preview_graph_rows(
+def _write_cached_preview_graph(
     profile: ExplorerTopologyProfile,
     *,
     dims: tuple[int, ...],
-    graph_rows,
+    graph: MovementGraphCSR,
     root_dir: Path | None = None,
 ) -> None:
-    write_cached_graph_rows(
+    write_cached_movement_graph(
         profile,
         dims=dims,
         cache_version=_PREVIEW_LOCAL_CACHE_VERSION,
         root_dir=root_dir,
-        graph_rows=graph_rows,
+        graph=graph,
     )
 
 
@@ -389,28 +396,27 @@ def compile_explorer_topology_preview(
         glue_count=len(profile.gluings),
         source=source,
     ):
-        graph_rows = (
-            read_cached_graph_rows(
-                profile,
-                dims=normalized_dims,
-                cache_version=_PREVIEW_LOCAL_CACHE_VERSION,
-                root_dir=root_dir,
+        with record_active_interaction_phase("movement_graph_build"):
+            cached_graph = (
+                read_cached_movement_graph(
+                    profile,
+                    dims=normalized_dims,
+                    cache_version=_PREVIEW_LOCAL_CACHE_VERSION,
+                    root_dir=root_dir,
+                )
+                if use_local_cache
+                else None
             )
-            if use_local_cache
-            else None
-        )
-        cache_miss = graph_rows is None
-        if cache_miss:
-            graph_rows = movement_graph_rows(profile, dims=normalized_dims)
-        graph = movement_graph_from_rows(graph_rows)
-        degree_histogram = Counter(len(edges) for edges in graph.values())
-        traversal_count = sum(
-            1
-            for edges in graph.values()
-            for edge in edges
-            if edge.traversal is not None
-        )
-        component_count = _component_count(graph)
+            cache_miss = cached_graph is None
+            graph = (
+                movement_graph_csr(profile, dims=normalized_dims)
+                if cached_graph is None
+                else cached_graph
+            )
+        with record_active_interaction_phase("component_count"):
+            degree_histogram = Counter(graph.degrees())
+            traversal_count = len(graph.traversals)
+            component_count = _component_count(graph)
         payload = {
             "version": 1,
             "source": str(source),
@@ -420,8 +426,8 @@ def compile_explorer_topology_preview(
             "gluings": _glue_payload(profile),
             "basis_arrows": basis_arrow_payload(profile),
             "movement_graph": {
-                "cell_count": len(graph),
-                "directed_edge_count": sum(len(edges) for edges in graph.values()),
+                "cell_count": graph.cell_count,
+                "directed_edge_count": graph.edge_count,
                 "boundary_traversal_count": traversal_count,
                 "component_count": component_count,
                 "degree_histogram": {
@@ -435,10 +441,10 @@ def compile_explorer_topology_preview(
         }
         if use_local_cache and cache_miss:
             try:
-                _write_cached_preview_graph_rows(
+                _write_cached_preview_graph(
                     profile,
                     dims=normalized_dims,
-                    graph_rows=graph_rows,
+                    graph=graph,
                     root_dir=root_dir,
                 )
             except OSError:
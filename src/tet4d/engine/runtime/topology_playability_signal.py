@@ -1,7 +1,14 @@
 from __future__ import annotations
 
+import atexit
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
-from itertools import product
+from pathlib import Path
 
 from tet4d.engine.core.model import Coord
 from tet4d.engine.topology_explorer import (
@@ -15,6 +22,11 @@ from tet4d.engine.topology_explorer.transport_resolver import (
     build_explorer_transport_resolver,
 )
 
+from .project_config import project_constant_int
+from .topology_cache import (
+    read_cached_rigid_transport_scan,
+    write_cached_rigid_transport_scan,
+)
 from .topology_playground_state import (
     EXPLORER_USABILITY_BLOCKED,
     EXPLORER_USABILITY_CELLWISE,
@@ -35,6 +47,13 @@ from .topology_playground_state import (
     TopologyPlaygroundState,
 )
 
+RIGID_TRANSPORT_SCAN_VERSION = 1
+
+_RIGID_SCAN_MEMO_LIMIT = 64
+
+# A scan shard: (step index, source cell pair) in serial scan order.
+_ScanPair = tuple[int, tuple[Coord, Coord]]
+
 
 @dataclass(frozen=True)
 class _RigidTransportFailure:
@@ -44,6 +63,17 @@ class _RigidTransportFailure:
     crossing_text: str | None
 
 
+_RIGID_SCAN_MEMO: OrderedDict[
+    tuple[ExplorerTopologyProfile, tuple[int, ...]],
+    _RigidTransportFailure | None,
+] = OrderedDict()
+_RIGID_SCAN_MEMO_LOCK = threading.Lock()
+
+_scan_pool: ProcessPoolExecutor | None = None
+_scan_pool_workers = 0
+_SCAN_POOL_LOCK = threading.Lock()
+
+
 def _movement_summary_from_preview(
     preview: dict[str, object] | None,
 ) -> TopologyPlaygroundMovementSummary:
@@ -63,21 +93,6 @@ def _movement_summary_from_preview(
     )
 
 
-def _all_coords(dims: tuple[int, ...]) -> tuple[Coord, ...]:
-    return tuple(
-        tuple(int(value) for value in coord)
-        for coord in product(*(range(size) for size in dims))
-    )
-
-
-def _adjacent_neighbor(coord: Coord, axis: int, dims: tuple[int, ...]) -> Coord | None:
-    candidate = list(coord)
-    candidate[axis] += 1
-    if candidate[axis] >= dims[axis]:
-        return None
-    return tuple(candidate)
-
-
 def _crossing_text_from_piece_step(cell_steps: tuple[object, ...]) -> str | None:
     for cell_step in cell_steps:
         traversal = getattr(cell_step, "traversal", None)
@@ -90,37 +105,299 @@ def _crossing_text_from_piece_step(cell_steps: tuple[object, ...]) -> str | None
     return None
 
 
-def _first_rigid_transport_failure(
+def _seam_pairs(
     profile: ExplorerTopologyProfile,
     *,
     dims: tuple[int, ...],
+    resolver,
+) -> list[_ScanPair]:
+    """
+    Adjacent cell pairs with a cell on a seam's source boundary, per seam
+    exit step. Any other pair moves as a plain translation or is blocked,
+    so it cannot deform. Ordered like the full step x cell x axis scan.
+    """
+    steps = tuple(movement_steps_for_dimension(profile.dimension))
+    step_index = {step: index for index, step in enumerate(steps)}
+    keyed: dict[tuple[int, Coord, int], tuple[Coord, Coord]] = {}
+    for seam in resolver.directed_seams:
+        step_id = step_index[seam.exit_step]
+        for coord, _target in seam.boundary_coord_map:
+            for axis, size in enumerate(dims):
+                lower = coord[:axis] + (coord[axis] - 1,) + coord[axis + 1 :]
+                upper = coord[:axis] + (coord[axis] + 1,) + coord[axis + 1 :]
+                if coord[axis] > 0:
+                    keyed[(step_id, lower, axis)] = (lower, coord)
+                if coord[axis] + 1 < size:
+                    keyed[(step_id, coord, axis)] = (coord, upper)
+    return [(key[0], keyed[key]) for key in sorted(keyed)]
+
+
+def _scan_rigid_transport_pairs(
+    profile: ExplorerTopologyProfile,
+    dims: tuple[int, ...],
+    pairs: list[_ScanPair],
     resolver=None,
 ) -> _RigidTransportFailure | None:
-    coords = _all_coords(dims)
+    """First deforming pair in ``pairs``; stops at the first failure."""
     steps = tuple(movement_steps_for_dimension(profile.dimension))
     if resolver is None:
         resolver = build_explorer_transport_resolver(profile, dims)
-    for step in steps:
-        for coord in coords:
-            for axis in range(profile.dimension):
-                neighbor = _adjacent_neighbor(coord, axis, dims)
-                if neighbor is None:
-                    continue
-                source_cells = (coord, neighbor)
-                outcome = resolver.resolve_piece_step(source_cells, step)
-                if outcome.kind != CELLWISE_DEFORMATION or outcome.rigidly_coherent:
-                    continue
-                if outcome.moved_cells is None or len(outcome.moved_cells) != 2:
-                    continue
-                return _RigidTransportFailure(
-                    step_label=step.label,
-                    source_cells=source_cells,
-                    moved_cells=(outcome.moved_cells[0], outcome.moved_cells[1]),
-                    crossing_text=_crossing_text_from_piece_step(outcome.cell_steps),
-                )
+    for step_id, source_cells in pairs:
+        step = steps[step_id]
+        outcome = resolver.resolve_piece_step(source_cells, step)
+        if outcome.kind != CELLWISE_DEFORMATION or outcome.rigidly_coherent:
+            continue
+        if outcome.moved_cells is None or len(outcome.moved_cells) != 2:
+            continue
+        return _RigidTransportFailure(
+            step_label=step.label,
+            source_cells=source_cells,
+            moved_cells=(outcome.moved_cells[0], outcome.moved_cells[1]),
+            crossing_text=_crossing_text_from_piece_step(outcome.cell_steps),
+        )
     return None
 
 
+def _scan_worker_count(workers: int | None) -> int:
+    if workers is None:
+        workers = project_constant_int(
+            ("topology", "playability_scan", "workers"), 0, min_value=0
+        )
+    if workers > 0:
+        return workers
+    return max(1, (os.cpu_count() or 1) - 1)
+
+
+def _rigid_scan_pool(workers: int) -> ProcessPoolExecutor:
+    global _scan_pool, _scan_pool_workers
+    with _SCAN_POOL_LOCK:
+        if _scan_pool is None or _scan_pool_workers != workers:
+            if _scan_pool is not None:
+                _scan_pool.shutdown(wait=False, cancel_futures=True)
+            # Spawned workers avoid inheriting the render loop's threads and state.
+            _scan_pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            _scan_pool_workers = workers
+        return _scan_pool
+
+
+def shutdown_rigid_scan_pool() -> None:
+    global _scan_pool, _scan_pool_workers
+    with _SCAN_POOL_LOCK:
+        if _scan_pool is not None:
+            _scan_pool.shutdown(wait=False, cancel_futures=True)
+        _scan_pool = None
+        _scan_pool_workers = 0
+
+
+atexit.register(shutdown_rigid_scan_pool)
+
+
+def _scan_rigid_transport_sharded(
+    profile: ExplorerTopologyProfile,
+    dims: tuple[int, ...],
+    pairs: list[_ScanPair],
+    *,
+    workers: int,
+) -> _RigidTransportFailure | None:
+    """
+    Contiguous shards on the shared spawned process pool, consumed in order
+    so the reported failure is the one the serial scan would find; shards
+    after the first failing one are cancelled. A broken pool is dropped so
+    the next scan starts a fresh one.
+    """
+    shard_size = -(-len(pairs) // (workers * 4))
+    shards = [
+        pairs[start : start + shard_size] for start in range(0, len(pairs), shard_size)
+    ]
+    futures = []
+    try:
+        pool = _rigid_scan_pool(workers)
+        futures = [
+            pool.submit(_scan_rigid_transport_pairs, profile, dims, shard)
+            for shard in shards
+        ]
+        for future in futures:
+            failure = future.result()
+            if failure is not None:
+                return failure
+        return None
+    except BrokenProcessPool:
+        shutdown_rigid_scan_pool()
+        raise
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def _scan_rigid_transport(
+    profile: ExplorerTopologyProfile,
+    *,
+    dims: tuple[int, ...],
+    resolver=None,
+    workers: int | None = None,
+) -> _RigidTransportFailure | None:
+    if resolver is None:
+        resolver = build_explorer_transport_resolver(profile, dims)
+    pairs = _seam_pairs(profile, dims=dims, resolver=resolver)
+    worker_count = _scan_worker_count(workers)
+    min_parallel_pairs = project_constant_int(
+        ("topology", "playability_scan", "parallel_min_pairs"), 4096, min_value=1
+    )
+    if worker_count <= 1 or len(pairs) < min_parallel_pairs:
+        return _scan_rigid_transport_pairs(profile, dims, pairs, resolver)
+    return _scan_rigid_transport_sharded(profile, dims, pairs, workers=worker_count)
+
+
+def _failure_payload(failure: _RigidTransportFailure | None) -> dict[str, object]:
+    return {
+        "version": RIGID_TRANSPORT_SCAN_VERSION,
+        "failure": (
+            None
+            if failure is None
+            else {
+                "step": failure.step_label,
+                "source_cells": [list(cell) for cell in failure.source_cells],
+                "moved_cells": [list(cell) for cell in failure.moved_cells],
+                "crossing_text": failure.crossing_text,
+            }
+        ),
+    }
+
+
+def _failure_from_payload(
+    payload: dict[str, object], *, dims: tuple[int, ...]
+) -> tuple[bool, _RigidTransportFailure | None]:
+    """(hit, failure); any unexpected shape is a miss."""
+    if payload.get("version") != RIGID_TRANSPORT_SCAN_VERSION:
+        return False, None
+    failure = payload.get("failure")
+    if failure is None:
+        return True, None
+    try:
+        if type(failure) is not dict or set(failure) != {
+            "step",
+            "source_cells",
+            "moved_cells",
+            "crossing_text",
+        }:
+            return False, None
+        step_label = failure["step"]
+        labels = {step.label for step in movement_steps_for_dimension(len(dims))}
+        crossing_text = failure["crossing_text"]
+        if step_label not in labels or (
+            crossing_text is not None and type(crossing_text) is not str
+        ):
+            return False, None
+        cells: list[tuple[Coord, Coord]] = []
+        for key in ("source_cells", "moved_cells"):
+            pair = failure[key]
+            if type(pair) is not list or len(pair) != 2:
+                return False, None
+            coords = tuple(tuple(cell) for cell in pair)
+            if any(
+                len(cell) != len(dims) or any(type(value) is not int for value in cell)
+                for cell in coords
+            ):
+                return False, None
+            cells.append((coords[0], coords[1]))
+    except TypeError:
+        return False, None
+    return True, _RigidTransportFailure(
+        step_label=step_label,
+        source_cells=cells[0],
+        moved_cells=cells[1],
+        crossing_text=crossing_text,
+    )
+
+
+def clear_rigid_transport_scan_memo() -> None:
+    with _RIGID_SCAN_MEMO_LOCK:
+        _RIGID_SCAN_MEMO.clear()
+
+
+def _remember_rigid_transport_failure(
+    key: tuple[ExplorerTopologyProfile, tuple[int, ...]],
+    failure: _RigidTransportFailure | None,
+) -> None:
+    with _RIGID_SCAN_MEMO_LOCK:
+        _RIGID_SCAN_MEMO[key] = failure
+        _RIGID_SCAN_MEMO.move_to_end(key)
+        if len(_RIGID_SCAN_MEMO) > _RIGID_SCAN_MEMO_LIMIT:
+            _RIGID_SCAN_MEMO.popitem(last=False)
+
+
+def _memoized_rigid_transport_failure(
+    key: tuple[ExplorerTopologyProfile, tuple[int, ...]],
+) -> tuple[bool, _RigidTransportFailure | None]:
+    """(hit, failure) from the in-process LRU memo."""
+    with _RIGID_SCAN_MEMO_LOCK:
+        if key not in _RIGID_SCAN_MEMO:
+            return False, None
+        _RIGID_SCAN_MEMO.move_to_end(key)
+        return True, _RIGID_SCAN_MEMO[key]
+
+
+def _first_rigid_transport_failure(
+    profile: ExplorerTopologyProfile,
+    *,
+    dims: tuple[int, ...],
+    resolver=None,
+) -> _RigidTransportFailure | None:
+    """
+    Memoized per profile signature in a bounded in-process LRU, so revisiting
+    a preset does not rescan. Never touches disk; see
+    ``warm_rigid_transport_scan`` for the persisted topology cache.
+    """
+    key = (profile, tuple(int(value) for value in dims))
+    hit, failure = _memoized_rigid_transport_failure(key)
+    if hit:
+        return failure
+    failure = _scan_rigid_transport(profile, dims=key[1], resolver=resolver)
+    _remember_rigid_transport_failure(key, failure)
+    return failure
+
+
+def warm_rigid_transport_scan(
+    profile: ExplorerTopologyProfile,
+    *,
+    dims: tuple[int, ...],
+    root_dir: Path | None = None,
+) -> None:
+    """
+    Seed the scan memo from the topology cache under ``root_dir``, scanning
+    and persisting on a miss, so a following derive does not rescan. Invalid
+    topologies are left for the derive to report. Only the compile/cache
+    layer calls this; derive functions stay off disk.
+    """
+    key = (profile, tuple(int(value) for value in dims))
+    if _memoized_rigid_transport_failure(key)[0]:
+        return
+    try:
+        validate_topology_structure(profile)
+        validate_topology_bijection(profile, dims=key[1])
+    except ValueError:
+        return
+    payload = read_cached_rigid_transport_scan(profile, dims=key[1], root_dir=root_dir)
+    if payload is not None:
+        hit, failure = _failure_from_payload(payload, dims=key[1])
+        if hit:
+            _remember_rigid_transport_failure(key, failure)
+            return
+    failure = _first_rigid_transport_failure(profile, dims=key[1])
+    try:
+        write_cached_rigid_transport_scan(
+            profile,
+            dims=key[1],
+            scan=_failure_payload(failure),
+            root_dir=root_dir,
+        )
+    except OSError:
+        pass
+
+
 def _invalid_summary(reason: str) -> str:
     if "unsupported for current board dimensions" in reason:
         return "Invalid for current board dimensions."
@@ -152,6 +429,26 @@ def _invalid_analysis(
     )
 
 
+def analyzing_topology_playability_analysis() -> TopologyPlaygroundPlayabilityAnalysis:
+    """Placeholder while a background compile has not published yet."""
+    return TopologyPlaygroundPlayabilityAnalysis(
+        status=PLAYABILITY_STATUS_ANALYZING,
+        summary="Analyzing topology.",
+        validity_reason="Current topology is still being compiled.",
+        explorer_reason="Explorer/probe waits for the movement graph.",
+        rigid_reason="Rigid transport is still being analyzed for the current topology.",
+    )
+
+
+def failed_topology_playability_analysis(
+    reason: str,
+    *,
+    preview: dict[str, object] | None = None,
+) -> TopologyPlaygroundPlayabilityAnalysis:
+    """Blocked analysis for a background compile that raised."""
+    return _invalid_analysis(reason, preview=preview)
+
+
 def _valid_pending_analysis(
     *,
     preview: dict[str, object] | None,
@@ -182,8 +479,24 @@ def derive_topology_playability_analysis(
     preview_error: str | None = None,
     include_rigid_scan: bool = True,
 ) -> TopologyPlaygroundPlayabilityAnalysis:
-    profile = state.explorer_profile
-    dims = tuple(int(value) for value in state.axis_sizes)
+    return derive_profile_playability_analysis(
+        state.explorer_profile,
+        dims=state.axis_sizes,
+        preview=preview,
+        preview_error=preview_error,
+        include_rigid_scan=include_rigid_scan,
+    )
+
+
+def derive_profile_playability_analysis(
+    profile: ExplorerTopologyProfile,
+    *,
+    dims: tuple[int, ...],
+    preview: dict[str, object] | None = None,
+    preview_error: str | None = None,
+    include_rigid_scan: bool = True,
+) -> TopologyPlaygroundPlayabilityAnalysis:
+    dims = tuple(int(value) for value in dims)
     warnings = tuple(str(item) for item in (preview or {}).get("warnings", ()))
     movement_summary = _movement_summary_from_preview(preview)
 
@@ -307,8 +620,15 @@ def update_topology_playability_analysis(
 
 
 __all__ = [
+    "RIGID_TRANSPORT_SCAN_VERSION",
+    "analyzing_topology_playability_analysis",
+    "clear_rigid_transport_scan_memo",
+    "derive_profile_playability_analysis",
     "derive_topology_playability_analysis",
+    "failed_topology_playability_analysis",
     "resolve_rigid_play_enabled",
+    "shutdown_rigid_scan_pool",
     "topology_is_rigid_playable",
     "update_topology_playability_analysis",
+    "warm_rigid_transport_scan",
 ]
@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import atexit
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from tet4d.engine.runtime.topology_cache import (
+    read_cached_playability_analysis,
+    write_cached_playability_analysis,
+)
+from tet4d.engine.runtime.topology_explorer_audit import (
+    ExplorerInteractionAudit,
+    capture_interaction_phases,
+    record_active_interaction_phase,
+)
+from tet4d.engine.runtime.topology_explorer_preview import (
+    compile_explorer_topology_preview,
+)
+from tet4d.engine.runtime.topology_playability_signal import (
+    derive_profile_playability_analysis,
+    failed_topology_playability_analysis,
+    warm_rigid_transport_scan,
+)
+from tet4d.engine.runtime.topology_playground_state import (
+    TopologyPlaygroundPlayabilityAnalysis,
+)
+from tet4d.engine.topology_explorer import ExplorerTopologyProfile
+
+PreviewCompile = Callable[..., dict[str, object]]
+
+_BACKGROUND_COMPILE_ACTION = "background_preview_compile"
+
+
+def _failure_reason(exc: Exception) -> str:
+    return f"Topology preview failed: {type(exc).__name__}: {exc}"
+
+
+@dataclass(frozen=True)
+class TopologyPreviewRequest:
+    generation: int
+    profile: ExplorerTopologyProfile
+    dims: tuple[int, ...]
+    source: str
+
+
+@dataclass(frozen=True)
+class TopologyPreviewResult:
+    generation: int
+    profile: ExplorerTopologyProfile
+    dims: tuple[int, ...]
+    preview: dict[str, object] | None
+    preview_error: str | None
+    analysis: TopologyPlaygroundPlayabilityAnalysis
+    audit: ExplorerInteractionAudit
+
+
+class TopologyPreviewCompiler:
+    """
+    Background compiler for explorer topology previews. One worker compiles
+    the latest submitted profile; a newer ``submit`` supersedes anything
+    pending or in flight (last edit wins), and a superseded compile stops at
+    its next phase boundary and is never published. A compile that raises
+    is published as a preview error or blocked analysis, so the worker and
+    the lab never stall on it. ``poll`` returns the result for the latest
+    request once, from the UI thread.
+    """
+
+    def __init__(
+        self,
+        *,
+        compile_preview: PreviewCompile = compile_explorer_topology_preview,
+        root_dir: Path | None = None,
+    ) -> None:
+        self._compile_preview = compile_preview
+        self._root_dir = root_dir
+        self._condition = threading.Condition()
+        self._generation = 0
+        self._pending: TopologyPreviewRequest | None = None
+        self._result: TopologyPreviewResult | None = None
+        self._busy = False
+        self._closed = False
+        self._thread: threading.Thread | None = None
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    @property
+    def idle(self) -> bool:
+        """True when nothing is pending, compiling, or waiting to be polled."""
+        with self._condition:
+            return self._pending is None and not self._busy and self._result is None
+
+    def submit(
+        self,
+        profile: ExplorerTopologyProfile,
+        *,
+        dims: tuple[int, ...],
+        source: str = "topology_lab_live_preview",
+    ) -> int:
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("topology preview compiler is closed")
+            self._generation += 1
+            self._pending = TopologyPreviewRequest(
+                generation=self._generation,
+                profile=profile,
+                dims=tuple(int(value) for value in dims),
+                source=str(source),
+            )
+            self._result = None
+            self._condition.notify_all()
+        self._ensure_started()
+        return self._generation
+
+    def cancel(self) -> None:
+        with self._condition:
+            self._generation += 1
+            self._pending = None
+            self._result = None
+            self._condition.notify_all()
+
+    def poll(self) -> TopologyPreviewResult | None:
+        with self._condition:
+            result = self._result
+            self._result = None
+            return result
+
+    def wait(self, timeout: float | None = None) -> TopologyPreviewResult | None:
+        """Block until the latest request is published, then ``poll``."""
+        with self._condition:
+            self._condition.wait_for(
+                lambda: (
+                    self._result is not None
+                    or (self._pending is None and not self._busy)
+                ),
+                timeout,
+            )
+        return self.poll()
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._generation += 1
+            self._pending = None
+            self._result = None
+            thread = self._thread
+            self._thread = None
+            self._condition.notify_all()
+        if thread is None:
+            return
+        atexit.unregister(self.close)
+        if thread is not threading.current_thread():
+            thread.join()
+
+    def _ensure_started(self) -> None:
+        with self._condition:
+            if self._closed or (self._thread is not None and self._thread.is_alive()):
+                return
+            self._thread = threading.Thread(
+                target=self._run,
+                name="tet4d-topology-preview-compiler",
+                daemon=True,
+            )
+            self._thread.start()
+        atexit.register(self.close)
+
+    def _is_current(self, request: TopologyPreviewRequest) -> bool:
+        return request.generation == self._generation and not self._closed
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._pending is not None or self._closed
+                )
+                if self._closed:
+                    return
+                request = self._pending
+                self._pending = None
+                self._busy = True
+            assert request is not None
+            result = None
+            try:
+                result = self._compile(request)
+            finally:
+                with self._condition:
+                    self._busy = False
+                    if result is not None and self._is_current(request):
+                        self._result = result
+                    self._condition.notify_all()
+
+    def _compile(self, request: TopologyPreviewRequest) -> TopologyPreviewResult | None:
+        with capture_interaction_phases(_BACKGROUND_COMPILE_ACTION) as audit:
+            try:
+                preview = self._compile_preview(
+                    request.profile,
+                    dims=request.dims,
+                    source=request.source,
+                    root_dir=self._root_dir,
+                )
+                preview_error = None
+            except ValueError as exc:
+                preview, preview_error = None, str(exc)
+            except Exception as exc:  # noqa: BLE001 - published as the preview error.
+                preview, preview_error = None, _failure_reason(exc)
+            if not self._is_current(request):
+                return None
+            with record_active_interaction_phase(
+                "playability_analysis",
+                dimension=request.profile.dimension,
+                dims=request.dims,
+            ):
+                try:
+                    analysis = self._analysis(request, preview, preview_error)
+                except Exception as exc:  # noqa: BLE001 - published as blocked.
+                    analysis = failed_topology_playability_analysis(
+                        _failure_reason(exc), preview=preview
+                    )
+        return TopologyPreviewResult(
+            generation=request.generation,
+            profile=request.profile,
+            dims=request.dims,
+            preview=preview,
+            preview_error=preview_error,
+            analysis=analysis,
+            audit=audit,
+        )
+
+    def _analysis(
+        self,
+        request: TopologyPreviewRequest,
+        preview: dict[str, object] | None,
+        preview_error: str | None,
+    ) -> TopologyPlaygroundPlayabilityAnalysis:
+        if preview_error is None:
+            cached = read_cached_playability_analysis(
+                request.profile, dims=request.dims, root_dir=self._root_dir
+            )
+            if cached is not None:
+                return cached
+            warm_rigid_transport_scan(
+                request.profile, dims=request.dims, root_dir=self._root_dir
+            )
+        analysis = derive_profile_playability_analysis(
+            request.profile,
+            dims=request.dims,
+            preview=preview,
+            preview_error=preview_error,
+        )
+        if preview_error is None:
+            try:
+                write_cached_playability_analysis(
+                    request.profile,
+                    dims=request.dims,
+                    analysis=analysis,
+                    root_dir=self._root_dir,
+                )
+            except OSError:
+                pass
+        return analysis
+
+
+__all__ = [
+    "TopologyPreviewCompiler",
+    "TopologyPreviewRequest",
+    "TopologyPreviewResult",
+]
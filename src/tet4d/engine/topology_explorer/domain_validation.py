@@ -8,6 +8,8 @@ _T = TypeVar("_T")
 
 
 def require_integral(value: object, path: str) -> int:
+    if type(value) is int:
+        return value
     if isinstance(value, bool) or not isinstance(value, Integral):
         raise ValueError(f"{path} must be an integer")  # noqa: TRY004 - topology domain validation has one stable rejection type.
     return int(value)
@@ -58,6 +60,9 @@ def require_instance(value: object, path: str, item_type: type[_T]) -> _T:
 
 
 def require_integral_sequence(value: object, path: str) -> tuple[int, ...]:
+    # Hot transport paths pass plain int tuples; skip per-item checks.
+    if type(value) is tuple and all(type(item) is int for item in value):
+        return value
     sequence = require_sequence(value, path)
     normalized = [
         require_integral(item, f"{path}[{index}]")
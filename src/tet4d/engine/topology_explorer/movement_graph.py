@@ -1,21 +1,19 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from functools import lru_cache
-from itertools import product
-from typing import Any
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass, replace
+from functools import cached_property, lru_cache
+from itertools import accumulate, chain, compress, islice, product, repeat
+from math import prod
+from operator import add, lt, ne
 
 from ..core.model import Coord
-from .contract_validation import (
-    require_json_array,
-    require_json_int_sequence,
-    require_json_object,
-    require_json_string,
-)
 from .domain_validation import require_integral_sequence
 from .glue_map import BoundaryTraversal
 from .glue_model import (
-    BoundaryRef,
     ExplorerTopologyProfile,
     MoveStep,
     movement_steps_for_dimension,
@@ -24,6 +22,11 @@ from .glue_validate import validate_explorer_topology_profile
 from .transport_resolver import build_explorer_transport_resolver
 
 MOVEMENT_GRAPH_ALGORITHM_VERSION = 1
+MOVEMENT_GRAPH_FORMAT_VERSION = 1
+
+_GRAPH_MAGIC = b"T4MG"
+# magic, format version, rank, cell count, edge count; dims follow as uint32.
+_GRAPH_HEADER = struct.Struct("<4sHHII")
 
 
 @dataclass(frozen=True)
@@ -59,98 +62,164 @@ def _neighbors_for_validated_cell(
     return tuple(edges)
 
 
-def _boundary_ref_for_exit(
-    dims: Coord,
-    *,
-    coord: Coord,
-    step: MoveStep,
-) -> BoundaryRef | None:
-    axis = int(step.axis)
-    delta = int(step.delta)
-    axis_value = int(coord[axis])
-    if delta < 0:
-        if axis_value != 0:
-            return None
-        return BoundaryRef(dimension=len(dims), axis=axis, side="-")
-    if axis_value != int(dims[axis]) - 1:
-        return None
-    return BoundaryRef(dimension=len(dims), axis=axis, side="+")
-
-
-def _graph_edges_for_cell(
-    resolver,
-    *,
-    dims: Coord,
-    steps: tuple[MoveStep, ...],
-    coord: Coord,
-) -> tuple[MovementEdge, ...]:
-    edges: list[MovementEdge] = []
-    for step in steps:
-        axis = int(step.axis)
-        delta = int(step.delta)
-        next_axis_value = int(coord[axis]) + delta
-        if 0 <= next_axis_value < int(dims[axis]):
-            target = list(coord)
-            target[axis] = next_axis_value
-            edges.append(
-                MovementEdge(
-                    step=step,
-                    target=tuple(int(value) for value in target),
-                    traversal=None,
-                )
-            )
-            continue
-        boundary = _boundary_ref_for_exit(dims, coord=coord, step=step)
-        if boundary is None:
-            continue
-        seam = resolver.seam_for_boundary(boundary)
-        if seam is None:
-            continue
-        target_coord = seam.target_for_source_coord(coord)
-        edges.append(
+@dataclass(frozen=True)
+class MovementGraphCSR:
+    """
+    Movement graph in compressed sparse rows over row-major cell indices.
+    The edges of cell ``i`` are ``offsets[i]:offsets[i + 1]`` of the flat
+    ``targets``/``step_ids``/``traversal_ids`` arrays; a traversal id
+    indexes ``traversals`` and is -1 for a plain one-cell move. The arrays
+    are stdlib arrays when built and int views over the file bytes when
+    decoded from the cache.
+    """
+
+    dims: Coord
+    steps: tuple[MoveStep, ...]
+    offsets: Sequence[int]
+    targets: Sequence[int]
+    step_ids: Sequence[int]
+    traversal_ids: Sequence[int]
+    traversals: tuple[BoundaryTraversal, ...]
+
+    @property
+    def cell_count(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.targets)
+
+    @cached_property
+    def coords(self) -> tuple[Coord, ...]:
+        return tuple(product(*(range(size) for size in self.dims)))
+
+    def index_of(self, coord: Coord) -> int:
+        index = 0
+        for value, size in zip(coord, self.dims):
+            index = index * size + value
+        return index
+
+    def degrees(self) -> list[int]:
+        offsets = self.offsets
+        return [
+            offsets[index + 1] - offsets[index] for index in range(len(offsets) - 1)
+        ]
+
+    def edges_at(self, index: int) -> tuple[MovementEdge, ...]:
+        coords = self.coords
+        return tuple(
             MovementEdge(
-                step=step,
-                target=target_coord,
-                traversal=BoundaryTraversal(
-                    glue_id=seam.glue_id,
-                    source_boundary=seam.source_boundary,
-                    target_boundary=seam.target_boundary,
-                    source_coord=coord,
-                    target_coord=target_coord,
-                    exit_step=step,
-                    entry_step=seam.entry_step,
+                step=self.steps[self.step_ids[edge]],
+                target=coords[self.targets[edge]],
+                traversal=(
+                    None
+                    if self.traversal_ids[edge] < 0
+                    else self.traversals[self.traversal_ids[edge]]
                 ),
             )
+            for edge in range(self.offsets[index], self.offsets[index + 1])
         )
-    return tuple(edges)
+
+    @cached_property
+    def rows(self) -> tuple[tuple[Coord, tuple[MovementEdge, ...]], ...]:
+        """The row/``MovementEdge`` view, materialized on first use."""
+        return tuple(
+            (coord, self.edges_at(index)) for index, coord in enumerate(self.coords)
+        )
+
+
+def _row_major_strides(dims: Coord) -> Coord:
+    strides = [1] * len(dims)
+    for axis in range(len(dims) - 2, -1, -1):
+        strides[axis] = strides[axis + 1] * dims[axis + 1]
+    return tuple(strides)
+
+
+def _axis_value_columns(dims: Coord) -> tuple[list[int], ...]:
+    """Per axis, the coordinate value at every row-major cell index."""
+    strides = _row_major_strides(dims)
+    total = prod(dims)
+    return tuple(
+        [value for value in range(size) for _ in range(stride)]
+        * (total // (size * stride))
+        for size, stride in zip(dims, strides)
+    )
+
+
+def _exit_cells(
+    dims: Coord, axis_values: tuple[list[int], ...], step: MoveStep
+) -> list[tuple[int, Coord]]:
+    """(index, coord) of every cell on the boundary face ``step`` leaves."""
+    exit_value = 0 if step.delta < 0 else dims[step.axis] - 1
+    return [
+        (index, tuple(axis_column[index] for axis_column in axis_values))
+        for index, value in enumerate(axis_values[step.axis])
+        if value == exit_value
+    ]
 
 
 @lru_cache(maxsize=32)
-def _build_movement_graph_rows(
+def _build_movement_graph_csr(
     profile: ExplorerTopologyProfile,
     dims: Coord,
-) -> tuple[tuple[Coord, tuple[MovementEdge, ...]], ...]:
+) -> MovementGraphCSR:
+    """
+    Interior moves are index arithmetic over whole per-step columns, which
+    are interleaved into cell-major edge slots; only exits from boundary
+    cells go through the resolver's compiled seam table. Blocked slots are
+    then compressed away.
+    """
     validated_profile = validate_explorer_topology_profile(
         profile,
         dims=dims,
     )
     resolver = build_explorer_transport_resolver(validated_profile, dims)
     steps = tuple(movement_steps_for_dimension(validated_profile.dimension))
-    rows: list[tuple[Coord, tuple[MovementEdge, ...]]] = []
-    for coord_values in product(*(range(size) for size in dims)):
-        coord = tuple(int(value) for value in coord_values)
-        rows.append(
-            (
-                coord,
-                _graph_edges_for_cell(
-                    resolver,
-                    dims=dims,
-                    steps=steps,
-                    coord=coord,
-                ),
-            )
-        )
-    return tuple(rows)
+    strides = _row_major_strides(dims)
+    axis_values = _axis_value_columns(dims)
+    cell_count = prod(dims)
+    step_count = len(steps)
+    slot_targets = [0] * (cell_count * step_count)
+    slot_traversals: dict[int, BoundaryTraversal] = {}
+    blocked = [0] * cell_count
+    for step_id, step in enumerate(steps):
+        offset = step.delta * strides[step.axis]
+        column = list(range(offset, cell_count + offset))
+        for index, coord in _exit_cells(dims, axis_values, step):
+            result = resolver.resolve_cell_step(coord, step)
+            if result.target is None:
+                column[index] = -1
+                blocked[index] += 1
+                continue
+            column[index] = sum(map(int.__mul__, result.target, strides))
+            slot_traversals[index * step_count + step_id] = result.traversal
+        slot_targets[step_id::step_count] = column
+
+    slot_traversal_ids = [-1] * len(slot_targets)
+    traversals: list[BoundaryTraversal] = []
+    for slot in sorted(slot_traversals):
+        slot_traversal_ids[slot] = len(traversals)
+        traversals.append(slot_traversals[slot])
+    kept = [target >= 0 for target in slot_targets]
+    return MovementGraphCSR(
+        dims=dims,
+        steps=steps,
+        offsets=array(
+            "i", accumulate((step_count - count for count in blocked), initial=0)
+        ),
+        targets=array("i", compress(slot_targets, kept)),
+        step_ids=array("b", compress(list(range(step_count)) * cell_count, kept)),
+        traversal_ids=array("i", compress(slot_traversal_ids, kept)),
+        traversals=tuple(traversals),
+    )
+
+
+def movement_graph_csr(
+    profile: ExplorerTopologyProfile,
+    *,
+    dims: Coord,
+) -> MovementGraphCSR:
+    return _build_movement_graph_csr(profile, _normalized_dims(dims))
 
 
 def movement_graph_rows(
@@ -158,7 +227,7 @@ def movement_graph_rows(
     *,
     dims: Coord,
 ) -> tuple[tuple[Coord, tuple[MovementEdge, ...]], ...]:
-    return _build_movement_graph_rows(profile, _normalized_dims(dims))
+    return _build_movement_graph_csr(profile, _normalized_dims(dims)).rows
 
 
 def movement_graph_from_rows(
@@ -167,254 +236,173 @@ def movement_graph_from_rows(
     return dict(rows)
 
 
-def serialize_movement_graph_rows(
-    rows: tuple[tuple[Coord, tuple[MovementEdge, ...]], ...],
-    *,
-    dims: Coord,
-) -> list[dict[str, Any]]:
-    payload: list[dict[str, Any]] = []
-    for coord, edges in rows:
-        payload.append(
-            {
-                "coord": list(coord),
-                "edges": [
-                    {
-                        "step": edge.step.label,
-                        "target": list(edge.target),
-                        "traversal": (
-                            None
-                            if edge.traversal is None
-                            else {
-                                "glue_id": edge.traversal.glue_id,
-                                "source_boundary": {
-                                    "axis": edge.traversal.source_boundary.axis,
-                                    "side": edge.traversal.source_boundary.side,
-                                },
-                                "target_boundary": {
-                                    "axis": edge.traversal.target_boundary.axis,
-                                    "side": edge.traversal.target_boundary.side,
-                                },
-                                "source_coord": list(edge.traversal.source_coord),
-                                "target_coord": list(edge.traversal.target_coord),
-                                "entry_step": edge.traversal.entry_step.label,
-                            }
-                        ),
-                    }
-                    for edge in edges
-                ],
-            }
-        )
-    if deserialize_movement_graph_rows(payload, dims=dims) is None:
-        raise ValueError("movement graph rows do not satisfy the strict cache format")
-    return payload
-
-
-def _deserialize_boundary_ref(
-    payload: object,
-    *,
-    dimension: int,
-) -> BoundaryRef:
-    boundary = require_json_object(payload, "cache.boundary")
-    if set(boundary) != {"axis", "side"}:
-        raise ValueError("cache boundary fields must be exactly axis and side")
-    axis = require_json_int_sequence(
-        [boundary["axis"]],
-        "cache.boundary.axis",
-        minimum=0,
-        maximum=dimension - 1,
-    )[0]
-    return BoundaryRef(
-        dimension=dimension,
-        axis=axis,
-        side=require_json_string(boundary["side"], "cache.boundary.side"),
-    )
-
-
-def _deserialize_coord(payload: object, *, dims: Coord, path: str) -> Coord:
-    coord = require_json_int_sequence(payload, path)
-    if len(coord) != len(dims):
-        raise ValueError(f"{path} rank must match cache dimensions")
-    if any(value < 0 or value >= dims[axis] for axis, value in enumerate(coord)):
-        raise ValueError(f"{path} must be within cache dimensions")
-    return coord
-
-
-def _require_exact_fields(
-    payload: dict[str, object],
-    expected: set[str],
-    *,
-    path: str,
-) -> None:
-    if set(payload) != expected:
-        raise ValueError(f"{path} fields must be exactly {', '.join(sorted(expected))}")
+def encode_movement_graph_csr(graph: MovementGraphCSR) -> bytes:
+    """
+    Header and dims, then little-endian int32 offsets, targets and
+    traversal ids, then int8 step ids. Traversals are not stored; they are
+    re-resolved from the profile on decode.
+    """
+    parts = [
+        _GRAPH_HEADER.pack(
+            _GRAPH_MAGIC,
+            MOVEMENT_GRAPH_FORMAT_VERSION,
+            len(graph.dims),
+            graph.cell_count,
+            graph.edge_count,
+        ),
+        struct.pack(f"<{len(graph.dims)}I", *graph.dims),
+    ]
+    for typecode, values in (
+        ("i", graph.offsets),
+        ("i", graph.targets),
+        ("i", graph.traversal_ids),
+        ("b", graph.step_ids),
+    ):
+        packed = array(typecode, values)
+        if sys.byteorder != "little":
+            packed.byteswap()
+        parts.append(packed.tobytes())
+    return b"".join(parts)
+
+
+def _int32_view(data: memoryview) -> Sequence[int]:
+    view = data.cast("i")
+    if sys.byteorder == "little":
+        return view
+    swapped = array("i", view)
+    swapped.byteswap()
+    return swapped
+
+
+def _step_edge(graph: MovementGraphCSR, index: int, step_id: int) -> int | None:
+    for edge in range(graph.offsets[index], graph.offsets[index + 1]):
+        if graph.step_ids[edge] == step_id:
+            return edge
+    return None
+
+
+def _plain_edges_are_unit_moves(graph: MovementGraphCSR) -> bool:
+    degrees = graph.degrees()
+    step_count = len(graph.steps)
+    if min(degrees, default=0) < 0 or max(degrees, default=0) > step_count:
+        return False
+    if graph.edge_count and (
+        min(graph.targets) < 0
+        or max(graph.targets) >= graph.cell_count
+        or min(graph.step_ids) < 0
+        or max(graph.step_ids) >= step_count
+        or min(graph.traversal_ids) < -1
+    ):
+        return False
+    sources = list(chain.from_iterable(map(repeat, range(graph.cell_count), degrees)))
+    step_ids = graph.step_ids
+    # Edge slots (cell * steps + step id) strictly increase exactly when every
+    # cell lists its steps in canonical order without duplicates.
+    slots = list(map(add, map(step_count.__mul__, sources), step_ids))
+    if not all(map(lt, slots, islice(slots, 1, None))):
+        return False
+    strides = _row_major_strides(graph.dims)
+    step_offsets = [step.delta * strides[step.axis] for step in graph.steps]
+    plain = [traversal_id < 0 for traversal_id in graph.traversal_ids]
+    expected = map(add, sources, map(step_offsets.__getitem__, step_ids))
+    return not any(map(ne, compress(graph.targets, plain), compress(expected, plain)))
+
+
+def _resolved_boundary_traversals(
+    graph: MovementGraphCSR, resolver
+) -> tuple[BoundaryTraversal, ...] | None:
+    """
+    Check every boundary exit against the resolver: blocked exits must be
+    absent, seam exits present with the seam's target. Returns the seam
+    traversals in edge order, or None on any mismatch.
+    """
+    dims = graph.dims
+    axis_values = _axis_value_columns(dims)
+    traversal_by_edge: dict[int, BoundaryTraversal] = {}
+    blocked = 0
+    for step_id, step in enumerate(graph.steps):
+        for index, coord in _exit_cells(dims, axis_values, step):
+            edge = _step_edge(graph, index, step_id)
+            result = resolver.resolve_cell_step(coord, step)
+            if result.target is None:
+                if edge is not None:
+                    return None
+                blocked += 1
+                continue
+            if (
+                edge is None
+                or graph.traversal_ids[edge] < 0
+                or graph.targets[edge] != graph.index_of(result.target)
+            ):
+                return None
+            traversal_by_edge[edge] = result.traversal
+    # Every non-exit slot is present, and only seam exits carry traversals.
+    if graph.edge_count != graph.cell_count * len(graph.steps) - blocked:
+        return None
+    traversal_ids = [value for value in graph.traversal_ids if value >= 0]
+    if traversal_ids != list(range(len(traversal_by_edge))):
+        return None
+    return tuple(traversal_by_edge[edge] for edge in sorted(traversal_by_edge))
 
 
-def _deserialize_movement_edge(
-    payload: object,
+def decode_movement_graph_csr(
+    data: bytes,
+    profile: ExplorerTopologyProfile,
     *,
     dims: Coord,
-    source_coord: Coord,
-    step_by_label: dict[str, MoveStep],
-) -> MovementEdge:
-    edge_payload = require_json_object(payload, "cache.edge")
-    _require_exact_fields(
-        edge_payload,
-        {"step", "target", "traversal"},
-        path="cache.edge",
-    )
-    step_label = require_json_string(edge_payload["step"], "cache.edge.step")
-    step = step_by_label.get(step_label)
-    if step is None:
-        raise ValueError(f"cache.edge.step is unsupported: {step_label!r}")
-    target = _deserialize_coord(
-        edge_payload["target"],
-        dims=dims,
-        path="cache.edge.target",
-    )
-    traversal_payload = edge_payload["traversal"]
-    if traversal_payload is None:
-        expected_target = list(source_coord)
-        expected_target[step.axis] += step.delta
-        if tuple(expected_target) != target:
-            raise ValueError("non-traversal cache edge must be one unit movement")
-        return MovementEdge(step=step, target=target, traversal=None)
-    traversal_obj = require_json_object(traversal_payload, "cache.edge.traversal")
-    _require_exact_fields(
-        traversal_obj,
-        {
-            "glue_id",
-            "source_boundary",
-            "target_boundary",
-            "source_coord",
-            "target_coord",
-            "entry_step",
-        },
-        path="cache.edge.traversal",
-    )
-    source_boundary = _deserialize_boundary_ref(
-        traversal_obj["source_boundary"],
-        dimension=len(dims),
-    )
-    target_boundary = _deserialize_boundary_ref(
-        traversal_obj["target_boundary"],
-        dimension=len(dims),
-    )
-    entry_step_label = require_json_string(
-        traversal_obj["entry_step"],
-        "cache.edge.traversal.entry_step",
-    )
-    entry_step = step_by_label.get(entry_step_label)
-    if entry_step is None:
-        raise ValueError("cache traversal entry step is unsupported")
-    traversal_source = _deserialize_coord(
-        traversal_obj["source_coord"],
-        dims=dims,
-        path="cache.edge.traversal.source_coord",
-    )
-    traversal_target = _deserialize_coord(
-        traversal_obj["target_coord"],
-        dims=dims,
-        path="cache.edge.traversal.target_coord",
-    )
-    expected_source_boundary = _boundary_ref_for_exit(
-        dims,
-        coord=source_coord,
-        step=step,
-    )
-    if expected_source_boundary != source_boundary:
-        raise ValueError("cache traversal source boundary does not match its exit")
-    if traversal_source != source_coord or traversal_target != target:
-        raise ValueError("cache traversal coordinates must match their edge")
-    expected_entry_delta = 1 if target_boundary.side == "-" else -1
-    if entry_step != MoveStep(axis=target_boundary.axis, delta=expected_entry_delta):
-        raise ValueError("cache traversal entry step must point inward")
-    expected_target_axis_value = (
-        0 if target_boundary.side == "-" else dims[target_boundary.axis] - 1
-    )
-    if target[target_boundary.axis] != expected_target_axis_value:
-        raise ValueError("cache traversal target must lie on its target boundary")
-    glue_id = require_json_string(
-        traversal_obj["glue_id"],
-        "cache.edge.traversal.glue_id",
-    ).strip()
-    if not glue_id:
-        raise ValueError("cache traversal glue_id must be non-empty")
-    traversal = BoundaryTraversal(
-        glue_id=glue_id,
-        source_boundary=source_boundary,
-        target_boundary=target_boundary,
-        source_coord=traversal_source,
-        target_coord=traversal_target,
-        exit_step=step,
-        entry_step=entry_step,
+) -> MovementGraphCSR | None:
+    """
+    Graph arrays as views over ``data`` without copying or per-edge
+    parsing. The layout is checked, plain edges must be one-cell moves,
+    and boundary exits are re-resolved from ``profile``, which also
+    supplies the traversals. Returns None for anything that does not
+    match.
+    """
+    try:
+        normalized_dims = _normalized_dims(dims)
+        view = memoryview(data)
+        magic, version, rank, cell_count, edge_count = _GRAPH_HEADER.unpack_from(view)
+        if magic != _GRAPH_MAGIC or version != MOVEMENT_GRAPH_FORMAT_VERSION:
+            return None
+        if rank != len(normalized_dims) or cell_count != prod(normalized_dims):
+            return None
+        position = _GRAPH_HEADER.size
+        if struct.unpack_from(f"<{rank}I", view, position) != normalized_dims:
+            return None
+        position += 4 * rank
+        if len(view) != position + 4 * (cell_count + 1 + 2 * edge_count) + edge_count:
+            return None
+        int_arrays: list[Sequence[int]] = []
+        for count in (cell_count + 1, edge_count, edge_count):
+            int_arrays.append(_int32_view(view[position : position + 4 * count]))
+            position += 4 * count
+        offsets, targets, traversal_ids = int_arrays
+        if offsets[0] != 0 or offsets[-1] != edge_count:
+            return None
+        validated_profile = validate_explorer_topology_profile(
+            profile,
+            dims=normalized_dims,
+        )
+    except (struct.error, TypeError, ValueError):
+        return None
+    graph = MovementGraphCSR(
+        dims=normalized_dims,
+        steps=tuple(movement_steps_for_dimension(len(normalized_dims))),
+        offsets=offsets,
+        targets=targets,
+        step_ids=view[position:].cast("b"),
+        traversal_ids=traversal_ids,
+        traversals=(),
     )
-    return MovementEdge(
-        step=step,
-        target=target,
-        traversal=traversal,
+    if not _plain_edges_are_unit_moves(graph):
+        return None
+    traversals = _resolved_boundary_traversals(
+        graph,
+        build_explorer_transport_resolver(validated_profile, normalized_dims),
     )
-
-
-def deserialize_movement_graph_rows(
-    payload: object,
-    *,
-    dims: Coord,
-) -> tuple[tuple[Coord, tuple[MovementEdge, ...]], ...] | None:
-    try:
-        normalized_dims = require_integral_sequence(dims, "cache dims")
-        if len(normalized_dims) < 2 or any(value <= 0 for value in normalized_dims):
-            raise ValueError("cache dimensions must be positive and have rank >= 2")
-        rows_payload = require_json_array(payload, "cache.graph_rows")
-        steps = movement_steps_for_dimension(len(normalized_dims))
-        step_by_label = {step.label: step for step in steps}
-        rows: list[tuple[Coord, tuple[MovementEdge, ...]]] = []
-        seen_coords: set[Coord] = set()
-        for row_index, row_raw in enumerate(rows_payload):
-            row_path = f"cache.graph_rows[{row_index}]"
-            row_payload = require_json_object(row_raw, row_path)
-            _require_exact_fields(row_payload, {"coord", "edges"}, path=row_path)
-            coord = _deserialize_coord(
-                row_payload["coord"],
-                dims=normalized_dims,
-                path=f"{row_path}.coord",
-            )
-            if coord in seen_coords:
-                raise ValueError("cache graph coordinates must be unique")
-            seen_coords.add(coord)
-            edges_payload = require_json_array(
-                row_payload["edges"], f"{row_path}.edges"
-            )
-            edges = tuple(
-                _deserialize_movement_edge(
-                    edge_payload,
-                    dims=normalized_dims,
-                    source_coord=coord,
-                    step_by_label=step_by_label,
-                )
-                for edge_payload in edges_payload
-            )
-            edge_steps = tuple(edge.step for edge in edges)
-            if len(set(edge_steps)) != len(edge_steps):
-                raise ValueError("cache graph contains duplicate moves for one cell")
-            if edge_steps != tuple(step for step in steps if step in edge_steps):
-                raise ValueError("cache graph movement edges must use canonical order")
-            for step in steps:
-                neighbor = list(coord)
-                neighbor[step.axis] += step.delta
-                if (
-                    0 <= neighbor[step.axis] < normalized_dims[step.axis]
-                    and step not in edge_steps
-                ):
-                    raise ValueError("cache graph omits an in-bounds movement edge")
-            rows.append((coord, edges))
-        expected_coords = tuple(product(*(range(size) for size in normalized_dims)))
-        if tuple(coord for coord, _ in rows) != expected_coords:
-            raise ValueError(
-                "cache graph must contain every board coordinate exactly once"
-            )
-        return tuple(rows)
-    except (KeyError, TypeError, ValueError):
+    if traversals is None:
         return None
+    return replace(graph, traversals=traversals)
 
 
 def neighbors_for_cell(
@@ -443,5 +431,5 @@ def build_movement_graph(
 ) -> dict[Coord, tuple[MovementEdge, ...]]:
     normalized_dims = _normalized_dims(dims)
     return movement_graph_from_rows(
-        _build_movement_graph_rows(profile, normalized_dims)
+        _build_movement_graph_csr(profile, normalized_dims).rows
     )
@@ -325,6 +325,17 @@ def _translation_for_step(dimension: int, step: MoveStep) -> Coord:
     return tuple(values)
 
 
+@lru_cache(maxsize=64)
+def _step_identity_transform(
+    dimension: int, step: MoveStep
+) -> ExplorerTransportFrameTransform:
+    """Shared translation-only transform for interior moves along ``step``."""
+    return _identity_frame_transform(
+        dimension,
+        translation=_translation_for_step(dimension, step),
+    )
+
+
 def _lift_boundary_transform(
     *,
     dimension: int,
@@ -552,6 +563,62 @@ def _validate_inverse_seam_family(
                 )
 
 
+def _blocked_cell_step(coord: Coord, step: MoveStep) -> CellStepResult:
+    return CellStepResult(
+        source=coord,
+        step=step,
+        target=None,
+        traversal=None,
+        frame_transform=None,
+        piece_frame_transform=None,
+    )
+
+
+def _seam_cell_step(
+    coord: Coord, step: MoveStep, seam: DirectedBoundarySeam
+) -> CellStepResult:
+    target_coord = seam.target_for_source_coord(coord)
+    return CellStepResult(
+        source=coord,
+        step=step,
+        target=target_coord,
+        traversal=BoundaryTraversal(
+            glue_id=seam.glue_id,
+            source_boundary=seam.source_boundary,
+            target_boundary=seam.target_boundary,
+            source_coord=coord,
+            target_coord=target_coord,
+            exit_step=step,
+            entry_step=seam.entry_step,
+        ),
+        frame_transform=seam.frame_transform,
+        piece_frame_transform=seam.piece_frame_transform,
+    )
+
+
+def _compile_boundary_steps(
+    dims: Coord,
+    seam_lookup: dict[BoundaryRef, DirectedBoundarySeam],
+) -> dict[tuple[Coord, MoveStep], CellStepResult]:
+    """
+    Every outward step from every boundary cell, resolved once: a seam
+    crossing with its target and interned frame transforms, or blocked.
+    """
+    table: dict[tuple[Coord, MoveStep], CellStepResult] = {}
+    for axis in range(len(dims)):
+        for side in ("-", "+"):
+            boundary = BoundaryRef(dimension=len(dims), axis=axis, side=side)
+            step = _exit_step_for_boundary(boundary)
+            seam = seam_lookup.get(boundary)
+            for coord in _iter_boundary_coords(dims, boundary):
+                table[(coord, step)] = (
+                    _blocked_cell_step(coord, step)
+                    if seam is None
+                    else _seam_cell_step(coord, step, seam)
+                )
+    return table
+
+
 @dataclass(frozen=True)
 class ExplorerTransportResolver:
     profile: ExplorerTopologyProfile
@@ -560,6 +627,10 @@ class ExplorerTransportResolver:
     _seam_lookup: dict[BoundaryRef, DirectedBoundarySeam] = field(
         repr=False, compare=False
     )
+    # (coord, step) -> shared CellStepResult; see resolve_cell_step.
+    _step_table: dict[tuple[Coord, MoveStep], CellStepResult] = field(
+        default_factory=dict, repr=False, compare=False
+    )
 
     def seam_for_boundary(
         self,
@@ -568,6 +639,15 @@ class ExplorerTransportResolver:
         return self._seam_lookup.get(boundary)
 
     def resolve_cell_step(self, coord: Sequence[int], step: MoveStep) -> CellStepResult:
+        """
+        Table lookup: boundary exits are compiled with the resolver and
+        interior moves are memoized on first use, so repeated steps return
+        the same shared result.
+        """
+        key = (coord if type(coord) is tuple else tuple(coord), step)
+        cached = self._step_table.get(key)
+        if cached is not None:
+            return cached
         normalized_coord = tuple(int(value) for value in coord)
         if not coord_in_bounds(normalized_coord, self.dims):
             raise ValueError("coord must be in bounds")
@@ -576,63 +656,31 @@ class ExplorerTransportResolver:
 
         next_coord = list(normalized_coord)
         next_coord[int(step.axis)] += int(step.delta)
-        translated = tuple(int(value) for value in next_coord)
-        if coord_in_bounds(translated, self.dims):
-            return CellStepResult(
-                source=normalized_coord,
-                step=step,
-                target=translated,
-                traversal=None,
-                frame_transform=_identity_frame_transform(
-                    len(self.dims),
-                    translation=_translation_for_step(len(self.dims), step),
-                ),
-                piece_frame_transform=_identity_frame_transform(
-                    len(self.dims),
-                    translation=_translation_for_step(len(self.dims), step),
-                ),
-            )
-
-        source_boundary = _boundary_for_exit(normalized_coord, step, self.dims)
-        if source_boundary is None:
-            return CellStepResult(
-                source=normalized_coord,
-                step=step,
-                target=None,
-                traversal=None,
-                frame_transform=None,
-                piece_frame_transform=None,
+        translated = tuple(next_coord)
+        if not coord_in_bounds(translated, self.dims):
+            # Outward boundary steps are all compiled; keep the direct path
+            # for lookups that missed on key normalization.
+            source_boundary = _boundary_for_exit(normalized_coord, step, self.dims)
+            seam = (
+                None
+                if source_boundary is None
+                else self._seam_lookup.get(source_boundary)
             )
+            if seam is None:
+                return _blocked_cell_step(normalized_coord, step)
+            return _seam_cell_step(normalized_coord, step, seam)
 
-        seam = self._seam_lookup.get(source_boundary)
-        if seam is None:
-            return CellStepResult(
-                source=normalized_coord,
-                step=step,
-                target=None,
-                traversal=None,
-                frame_transform=None,
-                piece_frame_transform=None,
-            )
-
-        target_coord = seam.target_for_source_coord(normalized_coord)
-        traversal = BoundaryTraversal(
-            glue_id=seam.glue_id,
-            source_boundary=seam.source_boundary,
-            target_boundary=seam.target_boundary,
-            source_coord=normalized_coord,
-            target_coord=target_coord,
-            exit_step=step,
-            entry_step=seam.entry_step,
-        )
-        return CellStepResult(
+        identity = _step_identity_transform(len(self.dims), step)
+        result = CellStepResult(
             source=normalized_coord,
             step=step,
-            target=target_coord,
-            traversal=traversal,
-            frame_transform=seam.frame_transform,
-            piece_frame_transform=seam.piece_frame_transform,
+            target=translated,
+            traversal=None,
+            frame_transform=identity,
+            piece_frame_transform=identity,
         )
+        self._step_table[(normalized_coord, step)] = result
+        return result
 
     def resolve_piece_step(
         self,
@@ -673,6 +721,16 @@ class ExplorerTransportResolver:
             raise ValueError(
                 "non-blocked cell transport requires a piece-frame transform"
             )
+        if all(result.traversal is None for result in cell_steps):
+            # Interior move: every cell shares the interned step translation.
+            return PieceStepResult(
+                step=step,
+                source_cells=source_cells,
+                kind=PLAIN_TRANSLATION,
+                moved_cells=moved_cells,
+                frame_transform=piece_frame_transform,
+                cell_steps=cell_steps,
+            )
         if all(
             result.piece_frame_transform == piece_frame_transform
             for result in cell_steps
@@ -730,6 +788,7 @@ def build_explorer_transport_resolver(
         dims=normalized_dims,
         directed_seams=directed_seams,
         _seam_lookup=seam_lookup,
+        _step_table=_compile_boundary_steps(normalized_dims, seam_lookup),
     )
 
 
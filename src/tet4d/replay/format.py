@@ -165,7 +165,14 @@ _CONFIG_INT_FIELDS = frozenset(
 )
 _CONFIG_BOOL_FIELDS = frozenset({"wrap_gravity_axis", "exploration_mode"})
 _CONFIG_STRING_FIELDS = frozenset(
-    {"topology_mode", "piece_set", "kick_level", "rng_mode", "piece_set_4d"}
+    {
+        "topology_mode",
+        "piece_set",
+        "kick_level",
+        "rng_mode",
+        "piece_set_4d",
+        "board_storage",
+    }
 )
 
 
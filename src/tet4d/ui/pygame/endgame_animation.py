@@ -49,6 +49,13 @@ TERMINAL_PHASE_GAME_OVER_COMPLETE = "game_over_complete"
 # pre-split endgame phase name.
 TERMINAL_PHASE_GAME_OVER_ANIMATING = TERMINAL_PHASE_ENDGAME_SHATTER
 
+ENDGAME_SIMULATION_MODE_INLINE = "inline"
+ENDGAME_SIMULATION_MODE_THREADED = "threaded"
+ENDGAME_SIMULATION_MODES = (
+    ENDGAME_SIMULATION_MODE_INLINE,
+    ENDGAME_SIMULATION_MODE_THREADED,
+)
+
 _TAU = math.tau
 
 
@@ -70,6 +77,12 @@ def _coerce_bool(value: object, *, default: bool) -> bool:
     return bool(default)
 
 
+def _normalize_simulation_mode(value: object) -> str:
+    if isinstance(value, str) and value.strip().lower() in ENDGAME_SIMULATION_MODES:
+        return value.strip().lower()
+    return ENDGAME_SIMULATION_MODE_THREADED
+
+
 def _normalize_path_family_weights(
     value: object,
 ) -> tuple[tuple[str, int], ...]:
@@ -170,6 +183,9 @@ class EndgameAnimationTuning:
     collision_max_relics: int
     collision_velocity_sample_ms: float
     seed_salt: int
+    simulation_mode: str
+    simulation_fixed_step_ms: float
+    simulation_max_catch_up_steps: int
 
     @property
     def capture_start_ms(self) -> float:
@@ -549,6 +565,17 @@ def load_endgame_animation_tuning() -> EndgameAnimationTuning:
             minimum=1.0,
         ),
         seed_salt=_clamp_int(payload.get("seed_salt"), default=7919, minimum=0),
+        simulation_mode=_normalize_simulation_mode(payload.get("simulation_mode")),
+        simulation_fixed_step_ms=_clamp_float(
+            payload.get("simulation_fixed_step_ms"),
+            default=16.0,
+            minimum=1.0,
+        ),
+        simulation_max_catch_up_steps=_clamp_int(
+            payload.get("simulation_max_catch_up_steps"),
+            default=8,
+            minimum=1,
+        ),
     )
 
 
@@ -1832,10 +1859,36 @@ def ensure_endgame_animation(
     tuning: EndgameAnimationTuning | None = None,
 ) -> EndgameAnimationState | None:
     if not game_over:
+        stop_endgame_simulation_worker(current)
         return None
     if current is not None:
         return current
-    return build_endgame_animation_state(snapshot_factory(), tuning=tuning)
+    animation = build_endgame_animation_state(snapshot_factory(), tuning=tuning)
+    start_endgame_simulation_worker(animation)
+    return animation
+
+
+def start_endgame_simulation_worker(animation: EndgameAnimationState) -> None:
+    """
+    Step the relic explosion on a fixed-timestep worker when the tuning asks
+    for it. Only live game loops call this; states built directly (tests,
+    trace export) keep stepping inline with the frame ``dt``.
+    """
+    tuning = animation.tuning
+    controller = animation.explosion_controller
+    if controller is None or tuning.simulation_mode != ENDGAME_SIMULATION_MODE_THREADED:
+        return
+    controller.start_fixed_step_worker(
+        fixed_step_ms=float(tuning.simulation_fixed_step_ms),
+        max_catch_up_steps=int(tuning.simulation_max_catch_up_steps),
+    )
+
+
+def stop_endgame_simulation_worker(animation: EndgameAnimationState | None) -> None:
+    """Stop the fixed-step worker of an animation the loop is discarding."""
+    if animation is None or animation.explosion_controller is None:
+        return
+    animation.explosion_controller.close()
 
 
 def fragment_alpha(
@@ -2026,6 +2079,9 @@ def transform_shell_geometry(
 
 
 __all__ = [
+    "ENDGAME_SIMULATION_MODES",
+    "ENDGAME_SIMULATION_MODE_INLINE",
+    "ENDGAME_SIMULATION_MODE_THREADED",
     "TERMINAL_PHASE_ENDGAME_RELIC_FIELD",
     "TERMINAL_PHASE_ENDGAME_SHATTER",
     "TERMINAL_PHASE_GAME_OVER_ANIMATING",
@@ -2060,6 +2116,8 @@ __all__ = [
     "rotate_point",
     "rupture_flash_alpha",
     "split_endgame_locked_cells",
+    "start_endgame_simulation_worker",
+    "stop_endgame_simulation_worker",
     "transform_for_shell_fragment",
     "transform_grid_break_mark",
     "transform_shell_artifact",
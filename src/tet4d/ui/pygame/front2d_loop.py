@@ -14,6 +14,7 @@ from tet4d.ui.pygame.endgame_animation import (
 )
 from tet4d.ui.pygame.render.gfx_game import GfxFonts
 from tet4d.ui.pygame.runtime_ui.app_runtime import DisplaySettings
+from tet4d.ui.pygame.runtime_ui.loop_runner_nd import shutdown_loop_workers
 
 from . import front2d_frame, front2d_results
 from .front2d_session import LoopContext2D
@@ -109,42 +110,45 @@ def run_game_loop(
     )
 
     clock = pygame.time.Clock()
-    while True:
-        dt = clock.tick(60)
-        loop.gravity_accumulator += dt
-        cooldown = int(getattr(loop, "tutorial_action_cooldown_ms", 0))
-        if cooldown > 0:
-            loop.tutorial_action_cooldown_ms = max(0, cooldown - int(dt))
-        loop.refresh_score_multiplier()
+    try:
+        while True:
+            dt = clock.tick(60)
+            loop.gravity_accumulator += dt
+            cooldown = int(getattr(loop, "tutorial_action_cooldown_ms", 0))
+            if cooldown > 0:
+                loop.tutorial_action_cooldown_ms = max(0, cooldown - int(dt))
+            loop.refresh_score_multiplier()
 
-        screen, display_settings, terminal, continue_loop = (
-            front2d_frame._handle_loop_event_cycle(
+            screen, display_settings, terminal, continue_loop = (
+                front2d_frame._handle_loop_event_cycle(
+                    screen=screen,
+                    fonts=fonts,
+                    loop=loop,
+                    display_settings=display_settings,
+                    restart_with_record=_restart_with_record,
+                    pause_menu_runner=(
+                        front2d_results.run_pause_menu
+                        if pause_menu_runner is None
+                        else pause_menu_runner
+                    ),
+                )
+            )
+            if terminal is not None:
+                return terminal
+            if continue_loop:
+                continue
+            front2d_frame._run_game_frame_2d(
                 screen=screen,
                 fonts=fonts,
                 loop=loop,
-                display_settings=display_settings,
-                restart_with_record=_restart_with_record,
-                pause_menu_runner=(
-                    front2d_results.run_pause_menu
-                    if pause_menu_runner is None
-                    else pause_menu_runner
-                ),
+                dt=dt,
+                clear_anim_duration_ms=clear_anim_duration_ms,
             )
-        )
-        if terminal is not None:
-            return terminal
-        if continue_loop:
-            continue
-        front2d_frame._run_game_frame_2d(
-            screen=screen,
-            fonts=fonts,
-            loop=loop,
-            dt=dt,
-            clear_anim_duration_ms=clear_anim_duration_ms,
-        )
-        if not endgame_session_handled and (
-            endgame_prompt_ready(loop.endgame_animation)
-            or loop.terminal_phase == TERMINAL_PHASE_GAME_OVER_COMPLETE
-        ):
-            _record_session("game_over")
-            endgame_session_handled = True
+            if not endgame_session_handled and (
+                endgame_prompt_ready(loop.endgame_animation)
+                or loop.terminal_phase == TERMINAL_PHASE_GAME_OVER_COMPLETE
+            ):
+                _record_session("game_over")
+                endgame_session_handled = True
+    finally:
+        shutdown_loop_workers(loop)
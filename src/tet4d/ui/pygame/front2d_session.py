@@ -7,7 +7,6 @@ import pygame
 
 from tet4d.ai.playbot import PlayBotController
 from tet4d.ai.playbot.types import BotMode
-from tet4d.engine.core.model import BoardND
 from tet4d.engine.core.rng import RNG_MODE_TRUE_RANDOM
 from tet4d.engine.gameplay.api import runtime_assist_combined_score_multiplier
 from tet4d.engine.gameplay.challenge_mode import apply_challenge_prefill_2d
@@ -27,6 +26,7 @@ from tet4d.ui.pygame.runtime_ui.audio import play_sfx
 from .endgame_animation import (
     TERMINAL_PHASE_PLAYING,
     EndgameAnimationState,
+    stop_endgame_simulation_worker,
 )
 from .front2d_input import handle_game_keydown
 from .front2d_setup import (
@@ -44,7 +44,7 @@ from .front2d_tutorial import (
 
 
 def create_initial_state(cfg: GameConfig) -> GameState:
-    board = BoardND((cfg.width, cfg.height))
+    board = cfg.new_board()
     if cfg.rng_mode == RNG_MODE_TRUE_RANDOM:
         rng = random.Random()
     else:
@@ -213,6 +213,7 @@ class LoopContext2D:
         self.bot.reset_runtime()
         self.rotation_anim.reset()
         self.tutorial_action_cooldown_ms = 0
+        stop_endgame_simulation_worker(self.endgame_animation)
         self.endgame_animation = None
         self.terminal_phase = TERMINAL_PHASE_PLAYING
         self.refresh_score_multiplier()
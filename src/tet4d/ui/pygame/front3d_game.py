@@ -66,6 +66,7 @@ from tet4d.ui.pygame.endgame_animation import (
     EndgameRenderContext,
     SnapshotCell,
     create_snapshot,
+    stop_endgame_simulation_worker,
 )
 from tet4d.ui.pygame.input.camera_mouse import (
     MouseOrbitState,
@@ -671,6 +672,7 @@ class LoopContext3D(PanelDragMixin):
             create_initial_state=create_initial_state,
             refresh_score_multiplier=self.refresh_score_multiplier,
         )
+        stop_endgame_simulation_worker(self.endgame_animation)
         self.endgame_animation = None
         self.terminal_phase = TERMINAL_PHASE_PLAYING
 
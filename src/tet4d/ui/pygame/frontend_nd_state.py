@@ -2,14 +2,13 @@ from __future__ import annotations
 
 import random
 
-from tet4d.engine.core.model import BoardND
 from tet4d.engine.core.rng import RNG_MODE_TRUE_RANDOM
 from tet4d.engine.gameplay.challenge_mode import apply_challenge_prefill_nd
 from tet4d.engine.gameplay.game_nd import GameConfigND, GameStateND
 
 
 def create_initial_state(cfg: GameConfigND) -> GameStateND:
-    board = BoardND(cfg.dims)
+    board = cfg.new_board()
     if cfg.rng_mode == RNG_MODE_TRUE_RANDOM:
         rng = random.Random()
     else:
@@ -43,6 +43,9 @@ from tet4d.engine.runtime.topology_cache import (
     clear_topology_cache,
     topology_cache_usage,
 )
+from tet4d.engine.runtime.topology_playability_signal import (
+    clear_rigid_transport_scan_memo,
+)
 from tet4d.engine.topology_explorer import movement_graph as movement_graph_module
 from tet4d.engine.topology_explorer.presets import (
     explorer_preset_sections_for_dimension,
@@ -1042,8 +1045,9 @@ def _measure_topology_cache(state: _UnifiedSettingsState) -> bool:
 
 def _clear_topology_cache_action(state: _UnifiedSettingsState) -> bool:
     file_count, total_bytes = clear_topology_cache()
-    movement_graph_module._build_movement_graph_rows.cache_clear()
+    movement_graph_module._build_movement_graph_csr.cache_clear()
     build_explorer_transport_resolver.cache_clear()
+    clear_rigid_transport_scan_memo()
     state.topology_cache_file_count = 0
     state.topology_cache_size_bytes = 0
     _set_unified_status(
@@ -5,6 +5,7 @@ import pygame
 from tet4d.engine.gameplay.topology_designer import (
     GAMEPLAY_MODE_EXPLORER,
 )
+from tet4d.engine.runtime.topology_preview_compiler import TopologyPreviewCompiler
 from tet4d.engine.topology_explorer import (
     ExplorerTopologyProfile,
 )
@@ -1025,25 +1026,31 @@ def _run_playground_shell(
     if resolved_launch.startup_notice:
         _set_status(state, resolved_launch.startup_notice, is_error=True)
     clock = pygame.time.Clock()
-    while state.running:
-        _dt = clock.tick(60)
-        _process_topology_lab_events(state, _dt)
-        if not state.running:
-            break
-        screen, display_settings = _handle_pending_play_preview(
-            state,
-            screen,
-            fonts,
-            fonts_2d=fonts_2d,
-            display_settings=display_settings,
-        )
-        _handle_pending_explosion_preview(
-            state,
-            screen,
-            fonts,
-        )
-        _draw_menu(screen, fonts, state)
-        pygame.display.flip()
+    state.scene_preview_compiler = TopologyPreviewCompiler()
+    try:
+        while state.running:
+            _dt = clock.tick(60)
+            _process_topology_lab_events(state, _dt)
+            if not state.running:
+                break
+            screen, display_settings = _handle_pending_play_preview(
+                state,
+                screen,
+                fonts,
+                fonts_2d=fonts_2d,
+                display_settings=display_settings,
+            )
+            _handle_pending_explosion_preview(
+                state,
+                screen,
+                fonts,
+            )
+            _draw_menu(screen, fonts, state)
+            pygame.display.flip()
+    finally:
+        state.scene_preview_compiler.close()
+        state.scene_preview_compiler = None
+        state.scene_preview_compile_signature = None
     return _finalize_topology_lab_result(state)
 
 
@@ -28,6 +28,7 @@ from .model import (
     ExplosionRenderTrailSegment,
     ExplosionSeedCell,
     ExplosionTopologyInput,
+    ExplosionTrailBuffer,
     ExplosionTrailSample,
     StandaloneExplosionConfig,
     normalize_boundary_response,
@@ -91,6 +92,7 @@ __all__ = [
     "ExplosionRenderTrailSegment",
     "ExplosionSeedCell",
     "ExplosionTopologyInput",
+    "ExplosionTrailBuffer",
     "ExplosionTrailSample",
     "LockedCellExplosionController",
     "StandaloneExplosionConfig",
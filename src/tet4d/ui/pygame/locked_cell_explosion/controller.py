@@ -3,8 +3,9 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 from .audio import aggregate_audio_events
+from .fixed_step import FixedStepExplosionWorker
 from .model import ExplosionAudioState, ExplosionParticle, StandaloneExplosionConfig
-from .render import render_particles
+from .render import render_particles, render_simulation_frames
 from .simulation import (
     build_simulation,
     kinetic_energy_formula_text_for_particles,
@@ -20,6 +21,9 @@ class LockedCellExplosionController:
     topology: ExplosionTopologyAdapter
     audio_state: ExplosionAudioState = field(default_factory=ExplosionAudioState)
     pending_audio_events: tuple[str, ...] = ()
+    worker: FixedStepExplosionWorker | None = field(
+        default=None, repr=False, compare=False
+    )
 
     @property
     def particles(self) -> tuple[ExplosionParticle, ...]:
@@ -27,20 +31,50 @@ class LockedCellExplosionController:
 
     @property
     def elapsed_ms(self) -> float:
+        if self.worker is not None:
+            return float(self.worker.current_frame.elapsed_ms)
         return float(self.simulation.elapsed_ms)
 
     @property
     def total_kinetic_energy(self) -> float:
+        if self.worker is not None:
+            return float(self.worker.current_frame.total_kinetic_energy)
         return float(self.simulation.total_kinetic_energy)
 
     @property
     def velocity_norm_sq_sum(self) -> float:
+        if self.worker is not None:
+            return float(self.worker.current_frame.velocity_norm_sq_sum)
         return float(self.simulation.velocity_norm_sq_sum)
 
     @property
     def diagnostics_summary(self):
+        if self.worker is not None:
+            return self.worker.current_frame.diagnostics_summary
         return self.simulation.diagnostics_summary
 
+    def start_fixed_step_worker(
+        self, *, fixed_step_ms: float, max_catch_up_steps: int
+    ) -> FixedStepExplosionWorker:
+        """
+        Hand the simulation to a fixed-timestep background worker. ``step``
+        then only advances its clock and ``render_particles`` interpolates
+        its frames; without a worker both run inline, as trace export needs.
+        """
+        if self.worker is None:
+            self.worker = FixedStepExplosionWorker(
+                self.simulation,
+                self.topology,
+                fixed_step_ms=fixed_step_ms,
+                time_scale=float(self.config.time_scale),
+                max_catch_up_steps=max_catch_up_steps,
+            )
+        return self.worker
+
+    def close(self) -> None:
+        if self.worker is not None:
+            self.worker.close()
+
     def kinetic_energy_formula_text(self, *, max_terms: int = 4) -> str:
         return kinetic_energy_formula_text_for_particles(
             self.simulation.particles,
@@ -48,15 +82,18 @@ class LockedCellExplosionController:
         )
 
     def step(self, dt_ms: float) -> tuple[str, ...]:
-        raw_events = step_simulation(
-            self.simulation,
-            adapter=self.topology,
-            dt_ms=dt_ms,
-            time_scale=float(self.config.time_scale),
-        )
+        if self.worker is not None:
+            raw_events = self.worker.advance(dt_ms)
+        else:
+            raw_events = step_simulation(
+                self.simulation,
+                adapter=self.topology,
+                dt_ms=dt_ms,
+                time_scale=float(self.config.time_scale),
+            )
         self.pending_audio_events = aggregate_audio_events(
             raw_events,
-            elapsed_ms=float(self.simulation.elapsed_ms),
+            elapsed_ms=self.elapsed_ms,
             sound_enabled=bool(self.config.sound_enabled),
             state=self.audio_state,
         )
@@ -68,10 +105,22 @@ class LockedCellExplosionController:
         return events
 
     def render_particles(self, *, render_context) -> tuple[object, ...]:
+        board_dims = tuple(int(value) for value in self.config.topology.board_dims)
+        if self.worker is not None:
+            previous, current, alpha = self.worker.frames()
+            return render_simulation_frames(
+                self.simulation.particles,
+                previous=previous,
+                current=current,
+                alpha=alpha,
+                dimension=int(self.config.dimension),
+                board_dims=board_dims,
+                render_context=render_context,
+            )
         return render_particles(
             self.particles,
             dimension=int(self.config.dimension),
-            board_dims=tuple(int(value) for value in self.config.topology.board_dims),
+            board_dims=board_dims,
             render_context=render_context,
         )
 
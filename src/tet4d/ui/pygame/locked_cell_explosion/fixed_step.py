@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .model import (
+    ExplosionAudioEvent,
+    ExplosionSimulationFrame,
+    ExplosionSimulationState,
+)
+from .simulation import step_simulation
+from .topology import ExplosionTopologyAdapter
+
+_STEP_EXECUTOR: ThreadPoolExecutor | None = None
+_STEP_EXECUTOR_LOCK = threading.Lock()
+
+
+def _step_executor() -> ThreadPoolExecutor:
+    global _STEP_EXECUTOR
+    with _STEP_EXECUTOR_LOCK:
+        if _STEP_EXECUTOR is None:
+            _STEP_EXECUTOR = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="explosion-sim"
+            )
+        return _STEP_EXECUTOR
+
+
+def capture_simulation_frame(
+    state: ExplosionSimulationState,
+) -> ExplosionSimulationFrame:
+    particles = state.particles
+    return ExplosionSimulationFrame(
+        elapsed_ms=float(state.elapsed_ms),
+        positions=tuple(particle.position_nd for particle in particles),
+        rotations=tuple(particle.rotation_deg for particle in particles),
+        trail_windows=tuple(particle.trail_samples.window() for particle in particles),
+        trail_elapsed_ms=tuple(particle.trail_elapsed_ms for particle in particles),
+        trail_break_counts=tuple(
+            particle.trail_samples.break_count for particle in particles
+        ),
+        total_kinetic_energy=float(state.total_kinetic_energy),
+        velocity_norm_sq_sum=float(state.velocity_norm_sq_sum),
+        diagnostics_summary=state.diagnostics_summary,
+    )
+
+
+class FixedStepExplosionWorker:
+    """
+    Steps an explosion simulation in fixed ``fixed_step_ms`` increments on a
+    background thread while the frame loop only advances a target clock.
+    After each step the worker publishes a frame; the previous and current
+    frames form a double buffer the renderer interpolates between, one step
+    behind the target. At most ``max_catch_up_steps`` steps of backlog are
+    kept, so a slow machine slows the explosion instead of falling behind.
+    Once handed to the worker, ``state`` must not be read or stepped elsewhere.
+    """
+
+    def __init__(
+        self,
+        state: ExplosionSimulationState,
+        adapter: ExplosionTopologyAdapter,
+        *,
+        fixed_step_ms: float,
+        time_scale: float = 1.0,
+        max_catch_up_steps: int = 8,
+    ) -> None:
+        self._state = state
+        self._adapter = adapter
+        self._fixed_step_ms = max(1.0, float(fixed_step_ms))
+        self._time_scale = float(time_scale)
+        self._max_backlog_ms = self._fixed_step_ms * max(1, int(max_catch_up_steps))
+        self._condition = threading.Condition()
+        self._current = capture_simulation_frame(state)
+        self._previous = self._current
+        self._target_ms = self._current.elapsed_ms
+        self._events: list[ExplosionAudioEvent] = []
+        self._running = False
+        self._closed = False
+        self._error: BaseException | None = None
+
+    @property
+    def fixed_step_ms(self) -> float:
+        return self._fixed_step_ms
+
+    @property
+    def current_frame(self) -> ExplosionSimulationFrame:
+        with self._condition:
+            return self._current
+
+    def advance(self, dt_ms: float) -> tuple[ExplosionAudioEvent, ...]:
+        """Move the target clock on and return events stepped since last call."""
+        with self._condition:
+            self._raise_error()
+            if self._closed:
+                return ()
+            self._target_ms = min(
+                self._target_ms + max(0.0, float(dt_ms)),
+                self._current.elapsed_ms + self._max_backlog_ms,
+            )
+            if not self._running and self._step_due():
+                self._running = True
+                _step_executor().submit(self._run)
+            events = tuple(self._events)
+            self._events.clear()
+            return events
+
+    def frames(
+        self,
+    ) -> tuple[ExplosionSimulationFrame, ExplosionSimulationFrame, float]:
+        """(previous, current, alpha) for the render time one step behind target."""
+        with self._condition:
+            previous, current = self._previous, self._current
+            render_ms = self._target_ms - self._fixed_step_ms
+        span = current.elapsed_ms - previous.elapsed_ms
+        if span <= 0.0:
+            return previous, current, 1.0
+        alpha = (render_ms - previous.elapsed_ms) / span
+        return previous, current, min(1.0, max(0.0, alpha))
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until every due step has run; False on timeout."""
+        with self._condition:
+            done = self._condition.wait_for(lambda: not self._running, timeout)
+            self._raise_error()
+            return done
+
+    def close(self) -> None:
+        """Stop stepping after the step in flight; frames stay readable."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def _step_due(self) -> bool:
+        return self._current.elapsed_ms + self._fixed_step_ms <= self._target_ms
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            raise RuntimeError("explosion simulation worker failed") from self._error
+
+    def _run(self) -> None:
+        try:
+            while True:
+                with self._condition:
+                    if self._closed or not self._step_due():
+                        self._running = False
+                        self._condition.notify_all()
+                        return
+                events = step_simulation(
+                    self._state,
+                    adapter=self._adapter,
+                    dt_ms=self._fixed_step_ms,
+                    time_scale=self._time_scale,
+                )
+                frame = capture_simulation_frame(self._state)
+                with self._condition:
+                    self._previous, self._current = self._current, frame
+                    self._events.extend(events)
+        except BaseException as exc:
+            with self._condition:
+                self._error = exc
+                self._running = False
+                self._condition.notify_all()
+            raise
+
+
+__all__ = [
+    "FixedStepExplosionWorker",
+    "capture_simulation_frame",
+]
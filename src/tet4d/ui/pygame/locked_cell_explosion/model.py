@@ -332,6 +332,152 @@ def split_endgame_cells(
     )
 
 
+@dataclass(frozen=True)
+class ExplosionTrailSample:
+    position_nd: VecN
+    elapsed_ms: float
+    segment_break: bool = False
+
+
+class ExplosionTrailBuffer:
+    """
+    Fixed-capacity ring of trail samples, oldest first. Positions, times and
+    break flags live in parallel slot lists indexed by an absolute sample
+    number; appending past capacity overwrites the oldest slot and expiry
+    only advances the head. Iterating yields ``ExplosionTrailSample`` views;
+    renderers read ``window()`` slices instead.
+    """
+
+    __slots__ = (
+        "_break_count",
+        "_breaks",
+        "_elapsed_ms",
+        "_end",
+        "_last_point",
+        "_positions",
+        "_start",
+    )
+
+    def __init__(self, capacity: int = EXPLOSION_TRAIL_MAX_SAMPLES) -> None:
+        size = max(1, int(capacity))
+        self._positions: list[VecN] = [()] * size
+        self._elapsed_ms: list[float] = [0.0] * size
+        self._breaks: list[bool] = [False] * size
+        self._start = 0
+        self._end = 0
+        self._last_point = -1
+        self._break_count = 0
+
+    @classmethod
+    def from_samples(
+        cls,
+        samples,
+        *,
+        capacity: int = EXPLOSION_TRAIL_MAX_SAMPLES,
+    ) -> ExplosionTrailBuffer:
+        buffer = cls(capacity)
+        for sample in samples:
+            buffer.append(
+                tuple(sample.position_nd),
+                float(sample.elapsed_ms),
+                segment_break=bool(sample.segment_break),
+            )
+        return buffer
+
+    @property
+    def capacity(self) -> int:
+        return len(self._positions)
+
+    @property
+    def break_count(self) -> int:
+        """Segment breaks ever appended; expiry and resizing never lower it."""
+        return self._break_count
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def __iter__(self):
+        positions, elapsed_ms, breaks = self.window()
+        for position, elapsed, segment_break in zip(positions, elapsed_ms, breaks):
+            yield ExplosionTrailSample(
+                position_nd=position,
+                elapsed_ms=elapsed,
+                segment_break=segment_break,
+            )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ExplosionTrailBuffer):
+            return NotImplemented
+        return self.capacity == other.capacity and self.window() == other.window()
+
+    def __repr__(self) -> str:
+        return f"ExplosionTrailBuffer(capacity={self.capacity}, samples={list(self)!r})"
+
+    def append(
+        self, position_nd: VecN, elapsed_ms: float, *, segment_break: bool = False
+    ) -> None:
+        slot = self._end % len(self._positions)
+        self._positions[slot] = position_nd
+        self._elapsed_ms[slot] = elapsed_ms
+        self._breaks[slot] = segment_break
+        if segment_break:
+            self._break_count += 1
+        else:
+            self._last_point = self._end
+        self._end += 1
+        if self._end - self._start > len(self._positions):
+            self._start += 1
+
+    def last_point(self) -> tuple[VecN, float] | None:
+        """Newest retained non-break sample as (position, elapsed_ms)."""
+        if self._last_point < self._start:
+            return None
+        slot = self._last_point % len(self._positions)
+        return self._positions[slot], self._elapsed_ms[slot]
+
+    def expire_before(self, cutoff_ms: float) -> None:
+        """Drop samples older than ``cutoff_ms`` (times never decrease)."""
+        size = len(self._positions)
+        elapsed_ms = self._elapsed_ms
+        while self._start < self._end and elapsed_ms[self._start % size] < cutoff_ms:
+            self._start += 1
+
+    def resize(self, capacity: int) -> None:
+        """Change capacity, keeping the newest samples."""
+        size = max(1, int(capacity))
+        if size == len(self._positions):
+            return
+        positions, elapsed_ms, breaks = self.window()
+        kept = len(positions) - min(len(positions), size)
+        self._positions = positions[kept:] + [()] * (size - len(positions) + kept)
+        self._elapsed_ms = elapsed_ms[kept:] + [0.0] * (size - len(positions) + kept)
+        self._breaks = breaks[kept:] + [False] * (size - len(positions) + kept)
+        offset = self._start + kept
+        self._last_point = (
+            -1 if self._last_point < offset else self._last_point - offset
+        )
+        self._start = 0
+        self._end = len(positions) - kept
+
+    def window(self) -> tuple[list[VecN], list[float], list[bool]]:
+        """Retained (positions, elapsed_ms, segment_breaks), oldest first."""
+        size = len(self._positions)
+        head = self._start % size
+        tail = head + (self._end - self._start)
+        if tail <= size:
+            return (
+                self._positions[head:tail],
+                self._elapsed_ms[head:tail],
+                self._breaks[head:tail],
+            )
+        tail -= size
+        return (
+            self._positions[head:] + self._positions[:tail],
+            self._elapsed_ms[head:] + self._elapsed_ms[:tail],
+            self._breaks[head:] + self._breaks[:tail],
+        )
+
+
 @dataclass
 class ExplosionParticle:
     particle_id: int
@@ -349,14 +495,7 @@ class ExplosionParticle:
     trail_elapsed_ms: float = 0.0
     trail_max_lifetime_ms: float = EXPLOSION_TRAIL_MAX_LIFETIME_MS
     trail_max_samples: int = EXPLOSION_TRAIL_MAX_SAMPLES
-    trail_samples: list[ExplosionTrailSample] = field(default_factory=list)
-
-
-@dataclass(frozen=True)
-class ExplosionTrailSample:
-    position_nd: VecN
-    elapsed_ms: float
-    segment_break: bool = False
+    trail_samples: ExplosionTrailBuffer = field(default_factory=ExplosionTrailBuffer)
 
 
 @dataclass(frozen=True)
@@ -488,3 +627,21 @@ class ExplosionSimulationState:
     )
     diagnostics_summary: ExplosionDiagnosticsSummary | None = None
     last_step_events: tuple[EndgameModelEvent, ...] = ()
+
+
+@dataclass(frozen=True)
+class ExplosionSimulationFrame:
+    """
+    What the renderer needs from the simulation after one step, as parallel
+    columns indexed like ``ExplosionSimulationState.particles``.
+    """
+
+    elapsed_ms: float
+    positions: tuple[VecN, ...]
+    rotations: tuple[Vec3, ...]
+    trail_windows: tuple[tuple[list[VecN], list[float], list[bool]], ...]
+    trail_elapsed_ms: tuple[float, ...]
+    trail_break_counts: tuple[int, ...]
+    total_kinetic_energy: float = 0.0
+    velocity_norm_sq_sum: float = 0.0
+    diagnostics_summary: ExplosionDiagnosticsSummary | None = None
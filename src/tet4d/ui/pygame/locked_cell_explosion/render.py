@@ -11,7 +11,7 @@ from .model import (
     ExplosionParticle,
     ExplosionRenderParticle,
     ExplosionRenderTrailSegment,
-    ExplosionTrailSample,
+    ExplosionSimulationFrame,
 )
 
 
@@ -107,13 +107,13 @@ def _trail_strength_for_age(age_ms: float, *, max_lifetime_ms: float) -> float:
 
 
 def _trail_style_for_sample(
-    sample: ExplosionTrailSample,
+    sample_elapsed_ms: float,
     *,
     elapsed_ms: float,
     max_lifetime_ms: float,
 ) -> tuple[float, float]:
     strength = _trail_strength_for_age(
-        float(elapsed_ms) - float(sample.elapsed_ms),
+        float(elapsed_ms) - float(sample_elapsed_ms),
         max_lifetime_ms=max_lifetime_ms,
     )
     alpha = 0.18 + (0.72 * strength)
@@ -122,24 +122,28 @@ def _trail_style_for_sample(
 
 
 def _render_trail_segments(
-    particle: ExplosionParticle,
+    trail_window: tuple[list[Any], list[float], list[bool]],
     *,
+    max_lifetime_ms: float,
     dimension: int,
     board_dims: tuple[int, ...],
     render_context: Any | None,
     elapsed_ms: float,
 ) -> tuple[ExplosionRenderTrailSegment, ...]:
     segments: list[ExplosionRenderTrailSegment] = []
-    previous_sample: ExplosionTrailSample | None = None
-    max_lifetime_ms = float(getattr(particle, "trail_max_lifetime_ms", 1.0))
-    for sample in tuple(particle.trail_samples):
-        if sample.segment_break:
-            previous_sample = None
+    previous_position: tuple[float, ...] | None = None
+    positions, sample_elapsed_ms, breaks = trail_window
+    for raw_position, sample_elapsed, segment_break in zip(
+        positions, sample_elapsed_ms, breaks
+    ):
+        if segment_break:
+            previous_position = None
             continue
-        if previous_sample is not None:
+        position = tuple(float(value) for value in raw_position)
+        if previous_position is not None:
             tail_render_position, tail_layer_weights, _tail_layer_scales = (
                 _project_position_for_render(
-                    tuple(float(value) for value in previous_sample.position_nd),
+                    previous_position,
                     dimension=dimension,
                     board_dims=board_dims,
                     render_context=render_context,
@@ -147,25 +151,21 @@ def _render_trail_segments(
             )
             head_render_position, head_layer_weights, _head_layer_scales = (
                 _project_position_for_render(
-                    tuple(float(value) for value in sample.position_nd),
+                    position,
                     dimension=dimension,
                     board_dims=board_dims,
                     render_context=render_context,
                 )
             )
             alpha, width = _trail_style_for_sample(
-                sample,
+                sample_elapsed,
                 elapsed_ms=elapsed_ms,
                 max_lifetime_ms=max_lifetime_ms,
             )
             segments.append(
                 ExplosionRenderTrailSegment(
-                    tail_position_nd=tuple(
-                        float(value) for value in previous_sample.position_nd
-                    ),
-                    head_position_nd=tuple(
-                        float(value) for value in sample.position_nd
-                    ),
+                    tail_position_nd=previous_position,
+                    head_position_nd=position,
                     tail_render_position=tail_render_position,
                     head_render_position=head_render_position,
                     tail_layer_weights=tail_layer_weights,
@@ -174,37 +174,42 @@ def _render_trail_segments(
                     width=width,
                 )
             )
-        previous_sample = sample
+        previous_position = position
     return tuple(segments)
 
 
-def project_particle_for_render(
+def _project_particle_state(
     particle: ExplosionParticle,
     *,
+    position_nd: tuple[float, ...],
+    rotation_deg: tuple[float, float, float],
+    trail_window: tuple[list[Any], list[float], list[bool]],
+    trail_elapsed_ms: float,
     dimension: int,
     board_dims: tuple[int, ...],
     render_context: Any | None,
 ) -> ExplosionRenderParticle:
     render_position, layer_weights, layer_scales = _project_position_for_render(
-        tuple(float(value) for value in particle.position_nd),
+        tuple(float(value) for value in position_nd),
         dimension=dimension,
         board_dims=board_dims,
         render_context=render_context,
     )
     trail_segments = _render_trail_segments(
-        particle,
+        trail_window,
+        max_lifetime_ms=float(getattr(particle, "trail_max_lifetime_ms", 1.0)),
         dimension=dimension,
         board_dims=board_dims,
         render_context=render_context,
-        elapsed_ms=float(getattr(particle, "trail_elapsed_ms", 0.0)),
+        elapsed_ms=float(trail_elapsed_ms),
     )
     if render_context is None or int(dimension) < 4:
         return ExplosionRenderParticle(
             particle_id=particle.particle_id,
             source_coord=particle.source_coord,
-            position_nd=particle.position_nd,
+            position_nd=position_nd,
             render_position=render_position,
-            rotation_deg=particle.rotation_deg,
+            rotation_deg=rotation_deg,
             alpha=1.0,
             color_id=particle.color_id,
             layer_scales=layer_scales,
@@ -213,9 +218,9 @@ def project_particle_for_render(
     return ExplosionRenderParticle(
         particle_id=particle.particle_id,
         source_coord=particle.source_coord,
-        position_nd=particle.position_nd,
+        position_nd=position_nd,
         render_position=render_position,
-        rotation_deg=particle.rotation_deg,
+        rotation_deg=rotation_deg,
         alpha=1.0,
         color_id=particle.color_id,
         layer_weights=layer_weights,
@@ -224,6 +229,25 @@ def project_particle_for_render(
     )
 
 
+def project_particle_for_render(
+    particle: ExplosionParticle,
+    *,
+    dimension: int,
+    board_dims: tuple[int, ...],
+    render_context: Any | None,
+) -> ExplosionRenderParticle:
+    return _project_particle_state(
+        particle,
+        position_nd=particle.position_nd,
+        rotation_deg=particle.rotation_deg,
+        trail_window=particle.trail_samples.window(),
+        trail_elapsed_ms=float(getattr(particle, "trail_elapsed_ms", 0.0)),
+        dimension=dimension,
+        board_dims=board_dims,
+        render_context=render_context,
+    )
+
+
 def render_particles(
     particles: tuple[ExplosionParticle, ...] | list[ExplosionParticle],
     *,
@@ -240,3 +264,54 @@ def render_particles(
         )
         for particle in particles
     )
+
+
+def _lerp_angle_deg(start: float, end: float, alpha: float) -> float:
+    delta = ((end - start + 180.0) % 360.0) - 180.0
+    return (start + (delta * alpha)) % 360.0
+
+
+def render_simulation_frames(
+    particles: tuple[ExplosionParticle, ...] | list[ExplosionParticle],
+    *,
+    previous: ExplosionSimulationFrame,
+    current: ExplosionSimulationFrame,
+    alpha: float,
+    dimension: int,
+    board_dims: tuple[int, ...],
+    render_context: Any | None,
+) -> tuple[ExplosionRenderParticle, ...]:
+    """
+    Render ``alpha`` of the way from ``previous`` to ``current``. Particles
+    that crossed a seam in between are drawn at ``current``; trails always
+    come from ``current``.
+    """
+    rendered: list[ExplosionRenderParticle] = []
+    for index, particle in enumerate(particles):
+        position = current.positions[index]
+        rotation = current.rotations[index]
+        if (
+            alpha < 1.0
+            and previous.trail_break_counts[index] == current.trail_break_counts[index]
+        ):
+            start = previous.positions[index]
+            position = tuple(a + ((b - a) * alpha) for a, b in zip(start, position))
+            start_rotation = previous.rotations[index]
+            rotation = (
+                _lerp_angle_deg(start_rotation[0], rotation[0], alpha),
+                _lerp_angle_deg(start_rotation[1], rotation[1], alpha),
+                _lerp_angle_deg(start_rotation[2], rotation[2], alpha),
+            )
+        rendered.append(
+            _project_particle_state(
+                particle,
+                position_nd=position,
+                rotation_deg=rotation,
+                trail_window=current.trail_windows[index],
+                trail_elapsed_ms=current.trail_elapsed_ms[index],
+                dimension=dimension,
+                board_dims=board_dims,
+                render_context=render_context,
+            )
+        )
+    return tuple(rendered)
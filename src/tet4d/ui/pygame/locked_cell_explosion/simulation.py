@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import heapq
+import itertools
 import math
 import random
 
@@ -29,6 +31,7 @@ from .model import (
     ExplosionSeedCell,
     ExplosionSimulationState,
     ExplosionTopologyInput,
+    ExplosionTrailBuffer,
     ExplosionTrailSample,
     StandaloneExplosionConfig,
     clamp_collision_elasticity,
@@ -230,12 +233,10 @@ def _initial_particle(
         collision_mass=mass,
         trail_max_lifetime_ms=clamp_trace_retention_ms(trace_retention_ms),
         trail_max_samples=trail_sample_budget_for_lifetime_ms(trace_retention_ms),
-        trail_samples=[
-            ExplosionTrailSample(
-                position_nd=origin,
-                elapsed_ms=0.0,
-            )
-        ],
+        trail_samples=ExplosionTrailBuffer.from_samples(
+            (ExplosionTrailSample(position_nd=origin, elapsed_ms=0.0),),
+            capacity=trail_sample_budget_for_lifetime_ms(trace_retention_ms),
+        ),
     )
 
 
@@ -260,11 +261,7 @@ def assign_particle_masses(
         )
 
 
-def _trim_trail_samples(
-    particle: ExplosionParticle,
-    *,
-    elapsed_ms: float,
-) -> None:
+def _trail_limits(particle: ExplosionParticle) -> tuple[float, int]:
     max_lifetime_ms = max(
         EXPLOSION_TRAIL_MIN_TIME_SPACING_MS,
         float(
@@ -275,22 +272,23 @@ def _trim_trail_samples(
         1,
         int(getattr(particle, "trail_max_samples", EXPLOSION_TRAIL_MAX_SAMPLES)),
     )
-    cutoff = float(elapsed_ms) - max_lifetime_ms
-    samples = [
-        sample
-        for sample in particle.trail_samples
-        if float(sample.elapsed_ms) >= cutoff
-    ]
+    return max_lifetime_ms, max_samples
+
+
+def _trim_trail_samples(
+    particle: ExplosionParticle,
+    *,
+    elapsed_ms: float,
+) -> None:
+    max_lifetime_ms, max_samples = _trail_limits(particle)
+    samples = particle.trail_samples
+    samples.resize(max_samples)
+    samples.expire_before(float(elapsed_ms) - max_lifetime_ms)
     if not samples:
-        samples = [
-            ExplosionTrailSample(
-                position_nd=tuple(float(value) for value in particle.position_nd),
-                elapsed_ms=float(elapsed_ms),
-            )
-        ]
-    if len(samples) > max_samples:
-        samples = samples[-max_samples:]
-    particle.trail_samples = samples
+        samples.append(
+            tuple(float(value) for value in particle.position_nd),
+            float(elapsed_ms),
+        )
     particle.trail_elapsed_ms = float(elapsed_ms)
 
 
@@ -309,32 +307,22 @@ def _record_trail_sample(
         )
     )
     particle.trail_elapsed_ms = float(elapsed_ms)
-    if not force and particle.trail_samples:
-        last_sample = next(
-            (
-                sample
-                for sample in reversed(particle.trail_samples)
-                if not sample.segment_break
-            ),
-            None,
-        )
-        if last_sample is not None:
-            elapsed_delta = float(elapsed_ms) - float(last_sample.elapsed_ms)
-            distance_delta = _vec_len(
-                _vec_sub(sample_position, tuple(last_sample.position_nd))
-            )
+    samples = particle.trail_samples
+    if not force and samples:
+        last_point = samples.last_point()
+        if last_point is not None:
+            last_position, last_elapsed_ms = last_point
+            elapsed_delta = float(elapsed_ms) - float(last_elapsed_ms)
+            distance_delta = _vec_len(_vec_sub(sample_position, last_position))
             if (
                 elapsed_delta < EXPLOSION_TRAIL_MIN_TIME_SPACING_MS
                 or distance_delta < EXPLOSION_TRAIL_MIN_MOVEMENT_SPACING
             ):
                 _trim_trail_samples(particle, elapsed_ms=elapsed_ms)
                 return
-    particle.trail_samples.append(
-        ExplosionTrailSample(
-            position_nd=sample_position,
-            elapsed_ms=float(elapsed_ms),
-            segment_break=bool(segment_break),
-        )
+    samples.resize(_trail_limits(particle)[1])
+    samples.append(
+        sample_position, float(elapsed_ms), segment_break=bool(segment_break)
     )
     _trim_trail_samples(particle, elapsed_ms=elapsed_ms)
 
@@ -881,6 +869,68 @@ def _step_particle(
     return tuple(events)
 
 
+class _CollisionGrid:
+    """
+    Uniform N-d broad-phase grid over particle indices. Cells are at least
+    one collision reach wide, so every pair that can overlap lies in the
+    same or an adjacent cell. Cell coordinates are packed into one integer
+    key; the packing is linear, so a neighbour is always ``key + delta`` (far
+    cells may alias, which only adds candidates).
+    """
+
+    _KEY_STRIDE = 1 << 20
+
+    def __init__(self, particles: list[ExplosionParticle]) -> None:
+        reach = 2.0 * max(float(particle.collision_radius) for particle in particles)
+        # The epsilon keeps rounding in the cell division from splitting a
+        # pair closer than ``reach`` across non-adjacent cells.
+        self._cell_size = max(reach, _EPSILON) + _EPSILON
+        dimension = len(particles[0].position_nd)
+        self._strides = tuple(self._KEY_STRIDE**axis for axis in range(dimension))
+        self._deltas = tuple(
+            sum(step * stride for step, stride in zip(offset, self._strides))
+            for offset in itertools.product((-1, 0, 1), repeat=dimension)
+        )
+        self._cells: dict[int, set[int]] = {}
+        self._cell_of: list[int] = []
+        for index, particle in enumerate(particles):
+            cell = self._cell_for(particle.position_nd)
+            self._cell_of.append(cell)
+            self._cells.setdefault(cell, set()).add(index)
+
+    def _cell_for(self, position: tuple[float, ...]) -> int:
+        size = self._cell_size
+        return sum(
+            math.floor(float(value) / size) * stride
+            for value, stride in zip(position, self._strides)
+        )
+
+    def move(self, index: int, position: tuple[float, ...]) -> bool:
+        """Re-bucket ``index`` at ``position``; True when its cell changed."""
+        cell = self._cell_for(position)
+        previous = self._cell_of[index]
+        if cell == previous:
+            return False
+        bucket = self._cells[previous]
+        bucket.discard(index)
+        if not bucket:
+            del self._cells[previous]
+        self._cells.setdefault(cell, set()).add(index)
+        self._cell_of[index] = cell
+        return True
+
+    def neighbors(self, index: int, *, after: int) -> list[int]:
+        """Indices above ``after`` in the cells around ``index``."""
+        cell = self._cell_of[index]
+        cells = self._cells
+        found: list[int] = []
+        for delta in self._deltas:
+            bucket = cells.get(cell + delta)
+            if bucket:
+                found.extend(other for other in bucket if other > after)
+        return found
+
+
 def _resolve_collisions(
     particles: list[ExplosionParticle],
     *,
@@ -889,84 +939,124 @@ def _resolve_collisions(
     step_index: int,
     model_events: list[EndgameModelEvent],
 ) -> tuple[ExplosionAudioEvent, ...]:
+    """
+    Resolve overlapping pairs in (lower id, higher id) order. The grid only
+    narrows which partners are tested: a left particle pushed into another
+    cell re-queries its neighbours, so the result matches testing every
+    pair in order.
+    """
     if len(particles) < 2:
         return ()
     restitution = clamp_collision_elasticity(collision_elasticity)
     events: list[ExplosionAudioEvent] = []
     ordered = sorted(particles, key=lambda particle: particle.particle_id)
+    grid = _CollisionGrid(ordered)
     for left_index, left in enumerate(ordered):
-        for right in ordered[left_index + 1 :]:
-            delta = _vec_sub(right.position_nd, left.position_nd)
-            distance = _vec_len(delta)
-            minimum = float(left.collision_radius) + float(right.collision_radius)
-            if distance >= minimum:
+        pending = grid.neighbors(left_index, after=left_index)
+        heapq.heapify(pending)
+        queued = set(pending)
+        while pending:
+            right_index = heapq.heappop(pending)
+            right = ordered[right_index]
+            if not _resolve_collision_pair(
+                left,
+                right,
+                restitution=restitution,
+                collided_particle_ids=collided_particle_ids,
+                step_index=step_index,
+                model_events=model_events,
+                events=events,
+            ):
                 continue
-            normal = _normalize(
-                delta,
-                default=tuple(
-                    1.0
-                    if axis
-                    == (right.particle_id + left.particle_id) % len(left.position_nd)
-                    else 0.0
-                    for axis in range(len(left.position_nd))
-                ),
-            )
-            overlap = max(0.0, minimum - distance)
-            total_mass = max(
-                0.001, float(left.collision_mass) + float(right.collision_mass)
-            )
-            left_share = float(right.collision_mass) / total_mass
-            right_share = float(left.collision_mass) / total_mass
-            left.position_nd = _vec_sub(
-                left.position_nd, _vec_mul(normal, overlap * left_share)
-            )
-            right.position_nd = _vec_add(
-                right.position_nd, _vec_mul(normal, overlap * right_share)
+            grid.move(right_index, right.position_nd)
+            if not grid.move(left_index, left.position_nd):
+                continue
+            for other in grid.neighbors(left_index, after=right_index):
+                if other not in queued:
+                    queued.add(other)
+                    heapq.heappush(pending, other)
+    return tuple(events)
+
+
+def _resolve_collision_pair(
+    left: ExplosionParticle,
+    right: ExplosionParticle,
+    *,
+    restitution: float,
+    collided_particle_ids: set[int] | None,
+    step_index: int,
+    model_events: list[EndgameModelEvent],
+    events: list[ExplosionAudioEvent],
+) -> bool:
+    """Separate and bounce one pair; False when it does not overlap."""
+    delta = _vec_sub(right.position_nd, left.position_nd)
+    distance = _vec_len(delta)
+    minimum = float(left.collision_radius) + float(right.collision_radius)
+    if distance >= minimum:
+        return False
+    normal = _normalize(
+        delta,
+        default=tuple(
+            1.0
+            if axis == (right.particle_id + left.particle_id) % len(left.position_nd)
+            else 0.0
+            for axis in range(len(left.position_nd))
+        ),
+    )
+    overlap = max(0.0, minimum - distance)
+    total_mass = max(0.001, float(left.collision_mass) + float(right.collision_mass))
+    left_share = float(right.collision_mass) / total_mass
+    right_share = float(left.collision_mass) / total_mass
+    left.position_nd = _vec_sub(
+        left.position_nd, _vec_mul(normal, overlap * left_share)
+    )
+    right.position_nd = _vec_add(
+        right.position_nd, _vec_mul(normal, overlap * right_share)
+    )
+    relative_speed = _vec_dot(_vec_sub(right.velocity_nd, left.velocity_nd), normal)
+    if relative_speed < 0.0:
+        if collided_particle_ids is not None:
+            collided_particle_ids.add(int(left.particle_id))
+            collided_particle_ids.add(int(right.particle_id))
+        impulse = -((1.0 + restitution) * relative_speed) / total_mass
+        left.velocity_nd = _vec_mul(
+            _vec_sub(
+                left.velocity_nd,
+                _vec_mul(normal, impulse * float(right.collision_mass)),
+            ),
+            _COLLISION_DAMPING,
+        )
+        right.velocity_nd = _vec_mul(
+            _vec_add(
+                right.velocity_nd,
+                _vec_mul(normal, impulse * float(left.collision_mass)),
+            ),
+            _COLLISION_DAMPING,
+        )
+        events.append(
+            ExplosionAudioEvent(
+                family="collision",
+                strength=max(0.35, abs(relative_speed)),
             )
-            relative_speed = _vec_dot(
-                _vec_sub(right.velocity_nd, left.velocity_nd), normal
+        )
+        model_events.append(
+            EndgameModelEvent(
+                step_index=int(step_index),
+                particle_id=int(left.particle_id),
+                kind="collision",
+                other_particle_id=int(right.particle_id),
             )
-            if relative_speed < 0.0:
-                if collided_particle_ids is not None:
-                    collided_particle_ids.add(int(left.particle_id))
-                    collided_particle_ids.add(int(right.particle_id))
-                impulse = -((1.0 + restitution) * relative_speed) / total_mass
-                left.velocity_nd = _vec_mul(
-                    _vec_sub(
-                        left.velocity_nd,
-                        _vec_mul(normal, impulse * float(right.collision_mass)),
-                    ),
-                    _COLLISION_DAMPING,
-                )
-                right.velocity_nd = _vec_mul(
-                    _vec_add(
-                        right.velocity_nd,
-                        _vec_mul(normal, impulse * float(left.collision_mass)),
-                    ),
-                    _COLLISION_DAMPING,
-                )
-                events.append(
-                    ExplosionAudioEvent(
-                        family="collision",
-                        strength=max(0.35, abs(relative_speed)),
-                    )
-                )
-                model_events.append(
-                    EndgameModelEvent(
-                        step_index=int(step_index),
-                        particle_id=int(left.particle_id),
-                        kind="collision",
-                        other_particle_id=int(right.particle_id),
-                    )
-                )
-    return tuple(events)
+        )
+    return True
 
 
 def _build_diagnostics_summary(
     state: ExplosionSimulationState,
     *,
+    particles: tuple[ExplosionParticle, ...],
+    speed_sq: list[float],
+    weighted_speed_sq_sum: float,
     before_energy: float,
-    before_weighted_sum: float,
     particle_stage_data: dict[int, dict[str, object]],
     before_collision_energy: float,
     after_collision_energy: float,
@@ -989,13 +1079,24 @@ def _build_diagnostics_summary(
     step_events: list[ExplosionDiagnosticsEvent] = []
     particle_details: list[ExplosionParticleDiagnostics] = []
     contact_count = 0
-    for particle in state.particles:
-        if not particle.active:
+    summary_only = mode != EXPLOSION_DIAGNOSTICS_MODE_FULL
+    previous_speed_sq_by_particle = state.diagnostics_previous_speed_sq_by_particle
+    for particle, particle_speed_sq in zip(particles, speed_sq):
+        data = particle_stage_data.get(particle.particle_id, {})
+        if (
+            summary_only
+            and particle_details
+            and data.get("free_flight")
+            and particle.particle_id not in collided_particle_ids
+        ):
+            # Untouched free flight cannot flag; summaries keep one detail.
+            previous_speed_sq_by_particle[particle.particle_id] = particle_speed_sq
             continue
         detail, particle_events, particle_contacts = _particle_diagnostics_for_step(
             state,
             particle=particle,
-            data=particle_stage_data.get(particle.particle_id, {}),
+            speed_sq=particle_speed_sq,
+            data=data,
             collided_particle_ids=collided_particle_ids,
             seam_energy_before_after=seam_energy_before_after,
             boundary_energy_before_after=boundary_energy_before_after,
@@ -1025,9 +1126,7 @@ def _build_diagnostics_summary(
         diagnostics_mode=mode,
         step_index=int(state.diagnostics_step_index),
         kinetic_energy=float(state.total_kinetic_energy),
-        weighted_speed_sq_sum=float(
-            velocity_norm_sq_sum_for_particles(state.particles, weighted_by_mass=True)
-        ),
+        weighted_speed_sq_sum=float(weighted_speed_sq_sum),
         delta_kinetic_energy=float(state.total_kinetic_energy - before_energy),
         contact_count=int(contact_count),
         suspicious_count=len(step_events),
@@ -1043,6 +1142,7 @@ def _particle_diagnostics_for_step(
     state: ExplosionSimulationState,
     *,
     particle: ExplosionParticle,
+    speed_sq: float,
     data: dict[str, object],
     collided_particle_ids: set[int],
     seam_energy_before_after: dict[int, tuple[float, float]],
@@ -1053,7 +1153,6 @@ def _particle_diagnostics_for_step(
     before_velocity = tuple(data.get("before_velocity", particle.velocity_nd))
     after_velocity = tuple(data.get("after_finalize_velocity", particle.velocity_nd))
     heading_delta = _heading_delta_deg(before_velocity, after_velocity)
-    speed_sq = _speed_sq_for_particle(particle)
     previous_speed_sq = float(
         state.diagnostics_previous_speed_sq_by_particle.get(
             particle.particle_id, speed_sq
@@ -1249,46 +1348,148 @@ def _collision_diagnostics_events(
     return events
 
 
-def step_simulation(
-    state: ExplosionSimulationState,
+def _free_flight_mask(
+    particles: tuple[ExplosionParticle, ...],
     *,
-    adapter: ExplosionTopologyAdapter,
-    dt_ms: float,
-    time_scale: float,
-) -> tuple[ExplosionAudioEvent, ...]:
-    dt_seconds = max(0.0, float(dt_ms)) * max(0.05, float(time_scale)) / 1000.0
-    state.elapsed_ms += max(0.0, float(dt_ms))
-    if dt_seconds <= 0.0:
-        state.last_step_events = ()
-        return ()
-    state.diagnostics_step_index += 1
-    before_energy = float(state.total_kinetic_energy)
-    before_weighted_sum = float(
-        velocity_norm_sq_sum_for_particles(state.particles, weighted_by_mass=True)
-    )
-    particle_stage_data: dict[int, dict[str, object]] = {}
-    events: list[ExplosionAudioEvent] = []
-    model_events: list[EndgameModelEvent] = []
-    for particle in state.particles:
-        diagnostics = particle_stage_data.setdefault(particle.particle_id, {})
-        events.extend(
-            _step_particle(
-                particle,
-                dt_seconds=dt_seconds,
-                adapter=adapter,
-                boundary_response=state.boundary_response,
-                elapsed_ms=state.elapsed_ms,
-                step_index=state.diagnostics_step_index,
-                model_events=model_events,
-                diagnostics=diagnostics,
+    dt_seconds: float,
+    board_dims: tuple[int, ...],
+) -> list[bool]:
+    """
+    Column pass over ``particles``: True where no wall is reachable within
+    the step, so the particle skips the per-particle contact loop. The
+    horizon keeps a margin over ``_boundary_time``'s tie epsilon; escaped
+    particles always fly free.
+    """
+    horizon = float(dt_seconds) + 2.0 * _EPSILON
+    reach = [False] * len(particles)
+    positions = [particle.position_nd for particle in particles]
+    velocities = [particle.velocity_nd for particle in particles]
+    for axis, (low, high) in enumerate(board_boundary_limits(board_dims)):
+        reach = [
+            hit
+            or (v > _EPSILON and -_EPSILON <= (high - x) / v <= horizon)
+            or (v < -_EPSILON and -_EPSILON <= (low - x) / v <= horizon)
+            for hit, x, v in zip(
+                reach,
+                (float(position[axis]) for position in positions),
+                (float(velocity[axis]) for velocity in velocities),
             )
+        ]
+    return [particle.escaped or not hit for particle, hit in zip(particles, reach)]
+
+
+def _advance_free_flight(
+    particles: list[ExplosionParticle],
+    *,
+    dt_seconds: float,
+    board_dims: tuple[int, ...] | None,
+) -> None:
+    """
+    Integrate wall-free particles as columns: position and rotation advance
+    by ``dt_seconds`` and, given ``board_dims``, positions are clamped to
+    the board interior exactly as ``_finish_particle_step`` does.
+    """
+    if not particles:
+        return
+    dt = float(dt_seconds)
+    positions = [particle.position_nd for particle in particles]
+    velocities = [particle.velocity_nd for particle in particles]
+    columns = [
+        [
+            position[axis] + velocity[axis] * dt
+            for position, velocity in zip(positions, velocities)
+        ]
+        for axis in range(len(positions[0]))
+    ]
+    if board_dims is not None:
+        for axis, (low, high) in enumerate(board_boundary_limits(board_dims)):
+            low += _INTERIOR_POSITION_EPSILON
+            high -= _INTERIOR_POSITION_EPSILON
+            columns[axis] = [min(max(float(x), low), high) for x in columns[axis]]
+    rotations = [
+        (
+            (float(r0) + float(w0) * dt) % 360.0,
+            (float(r1) + float(w1) * dt) % 360.0,
+            (float(r2) + float(w2) * dt) % 360.0,
+        )
+        for (r0, r1, r2), (w0, w1, w2) in (
+            (particle.rotation_deg, particle.angular_velocity_deg)
+            for particle in particles
         )
+    ]
+    for particle, position, rotation in zip(particles, zip(*columns), rotations):
+        particle.position_nd = position
+        particle.rotation_deg = rotation
+
+
+def _partition_free_flight(
+    particles: tuple[ExplosionParticle, ...],
+    free_mask: list[bool],
+    *,
+    clamp: bool,
+    particle_stage_data: dict[int, dict[str, object]] | None,
+) -> tuple[list[ExplosionParticle], list[ExplosionParticle], list[ExplosionParticle]]:
+    """Split into (clamped free, unclamped free, wall subset) particles."""
+    free_clamped: list[ExplosionParticle] = []
+    free_unclamped: list[ExplosionParticle] = []
+    wall_subset: list[ExplosionParticle] = []
+    for particle, free in zip(particles, free_mask):
+        if not free:
+            wall_subset.append(particle)
+            continue
+        if clamp and not particle.escaped:
+            free_clamped.append(particle)
+        else:
+            free_unclamped.append(particle)
+        if particle_stage_data is not None:
+            particle_stage_data[particle.particle_id] = {
+                "free_flight": True,
+                "before_velocity": particle.velocity_nd,
+            }
+    return free_clamped, free_unclamped, wall_subset
+
+
+def _finish_free_flight_diagnostics(
+    particles: list[ExplosionParticle],
+    particle_stage_data: dict[int, dict[str, object]],
+) -> list[ExplosionParticle]:
+    """Record free-flight results; return the particles whose velocity changed."""
+    changed: list[ExplosionParticle] = []
+    for particle in particles:
+        data = particle_stage_data[particle.particle_id]
+        data["after_finalize_velocity"] = particle.velocity_nd
+        if data["before_velocity"] is not particle.velocity_nd:
+            data["free_flight"] = False
+            changed.append(particle)
+    return changed
+
+
+def _speed_sq_column(particles: tuple[ExplosionParticle, ...]) -> list[float]:
+    return [_speed_sq_for_particle(particle) for particle in particles]
+
+
+def _weighted_speed_sq_sum(
+    particles: tuple[ExplosionParticle, ...],
+    speed_sq: list[float],
+) -> float:
+    total = 0.0
+    for particle, value in zip(particles, speed_sq):
+        total += float(particle.collision_mass) * value
+    return float(total)
+
+
+def _stage_energy_bookkeeping(
+    particles: list[ExplosionParticle],
+    particle_stage_data: dict[int, dict[str, object]],
+) -> tuple[
+    dict[int, tuple[float, float]],
+    dict[int, tuple[float, float]],
+    dict[int, tuple[float, float]],
+]:
     seam_energy_before_after: dict[int, tuple[float, float]] = {}
     boundary_energy_before_after: dict[int, tuple[float, float]] = {}
     finalize_energy_before_after: dict[int, tuple[float, float]] = {}
-    for particle in state.particles:
-        if not particle.active:
-            continue
+    for particle in particles:
         data = particle_stage_data.get(particle.particle_id, {})
         before_velocity = tuple(data.get("before_velocity", particle.velocity_nd))
         after_seam_velocity = data.get("after_seam_velocity")
@@ -1335,9 +1536,80 @@ def step_simulation(
             finalize_k_before,
             finalize_k_after,
         )
-    before_collision_energy = total_kinetic_energy_for_particles(state.particles)
+    return (
+        seam_energy_before_after,
+        boundary_energy_before_after,
+        finalize_energy_before_after,
+    )
+
+
+def step_simulation(
+    state: ExplosionSimulationState,
+    *,
+    adapter: ExplosionTopologyAdapter,
+    dt_ms: float,
+    time_scale: float,
+) -> tuple[ExplosionAudioEvent, ...]:
+    """
+    Advance every active particle by one step. Particles that cannot reach
+    a wall this step are integrated together as columns; only the masked
+    subset that can goes through the per-particle seam/boundary loop.
+    Speeds are gathered once per stage and shared by the energy totals.
+    """
+    dt_seconds = max(0.0, float(dt_ms)) * max(0.05, float(time_scale)) / 1000.0
+    state.elapsed_ms += max(0.0, float(dt_ms))
+    if dt_seconds <= 0.0:
+        state.last_step_events = ()
+        return ()
+    state.diagnostics_step_index += 1
+    diagnostics_enabled = (
+        normalize_diagnostics_mode(state.diagnostics_mode)
+        != EXPLOSION_DIAGNOSTICS_MODE_OFF
+    )
+    collisions_enabled = state.particle_collisions == EXPLOSION_PARTICLE_COLLISIONS_ON
+    before_energy = float(state.total_kinetic_energy)
+    active = _active_particles(state.particles)
+    particle_stage_data: dict[int, dict[str, object]] = {}
+    events: list[ExplosionAudioEvent] = []
+    model_events: list[EndgameModelEvent] = []
+    free_clamped, free_unclamped, wall_subset = _partition_free_flight(
+        active,
+        _free_flight_mask(active, dt_seconds=dt_seconds, board_dims=adapter.board_dims),
+        clamp=state.boundary_response != EXPLOSION_BOUNDARY_RESPONSE_ESCAPE,
+        particle_stage_data=particle_stage_data if diagnostics_enabled else None,
+    )
+    _advance_free_flight(
+        free_clamped, dt_seconds=dt_seconds, board_dims=adapter.board_dims
+    )
+    _advance_free_flight(free_unclamped, dt_seconds=dt_seconds, board_dims=None)
+    changed_free = (
+        _finish_free_flight_diagnostics(
+            free_clamped + free_unclamped, particle_stage_data
+        )
+        if diagnostics_enabled
+        else []
+    )
+    for particle in wall_subset:
+        events.extend(
+            _step_particle(
+                particle,
+                dt_seconds=dt_seconds,
+                adapter=adapter,
+                boundary_response=state.boundary_response,
+                elapsed_ms=state.elapsed_ms,
+                step_index=state.diagnostics_step_index,
+                model_events=model_events,
+                diagnostics=particle_stage_data.setdefault(particle.particle_id, {})
+                if diagnostics_enabled
+                else None,
+            )
+        )
+    speed_sq = _speed_sq_column(active)
+    before_collision_energy = 0.0
+    if diagnostics_enabled:
+        before_collision_energy = float(0.5 * _weighted_speed_sq_sum(active, speed_sq))
     collided_particle_ids: set[int] = set()
-    if state.particle_collisions == EXPLOSION_PARTICLE_COLLISIONS_ON:
+    if collisions_enabled:
         events.extend(
             _resolve_collisions(
                 state.particles,
@@ -1347,23 +1619,38 @@ def step_simulation(
                 model_events=model_events,
             )
         )
-    after_collision_energy = total_kinetic_energy_for_particles(state.particles)
-    for particle in state.particles:
-        if not particle.active:
-            continue
+        speed_sq = _speed_sq_column(active)
+    for particle in active:
         _record_trail_sample(
             particle,
             elapsed_ms=state.elapsed_ms,
         )
-    state.velocity_norm_sq_sum = velocity_norm_sq_sum_for_particles(state.particles)
-    state.total_kinetic_energy = total_kinetic_energy_for_particles(state.particles)
+    velocity_norm_sq_sum = 0.0
+    for value in speed_sq:
+        velocity_norm_sq_sum += value
+    weighted_sum = _weighted_speed_sq_sum(active, speed_sq)
+    state.velocity_norm_sq_sum = float(velocity_norm_sq_sum)
+    state.total_kinetic_energy = float(0.5 * weighted_sum)
+    seam_energy_before_after: dict[int, tuple[float, float]] = {}
+    boundary_energy_before_after: dict[int, tuple[float, float]] = {}
+    finalize_energy_before_after: dict[int, tuple[float, float]] = {}
+    if diagnostics_enabled:
+        (
+            seam_energy_before_after,
+            boundary_energy_before_after,
+            finalize_energy_before_after,
+        ) = _stage_energy_bookkeeping(wall_subset + changed_free, particle_stage_data)
     state.diagnostics_summary = _build_diagnostics_summary(
         state,
+        particles=active,
+        speed_sq=speed_sq,
+        weighted_speed_sq_sum=weighted_sum,
         before_energy=before_energy,
-        before_weighted_sum=before_weighted_sum,
         particle_stage_data=particle_stage_data,
         before_collision_energy=before_collision_energy,
-        after_collision_energy=after_collision_energy,
+        after_collision_energy=state.total_kinetic_energy
+        if collisions_enabled
+        else before_collision_energy,
         collided_particle_ids=collided_particle_ids,
         seam_energy_before_after=seam_energy_before_after,
         boundary_energy_before_after=boundary_energy_before_after,
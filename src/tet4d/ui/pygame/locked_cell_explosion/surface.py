@@ -1426,15 +1426,10 @@ def _apply_live_trace_retention(state: StandaloneExplosionSurfaceState) -> None:
         particle.trail_max_samples = trail_sample_budget_for_lifetime_ms(
             state.trace_retention_ms
         )
-        retained = [
-            sample
-            for sample in particle.trail_samples
-            if float(sample.elapsed_ms)
-            >= float(particle.trail_elapsed_ms) - float(particle.trail_max_lifetime_ms)
-        ]
-        if len(retained) > particle.trail_max_samples:
-            retained = retained[-particle.trail_max_samples :]
-        particle.trail_samples = retained
+        particle.trail_samples.expire_before(
+            float(particle.trail_elapsed_ms) - float(particle.trail_max_lifetime_ms)
+        )
+        particle.trail_samples.resize(particle.trail_max_samples)
 
 
 def _apply_live_mass_and_collision_settings(
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
-import math
-from array import array
+import threading
 from dataclasses import dataclass
 
 import pygame
 
-from tet4d.engine.runtime.runtime_config import audio_event_specs
+from tet4d.engine.runtime.runtime_config import (
+    audio_event_specs,
+    audio_event_voice_limits,
+)
+
+from .sfx_cache import load_tone_pcm
 
 
 @dataclass
@@ -17,13 +21,25 @@ class AudioSettings:
 
 
 _EVENT_SPECS: dict[str, tuple[float, int, float]] = audio_event_specs()
+_EVENT_VOICE_LIMITS: dict[str, int] = audio_event_voice_limits()
 
 
 class AudioEngine:
+    """
+    Tone SFX player. ``initialize`` starts a warm-up thread that loads every
+    event's PCM from the on-disk cache (synthesizing misses) into ready
+    sounds, so the first lock or clear does not synthesize on the frame.
+    Events with ``max_voices`` are dropped while that many copies play.
+    """
+
     def __init__(self) -> None:
         self.settings = AudioSettings()
         self.enabled = False
         self._sounds: dict[str, pygame.mixer.Sound] = {}
+        self._build_locks = {
+            event_name: threading.Lock() for event_name in _EVENT_SPECS
+        }
+        self._warm_up_thread: threading.Thread | None = None
         self._sample_rate = 44100
         self._channels = 2
 
@@ -41,6 +57,15 @@ class AudioEngine:
             self._sounds.clear()
         except pygame.error:
             self.enabled = False
+            return
+        self._warm_up_thread = threading.Thread(
+            target=self.warm_up, name="tet4d-sfx-warm-up", daemon=True
+        )
+        self._warm_up_thread.start()
+
+    def warm_up(self) -> None:
+        for event_name in _EVENT_SPECS:
+            self._get_sound(event_name)
 
     def apply_settings(self, settings: AudioSettings) -> None:
         self.settings = AudioSettings(
@@ -54,39 +79,32 @@ class AudioEngine:
             return 0.0
         return self.settings.master_volume * self.settings.sfx_volume
 
-    def _tone_buffer(
-        self, frequency: float, duration_ms: int, amplitude: float
-    ) -> bytes:
-        frame_count = max(1, int(self._sample_rate * (duration_ms / 1000.0)))
-        peak = int(32767 * max(0.0, min(1.0, amplitude)))
-        wave = array("h")
-        for idx in range(frame_count):
-            t = idx / self._sample_rate
-            sample = int(peak * math.sin(2.0 * math.pi * frequency * t))
-            if self._channels <= 1:
-                wave.append(sample)
-            else:
-                for _ in range(self._channels):
-                    wave.append(sample)
-        return wave.tobytes()
-
     def _get_sound(self, event_name: str) -> pygame.mixer.Sound | None:
         if not self.enabled:
             return None
-        if event_name not in _EVENT_SPECS:
+        spec = _EVENT_SPECS.get(event_name)
+        if spec is None:
             return None
         cached = self._sounds.get(event_name)
         if cached is not None:
             return cached
-        frequency, duration_ms, amplitude = _EVENT_SPECS[event_name]
-        try:
-            sound = pygame.mixer.Sound(
-                buffer=self._tone_buffer(frequency, duration_ms, amplitude)
-            )
-        except pygame.error:
-            return None
-        self._sounds[event_name] = sound
-        return sound
+        # Per-event lock: a play racing the warm-up on the same event waits for
+        # that one sound instead of synthesizing it twice, while cached events
+        # and other builds never queue behind it.
+        with self._build_locks[event_name]:
+            cached = self._sounds.get(event_name)
+            if cached is not None:
+                return cached
+            try:
+                sound = pygame.mixer.Sound(
+                    buffer=load_tone_pcm(
+                        spec, sample_rate=self._sample_rate, channels=self._channels
+                    )
+                )
+            except pygame.error:
+                return None
+            self._sounds[event_name] = sound
+            return sound
 
     def play(self, event_name: str) -> None:
         if not self.enabled:
@@ -98,6 +116,9 @@ class AudioEngine:
         if sound is None:
             return
         try:
+            voice_limit = _EVENT_VOICE_LIMITS.get(event_name)
+            if voice_limit is not None and sound.get_num_channels() >= voice_limit:
+                return
             sound.set_volume(volume)
             sound.play()
         except pygame.error:
@@ -19,6 +19,7 @@ from tet4d.ui.pygame.endgame_animation import (
     endgame_prompt_ready,
     endgame_sfx_events_between,
     ensure_endgame_animation,
+    stop_endgame_simulation_worker,
 )
 from tet4d.ui.pygame.launch.leaderboard_menu import maybe_record_leaderboard_session
 from tet4d.ui.pygame.runtime_ui.tutorial_overlay import draw_tutorial_overlay
@@ -158,6 +159,13 @@ def _advance_gravity(state: Any, accumulator_ms: int, gravity_interval_ms: int)
     return accumulator_ms
 
 
+def shutdown_loop_workers(loop: Any) -> None:
+    bot = getattr(loop, "bot", None)
+    if bot is not None:
+        bot.shutdown()
+    stop_endgame_simulation_worker(getattr(loop, "endgame_animation", None))
+
+
 def _tick_animation(animation: Any, dt_ms: int) -> Any:
     if animation is None:
         return None
@@ -435,75 +443,78 @@ def run_nd_loop(
         endgame_session_handled = False
         loop.on_restart()
 
-    while True:
-        dt = clock.tick(60)
-        loop.gravity_accumulator += dt
-        _update_tutorial_action_cooldown(loop, dt)
-        loop.refresh_score_multiplier()
-
-        decision = process_game_events(
-            keydown_handler=loop.keydown_handler,
-            on_restart=_restart_with_record,
-            on_toggle_grid=loop.on_toggle_grid,
-            event_handler=event_handler,
-        )
-        status, screen = _handle_runtime_decision(
-            decision=decision,
-            screen=screen,
-            fonts=fonts,
-            loop=loop,
-            pause_dimension=pause_dimension,
-            run_pause_menu=run_pause_menu,
-            run_help_menu=run_help_menu,
-        )
-        terminal = _terminal_from_status(status)
-        if terminal is not None:
-            return terminal
-        if status == "restart":
-            continue
-
-        gravity_interval_ms = int(gravity_interval_from_config(loop.state.config))
-        loop.bot.configure_speed(
-            gravity_interval_ms,
-            int(getattr(loop, "bot_speed_level", 7)),
-        )
-        _advance_simulation_step(
-            loop=loop,
-            dt=dt,
-            gravity_interval_ms=gravity_interval_ms,
-            tutorial_step_pause_active=_tutorial_step_pause_active(loop),
-        )
-        _run_optional_tutorial_safety(loop)
-        _maybe_apply_auto_speedup(
-            loop=loop,
-            auto_speedup_enabled=auto_speedup_enabled,
-            lines_per_level=lines_per_level,
-            gravity_interval_from_config=gravity_interval_from_config,
-        )
-        _maybe_sync_tutorial(tutorial_sync, loop)
-        active_overlay = _update_loop_effects(
-            loop=loop,
-            dt=dt,
-            spawn_clear_animation=spawn_clear_animation,
-            capture_endgame_snapshot=capture_endgame_snapshot,
-            play_clear_sfx=play_clear_sfx,
-            play_game_over_sfx=play_game_over_sfx,
-            play_endgame_sfx=play_endgame_sfx,
-            step_view=step_view,
-        )
+    try:
+        while True:
+            dt = clock.tick(60)
+            loop.gravity_accumulator += dt
+            _update_tutorial_action_cooldown(loop, dt)
+            loop.refresh_score_multiplier()
+
+            decision = process_game_events(
+                keydown_handler=loop.keydown_handler,
+                on_restart=_restart_with_record,
+                on_toggle_grid=loop.on_toggle_grid,
+                event_handler=event_handler,
+            )
+            status, screen = _handle_runtime_decision(
+                decision=decision,
+                screen=screen,
+                fonts=fonts,
+                loop=loop,
+                pause_dimension=pause_dimension,
+                run_pause_menu=run_pause_menu,
+                run_help_menu=run_help_menu,
+            )
+            terminal = _terminal_from_status(status)
+            if terminal is not None:
+                return terminal
+            if status == "restart":
+                continue
+
+            gravity_interval_ms = int(gravity_interval_from_config(loop.state.config))
+            loop.bot.configure_speed(
+                gravity_interval_ms,
+                int(getattr(loop, "bot_speed_level", 7)),
+            )
+            _advance_simulation_step(
+                loop=loop,
+                dt=dt,
+                gravity_interval_ms=gravity_interval_ms,
+                tutorial_step_pause_active=_tutorial_step_pause_active(loop),
+            )
+            _run_optional_tutorial_safety(loop)
+            _maybe_apply_auto_speedup(
+                loop=loop,
+                auto_speedup_enabled=auto_speedup_enabled,
+                lines_per_level=lines_per_level,
+                gravity_interval_from_config=gravity_interval_from_config,
+            )
+            _maybe_sync_tutorial(tutorial_sync, loop)
+            active_overlay = _update_loop_effects(
+                loop=loop,
+                dt=dt,
+                spawn_clear_animation=spawn_clear_animation,
+                capture_endgame_snapshot=capture_endgame_snapshot,
+                play_clear_sfx=play_clear_sfx,
+                play_game_over_sfx=play_game_over_sfx,
+                play_endgame_sfx=play_endgame_sfx,
+                step_view=step_view,
+            )
 
-        _draw_runtime_frame(
-            screen=screen,
-            fonts=fonts,
-            pause_dimension=pause_dimension,
-            draw_frame=draw_frame,
-            active_overlay=active_overlay,
-            loop=loop,
-        )
-        if not endgame_session_handled and (
-            endgame_prompt_ready(getattr(loop, "endgame_animation", None))
-            or getattr(loop, "terminal_phase", TERMINAL_PHASE_PLAYING)
-            == TERMINAL_PHASE_GAME_OVER_COMPLETE
-        ):
-            _record_session("game_over")
-            endgame_session_handled = True
+            _draw_runtime_frame(
+                screen=screen,
+                fonts=fonts,
+                pause_dimension=pause_dimension,
+                draw_frame=draw_frame,
+                active_overlay=active_overlay,
+                loop=loop,
+            )
+            if not endgame_session_handled and (
+                endgame_prompt_ready(getattr(loop, "endgame_animation", None))
+                or getattr(loop, "terminal_phase", TERMINAL_PHASE_PLAYING)
+                == TERMINAL_PHASE_GAME_OVER_COMPLETE
+            ):
+                _record_session("game_over")
+                endgame_session_handled = True
+    finally:
+        shutdown_loop_workers(loop)
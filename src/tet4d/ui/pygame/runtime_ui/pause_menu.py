@@ -11,6 +11,7 @@ from tet4d.engine.runtime.menu_settings_state import (
     get_audio_settings,
     get_display_settings,
 )
+from tet4d.engine.runtime.score_analyzer import flush_score_analysis_events
 from tet4d.ui.pygame.keybindings import (
     active_key_profile,
     cycle_key_profile,
@@ -558,6 +559,7 @@ def run_pause_menu(
     on_tutorial_skip: Callable[[], bool] | None = None,
     on_escape_back: Callable[[], None] | None = None,
 ) -> tuple[PauseDecision, pygame.Surface]:
+    flush_score_analysis_events()
     state = _PauseState()
     screen_ref = [screen]
 
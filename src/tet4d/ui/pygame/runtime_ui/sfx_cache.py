@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+from array import array
+from pathlib import Path
+
+from tet4d.engine.runtime.project_config import sfx_cache_dir_path
+from tet4d.engine.runtime.settings_schema import atomic_write_bytes, read_file_bytes
+
+ToneSpec = tuple[float, int, float]
+
+SFX_CACHE_VERSION = 1
+_SAMPLE_BYTES = array("h").itemsize
+
+
+def tone_frame_count(duration_ms: int, *, sample_rate: int) -> int:
+    return max(1, int(sample_rate * (duration_ms / 1000.0)))
+
+
+def synthesize_tone_pcm(spec: ToneSpec, *, sample_rate: int, channels: int) -> bytes:
+    """
+    Signed 16-bit sine tone with ``channels`` interleaved copies. The mono
+    wave is built in one pass and copied into each channel with strided
+    slice assignment instead of per-sample appends.
+    """
+    frequency, duration_ms, amplitude = spec
+    frame_count = tone_frame_count(duration_ms, sample_rate=sample_rate)
+    peak = int(32767 * max(0.0, min(1.0, amplitude)))
+    omega = 2.0 * math.pi * frequency
+    sin = math.sin
+    mono = array(
+        "h",
+        [int(peak * sin(omega * (idx / sample_rate))) for idx in range(frame_count)],
+    )
+    if channels <= 1:
+        return mono.tobytes()
+    wave = array("h", bytes(_SAMPLE_BYTES * frame_count * channels))
+    for channel in range(channels):
+        wave[channel::channels] = mono
+    return wave.tobytes()
+
+
+def sfx_cache_key(spec: ToneSpec, *, sample_rate: int, channels: int) -> str:
+    frequency, duration_ms, amplitude = spec
+    payload = {
+        "cache_version": SFX_CACHE_VERSION,
+        "frequency_hz": float(frequency),
+        "duration_ms": int(duration_ms),
+        "amplitude": float(amplitude),
+        "sample_rate": int(sample_rate),
+        "channels": int(channels),
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def sfx_cache_file_path(
+    spec: ToneSpec,
+    *,
+    sample_rate: int,
+    channels: int,
+    root_dir: Path | None = None,
+) -> Path:
+    key = sfx_cache_key(spec, sample_rate=sample_rate, channels=channels)
+    return sfx_cache_dir_path(root_dir=root_dir) / f"{key}.pcm"
+
+
+def load_tone_pcm(
+    spec: ToneSpec,
+    *,
+    sample_rate: int,
+    channels: int,
+    root_dir: Path | None = None,
+) -> bytes:
+    """
+    Cached PCM for ``spec``, synthesized and written back on a miss. A cache
+    file of the wrong size is treated as a miss; write failures are ignored.
+    """
+    path = sfx_cache_file_path(
+        spec, sample_rate=sample_rate, channels=channels, root_dir=root_dir
+    )
+    expected_size = (
+        _SAMPLE_BYTES
+        * max(1, channels)
+        * tone_frame_count(spec[1], sample_rate=sample_rate)
+    )
+    try:
+        cached = read_file_bytes(path)
+    except OSError:
+        cached = b""
+    if len(cached) == expected_size:
+        return cached
+    pcm = synthesize_tone_pcm(spec, sample_rate=sample_rate, channels=channels)
+    try:
+        atomic_write_bytes(path, pcm)
+    except OSError:
+        pass
+    return pcm
+
+
+__all__ = [
+    "SFX_CACHE_VERSION",
+    "ToneSpec",
+    "load_tone_pcm",
+    "sfx_cache_file_path",
+    "sfx_cache_key",
+    "synthesize_tone_pcm",
+    "tone_frame_count",
+]
@@ -15,6 +15,9 @@ from .scene_preview_state import (
 from .scene_preview_state import (
     refresh_explorer_scene_state as _refresh_explorer_scene_state,
 )
+from .scene_preview_state import (
+    settle_background_explorer_preview as _settle_background_explorer_preview,
+)
 from .scene_state import (
     TopologyLabState,
     canonical_playground_state,
@@ -79,6 +82,7 @@ def launch_play_preview(
                 is_error=True,
             )
             return screen, display_settings
+        _settle_background_explorer_preview(state)
         if state.scene_preview_error:
             set_status(
                 state,
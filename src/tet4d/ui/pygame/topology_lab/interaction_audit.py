@@ -4,6 +4,7 @@ from tet4d.engine.runtime.topology_explorer_audit import (
     ExplorerInteractionAuditSpan,
     current_audit_action,
     latest_span_for_phase,
+    merge_interaction_audit,
     record_active_interaction_phase,
     record_interaction_handler,
     record_interaction_phase,
@@ -15,6 +16,7 @@ __all__ = [
     "ExplorerInteractionAuditSpan",
     "current_audit_action",
     "latest_span_for_phase",
+    "merge_interaction_audit",
     "record_active_interaction_phase",
     "record_interaction_handler",
     "record_interaction_phase",
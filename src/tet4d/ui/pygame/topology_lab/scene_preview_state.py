@@ -9,10 +9,13 @@ from tet4d.engine.runtime.topology_explorer_preview import (
     compile_explorer_topology_preview,
 )
 from tet4d.engine.runtime.topology_playability_signal import (
+    analyzing_topology_playability_analysis,
     update_topology_playability_analysis,
 )
+from tet4d.engine.runtime.topology_preview_compiler import TopologyPreviewResult
 
 from .common import boundaries_for_dimension
+from .interaction_audit import merge_interaction_audit
 from .scene_state import (
     ExplorerPlayabilityArtifacts,
     ExplorerPreviewCompileArtifacts,
@@ -38,6 +41,7 @@ def clear_explorer_scene_state(state: TopologyLabState) -> None:
     state.scene_pending_playability_signature = None
     state.scene_pending_playability_delay_frames = 0
     state.experiment_batch = None
+    _cancel_background_preview(state)
 
 
 def preview_signature_for_state(
@@ -222,6 +226,90 @@ def _apply_playability_analysis(
     _clear_pending_playability_analysis(state)
 
 
+def _cancel_background_preview(state: TopologyLabState) -> None:
+    if state.scene_preview_compile_signature is None:
+        return
+    state.scene_preview_compile_signature = None
+    if state.scene_preview_compiler is not None:
+        state.scene_preview_compiler.cancel()
+
+
+def _submit_background_preview(
+    state: TopologyLabState,
+    *,
+    signature: ExplorerPreviewCompileSignature,
+) -> None:
+    """Compile off the UI thread; the scene shows the analyzing state meanwhile."""
+    assert state.scene_preview_compiler is not None
+    if state.scene_preview_compile_signature == signature:
+        return
+    state.scene_preview_compiler.submit(
+        signature.profile,
+        dims=signature.dims,
+        source="topology_lab_live_preview",
+    )
+    state.scene_preview_compile_signature = signature
+    state.scene_preview = None
+    state.scene_preview_error = None
+    state.scene_basis_arrows = tuple(basis_arrow_payload(signature.profile))
+    _clear_pending_playability_analysis(state)
+    runtime_state = canonical_playground_state(state)
+    if runtime_state is not None:
+        runtime_state.playability_analysis = analyzing_topology_playability_analysis()
+
+
+def _publish_background_preview(
+    state: TopologyLabState,
+    result: TopologyPreviewResult,
+) -> None:
+    merge_interaction_audit(state, result.audit)
+    signature = ExplorerPreviewCompileSignature(
+        profile=result.profile, dims=result.dims
+    )
+    if state.scene_preview_compile_signature != signature:
+        return
+    state.scene_preview_compile_signature = None
+    state.scene_preview_cache = ExplorerPreviewCompileArtifacts(
+        signature=signature,
+        preview=result.preview,
+        preview_error=result.preview_error,
+    )
+    state.scene_preview = result.preview
+    state.scene_preview_error = result.preview_error
+    if result.preview is not None:
+        state.scene_basis_arrows = tuple(result.preview.get("basis_arrows", ()))
+    state.scene_playability_cache = ExplorerPlayabilityArtifacts(
+        signature=signature,
+        analysis=result.analysis,
+    )
+    runtime_state = canonical_playground_state(state)
+    if runtime_state is not None:
+        runtime_state.playability_analysis = result.analysis
+
+
+def poll_background_explorer_preview(state: TopologyLabState) -> None:
+    compiler = state.scene_preview_compiler
+    if compiler is None or state.scene_preview_compile_signature is None:
+        return
+    result = compiler.poll()
+    if result is not None:
+        _publish_background_preview(state, result)
+
+
+def settle_background_explorer_preview(
+    state: TopologyLabState,
+    *,
+    timeout: float | None = None,
+) -> None:
+    """Wait for an in-flight background compile, e.g. before launching play."""
+    compiler = state.scene_preview_compiler
+    if compiler is None or state.scene_preview_compile_signature is None:
+        return
+    result = compiler.wait(timeout)
+    if result is not None:
+        _publish_background_preview(state, result)
+
+
 def refresh_explorer_scene_state(state: TopologyLabState) -> None:
     if not uses_general_explorer_editor(state):
         clear_explorer_scene_state(state)
@@ -252,6 +340,7 @@ def refresh_explorer_scene_state(state: TopologyLabState) -> None:
             if cached.preview is None
             else tuple(cached.preview.get("basis_arrows", ()))
         )
+        _cancel_background_preview(state)
         if _restore_cached_playability_analysis(state, signature=signature):
             return
         _apply_playability_analysis(
@@ -260,6 +349,10 @@ def refresh_explorer_scene_state(state: TopologyLabState) -> None:
             include_rigid_scan=False,
         )
         return
+    if state.scene_preview_compiler is not None:
+        _submit_background_preview(state, signature=signature)
+        return
+    _cancel_background_preview(state)
     preview_artifacts = _preview_compile_artifacts(state, signature=signature)
     state.scene_preview = preview_artifacts.preview
     state.scene_preview_error = preview_artifacts.preview_error
@@ -278,6 +371,7 @@ def refresh_explorer_scene_state(state: TopologyLabState) -> None:
 
 
 def advance_pending_explorer_playability_analysis(state: TopologyLabState) -> None:
+    poll_background_explorer_preview(state)
     signature = state.scene_pending_playability_signature
     if signature is None:
         return
@@ -295,6 +389,7 @@ def advance_pending_explorer_playability_analysis(state: TopologyLabState) -> No
 
 
 def ensure_explorer_playability_analysis(state: TopologyLabState) -> None:
+    settle_background_explorer_preview(state)
     signature = state.scene_preview_signature
     if signature is None:
         return
@@ -40,6 +40,7 @@ from tet4d.engine.runtime.topology_playground_state import (
 from tet4d.engine.runtime.topology_playground_state import (
     workspace_for_tool as runtime_workspace_for_tool,
 )
+from tet4d.engine.runtime.topology_preview_compiler import TopologyPreviewCompiler
 from tet4d.engine.topology_explorer import BoundaryRef, ExplorerTopologyProfile
 
 from .common import (
@@ -168,6 +169,8 @@ class TopologyPlaygroundState:
     scene_playability_cache: ExplorerPlayabilityArtifacts | None = None
     scene_pending_playability_signature: ExplorerPreviewCompileSignature | None = None
     scene_pending_playability_delay_frames: int = 0
+    scene_preview_compiler: TopologyPreviewCompiler | None = None
+    scene_preview_compile_signature: ExplorerPreviewCompileSignature | None = None
     experiment_batch: dict[str, object] | None = None
     pending_explosion_surface_state: Any | None = None
     scene_explosion: object | None = None
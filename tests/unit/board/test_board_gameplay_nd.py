@@ -0,0 +1,98 @@
+import random
+import unittest
+
+from tet4d.engine.core.model import BoardND
+from tet4d.engine.gameplay.game_nd import GameConfigND, GameStateND
+from tet4d.engine.gameplay.pieces_nd import (
+    ActivePieceND,
+    PieceShapeND,
+)
+from tet4d.engine.gameplay.topology import TOPOLOGY_WRAP_ALL
+from tet4d.engine.topology_explorer.presets import (
+    axis_wrap_profile,
+)
+
+
+class TestBoardGameplayND(unittest.TestCase):
+    def test_bitboard_storage_plays_like_sparse_storage_in_4d(self):
+        states = []
+        for board_storage in ("sparse", "bitboard"):
+            cfg = GameConfigND(
+                dims=(3, 8, 3, 2), gravity_axis=1, board_storage=board_storage
+            )
+            state = GameStateND(config=cfg, board=None, rng=random.Random(6))
+            for _ in range(10):
+                state.hard_drop()
+            states.append(state)
+        sparse, bitboard = states
+        self.assertEqual(bitboard.board.storage, "bitboard")
+        self.assertEqual(bitboard.board.cells, sparse.board.cells)
+        self.assertEqual(bitboard.board.level_masks(), sparse.board.level_masks())
+        self.assertEqual(
+            (bitboard.score, bitboard.lines_cleared),
+            (sparse.score, sparse.lines_cleared),
+        )
+
+    def test_hard_drop_lands_in_one_shot_like_stepping_in_4d(self) -> None:
+        cfg = GameConfigND(dims=(4, 8, 3, 3), gravity_axis=1, rng_seed=5)
+        for seed in range(6):
+            with self.subTest(seed=seed):
+                hard = GameStateND(
+                    config=cfg, board=cfg.new_board(), rng=random.Random(seed)
+                )
+                stepped = GameStateND(
+                    config=cfg, board=cfg.new_board(), rng=random.Random(seed)
+                )
+                rng = random.Random(seed)
+                for _ in range(24):
+                    coord = (
+                        rng.randrange(4),
+                        rng.randrange(3, 8),
+                        rng.randrange(3),
+                        rng.randrange(3),
+                    )
+                    hard.board.cells[coord] = 1
+                    stepped.board.cells[coord] = 1
+                for _ in range(4):
+                    if hard.game_over:
+                        break
+                    distance = hard.landing_distance()
+                    hard.hard_drop()
+                    steps = 0
+                    while stepped.try_gravity_step():
+                        steps += 1
+                    self.assertEqual(distance, steps)
+                    stepped.lock_current_piece()
+                    if not stepped.game_over:
+                        stepped.spawn_new_piece()
+                    self.assertEqual(hard.board.cells, stepped.board.cells)
+                    self.assertEqual(hard.score, stepped.score)
+
+    def test_landing_distance_defers_to_stepping_off_bounded_topologies(self) -> None:
+        dot = PieceShapeND("dot", ((0, 0, 0),), color_id=6)
+        wrapped = GameStateND(
+            config=GameConfigND(
+                dims=(4, 5, 4), gravity_axis=1, topology_mode=TOPOLOGY_WRAP_ALL
+            ),
+            board=BoardND((4, 5, 4)),
+        )
+        explorer = GameStateND(
+            config=GameConfigND(
+                dims=(4, 5, 4),
+                gravity_axis=1,
+                explorer_topology_profile=axis_wrap_profile(
+                    dimension=3, wrapped_axes=(0,)
+                ),
+            ),
+            board=BoardND((4, 5, 4)),
+        )
+        for state in (wrapped, explorer):
+            state.board.cells.clear()
+            state.current_piece = ActivePieceND.from_shape(dot, pos=(1, 0, 1))
+            self.assertIsNone(state.landing_distance())
+            state.hard_drop()
+            self.assertEqual(state.board.cells, {(1, 4, 1): 6})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,348 @@
+import copy
+import pickle
+import random
+import unittest
+
+from tet4d.engine.core.model import BoardND
+from tet4d.engine.core.model.bitboard import (
+    drop_masks,
+    lock_masks,
+    masks_fit,
+    placed_level_masks,
+)
+from tet4d.engine.core.model.board import BOARD_STORAGE_BITBOARD, BOARD_STORAGE_DENSE
+
+
+def _random_stack(dims, *, gravity_axis, seed, full_levels=()):
+    rng = random.Random(seed)
+    cells = {}
+    for coord in _all_coords(dims):
+        level = coord[gravity_axis]
+        if level in full_levels or (level > 1 and rng.random() < 0.55):
+            cells[coord] = rng.randint(1, 7)
+    return cells
+
+
+def _all_coords(dims):
+    coords = [()]
+    for size in dims:
+        coords = [coord + (value,) for coord in coords for value in range(size)]
+    return coords
+
+
+def _brute_level_counts(board, axis):
+    counts = [0] * board.dims[axis]
+    for coord in board.cells:
+        counts[coord[axis]] += 1
+    return tuple(counts)
+
+
+def _brute_column_levels(board, gravity_axis):
+    columns = {}
+    for coord in board.cells:
+        column = tuple(v for axis, v in enumerate(coord) if axis != gravity_axis)
+        columns.setdefault(column, []).append(coord[gravity_axis])
+    return {column: sorted(levels) for column, levels in columns.items()}
+
+
+class TestBoardDenseStorage(unittest.TestCase):
+    def _pair(self, dims, cells):
+        sparse = BoardND(dims, cells=dict(cells))
+        dense = BoardND(dims, cells=dict(cells), storage=BOARD_STORAGE_DENSE)
+        return sparse, dense
+
+    def test_rejects_unknown_storage(self):
+        with self.assertRaises(ValueError):
+            BoardND((4, 4), storage="bogus")
+
+    def test_clear_parity_with_sparse_storage_in_3d_and_4d(self):
+        cases = (
+            ((4, 6, 3), 1, {5, 3}),
+            ((3, 5, 2, 2), 1, {4, 2}),
+            ((3, 4, 5), 2, {4}),
+        )
+        for dims, gravity_axis, full in cases:
+            with self.subTest(dims=dims, gravity_axis=gravity_axis):
+                cells = _random_stack(
+                    dims, gravity_axis=gravity_axis, seed=7, full_levels=full
+                )
+                sparse, dense = self._pair(dims, cells)
+                self.assertEqual(
+                    dense.full_levels(gravity_axis), sparse.full_levels(gravity_axis)
+                )
+                self.assertEqual(
+                    dense.clear_planes(gravity_axis), sparse.clear_planes(gravity_axis)
+                )
+                self.assertEqual(dense.cells, sparse.cells)
+                self.assertEqual(dense.last_cleared_levels, sparse.last_cleared_levels)
+                self.assertCountEqual(
+                    dense.last_cleared_cells, sparse.last_cleared_cells
+                )
+                self.assertEqual(dense.full_levels(gravity_axis), [])
+                for coord in _all_coords(dims):
+                    self.assertEqual(
+                        dense.can_place([coord]), sparse.can_place([coord])
+                    )
+
+    def test_direct_dict_mutation_keeps_dense_grid_in_sync(self):
+        board = BoardND((3, 3), storage=BOARD_STORAGE_DENSE)
+        for x in range(3):
+            board.cells[(x, 2)] = 1
+        self.assertEqual(board.full_levels(1), [2])
+        del board.cells[(0, 2)]
+        self.assertEqual(board.full_levels(1), [])
+        self.assertTrue(board.can_place([(0, 2)]))
+        board.cells.setdefault((0, 2), 4)
+        self.assertFalse(board.can_place([(0, 2)]))
+        board.cells.clear()
+        self.assertTrue(board.can_place([(1, 2), (2, 2)]))
+        board.cells = {(1, 1): 3}
+        self.assertFalse(board.can_place([(1, 1)]))
+        self.assertEqual(board.cells.pop((1, 1)), 3)
+        self.assertTrue(board.can_place([(1, 1)]))
+
+    def test_pickle_round_trip_rebinds_cells(self):
+        board = BoardND((3, 3), storage=BOARD_STORAGE_DENSE)
+        board.cells[(1, 2)] = 5
+        restored = pickle.loads(pickle.dumps(board))
+        self.assertEqual(restored, board)
+        restored.cells[(0, 2)] = 1
+        restored.cells[(2, 2)] = 1
+        self.assertEqual(restored.clear_planes(1), 1)
+        self.assertEqual(board.cells, {(1, 2): 5})
+
+
+class TestBoardBitboardStorage(unittest.TestCase):
+    def test_rejects_one_axis_boards(self):
+        with self.assertRaises(ValueError):
+            BoardND((4,), storage=BOARD_STORAGE_BITBOARD)
+
+    def test_clear_parity_with_sparse_storage(self):
+        cases = (
+            ((5, 8), 1, {7, 4}),
+            ((5, 8), 0, {2}),
+            ((4, 6, 3), 1, {5, 3}),
+            ((3, 5, 2, 2), 1, {4, 2}),
+            ((3, 4, 5), 2, {4}),
+        )
+        for dims, gravity_axis, full in cases:
+            with self.subTest(dims=dims, gravity_axis=gravity_axis):
+                cells = _random_stack(
+                    dims, gravity_axis=gravity_axis, seed=3, full_levels=full
+                )
+                sparse = BoardND(dims, cells=dict(cells))
+                bits = BoardND(dims, cells=dict(cells), storage=BOARD_STORAGE_BITBOARD)
+                self.assertEqual(
+                    bits.full_levels(gravity_axis), sparse.full_levels(gravity_axis)
+                )
+                self.assertEqual(
+                    bits.clear_planes(gravity_axis), sparse.clear_planes(gravity_axis)
+                )
+                self.assertEqual(bits.cells, sparse.cells)
+                self.assertEqual(bits.level_masks(), sparse.level_masks())
+                for coord in _all_coords(dims):
+                    self.assertEqual(bits.can_place([coord]), sparse.can_place([coord]))
+
+    def test_direct_dict_mutation_keeps_rows_in_sync(self):
+        board = BoardND((3, 3), storage=BOARD_STORAGE_BITBOARD)
+        for x in range(3):
+            board.cells[(x, 2)] = 1
+        self.assertEqual(board.level_masks(), (0, 0, 0b111))
+        self.assertEqual(board.full_levels(1), [2])
+        del board.cells[(0, 2)]
+        self.assertEqual(board.level_masks(), (0, 0, 0b110))
+        board.cells = {(1, 1): 3}
+        self.assertEqual(board.level_masks(), (0, 0b010, 0))
+
+    def test_level_masks_pack_cross_sections_and_shift_with_offsets(self):
+        dims = (3, 4, 2)
+        board = BoardND(dims, storage=BOARD_STORAGE_BITBOARD)
+        board.cells[(2, 3, 1)] = 1
+        board.cells[(0, 3, 0)] = 1
+        self.assertEqual(board.level_masks(), (0, 0, 0, 0b100001))
+        blocks = ((-1, 0, 0), (0, 0, 0), (0, -1, 1))
+        # Bit index is x * 2 + z; the level (y) offset component is ignored.
+        self.assertEqual(
+            placed_level_masks(blocks, (1, 0, 0), dims),
+            ((-1, 0b001000), (0, 0b000101)),
+        )
+        self.assertEqual(
+            placed_level_masks(blocks, (2, 7, 0), dims),
+            ((-1, 0b100000), (0, 0b010100)),
+        )
+
+    def test_row_mask_drop_and_lock_clear_full_rows(self):
+        rows = (0, 0, 0b1001, 0b1111)
+        masks = placed_level_masks(((0, 0), (1, 0), (1, 1)), (1, 0), (4, 4))
+        self.assertEqual(masks, ((0, 0b0110), (1, 0b0100)))
+        self.assertFalse(masks_fit(rows, masks, 2))
+        self.assertEqual(drop_masks(rows, masks, -1), 1)
+        locked, cleared, above = lock_masks(rows, masks, 1, 0b1111)
+        self.assertEqual((locked, cleared, above), ((0, 0, 0b0110, 0b1101), 1, False))
+        _locked, _cleared, above = lock_masks(rows, masks, -1, 0b1111)
+        self.assertTrue(above)
+
+
+class TestBoardLevelCounters(unittest.TestCase):
+    def _assert_index_matches(self, board, gravity_axis):
+        for axis in range(len(board.dims)):
+            self.assertEqual(board.level_counts(axis), _brute_level_counts(board, axis))
+        self.assertEqual(
+            dict(board.column_levels(gravity_axis)),
+            _brute_column_levels(board, gravity_axis),
+        )
+
+    def test_counters_follow_writes_locks_and_clears(self):
+        for storage in ("sparse", BOARD_STORAGE_DENSE):
+            with self.subTest(storage=storage):
+                dims = (3, 6, 2, 2)
+                cells = _random_stack(dims, gravity_axis=1, seed=3, full_levels={5, 2})
+                board = BoardND(dims, cells=cells, storage=storage)
+                self._assert_index_matches(board, 1)
+                self.assertEqual(board.full_levels(1), [2, 5])
+
+                board.cells[(0, 0, 0, 0)] = 4
+                board.cells.pop((1, 5, 1, 1))
+                self._assert_index_matches(board, 1)
+                self.assertEqual(board.full_levels(1), [2])
+
+                self.assertEqual(board.clear_planes(1), 1)
+                self._assert_index_matches(board, 1)
+                self.assertEqual(board.column_top(1, (0, 0, 0)), 1)
+                self.assertEqual(board.full_levels(1), [])
+
+    def test_clear_rebuilds_column_index_for_other_axes(self):
+        board = BoardND((3, 3), cells={(0, 2): 1, (1, 2): 1, (2, 2): 1, (1, 1): 2})
+        self.assertEqual(dict(board.column_levels(0)), {(1,): [1], (2,): [0, 1, 2]})
+        board.clear_planes(1)
+        self.assertEqual(dict(board.column_levels(0)), {(2,): [1]})
+        self.assertEqual(dict(board.column_levels(1)), {(1,): [2]})
+
+    def test_level_counts_rejects_invalid_axis(self):
+        with self.assertRaises(ValueError):
+            BoardND((3, 3)).level_counts(2)
+
+    def test_landing_distance_matches_stepping_down_columns(self):
+        rng = random.Random(11)
+        dims = (3, 7, 2, 2)
+        cells = _random_stack(dims, gravity_axis=1, seed=5, full_levels=set())
+        board = BoardND(dims, cells=cells)
+        for _ in range(40):
+            piece = {
+                (rng.randrange(3), rng.randrange(-3, 3), rng.randrange(2), 0)
+                for _ in range(3)
+            }
+            if not board.can_place(p for p in piece if p[1] >= 0):
+                continue
+            expected = 0
+            while board.can_place(
+                (x, y + expected + 1, z, w)
+                for x, y, z, w in piece
+                if y + expected + 1 >= 0
+            ) and all(y + expected + 1 < dims[1] for _x, y, _z, _w in piece):
+                expected += 1
+            self.assertEqual(board.landing_distance(piece, 1), expected)
+
+
+class TestBoardLockUndo(unittest.TestCase):
+    def _snapshot(self, board):
+        return (
+            dict(board.cells),
+            board.level_counts(1),
+            dict(board.column_levels(1)),
+            list(board.last_cleared_levels),
+            list(board.last_cleared_cells),
+        )
+
+    def test_apply_lock_matches_fresh_lock_and_undo_restores(self):
+        for storage in ("sparse", BOARD_STORAGE_DENSE):
+            with self.subTest(storage=storage):
+                dims = (3, 5, 2)
+                cells = _random_stack(dims, gravity_axis=1, seed=11, full_levels=set())
+                for x in range(3):
+                    for z in range(2):
+                        cells[(x, 4, z)] = 1
+                cells.pop((2, 4, 1), None)
+                board = BoardND(dims, cells=cells, storage=storage)
+                before = self._snapshot(board)
+
+                piece = [(2, 4, 1), (2, 3, 1), (2, -1, 1)]
+                delta = board.apply_lock(piece, 9, 1)
+                expected = BoardND(dims, cells=cells)
+                for coord in piece[:2]:
+                    expected.cells[coord] = 9
+                self.assertEqual(delta.cleared, expected.clear_planes(1))
+                self.assertEqual(board.cells, expected.cells)
+                self.assertEqual(board.level_counts(1), expected.level_counts(1))
+
+                board.undo_lock(delta)
+                self.assertEqual(self._snapshot(board), before)
+                self.assertEqual(board.can_place([(2, 4, 1)]), True)
+
+    def test_nested_locks_undo_in_reverse_order(self):
+        board = BoardND((2, 3), cells={(0, 2): 1, (1, 1): 3})
+        before = dict(board.cells)
+        first = board.apply_lock([(1, 2), (1, 1)], 5, 1)
+        second = board.apply_lock([(0, 0)], 6, 1)
+        self.assertEqual(first.cleared, 1)
+        self.assertEqual(second.cleared, 0)
+        board.undo_lock(second)
+        board.undo_lock(first)
+        self.assertEqual(board.cells, before)
+        self.assertEqual(board.full_levels(1), [])
+
+
+class TestBoardZobristHash(unittest.TestCase):
+    def test_hash_tracks_occupancy_not_write_order_or_colors(self):
+        dims = (3, 4, 2)
+        cells = _random_stack(dims, gravity_axis=1, seed=5)
+        shuffled = list(cells.items())
+        random.Random(1).shuffle(shuffled)
+        board = BoardND(dims)
+        for coord, _cell_id in shuffled:
+            board.cells[coord] = 7
+        self.assertEqual(board.zobrist_hash, BoardND(dims, cells=cells).zobrist_hash)
+        self.assertEqual(BoardND(dims).zobrist_hash, 0)
+
+        coord = next(iter(cells))
+        del board.cells[coord]
+        self.assertNotEqual(board.zobrist_hash, BoardND(dims, cells=cells).zobrist_hash)
+
+    def test_hash_follows_locks_clears_and_undo(self):
+        for storage in ("sparse", BOARD_STORAGE_DENSE):
+            with self.subTest(storage=storage):
+                dims = (2, 5, 2)
+                cells = _random_stack(dims, gravity_axis=1, seed=3, full_levels={4})
+                cells.pop((1, 3, 1), None)
+                board = BoardND(dims, cells=cells, storage=storage)
+                before = board.zobrist_hash
+
+                delta = board.apply_lock([(1, 3, 1)], 2, 1)
+                self.assertGreater(delta.cleared, 0)
+                self.assertEqual(
+                    board.zobrist_hash, BoardND(dims, cells=board.cells).zobrist_hash
+                )
+                board.undo_lock(delta)
+                self.assertEqual(board.zobrist_hash, before)
+
+    def test_writes_through_a_copy_leave_the_original_untouched(self):
+        for storage in ("sparse", BOARD_STORAGE_DENSE, BOARD_STORAGE_BITBOARD):
+            for clone in (copy.copy, copy.deepcopy):
+                with self.subTest(storage=storage, clone=clone.__name__):
+                    board = BoardND((3, 4), storage=storage)
+                    board.cells[(0, 3)] = 1
+                    before = board.zobrist_hash
+
+                    copied = clone(board)
+                    copied.cells[(1, 3)] = 1
+                    copied.cells[(2, 3)] = 1
+
+                    self.assertEqual(copied.full_levels(1), [3])
+                    self.assertEqual(board.full_levels(1), [])
+                    self.assertEqual(board.level_counts(1), (0, 0, 0, 1))
+                    self.assertEqual(board.zobrist_hash, before)
+                    self.assertTrue(board.can_place([(1, 3), (2, 3)]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1214,6 +1214,72 @@ class TestEndgameAnimation(unittest.TestCase):
         )
         self.assertEqual(animation_a.shell_fragments, animation_b.shell_fragments)
 
+    def test_live_endgame_steps_relics_on_fixed_step_worker(self) -> None:
+        snapshot = self._sample_snapshot()
+        tuning = endgame_animation.load_endgame_animation_tuning()
+        self.assertEqual(
+            tuning.simulation_mode, endgame_animation.ENDGAME_SIMULATION_MODE_THREADED
+        )
+
+        direct = endgame_animation.build_endgame_animation_state(snapshot)
+        live = endgame_animation.ensure_endgame_animation(
+            None, game_over=True, snapshot_factory=lambda: snapshot
+        )
+        inline = endgame_animation.ensure_endgame_animation(
+            None,
+            game_over=True,
+            snapshot_factory=lambda: snapshot,
+            tuning=replace(
+                tuning,
+                simulation_mode=endgame_animation.ENDGAME_SIMULATION_MODE_INLINE,
+            ),
+        )
+        assert live is not None and inline is not None
+        assert live.explosion_controller is not None
+        self.addCleanup(live.explosion_controller.close)
+
+        self.assertIsNone(direct.explosion_controller.worker)
+        self.assertIsNone(inline.explosion_controller.worker)
+        worker = live.explosion_controller.worker
+        self.assertIsNotNone(worker)
+        self.assertEqual(worker.fixed_step_ms, tuning.simulation_fixed_step_ms)
+
+        for _ in range(4):
+            live.step(tuning.simulation_fixed_step_ms)
+            direct.step(tuning.simulation_fixed_step_ms)
+        self.assertTrue(worker.wait(timeout=10.0))
+        self.assertEqual(
+            worker.current_frame.positions,
+            tuple(
+                particle.position_nd
+                for particle in direct.explosion_controller.simulation.particles
+            ),
+        )
+        self.assertEqual(live.elapsed_ms, direct.elapsed_ms)
+
+    def test_discarded_live_endgame_closes_fixed_step_worker(self) -> None:
+        snapshot = self._sample_snapshot()
+        for teardown in ("restart", "loop_exit"):
+            with self.subTest(teardown=teardown):
+                live = endgame_animation.ensure_endgame_animation(
+                    None, game_over=True, snapshot_factory=lambda: snapshot
+                )
+                assert live is not None and live.explosion_controller is not None
+                controller = live.explosion_controller
+                self.addCleanup(controller.close)
+                with patch.object(controller, "close", wraps=controller.close) as close:
+                    if teardown == "restart":
+                        self.assertIsNone(
+                            endgame_animation.ensure_endgame_animation(
+                                live, game_over=False, snapshot_factory=lambda: snapshot
+                            )
+                        )
+                    else:
+                        loop_runner_nd.shutdown_loop_workers(
+                            SimpleNamespace(endgame_animation=live)
+                        )
+                close.assert_called_once_with()
+
     def test_endgame_sfx_events_follow_shared_phase_thresholds(self) -> None:
         tuning = endgame_animation.load_endgame_animation_tuning()
         crack_events = endgame_animation.endgame_sfx_events_between(
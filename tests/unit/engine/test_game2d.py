@@ -51,6 +51,7 @@ class TestGame2D(unittest.TestCase):
             ("piece_set", b"classic"),
             ("kick_level", None),
             ("rng_mode", True),
+            ("board_storage", None),
         )
         for field, near_miss in cases:
             with (
@@ -78,6 +79,7 @@ class TestGame2D(unittest.TestCase):
             {"speed_level": 11},
             {"kick_level": "unknown"},
             {"topology_mode": "unknown"},
+            {"board_storage": "unknown"},
         )
         for kwargs in cases:
             with (
@@ -101,6 +103,23 @@ class TestGame2D(unittest.TestCase):
         self.assertEqual((config.width, config.height), (1, 1))
         self.assertEqual(config.speed_level, 10)
 
+    def test_bitboard_storage_plays_like_sparse_storage(self):
+        states = []
+        for board_storage in ("sparse", "bitboard"):
+            cfg = GameConfig(width=6, height=10, board_storage=board_storage)
+            state = GameState(config=cfg, board=None, rng=random.Random(4))
+            for _ in range(12):
+                state.hard_drop()
+            states.append(state)
+        sparse, bitboard = states
+        self.assertEqual(bitboard.board.storage, "bitboard")
+        self.assertEqual(bitboard.board.cells, sparse.board.cells)
+        self.assertEqual(bitboard.board.level_masks(), sparse.board.level_masks())
+        self.assertEqual(
+            (bitboard.score, bitboard.lines_cleared),
+            (sparse.score, sparse.lines_cleared),
+        )
+
     def make_empty_state(self, width=10, height=20) -> GameState:
         cfg = GameConfig(width=width, height=height)
         board = BoardND((cfg.width, cfg.height))
@@ -60,6 +60,7 @@ class TestGameND(unittest.TestCase):
             ("piece_set_4d", False),
             ("kick_level", b"off"),
             ("rng_mode", 1),
+            ("board_storage", 0),
         )
         for field, near_miss in cases:
             with (
@@ -97,6 +98,7 @@ class TestGameND(unittest.TestCase):
             {"gravity_axis": 3},
             {"kick_level": "unknown"},
             {"topology_mode": "unknown"},
+            {"board_storage": "bits"},
         )
         for kwargs in cases:
             with (
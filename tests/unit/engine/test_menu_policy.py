@@ -1204,18 +1204,22 @@ class TestMenuPolicy(unittest.TestCase):
                 return_value=(4, 4096),
             ),
             mock.patch.object(
-                settings_hub_actions.movement_graph_module._build_movement_graph_rows,
+                settings_hub_actions.movement_graph_module._build_movement_graph_csr,
                 "cache_clear",
             ) as clear_graph_cache,
             mock.patch.object(
                 settings_hub_actions.build_explorer_transport_resolver,
                 "cache_clear",
             ) as clear_resolver_cache,
+            mock.patch.object(
+                settings_hub_actions, "clear_rigid_transport_scan_memo"
+            ) as clear_scan_memo,
             mock.patch.object(settings_hub_actions, "play_sfx"),
         ):
             self.assertTrue(settings_hub_actions._clear_topology_cache_action(state))
         clear_graph_cache.assert_called_once_with()
         clear_resolver_cache.assert_called_once_with()
+        clear_scan_memo.assert_called_once_with()
         self.assertEqual(state.topology_cache_file_count, 0)
         self.assertEqual(state.topology_cache_size_bytes, 0)
         self.assertIn("Cleared topology cache", state.status)
@@ -12,8 +12,13 @@ from tet4d.ai.playbot import (
     run_dry_run_nd,
 )
 from tet4d.ai.playbot.controller import _rotation_sequence_nd
-from tet4d.ai.playbot.lookahead_common import choose_best_with_followup
-from tet4d.ai.playbot.planner_nd_core import greedy_key_4d, simulate_lock_board
+from tet4d.ai.playbot.lookahead_common import (
+    choose_best_with_followup,
+)
+from tet4d.ai.playbot.planner_nd_core import (
+    greedy_key_4d,
+    simulate_lock_board,
+)
 from tet4d.ai.playbot.planner_nd_search import enumerate_orientations
 from tet4d.ai.playbot.types import (
     BotMode,
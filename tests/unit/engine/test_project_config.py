@@ -34,6 +34,8 @@ from tet4d.engine.runtime.project_config import (
     score_events_file_default_path,
     score_events_file_default_relative,
     score_summary_file_default_path,
+    sfx_cache_dir_path,
+    sfx_cache_dir_relative,
     state_dir_path,
     state_dir_relative,
     topology_profile_export_file_default_path,
@@ -212,6 +214,10 @@ class TestProjectConfig(unittest.TestCase):
                 explorer_topology_preview_cache_dir_path(),
                 expected_root / "state/topology/cache/explorer_preview",
             )
+            self.assertEqual(
+                sfx_cache_dir_path(),
+                expected_root / "state/audio/cache/sfx",
+            )
             self.assertEqual(
                 explorer_topology_experiments_file_default_path(),
                 expected_root / "state/topology/explorer_experiments.json",
@@ -355,6 +361,7 @@ class TestProjectConfig(unittest.TestCase):
                 state_dir_relative() + "/"
             )
         )
+        self.assertTrue(sfx_cache_dir_relative().startswith(state_dir_relative() + "/"))
         self.assertEqual(explorer_topology_preview_dims(2), (4, 4))
         self.assertEqual(explorer_topology_preview_dims(3), (4, 4, 4))
         self.assertEqual(explorer_topology_preview_dims(4), (4, 4, 4, 4))
@@ -14,6 +14,7 @@ from tet4d.engine.runtime.runtime_config import (
     gameplay_tuning_payload,
     grid_mode_cycle_names,
     playbot_adaptive_fallback_enabled,
+    playbot_background_planning_enabled,
     playbot_benchmark_history_file,
     playbot_benchmark_p95_thresholds,
     playbot_board_size_scaling_policy_for_ndim,
@@ -21,6 +22,8 @@ from tet4d.engine.runtime.runtime_config import (
     playbot_default_hard_drop_after_soft_drops,
     playbot_dry_run_defaults,
     playbot_learning_mode_policy,
+    playbot_parallel_lookahead_policy,
+    playbot_transposition_policy,
     speed_curve_for_dimension,
 )
 
@@ -52,9 +55,12 @@ class TestRuntimeConfig(unittest.TestCase):
         self.assertEqual(playbot_budget_table_for_ndim(3), (10, 20, 34, 48))
         self.assertEqual(playbot_budget_table_for_ndim(4), (16, 32, 50, 72))
         self.assertEqual(playbot_default_hard_drop_after_soft_drops(), 4)
+        self.assertTrue(playbot_background_planning_enabled())
         self.assertEqual(playbot_learning_mode_policy(), (True, 8, 0.1, 0.45))
         self.assertEqual(playbot_dry_run_defaults(), (160, 1337))
         self.assertTrue(playbot_adaptive_fallback_enabled())
+        self.assertEqual(playbot_parallel_lookahead_policy(), (False, 0, 2))
+        self.assertEqual(playbot_transposition_policy(), (True, 32768))
 
     def test_playbot_board_size_scaling_policy_is_exposed(self) -> None:
         ref_2d, min_scale_2d, max_scale_2d, exponent_2d = (
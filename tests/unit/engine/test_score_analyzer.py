@@ -17,6 +17,7 @@ from tet4d.engine.runtime.project_config import (
 )
 from tet4d.engine.runtime.score_analyzer import (
     analyze_lock_event,
+    flush_score_analysis_events,
     hud_analysis_lines,
     record_score_analysis_event,
     reset_score_analyzer_runtime_state,
@@ -141,6 +142,7 @@ class TestScoreAnalyzer(unittest.TestCase):
                     second = self._sample_event(seq=2, session_id="session-a")
                     record_score_analysis_event(first)
                     record_score_analysis_event(second)
+                    flush_score_analysis_events()
 
                     lines = events_path.read_text(encoding="utf-8").strip().splitlines()
                     self.assertEqual(len(lines), 2)
@@ -187,6 +189,7 @@ class TestScoreAnalyzer(unittest.TestCase):
                     record_score_analysis_event(
                         self._sample_event(seq=1, session_id="sanitized")
                     )
+                    flush_score_analysis_events()
 
                     safe_events = (
                         tmp_path / "state" / "analytics" / "score_events.jsonl"
@@ -16,6 +16,9 @@ from tet4d.engine.topology_explorer.glue_validate import (
 )
 from tet4d.engine.topology_explorer.movement_graph import (
     build_movement_graph,
+    decode_movement_graph_csr,
+    encode_movement_graph_csr,
+    movement_graph_csr,
     neighbors_for_cell,
 )
 from tet4d.engine.topology_explorer.presets import (
@@ -262,7 +265,7 @@ class TestTopologyExplorer(unittest.TestCase):
 
     def test_build_movement_graph_validates_profile_once(self) -> None:
         profile = mobius_strip_profile_2d()
-        movement_graph_module._build_movement_graph_rows.cache_clear()
+        movement_graph_module._build_movement_graph_csr.cache_clear()
         with mock.patch(
             "tet4d.engine.topology_explorer.movement_graph.validate_explorer_topology_profile",
             return_value=profile,
@@ -273,7 +276,7 @@ class TestTopologyExplorer(unittest.TestCase):
     def test_build_movement_graph_reuses_cached_rows_for_same_signature(self) -> None:
         profile = mobius_strip_profile_2d()
         dims = (5, 4)
-        movement_graph_module._build_movement_graph_rows.cache_clear()
+        movement_graph_module._build_movement_graph_csr.cache_clear()
         with mock.patch(
             "tet4d.engine.topology_explorer.movement_graph.validate_explorer_topology_profile",
             return_value=profile,
@@ -299,6 +302,28 @@ class TestTopologyExplorer(unittest.TestCase):
                         neighbors_for_cell(profile, dims=dims, coord=coord),
                     )
 
+    def test_csr_graph_matches_cell_neighbors_on_every_cell(self) -> None:
+        cases = (
+            (mobius_strip_profile_2d(), (5, 3)),
+            (swapped_xz_profile_3d(), (3, 4, 3)),
+            (swap_xw_profile_4d(), (3, 3, 3, 3)),
+        )
+        for profile, dims in cases:
+            with self.subTest(dimension=profile.dimension, dims=dims):
+                csr = movement_graph_csr(profile, dims=dims)
+                self.assertEqual(csr.cell_count, len(csr.coords))
+                self.assertEqual(csr.edge_count, sum(csr.degrees()))
+                for index, coord in enumerate(csr.coords):
+                    self.assertEqual(csr.index_of(coord), index)
+                    self.assertEqual(
+                        csr.edges_at(index),
+                        neighbors_for_cell(profile, dims=dims, coord=coord),
+                    )
+                decoded = decode_movement_graph_csr(
+                    encode_movement_graph_csr(csr), profile, dims=dims
+                )
+                self.assertEqual(decoded, csr)
+
     def test_klein_bottle_graph_keeps_four_neighbors_per_cell(self) -> None:
         profile = klein_bottle_profile_2d()
         graph = build_movement_graph(profile, dims=(4, 3))
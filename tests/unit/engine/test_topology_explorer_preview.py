@@ -5,6 +5,8 @@ import json
 import shutil
 import unittest
 import warnings
+from array import array
+from dataclasses import replace
 from unittest import mock
 from uuid import uuid4
 
@@ -22,12 +24,12 @@ from tet4d.engine.runtime.project_config import (
 )
 from tet4d.engine.runtime.topology_cache import (
     clear_topology_cache,
-    read_cached_graph_rows,
+    read_cached_movement_graph,
     read_cached_playability_analysis,
     read_topology_cache_entry,
     topology_cache_file_path,
     topology_cache_usage,
-    write_cached_graph_rows,
+    write_cached_movement_graph,
     write_cached_playability_analysis,
 )
 from tet4d.engine.runtime.topology_explorer_bridge import (
@@ -47,10 +49,11 @@ from tet4d.engine.runtime.topology_playground_state import (
 )
 from tet4d.engine.topology_explorer import MoveStep
 from tet4d.engine.topology_explorer.movement_graph import (
-    _build_movement_graph_rows,
+    _build_movement_graph_csr,
     build_movement_graph,
+    encode_movement_graph_csr,
+    movement_graph_csr,
     movement_graph_from_rows,
-    movement_graph_rows,
 )
 from tet4d.engine.topology_explorer.presets import (
     mobius_strip_profile_2d,
@@ -70,6 +73,14 @@ class TestTopologyExplorerPreview(unittest.TestCase):
             encoding="utf-8",
         )
 
+    @classmethod
+    def _write_graph_file(cls, cache_file, encoded: bytes) -> None:
+        topology_cache_module._cache_graph_file_path(cache_file).write_bytes(encoded)
+        entry = json.loads(cache_file.read_text(encoding="utf-8"))
+        entry["graph_sha256"] = hashlib.sha256(encoded).hexdigest()
+        cache_file.write_text(json.dumps(entry), encoding="utf-8")
+        cls._refresh_cache_digest(cache_file)
+
     def test_bridge_converts_symmetric_wrap_profile(self) -> None:
         legacy = validate_topology_profile_state(
             gameplay_mode=GAMEPLAY_MODE_EXPLORER,
@@ -183,7 +194,7 @@ class TestTopologyExplorerPreview(unittest.TestCase):
                 return_value=profile,
             ) as validate_profile,
             mock.patch(
-                "tet4d.engine.runtime.topology_explorer_preview.movement_graph_rows",
+                "tet4d.engine.runtime.topology_explorer_preview.movement_graph_csr",
             ) as graph_rows,
         ):
             coord = recommended_explorer_probe_coord(profile, dims=(6, 6))
@@ -303,7 +314,7 @@ class TestTopologyExplorerPreview(unittest.TestCase):
             cache_dir = explorer_topology_preview_cache_dir_path(root_dir=root)
             self.assertTrue(cache_dir.exists())
             with mock.patch(
-                "tet4d.engine.runtime.topology_explorer_preview.movement_graph_rows",
+                "tet4d.engine.runtime.topology_explorer_preview.movement_graph_csr",
                 side_effect=AssertionError("cache miss"),
             ):
                 cached = compile_explorer_topology_preview(
@@ -326,25 +337,27 @@ class TestTopologyExplorerPreview(unittest.TestCase):
         root.mkdir(parents=True, exist_ok=False)
         try:
             profile = mobius_strip_profile_2d()
-            expected = movement_graph_rows(profile, dims=(6, 6))
-            write_cached_graph_rows(
+            expected = movement_graph_csr(profile, dims=(6, 6))
+            write_cached_movement_graph(
                 profile,
                 dims=(6, 6),
-                graph_rows=expected,
+                graph=expected,
                 root_dir=root,
             )
-            _build_movement_graph_rows.cache_clear()
+            _build_movement_graph_csr.cache_clear()
             with mock.patch(
-                "tet4d.engine.runtime.topology_cache.movement_graph_rows",
+                "tet4d.engine.topology_explorer.movement_graph._build_movement_graph_csr",
                 side_effect=AssertionError("cold cache hit rebuilt the graph"),
             ) as build_graph:
-                cached = read_cached_graph_rows(
+                cached = read_cached_movement_graph(
                     profile,
                     dims=(6, 6),
                     root_dir=root,
                 )
             build_graph.assert_not_called()
             self.assertEqual(cached, expected)
+            assert cached is not None
+            self.assertIsInstance(cached.targets, memoryview)
         finally:
             shutil.rmtree(root, ignore_errors=True)
 
@@ -397,8 +410,8 @@ class TestTopologyExplorerPreview(unittest.TestCase):
                     _PREVIEW_LOCAL_CACHE_VERSION + 1,
                 ),
                 mock.patch(
-                    "tet4d.engine.runtime.topology_explorer_preview.movement_graph_rows",
-                    wraps=movement_graph_rows,
+                    "tet4d.engine.runtime.topology_explorer_preview.movement_graph_csr",
+                    wraps=movement_graph_csr,
                 ) as build_graph,
             ):
                 preview = compile_explorer_topology_preview(
@@ -434,8 +447,8 @@ class TestTopologyExplorerPreview(unittest.TestCase):
             with (
                 warnings.catch_warnings(record=True) as caught,
                 mock.patch(
-                    "tet4d.engine.runtime.topology_explorer_preview.movement_graph_rows",
-                    wraps=movement_graph_rows,
+                    "tet4d.engine.runtime.topology_explorer_preview.movement_graph_csr",
+                    wraps=movement_graph_csr,
                 ) as build_graph,
             ):
                 warnings.simplefilter("always")
@@ -451,7 +464,7 @@ class TestTopologyExplorerPreview(unittest.TestCase):
         finally:
             shutil.rmtree(root, ignore_errors=True)
 
-    def test_compile_preview_persists_graph_rows_in_cache(self) -> None:
+    def test_compile_preview_persists_graph_in_cache(self) -> None:
         root = (
             state_dir_path()
             / "pytest_temp"
@@ -466,11 +479,11 @@ class TestTopologyExplorerPreview(unittest.TestCase):
                 source="graph_rows_seed",
                 root_dir=root,
             )
-            rows = read_cached_graph_rows(profile, dims=(6, 6), root_dir=root)
-            self.assertIsNotNone(rows)
-            assert rows is not None
+            graph = read_cached_movement_graph(profile, dims=(6, 6), root_dir=root)
+            self.assertIsNotNone(graph)
+            assert graph is not None
             self.assertEqual(
-                movement_graph_from_rows(rows),
+                movement_graph_from_rows(graph.rows),
                 build_movement_graph(profile, dims=(6, 6)),
             )
         finally:
@@ -573,7 +586,7 @@ class TestTopologyExplorerPreview(unittest.TestCase):
                 encoding="utf-8",
             )
             self.assertIsNone(
-                read_cached_graph_rows(
+                read_cached_movement_graph(
                     profile,
                     dims=(6, 6),
                     root_dir=root,
@@ -599,7 +612,7 @@ class TestTopologyExplorerPreview(unittest.TestCase):
         finally:
             shutil.rmtree(root, ignore_errors=True)
 
-    def test_cached_graph_rows_reject_semantic_near_misses(self) -> None:
+    def test_cached_graph_rejects_semantic_near_misses(self) -> None:
         root = (
             state_dir_path()
             / "pytest_temp"
@@ -617,90 +630,103 @@ class TestTopologyExplorerPreview(unittest.TestCase):
             cache_file = next(
                 explorer_topology_preview_cache_dir_path(root_dir=root).glob("*.json")
             )
-            original = json.loads(cache_file.read_text(encoding="utf-8"))
-            malformed_rows = []
-
-            bad_coord = json.loads(json.dumps(original))
-            bad_coord["graph_rows"][0]["coord"].append(0)
-            malformed_rows.append(bad_coord)
-
-            out_of_bounds_coord = json.loads(json.dumps(original))
-            out_of_bounds_coord["graph_rows"][0]["coord"][0] = 6
-            malformed_rows.append(out_of_bounds_coord)
-
-            duplicate_coord = json.loads(json.dumps(original))
-            duplicate_coord["graph_rows"][1]["coord"] = list(
-                duplicate_coord["graph_rows"][0]["coord"]
+            graph = movement_graph_csr(profile, dims=(6, 6))
+            original = encode_movement_graph_csr(graph)
+            seam_edge = next(
+                edge for edge, value in enumerate(graph.traversal_ids) if value >= 0
             )
-            malformed_rows.append(duplicate_coord)
-
-            missing_reference = json.loads(json.dumps(original))
-            missing_reference["graph_rows"][0]["edges"][0]["target"][0] = 6
-            malformed_rows.append(missing_reference)
+            interior_edge = graph.offsets[graph.index_of((2, 2))]
 
-            invalid_axis = json.loads(json.dumps(original))
-            invalid_axis["graph_rows"][0]["edges"][0]["step"] = "q+"
-            malformed_rows.append(invalid_axis)
+            def with_arrays(**arrays) -> bytes:
+                return encode_movement_graph_csr(replace(graph, **arrays))
 
-            invalid_delta = json.loads(json.dumps(original))
-            invalid_delta["graph_rows"][0]["edges"][0]["step"] = "x+2"
-            malformed_rows.append(invalid_delta)
+            def without_edge(edge: int) -> bytes:
+                def drop(values):
+                    return values[:edge] + values[edge + 1 :]
 
-            malformed_traversal = json.loads(json.dumps(original))
-            for row in malformed_traversal["graph_rows"]:
-                traversal = next(
-                    (
-                        edge["traversal"]
-                        for edge in row["edges"]
-                        if edge["traversal"] is not None
+                return with_arrays(
+                    offsets=array(
+                        "i",
+                        (value - (value > edge) for value in graph.offsets),
+                    ),
+                    targets=drop(graph.targets),
+                    step_ids=drop(graph.step_ids),
+                    traversal_ids=array(
+                        "i",
+                        (
+                            value - (value > graph.traversal_ids[edge] >= 0)
+                            for value in drop(graph.traversal_ids)
+                        ),
                     ),
-                    None,
                 )
-                if traversal is not None:
-                    del traversal["glue_id"]
-                    break
-            malformed_rows.append(malformed_traversal)
-
-            omitted_in_bounds = json.loads(json.dumps(original))
-            interior_row = next(
-                row for row in omitted_in_bounds["graph_rows"] if row["coord"] == [1, 1]
-            )
-            interior_row["edges"] = [
-                edge for edge in interior_row["edges"] if edge["step"] != "x+"
-            ]
-            malformed_rows.append(omitted_in_bounds)
-
-            omitted_seam = json.loads(json.dumps(original))
-            seam_removed = False
-            for row in omitted_seam["graph_rows"]:
-                for edge_index, edge in enumerate(row["edges"]):
-                    if edge["traversal"] is not None:
-                        row["edges"].pop(edge_index)
-                        seam_removed = True
-                        break
-                if seam_removed:
-                    break
-            self.assertTrue(seam_removed)
-            malformed_rows.append(omitted_seam)
-
-            wrong_row_count = json.loads(json.dumps(original))
-            wrong_row_count["graph_row_count"] += 1
-            malformed_rows.append(wrong_row_count)
-
-            wrong_edge_count = json.loads(json.dumps(original))
-            wrong_edge_count["graph_directed_edge_count"] += 1
-            malformed_rows.append(wrong_edge_count)
-
-            for malformed in malformed_rows:
-                cache_file.write_text(json.dumps(malformed), encoding="utf-8")
-                self._refresh_cache_digest(cache_file)
-                self.assertIsNone(
-                    read_cached_graph_rows(
-                        profile,
-                        dims=(6, 6),
-                        root_dir=root,
-                    )
+
+            shifted_targets = array("i", graph.targets)
+            shifted_targets[interior_edge] += 1
+            swapped_steps = array("b", graph.step_ids)
+            swapped_targets = array("i", graph.targets)
+            for values in (swapped_steps, swapped_targets):
+                values[interior_edge], values[interior_edge + 1] = (
+                    values[interior_edge + 1],
+                    values[interior_edge],
                 )
+            bad_step = array("b", graph.step_ids)
+            bad_step[interior_edge] = len(graph.steps)
+            unflagged_seam = array("i", graph.traversal_ids)
+            unflagged_seam[seam_edge] = -1
+            malformed = {
+                "magic": b"XXXX" + original[4:],
+                "format_version": original[:4] + b"\x02" + original[5:],
+                "dims": original[:16] + (7).to_bytes(4, "little") + original[20:],
+                "truncated": original[:-1],
+                "trailing": original + b"\x00",
+                "shifted_target": with_arrays(targets=shifted_targets),
+                "step_order": with_arrays(
+                    step_ids=swapped_steps, targets=swapped_targets
+                ),
+                "step_id": with_arrays(step_ids=bad_step),
+                "unflagged_seam": with_arrays(traversal_ids=unflagged_seam),
+                "omitted_in_bounds": without_edge(interior_edge),
+                "omitted_seam": without_edge(seam_edge),
+            }
+            for label, encoded in malformed.items():
+                with self.subTest(label=label):
+                    self._write_graph_file(cache_file, encoded)
+                    self.assertIsNone(
+                        read_cached_movement_graph(
+                            profile,
+                            dims=(6, 6),
+                            root_dir=root,
+                        )
+                    )
+
+            self._write_graph_file(cache_file, original)
+            self.assertEqual(
+                read_cached_movement_graph(profile, dims=(6, 6), root_dir=root),
+                graph,
+            )
+            entry = json.loads(cache_file.read_text(encoding="utf-8"))
+            for field in ("graph_row_count", "graph_directed_edge_count"):
+                with self.subTest(field=field):
+                    wrong_count = dict(entry)
+                    wrong_count[field] += 1
+                    cache_file.write_text(json.dumps(wrong_count), encoding="utf-8")
+                    self._refresh_cache_digest(cache_file)
+                    self.assertIsNone(
+                        read_cached_movement_graph(
+                            profile,
+                            dims=(6, 6),
+                            root_dir=root,
+                        )
+                    )
+
+            cache_file.write_text(json.dumps(entry), encoding="utf-8")
+            self._refresh_cache_digest(cache_file)
+            topology_cache_module._cache_graph_file_path(cache_file).write_bytes(
+                with_arrays(targets=shifted_targets)
+            )
+            self.assertIsNone(
+                read_cached_movement_graph(profile, dims=(6, 6), root_dir=root)
+            )
         finally:
             shutil.rmtree(root, ignore_errors=True)
 
@@ -728,8 +754,8 @@ class TestTopologyExplorerPreview(unittest.TestCase):
             )
 
             with mock.patch(
-                "tet4d.engine.runtime.topology_explorer_preview.movement_graph_rows",
-                wraps=movement_graph_rows,
+                "tet4d.engine.runtime.topology_explorer_preview.movement_graph_csr",
+                wraps=movement_graph_csr,
             ) as build_graph:
                 rebuilt = compile_explorer_topology_preview(
                     profile,
@@ -740,14 +766,14 @@ class TestTopologyExplorerPreview(unittest.TestCase):
             build_graph.assert_called_once_with(profile, dims=(6, 6))
             self.assertEqual(rebuilt["movement_graph"], expected["movement_graph"])
 
-            _build_movement_graph_rows.cache_clear()
+            _build_movement_graph_csr.cache_clear()
             with (
                 mock.patch(
-                    "tet4d.engine.runtime.topology_cache.movement_graph_rows",
+                    "tet4d.engine.topology_explorer.movement_graph._build_movement_graph_csr",
                     side_effect=AssertionError("cache reader rebuilt the graph"),
                 ) as cache_builder,
                 mock.patch(
-                    "tet4d.engine.runtime.topology_explorer_preview.movement_graph_rows",
+                    "tet4d.engine.runtime.topology_explorer_preview.movement_graph_csr",
                     side_effect=AssertionError("caller rebuilt the graph"),
                 ) as caller_builder,
             ):
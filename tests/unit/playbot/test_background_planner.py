@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from tet4d.ai.playbot import (
+    PlayBotController,
+    plan_best_nd_move,
+)
+from tet4d.ai.playbot.background_planner import (
+    BackgroundPlanService,
+    planning_snapshot,
+)
+from tet4d.ai.playbot.types import (
+    BotMode,
+    BotPlannerProfile,
+)
+from tet4d.engine.core.model import BoardND
+from tet4d.engine.gameplay.game2d import GameConfig, GameState
+from tet4d.engine.gameplay.game_nd import GameConfigND, GameStateND
+from tet4d.engine.gameplay.pieces2d import PIECE_SET_2D_DEBUG
+from tet4d.engine.gameplay.pieces_nd import (
+    PIECE_SET_3D_DEBUG,
+)
+from tet4d.ui.pygame.runtime_ui import loop_runner_nd
+
+
+class TestBackgroundPlanner(unittest.TestCase):
+    def test_auto_tick_steps_visible_piece_toward_background_plan_2d(self) -> None:
+        cfg = GameConfig(width=10, height=20, piece_set=PIECE_SET_2D_DEBUG)
+        state = GameState(
+            config=cfg, board=BoardND((cfg.width, cfg.height)), rng=random.Random(0)
+        )
+        bot = PlayBotController(
+            mode=BotMode.AUTO,
+            action_interval_ms=1,
+            planner_profile=BotPlannerProfile.FAST,
+            planning_budget_ms=1000,
+            background_planning=True,
+        )
+        self.addCleanup(bot.shutdown)
+        while not bot._piece_fully_visible_2d(state):
+            bot.tick_2d(state, dt_ms=16)
+
+        deadline = time.monotonic() + 10.0
+        moves: list[tuple[tuple[int, int], int]] = []
+        while time.monotonic() < deadline:
+            piece = state.current_piece
+            assert piece is not None
+            before = (piece.pos, piece.rotation)
+            bot.tick_2d(state, dt_ms=16)
+            after = state.current_piece
+            assert after is not None
+            if (after.pos, after.rotation) != before:
+                moves.append((after.pos, after.rotation))
+            if bot._target_x_2d is not None and after.pos[0] == bot._target_x_2d:
+                break
+            time.sleep(0.002)
+
+        self.assertEqual(len(state.board.cells), 0)
+        self.assertEqual(bot._target_x_2d, 2)
+        self.assertEqual(moves, [((3, 1), 0), ((2, 1), 0)])
+
+    def test_background_assist_applies_plan_on_later_tick_nd(self) -> None:
+        cfg = GameConfigND(
+            dims=(4, 8, 4), gravity_axis=1, piece_set_id=PIECE_SET_3D_DEBUG
+        )
+        state = GameStateND(config=cfg, board=BoardND(cfg.dims), rng=random.Random(3))
+        bot = PlayBotController(
+            mode=BotMode.ASSIST,
+            planner_profile=BotPlannerProfile.FAST,
+            planning_budget_ms=1000,
+            background_planning=True,
+        )
+        self.addCleanup(bot.shutdown)
+        expected = plan_best_nd_move(
+            planning_snapshot(state),
+            profile=BotPlannerProfile.FAST,
+            budget_ms=1000,
+            algorithm=bot.planner_algorithm,
+        )
+        self.assertIsNotNone(expected)
+        piece_before = state.current_piece
+
+        deadline = time.monotonic() + 10.0
+        bot.tick_nd(state, dt_ms=16)
+        while not bot._assist_preview_cells and time.monotonic() < deadline:
+            time.sleep(0.005)
+            bot.tick_nd(state, dt_ms=16)
+
+        self.assertFalse(bot.plan_pending)
+        self.assertIs(state.current_piece, piece_before)
+        self.assertEqual(
+            bot._assist_preview_cells,
+            tuple(tuple(cell) for cell in expected.final_piece.cells()),
+        )
+
+    def test_background_service_drops_results_for_stale_tokens(self) -> None:
+        service: BackgroundPlanService[str] = BackgroundPlanService()
+        self.addCleanup(service.shutdown)
+        release = threading.Event()
+        service.submit("piece-a", lambda: release.wait(5.0) and "plan-a")
+        self.assertTrue(service.pending("piece-a"))
+        self.assertFalse(service.pending("piece-b"))
+        self.assertEqual(service.poll("piece-a"), (False, None))
+
+        release.set()
+        ready, plan = False, None
+        deadline = time.monotonic() + 5.0
+        while not ready and time.monotonic() < deadline:
+            self.assertEqual(service.poll("piece-b"), (False, None))
+            ready, plan = service.poll("piece-a")
+            time.sleep(0.005)
+        self.assertEqual((ready, plan), (True, "plan-a"))
+
+        service.submit("piece-c", lambda: "plan-c")
+        service.cancel()
+        self.assertFalse(service.pending("piece-c"))
+        self.assertEqual(service.poll("piece-c"), (False, None))
+
+    def test_planning_snapshot_isolated_from_live_state(self) -> None:
+        cfg = GameConfigND(
+            dims=(4, 8, 4), gravity_axis=1, piece_set_id=PIECE_SET_3D_DEBUG
+        )
+        state = GameStateND(config=cfg, board=BoardND(cfg.dims), rng=random.Random(5))
+        snapshot = planning_snapshot(state)
+        bag_before = list(state.next_bag)
+        state.board.cells[(0, 7, 0)] = 1
+        state.next_bag.clear()
+
+        self.assertEqual(snapshot.next_bag, bag_before)
+
+        self.assertNotIn((0, 7, 0), snapshot.board.cells)
+        self.assertEqual(snapshot.board.level_counts(1)[7], 0)
+        self.assertIs(snapshot.current_piece, state.current_piece)
+
+    def test_run_nd_loop_shuts_down_bot_planner_on_exit(self) -> None:
+        bot = Mock()
+        loop = SimpleNamespace(
+            gravity_accumulator=0,
+            refresh_score_multiplier=lambda: None,
+            keydown_handler=lambda _event: "continue",
+            on_restart=lambda: None,
+            on_toggle_grid=lambda: None,
+            bot=bot,
+        )
+
+        with patch.object(loop_runner_nd, "process_game_events", return_value="quit"):
+            result = loop_runner_nd.run_nd_loop(
+                screen=Mock(),
+                fonts=object(),
+                loop=loop,
+                gravity_interval_from_config=lambda _cfg: 500,
+                pause_dimension=3,
+                run_pause_menu=lambda *_args, **_kwargs: ("continue", Mock()),
+                run_help_menu=lambda *_args, **_kwargs: Mock(),
+                spawn_clear_animation=lambda *_args, **_kwargs: (None, 0),
+                capture_endgame_snapshot=lambda: Mock(),
+                step_view=lambda _dt: None,
+                draw_frame=lambda _screen, _overlay: None,
+                play_clear_sfx=lambda: None,
+                play_game_over_sfx=lambda: None,
+                play_endgame_sfx=lambda _event_name: None,
+            )
+
+        self.assertFalse(result)
+        bot.shutdown.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
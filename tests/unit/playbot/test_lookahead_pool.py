@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import itertools
+import random
+import unittest
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from unittest import mock
+
+from tet4d.ai.playbot import (
+    lookahead_pool,
+    planner_nd_search,
+)
+from tet4d.ai.playbot.types import (
+    BotPlannerAlgorithm,
+    BotPlannerProfile,
+)
+from tet4d.engine.core.model import BoardND
+from tet4d.engine.gameplay.game_nd import GameConfigND, GameStateND
+
+
+class TestLookaheadPool(unittest.TestCase):
+    def test_occupancy_packing_round_trips(self) -> None:
+        dims = (3, 5, 2, 2)
+        rng = random.Random(4)
+        cells = {
+            coord: 1
+            for coord in itertools.product(*(range(size) for size in dims))
+            if rng.random() < 0.4
+        }
+        packed = lookahead_pool.pack_occupancy(cells, dims)
+        self.assertEqual(len(packed), 8)
+        self.assertEqual(lookahead_pool.unpack_occupancy(packed, dims), cells)
+
+    def test_parallel_lookahead_matches_serial_plan(self) -> None:
+        cfg = GameConfigND(dims=(5, 12, 4), gravity_axis=1)
+        rng = random.Random(2)
+        board = BoardND(cfg.dims)
+        for coord in itertools.product(range(5), range(7, 12), range(4)):
+            if rng.random() < 0.7:
+                board.cells[coord] = rng.randint(1, 7)
+        state = GameStateND(config=cfg, board=board, rng=random.Random(2))
+
+        def plan():
+            return planner_nd_search.plan_best_nd_with_budget(
+                state,
+                profile=BotPlannerProfile.DEEP,
+                planning_budget_ms=60_000,
+                algorithm=BotPlannerAlgorithm.HEURISTIC,
+            )
+
+        serial = plan()
+        in_process_map = mock.Mock(
+            side_effect=lambda fn, tasks, **_kwargs: [fn(task) for task in tasks]
+        )
+        with (
+            mock.patch.object(
+                lookahead_pool,
+                "playbot_parallel_lookahead_policy",
+                return_value=(True, 4, 2),
+            ),
+            mock.patch.object(planner_nd_search, "map_until_deadline", in_process_map),
+        ):
+            parallel = plan()
+
+        self.assertTrue(in_process_map.called)
+        self.assertEqual(parallel.final_piece, serial.final_piece)
+        self.assertEqual(parallel.stats.heuristic_score, serial.stats.heuristic_score)
+
+    def test_worker_errors_score_as_missed_and_broken_pool_resets(self) -> None:
+        def settled(task: object) -> Future[float]:
+            future: Future[float] = Future()
+            if isinstance(task, BaseException):
+                future.set_exception(task)
+            else:
+                future.set_result(task)
+            return future
+
+        pool = mock.Mock()
+        pool.submit.side_effect = lambda _fn, task: settled(task)
+        cases = (
+            ([1.5, ValueError("bad follow-up"), 2.5], [1.5, None, 2.5], False),
+            ([1.5, BrokenProcessPool("worker died")], [1.5, None], True),
+        )
+        for tasks, expected, resets in cases:
+            with (
+                self.subTest(resets=resets),
+                mock.patch.object(lookahead_pool, "_lookahead_pool", return_value=pool),
+                mock.patch.object(lookahead_pool, "shutdown_lookahead_pool") as reset,
+            ):
+                results = lookahead_pool.map_until_deadline(
+                    float, tasks, workers=2, timeout_s=1.0
+                )
+                self.assertEqual(results, expected)
+                self.assertEqual(reset.called, resets)
+
+    def test_submit_to_broken_pool_reports_every_task_missed(self) -> None:
+        pool = mock.Mock()
+        pool.submit.side_effect = BrokenProcessPool("pool is broken")
+        with (
+            mock.patch.object(lookahead_pool, "_lookahead_pool", return_value=pool),
+            mock.patch.object(lookahead_pool, "shutdown_lookahead_pool") as reset,
+        ):
+            results = lookahead_pool.map_until_deadline(
+                float, [1.0, 2.0], workers=2, timeout_s=1.0
+            )
+        self.assertEqual(results, [None, None])
+        reset.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import unittest
+
+from tet4d.engine.core.orientation_table import (
+    OrientationTable,
+    build_orientation_graph,
+    orientation_table,
+)
+from tet4d.engine.core.piece_transform import (
+    canonicalize_blocks_nd,
+    normalize_blocks_nd,
+    rotate_blocks_nd,
+)
+
+_L_TETROCUBE = canonicalize_blocks_nd(((0, 0, 0), (1, 0, 0), (2, 0, 0), (0, 1, 0)))
+
+
+class TestOrientationTable(unittest.TestCase):
+    def test_orientations_are_distinct_shapes_starting_with_start(self) -> None:
+        orientations = OrientationTable(3, 1).orientations(_L_TETROCUBE)
+
+        self.assertEqual(orientations[0], _L_TETROCUBE)
+        shapes = {
+            canonicalize_blocks_nd(normalize_blocks_nd(blocks))
+            for blocks in orientations
+        }
+        self.assertEqual(len(shapes), len(orientations))
+        self.assertEqual(len(orientations), 24)
+
+    def test_rotation_path_reaches_every_orientation(self) -> None:
+        table = OrientationTable(3, 1)
+        for target in table.orientations(_L_TETROCUBE):
+            blocks = _L_TETROCUBE
+            for axis_a, axis_b, delta in table.rotation_path(_L_TETROCUBE, target):
+                blocks = canonicalize_blocks_nd(
+                    rotate_blocks_nd(
+                        blocks, axis_a=axis_a, axis_b=axis_b, quarter_turns=delta
+                    )
+                )
+            self.assertEqual(blocks, target)
+
+    def test_unreachable_target_has_empty_path(self) -> None:
+        table = OrientationTable(3, 1)
+        self.assertEqual(table.rotation_path(_L_TETROCUBE, ((9, 9, 9),)), [])
+        self.assertEqual(table.rotation_path(_L_TETROCUBE, _L_TETROCUBE), [])
+
+    def test_graph_edges_point_at_rotated_nodes(self) -> None:
+        graph = build_orientation_graph(_L_TETROCUBE, 3, 1)
+        for (axis_a, axis_b, delta), node in graph.edges[0]:
+            rotated = canonicalize_blocks_nd(
+                rotate_blocks_nd(
+                    graph.start, axis_a=axis_a, axis_b=axis_b, quarter_turns=delta
+                )
+            )
+            self.assertEqual(graph.nodes[node], rotated)
+
+    def test_tables_are_shared_and_graphs_built_once(self) -> None:
+        table = orientation_table(3, 1)
+        self.assertIs(table, orientation_table(3, 1))
+        table.prime((_L_TETROCUBE,))
+        size = len(table)
+        graph = table.graph(_L_TETROCUBE)
+        self.assertIs(graph, table.graph(_L_TETROCUBE))
+        self.assertEqual(len(table), size)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import itertools
+import random
+import unittest
+
+from tet4d.ai.playbot import (
+    plan_best_nd_move,
+)
+from tet4d.ai.playbot.lookahead_common import (
+    choose_best_with_followup_batch,
+)
+from tet4d.ai.playbot.types import (
+    BotPlannerAlgorithm,
+    BotPlannerProfile,
+)
+from tet4d.engine.core.model import BoardND
+from tet4d.engine.gameplay.game_nd import GameConfigND, GameStateND
+from tet4d.engine.gameplay.pieces_nd import (
+    PIECE_SET_3D_DEBUG,
+    PIECE_SET_4D_DEBUG,
+)
+
+
+class TestPlaybotBatchPlanner(unittest.TestCase):
+    def test_batched_followups_skip_missed_deadlines(self) -> None:
+        selected, combined = choose_best_with_followup_batch(
+            candidates=("doomed", "safe", "late"),
+            base_candidate="doomed",
+            score_of=lambda candidate: {"doomed": 10.0, "safe": 9.0, "late": 9.5}[
+                candidate
+            ],
+            cleared_of=lambda _candidate: 0,
+            followup_scores_of=lambda ranked: [
+                {"doomed": -1000.0, "safe": -1.0, "late": None}[candidate]
+                for candidate in ranked
+            ],
+            followup_weight=0.30,
+        )
+
+        self.assertEqual(selected, "safe")
+        self.assertAlmostEqual(combined, 8.7)
+
+    def test_nd_batch_algorithm_matches_heuristic_choice(self) -> None:
+        for dims, piece_set_id in (
+            ((5, 10, 4), PIECE_SET_3D_DEBUG),
+            ((4, 10, 3, 2), PIECE_SET_4D_DEBUG),
+        ):
+            with self.subTest(dims=dims):
+                cfg = GameConfigND(dims=dims, gravity_axis=1, piece_set_id=piece_set_id)
+                rng = random.Random(7)
+                board = BoardND(cfg.dims)
+                for coord in itertools.product(*(range(size) for size in dims)):
+                    if coord[1] >= 6 and rng.random() < 0.8:
+                        board.cells[coord] = 1
+                state = GameStateND(config=cfg, board=board, rng=random.Random(3))
+                plans = [
+                    plan_best_nd_move(
+                        state,
+                        profile=BotPlannerProfile.FAST,
+                        budget_ms=60_000,
+                        algorithm=algorithm,
+                    )
+                    for algorithm in (
+                        BotPlannerAlgorithm.HEURISTIC,
+                        BotPlannerAlgorithm.BATCH,
+                    )
+                ]
+                heuristic, batch = plans
+                self.assertIsNotNone(heuristic)
+                self.assertIsNotNone(batch)
+                self.assertEqual(batch.final_piece, heuristic.final_piece)
+                self.assertEqual(
+                    batch.stats.heuristic_score, heuristic.stats.heuristic_score
+                )
+                self.assertEqual(
+                    batch.stats.candidate_count, heuristic.stats.candidate_count
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
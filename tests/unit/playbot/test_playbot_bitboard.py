@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import itertools
+import random
+import unittest
+
+from tet4d.ai.playbot import (
+    plan_best_2d_move,
+)
+from tet4d.ai.playbot.planner_nd_core import (
+    height_features,
+    iter_settled_candidates,
+    level_height_features,
+)
+from tet4d.ai.playbot.planner_nd_search import enumerate_orientations
+from tet4d.ai.playbot.types import (
+    BotPlannerProfile,
+)
+from tet4d.engine.gameplay.game2d import GameConfig, GameState
+from tet4d.engine.gameplay.game_nd import GameConfigND, GameStateND
+
+
+class TestPlaybotBitboard(unittest.TestCase):
+    def test_2d_bitboard_planner_matches_sparse_planner(self) -> None:
+        plans = []
+        for board_storage in ("sparse", "bitboard"):
+            cfg = GameConfig(width=8, height=12, board_storage=board_storage)
+            state = GameState(config=cfg, board=None, rng=random.Random(2))
+            for x in range(7):
+                state.board.cells[(x, 11)] = 1
+            state.board.cells[(3, 10)] = 1
+            plans.append(
+                plan_best_2d_move(
+                    state, profile=BotPlannerProfile.BALANCED, budget_ms=5000
+                )
+            )
+        sparse, bitboard = plans
+        self.assertEqual(bitboard.final_piece, sparse.final_piece)
+        self.assertEqual(bitboard.stats.heuristic_score, sparse.stats.heuristic_score)
+        self.assertEqual(bitboard.stats.candidate_count, sparse.stats.candidate_count)
+
+    def test_nd_bitboard_candidates_and_features_match_sparse(self) -> None:
+        dims = (4, 9, 3, 2)
+        settled = []
+        for board_storage in ("sparse", "bitboard"):
+            cfg = GameConfigND(dims=dims, gravity_axis=1, board_storage=board_storage)
+            state = GameStateND(config=cfg, board=None, rng=random.Random(3))
+            rng = random.Random(8)
+            for coord in itertools.product(*(range(size) for size in dims)):
+                if coord[1] >= 6 and rng.random() < 0.6:
+                    state.board.cells[coord] = 1
+            piece = state.current_piece
+            settled.append(
+                list(
+                    iter_settled_candidates(
+                        state,
+                        piece=piece,
+                        orientations=enumerate_orientations(
+                            piece.rel_blocks, cfg.ndim, cfg.gravity_axis
+                        ),
+                        ndim=cfg.ndim,
+                        dims=dims,
+                        gravity_axis=1,
+                        lateral_axes=(0, 2, 3),
+                        column_levels=state.board.column_levels(1),
+                    )
+                )
+            )
+        self.assertTrue(settled[0])
+        self.assertEqual(settled[1], settled[0])
+        self.assertEqual(
+            level_height_features(state.board.level_masks(), dims),
+            height_features(state.board.cells, dims, 1),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import unittest
+
+from tet4d.ai.playbot.soak import (
+    SoakCase,
+    SoakGameResult,
+    run_soak,
+    soak_games,
+    summarize_soak_case,
+)
+from tet4d.ai.playbot.types import (
+    BotPlannerAlgorithm,
+    BotPlannerProfile,
+)
+
+
+class TestPlaybotSoak(unittest.TestCase):
+    def test_soak_runner_streams_games_and_summarizes_per_case(self) -> None:
+        cases = [
+            SoakCase(
+                dims=dims,
+                piece_set=piece_set,
+                profile=BotPlannerProfile.FAST,
+                algorithm=BotPlannerAlgorithm.GREEDY_LAYER,
+                budget_ms=20,
+            )
+            for dims, piece_set in (((6, 10), "classic"), ((4, 8, 4), "native_3d"))
+        ]
+        games = soak_games(cases, games_per_case=2, seed_start=7, max_pieces=6)
+        streamed: list[SoakGameResult] = []
+        summaries = run_soak(games, workers=1, on_result=streamed.append)
+        self.assertEqual(
+            [(r.case, r.seed) for r in streamed], [(g.case, g.seed) for g in games]
+        )
+        self.assertEqual(
+            [summary["case"] for summary in summaries], [case.key for case in cases]
+        )
+        for summary in summaries:
+            self.assertEqual(summary["games"], 2)
+            self.assertGreater(summary["pieces"], 0)
+            self.assertIn("p50", summary["lines_cleared"])
+
+    def test_soak_summary_reports_game_over_distribution(self) -> None:
+        case = SoakCase(
+            dims=(10, 20),
+            piece_set="classic",
+            profile=BotPlannerProfile.BALANCED,
+            algorithm=BotPlannerAlgorithm.AUTO,
+            budget_ms=10,
+        )
+        results = [
+            SoakGameResult(case, seed, pieces, clears, clears, 0, game_over, 0.5)
+            for seed, (pieces, clears, game_over) in enumerate(
+                ((40, 3, False), (12, 0, True), (30, 1, True), (40, 5, False))
+            )
+        ]
+        summary = summarize_soak_case(case, results)
+        self.assertEqual(summary["pieces"], 122)
+        self.assertEqual(summary["pieces_per_sec"], 61.0)
+        self.assertEqual(summary["game_over_rate"], 0.5)
+        self.assertEqual(summary["game_over_pieces"]["min"], 12.0)
+        self.assertEqual(summary["game_over_pieces"]["max"], 30.0)
+        self.assertEqual(summary["lines_cleared"]["max"], 5.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
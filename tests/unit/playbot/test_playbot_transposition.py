@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import random
+import unittest
+
+from tet4d.ai.playbot import (
+    plan_best_nd_move,
+)
+from tet4d.ai.playbot.transposition import TranspositionTable
+from tet4d.ai.playbot.types import (
+    BotPlannerAlgorithm,
+    BotPlannerProfile,
+)
+from tet4d.engine.core.model import BoardND
+from tet4d.engine.gameplay.game_nd import GameConfigND, GameStateND
+from tet4d.engine.gameplay.pieces_nd import (
+    PIECE_SET_3D_DEBUG,
+)
+
+
+class TestPlaybotTransposition(unittest.TestCase):
+    def test_transposition_table_evicts_least_recent_and_counts_probes(self) -> None:
+        table = TranspositionTable(max_entries=2)
+        calls: list[str] = []
+
+        def compute(key: str):
+            return lambda: calls.append(key) or key.upper()
+
+        self.assertEqual(table.get_or_compute("a", compute("a")), "A")
+        table.get_or_compute("b", compute("b"))
+        self.assertEqual(table.get_or_compute("a", compute("a")), "A")
+        table.get_or_compute("c", compute("c"))
+        table.get_or_compute("a", compute("a"))
+        table.get_or_compute("b", compute("b"))
+
+        self.assertEqual(calls, ["a", "b", "c", "b"])
+        self.assertEqual(table.counters(), (2, 4))
+        self.assertEqual(len(table), 2)
+
+    def test_repeated_nd_plan_reports_transposition_hits(self) -> None:
+        cfg = GameConfigND(
+            dims=(4, 8, 4), gravity_axis=1, piece_set_id=PIECE_SET_3D_DEBUG
+        )
+        state = GameStateND(config=cfg, board=BoardND(cfg.dims), rng=random.Random(9))
+        plans = [
+            plan_best_nd_move(
+                state,
+                profile=BotPlannerProfile.FAST,
+                budget_ms=1000,
+                algorithm=BotPlannerAlgorithm.HEURISTIC,
+            )
+            for _ in range(2)
+        ]
+        self.assertIsNotNone(plans[0])
+        self.assertIsNotNone(plans[1])
+        repeat = plans[1].stats
+        self.assertEqual(repeat.transposition_misses, 0)
+        self.assertGreaterEqual(repeat.transposition_hits, repeat.candidate_count)
+        self.assertEqual(plans[0].final_piece.pos, plans[1].final_piece.pos)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import math
+import shutil
+import threading
+import unittest
+from array import array
+from unittest import mock
+from uuid import uuid4
+
+from tet4d.engine.runtime.project_config import state_dir_path
+from tet4d.engine.runtime.runtime_config import (
+    audio_event_specs,
+    audio_event_voice_limits,
+)
+from tet4d.engine.runtime.runtime_config_validation_gameplay import (
+    validate_audio_sfx_payload,
+)
+from tet4d.ui.pygame.runtime_ui import audio as runtime_audio
+from tet4d.ui.pygame.runtime_ui import sfx_cache
+
+
+def _reference_tone(spec, *, sample_rate: int, channels: int) -> bytes:
+    frequency, duration_ms, amplitude = spec
+    frame_count = max(1, int(sample_rate * (duration_ms / 1000.0)))
+    peak = int(32767 * max(0.0, min(1.0, amplitude)))
+    wave = array("h")
+    for idx in range(frame_count):
+        t = idx / sample_rate
+        sample = int(peak * math.sin(2.0 * math.pi * frequency * t))
+        wave.extend([sample] * max(1, channels))
+    return wave.tobytes()
+
+
+class TestSfxCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.root = state_dir_path() / "pytest_temp" / f"sfx_cache_{uuid4().hex}"
+        self.root.mkdir(parents=True, exist_ok=False)
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+
+    def test_synthesis_matches_per_sample_tone(self) -> None:
+        for spec in ((440.0, 25, 0.5), (182.0, 42, 0.03), (920.0, 1, 1.0)):
+            for channels in (1, 2, 4):
+                with self.subTest(spec=spec, channels=channels):
+                    self.assertEqual(
+                        sfx_cache.synthesize_tone_pcm(
+                            spec, sample_rate=22050, channels=channels
+                        ),
+                        _reference_tone(spec, sample_rate=22050, channels=channels),
+                    )
+
+    def test_cache_key_covers_spec_rate_and_channels(self) -> None:
+        base = sfx_cache.sfx_cache_key((440.0, 30, 0.1), sample_rate=44100, channels=2)
+        self.assertEqual(
+            base,
+            sfx_cache.sfx_cache_key((440.0, 30, 0.1), sample_rate=44100, channels=2),
+        )
+        variants = {
+            sfx_cache.sfx_cache_key((441.0, 30, 0.1), sample_rate=44100, channels=2),
+            sfx_cache.sfx_cache_key((440.0, 31, 0.1), sample_rate=44100, channels=2),
+            sfx_cache.sfx_cache_key((440.0, 30, 0.2), sample_rate=44100, channels=2),
+            sfx_cache.sfx_cache_key((440.0, 30, 0.1), sample_rate=48000, channels=2),
+            sfx_cache.sfx_cache_key((440.0, 30, 0.1), sample_rate=44100, channels=1),
+        }
+        self.assertEqual(len(variants), 5)
+        self.assertNotIn(base, variants)
+
+    def test_load_writes_then_reuses_and_repairs_cache_file(self) -> None:
+        spec = (520.0, 34, 0.05)
+        expected = sfx_cache.synthesize_tone_pcm(spec, sample_rate=44100, channels=2)
+        path = sfx_cache.sfx_cache_file_path(
+            spec, sample_rate=44100, channels=2, root_dir=self.root
+        )
+
+        first = sfx_cache.load_tone_pcm(
+            spec, sample_rate=44100, channels=2, root_dir=self.root
+        )
+        self.assertEqual(first, expected)
+        self.assertEqual(path.read_bytes(), expected)
+
+        with mock.patch.object(
+            sfx_cache, "synthesize_tone_pcm", side_effect=AssertionError("cache miss")
+        ):
+            cached = sfx_cache.load_tone_pcm(
+                spec, sample_rate=44100, channels=2, root_dir=self.root
+            )
+        self.assertEqual(cached, expected)
+
+        path.write_bytes(expected[:10])
+        repaired = sfx_cache.load_tone_pcm(
+            spec, sample_rate=44100, channels=2, root_dir=self.root
+        )
+        self.assertEqual(repaired, expected)
+        self.assertEqual(path.read_bytes(), expected)
+
+
+class TestAudioEngineWarmUp(unittest.TestCase):
+    def _engine(self) -> runtime_audio.AudioEngine:
+        engine = runtime_audio.AudioEngine()
+        engine.enabled = True
+        return engine
+
+    def test_warm_up_builds_every_event_sound_once(self) -> None:
+        engine = self._engine()
+        with (
+            mock.patch.object(runtime_audio.pygame.mixer, "Sound") as sound_cls,
+            mock.patch.object(
+                runtime_audio, "load_tone_pcm", return_value=b"\x00\x00"
+            ) as load_pcm,
+        ):
+            engine.warm_up()
+            engine.play("lock")
+
+        self.assertEqual(set(engine._sounds), set(audio_event_specs()))
+        self.assertEqual(load_pcm.call_count, len(audio_event_specs()))
+        self.assertEqual(sound_cls.call_count, len(audio_event_specs()))
+
+    def test_play_of_cached_sound_does_not_wait_for_another_build(self) -> None:
+        engine = self._engine()
+        cached = mock.Mock()
+        cached.get_num_channels.return_value = 0
+        engine._sounds["lock"] = cached
+        building = threading.Event()
+        release = threading.Event()
+
+        def slow_pcm(*_args, **_kwargs) -> bytes:
+            building.set()
+            release.wait(10.0)
+            return b"\x00\x00"
+
+        with (
+            mock.patch.object(runtime_audio.pygame.mixer, "Sound"),
+            mock.patch.object(runtime_audio, "load_tone_pcm", side_effect=slow_pcm),
+        ):
+            builder = threading.Thread(
+                target=engine._get_sound, args=("clear",), daemon=True
+            )
+            builder.start()
+            self.assertTrue(building.wait(5.0))
+            player = threading.Thread(target=engine.play, args=("lock",), daemon=True)
+            player.start()
+            player.join(2.0)
+            self.assertFalse(player.is_alive())
+            cached.play.assert_called_once()
+            release.set()
+            builder.join(5.0)
+
+        self.assertIn("clear", engine._sounds)
+
+    def test_voice_limit_drops_bursts_on_the_cached_sound(self) -> None:
+        limits = audio_event_voice_limits()
+        self.assertEqual(limits["explosion_collision_cluster"], 1)
+        self.assertNotIn("lock", limits)
+        engine = self._engine()
+        busy = mock.Mock()
+        busy.get_num_channels.return_value = 1
+        engine._sounds["explosion_collision_cluster"] = busy
+        engine._sounds["lock"] = busy
+
+        engine.play("explosion_collision_cluster")
+        busy.play.assert_not_called()
+        engine.play("lock")
+        busy.play.assert_called_once()
+
+    def test_max_voices_must_be_positive(self) -> None:
+        payload = {
+            "version": 1,
+            "events": {
+                "tick": {
+                    "frequency_hz": 400.0,
+                    "duration_ms": 10,
+                    "amplitude": 0.1,
+                    "max_voices": 0,
+                }
+            },
+        }
+        with self.assertRaises(RuntimeError):
+            validate_audio_sfx_payload(payload)
+        payload["events"]["tick"]["max_voices"] = 3
+        self.assertEqual(
+            validate_audio_sfx_payload(payload)["events"]["tick"]["max_voices"], 3
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import itertools
 import json
+import random
 import shutil
 import unittest
+from copy import deepcopy
 from dataclasses import replace
 from pathlib import Path
 from types import SimpleNamespace
@@ -48,6 +50,7 @@ from tet4d.ui.pygame.locked_cell_explosion import (
     EXPLOSION_TRAIL_RETENTION_MIN_MS,
     ExplosionSeedCell,
     ExplosionTopologyInput,
+    ExplosionTrailBuffer,
     ExplosionTrailSample,
     StandaloneExplosionConfig,
     build_locked_cell_explosion,
@@ -60,6 +63,7 @@ from tet4d.ui.pygame.locked_cell_explosion import (
     endgame_preview as explosion_endgame_preview,
 )
 from tet4d.ui.pygame.locked_cell_explosion import launcher as explosion_launcher
+from tet4d.ui.pygame.locked_cell_explosion import render as explosion_render
 from tet4d.ui.pygame.locked_cell_explosion import simulation as explosion_simulation
 from tet4d.ui.pygame.locked_cell_explosion import surface as explosion_surface
 from tet4d.ui.pygame.locked_cell_explosion.audio import aggregate_audio_events
@@ -68,6 +72,7 @@ from tet4d.ui.pygame.locked_cell_explosion.model import (
     ExplosionAudioState,
     ExplosionDiagnosticsEvent,
     ExplosionDiagnosticsSummary,
+    ExplosionParticle,
     ExplosionParticleDiagnostics,
 )
 from tet4d.ui.pygame.locked_cell_explosion.render import project_particle_for_render
@@ -208,12 +213,10 @@ class TestLockedCellExplosion(unittest.TestCase):
             particle.active = particle is lead
         lead.position_nd = (3.32, 2.0, 2.0)
         lead.velocity_nd = (2.4, 0.18, -0.12)
-        lead.trail_samples = [
-            ExplosionTrailSample(
-                position_nd=lead.position_nd,
-                elapsed_ms=0.0,
-            )
-        ]
+        lead.trail_samples = ExplosionTrailBuffer.from_samples(
+            [ExplosionTrailSample(position_nd=lead.position_nd, elapsed_ms=0.0)],
+            capacity=lead.trail_max_samples,
+        )
         lead.trail_elapsed_ms = 0.0
         return controller, lead
 
@@ -483,6 +486,28 @@ class TestLockedCellExplosion(unittest.TestCase):
             controller.elapsed_ms - EXPLOSION_TRAIL_MAX_LIFETIME_MS,
         )
 
+    def test_trail_buffer_ring_keeps_newest_window_in_order(self) -> None:
+        buffer = ExplosionTrailBuffer(capacity=3)
+        for index in range(5):
+            buffer.append((float(index), 0.0), index * 10.0)
+        buffer.append((4.0, 0.0), 50.0, segment_break=True)
+
+        positions, elapsed_ms, breaks = buffer.window()
+        self.assertEqual(positions, [(3.0, 0.0), (4.0, 0.0), (4.0, 0.0)])
+        self.assertEqual(elapsed_ms, [30.0, 40.0, 50.0])
+        self.assertEqual(breaks, [False, False, True])
+        self.assertEqual(buffer.last_point(), ((4.0, 0.0), 40.0))
+
+        buffer.expire_before(35.0)
+        self.assertEqual([sample.elapsed_ms for sample in buffer], [40.0, 50.0])
+        buffer.resize(1)
+        self.assertEqual([sample.elapsed_ms for sample in buffer], [50.0])
+        self.assertIsNone(buffer.last_point())
+        buffer.resize(4)
+        buffer.append((5.0, 0.0), 60.0)
+        self.assertEqual(len(buffer), 2)
+        self.assertEqual(buffer.last_point(), ((5.0, 0.0), 60.0))
+
     def test_trail_sampling_respects_time_and_movement_spacing(self) -> None:
         controller = build_locked_cell_explosion(
             self._config(
@@ -616,12 +641,10 @@ class TestLockedCellExplosion(unittest.TestCase):
         particle = controller.simulation.particles[0]
         particle.position_nd = (3.4, 1.5)
         particle.velocity_nd = (2.0, 0.0)
-        particle.trail_samples = [
-            ExplosionTrailSample(
-                position_nd=(3.4, 1.5),
-                elapsed_ms=0.0,
-            )
-        ]
+        particle.trail_samples = ExplosionTrailBuffer.from_samples(
+            [ExplosionTrailSample(position_nd=(3.4, 1.5), elapsed_ms=0.0)],
+            capacity=particle.trail_max_samples,
+        )
         controller.simulation.particles[1].active = False
 
         controller.step(200.0)
@@ -723,12 +746,10 @@ class TestLockedCellExplosion(unittest.TestCase):
         particle = controller.simulation.particles[0]
         particle.position_nd = (3.4, 1.5)
         particle.velocity_nd = (2.0, 0.0)
-        particle.trail_samples = [
-            ExplosionTrailSample(
-                position_nd=(3.4, 1.5),
-                elapsed_ms=0.0,
-            )
-        ]
+        particle.trail_samples = ExplosionTrailBuffer.from_samples(
+            [ExplosionTrailSample(position_nd=(3.4, 1.5), elapsed_ms=0.0)],
+            capacity=particle.trail_max_samples,
+        )
         controller.simulation.particles[1].active = False
 
         controller.step(200.0)
@@ -989,6 +1010,173 @@ class TestLockedCellExplosion(unittest.TestCase):
                 self.assertLess(particle.position_nd[0], -0.48)
                 self.assertGreater(particle.velocity_nd[0], 0.0)
 
+    def test_masked_free_flight_step_matches_per_particle_integration(self) -> None:
+        dims = (4, 6, 4)
+        cells = {
+            coord: 1 + sum(coord) % 7
+            for coord in itertools.product(*(range(size) for size in dims))
+            if coord[1] >= 3
+        }
+        for preset in ("classic", "wrap"):
+            for response in (
+                EXPLOSION_BOUNDARY_RESPONSE_BOUNCE,
+                EXPLOSION_BOUNDARY_RESPONSE_ESCAPE,
+            ):
+                with self.subTest(preset=preset, response=response):
+                    state = explosion_simulation.build_endgame_state(
+                        locked_cells=cells,
+                        board_shape=dims,
+                        dimension=3,
+                        preset=preset,
+                        seed=11,
+                        settings={"boundary_response": response},
+                    )
+                    state.boundary_response = response
+                    reference = deepcopy(state)
+                    adapter = build_explosion_topology_adapter(state.topology)
+                    for _ in range(40):
+                        explosion_simulation.step_simulation(
+                            state, adapter=adapter, dt_ms=16.0, time_scale=1.0
+                        )
+                        for particle in reference.particles:
+                            explosion_simulation._step_particle(
+                                particle,
+                                dt_seconds=0.016,
+                                adapter=adapter,
+                                boundary_response=response,
+                                elapsed_ms=0.0,
+                                step_index=0,
+                                model_events=[],
+                            )
+                    for stepped, expected in zip(state.particles, reference.particles):
+                        self.assertEqual(stepped.position_nd, expected.position_nd)
+                        self.assertEqual(stepped.velocity_nd, expected.velocity_nd)
+                        self.assertEqual(stepped.rotation_deg, expected.rotation_deg)
+                        self.assertEqual(stepped.escaped, expected.escaped)
+
+    def test_collision_broad_phase_matches_all_pairs_resolution(self) -> None:
+        for dimension in (2, 3, 4):
+            with self.subTest(dimension=dimension):
+                rng = random.Random(dimension)
+                particles = [
+                    ExplosionParticle(
+                        particle_id=(index * 37) % 120,
+                        source_coord=tuple(0 for _ in range(dimension)),
+                        position_nd=tuple(
+                            rng.uniform(0.0, 3.0) for _ in range(dimension)
+                        ),
+                        velocity_nd=tuple(
+                            rng.uniform(-2.0, 2.0) for _ in range(dimension)
+                        ),
+                        color_id=1,
+                        collision_radius=rng.uniform(0.2, 0.4),
+                        collision_mass=rng.uniform(0.75, 1.25),
+                    )
+                    for index in range(120)
+                ]
+                reference = deepcopy(particles)
+                model_events: list[object] = []
+                events = explosion_simulation._resolve_collisions(
+                    particles,
+                    collision_elasticity=0.8,
+                    step_index=1,
+                    model_events=model_events,
+                )
+                reference_model_events: list[object] = []
+                reference_events: list[ExplosionAudioEvent] = []
+                ordered = sorted(reference, key=lambda particle: particle.particle_id)
+                for left_index, left in enumerate(ordered):
+                    for right in ordered[left_index + 1 :]:
+                        explosion_simulation._resolve_collision_pair(
+                            left,
+                            right,
+                            restitution=0.8,
+                            collided_particle_ids=None,
+                            step_index=1,
+                            model_events=reference_model_events,
+                            events=reference_events,
+                        )
+
+                self.assertGreater(len(model_events), 0)
+                self.assertEqual(model_events, reference_model_events)
+                self.assertEqual(events, tuple(reference_events))
+                self.assertEqual(particles, reference)
+
+    def test_fixed_step_worker_matches_inline_fixed_steps(self) -> None:
+        config = self._config(
+            dimension=3,
+            boundary_response=EXPLOSION_BOUNDARY_RESPONSE_BOUNCE,
+            particle_collisions=EXPLOSION_PARTICLE_COLLISIONS_ON,
+        )
+        inline = build_locked_cell_explosion(config)
+        threaded = build_locked_cell_explosion(config)
+        worker = threaded.start_fixed_step_worker(
+            fixed_step_ms=16.0, max_catch_up_steps=64
+        )
+        self.addCleanup(threaded.close)
+
+        for _ in range(30):
+            inline.step(16.0)
+        for dt_ms in (7.0, 41.0, 16.0, 3.0, 100.0, 9.0, 304.0):
+            threaded.step(dt_ms)
+            self.assertTrue(worker.wait(timeout=10.0))
+            previous, current, alpha = worker.frames()
+            self.assertLessEqual(previous.elapsed_ms, current.elapsed_ms)
+            self.assertGreaterEqual(alpha, 0.0)
+            self.assertLessEqual(alpha, 1.0)
+
+        frame = worker.current_frame
+        self.assertAlmostEqual(frame.elapsed_ms, 480.0)
+        self.assertEqual(frame.elapsed_ms, inline.elapsed_ms)
+        self.assertEqual(
+            frame.positions,
+            tuple(particle.position_nd for particle in inline.simulation.particles),
+        )
+        self.assertEqual(frame.total_kinetic_energy, inline.total_kinetic_energy)
+        self.assertEqual(threaded.elapsed_ms, inline.elapsed_ms)
+
+    def test_fixed_step_worker_caps_backlog_and_interpolates_frames(self) -> None:
+        controller = build_locked_cell_explosion(self._config(dimension=2))
+        worker = controller.start_fixed_step_worker(
+            fixed_step_ms=10.0, max_catch_up_steps=3
+        )
+        self.addCleanup(controller.close)
+
+        controller.step(10_000.0)
+        self.assertTrue(worker.wait(timeout=10.0))
+        self.assertEqual(worker.current_frame.elapsed_ms, 30.0)
+        controller.step(5.0)
+        self.assertTrue(worker.wait(timeout=10.0))
+
+        previous, current, alpha = worker.frames()
+        self.assertEqual((previous.elapsed_ms, current.elapsed_ms), (20.0, 30.0))
+        self.assertAlmostEqual(alpha, 0.5)
+        rendered = controller.render_particles(render_context=None)
+        for index, particle in enumerate(rendered):
+            expected = tuple(
+                (a + b) / 2.0
+                for a, b in zip(previous.positions[index], current.positions[index])
+            )
+            for value, target in zip(particle.position_nd, expected):
+                self.assertAlmostEqual(value, target)
+
+        seam_crossed = replace(
+            current,
+            trail_break_counts=tuple(count + 1 for count in current.trail_break_counts),
+        )
+        snapped = explosion_render.render_simulation_frames(
+            controller.simulation.particles,
+            previous=previous,
+            current=seam_crossed,
+            alpha=0.5,
+            dimension=2,
+            board_dims=(4, 4),
+            render_context=None,
+        )
+        self.assertEqual(
+            tuple(particle.position_nd for particle in snapped), current.positions
+        )
+
     def test_3d_bounce_preserves_kinetic_energy_within_tolerance(self) -> None:
         controller = build_locked_cell_explosion(
             self._config(
@@ -1381,19 +1569,15 @@ class TestLockedCellExplosion(unittest.TestCase):
         particle.position_nd = (2.0, 2.0, 2.0)
         particle.velocity_nd = (1.0, 0.0, 0.0)
 
-        original_step_particle = explosion_simulation._step_particle
+        original_free_flight = explosion_simulation._advance_free_flight
 
-        def _bad_step_particle(*args, **kwargs):
-            events = original_step_particle(*args, **kwargs)
-            if args[0] is particle:
+        def _bad_free_flight(particles, **kwargs):
+            original_free_flight(particles, **kwargs)
+            if particle in particles:
                 particle.velocity_nd = (0.0, 1.0, 0.0)
-                diagnostics = kwargs.get("diagnostics")
-                if diagnostics is not None:
-                    diagnostics["after_finalize_velocity"] = particle.velocity_nd
-            return events
 
         with patch.object(
-            explosion_simulation, "_step_particle", side_effect=_bad_step_particle
+            explosion_simulation, "_advance_free_flight", side_effect=_bad_free_flight
         ):
             controller.step(16.0)
 
@@ -1449,19 +1633,17 @@ class TestLockedCellExplosion(unittest.TestCase):
         particle.position_nd = (2.0, 2.0, 2.0)
         particle.velocity_nd = (1.0, 0.0, 0.0)
 
-        original_step_particle = explosion_simulation._step_particle
+        original_free_flight = explosion_simulation._advance_free_flight
 
-        def _bad_finalize_step(*args, **kwargs):
-            events = original_step_particle(*args, **kwargs)
-            if args[0] is particle:
+        def _bad_finalize_free_flight(particles, **kwargs):
+            original_free_flight(particles, **kwargs)
+            if particle in particles:
                 particle.velocity_nd = (0.5, 0.0, 0.0)
-                diagnostics = kwargs.get("diagnostics")
-                if diagnostics is not None:
-                    diagnostics["after_finalize_velocity"] = particle.velocity_nd
-            return events
 
         with patch.object(
-            explosion_simulation, "_step_particle", side_effect=_bad_finalize_step
+            explosion_simulation,
+            "_advance_free_flight",
+            side_effect=_bad_finalize_free_flight,
         ):
             controller.step(16.0)
 
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+from tet4d.engine.core.model import BoardND
+from tet4d.engine.core.rules.board_rules import (
+    collapse_cleared_levels,
+    restore_cleared_levels,
+)
+from tet4d.engine.gameplay import lock_flow
+from tet4d.engine.runtime import score_analyzer
+from tet4d.engine.runtime.score_analyzer import (
+    LazyScoreAnalysis,
+    analyze_lock_event,
+    hud_analysis_lines,
+    reset_score_analyzer_runtime_state,
+)
+
+
+def _sampling_config(mode: str, every_nth: int = 1) -> dict[str, object]:
+    config = dict(score_analyzer._score_analyzer_config())
+    config["sampling"] = {"mode": mode, "every_nth": every_nth}
+    return config
+
+
+class TestLazyLockAnalysis(unittest.TestCase):
+    def setUp(self) -> None:
+        reset_score_analyzer_runtime_state()
+        self.addCleanup(reset_score_analyzer_runtime_state)
+        score_analyzer.set_score_analyzer_logging_enabled(False)
+
+    def _lock(
+        self, board: BoardND, cells: tuple[tuple[int, ...], ...], *, seq: int = 1
+    ) -> lock_flow.LockFlowResult:
+        return lock_flow.apply_lock_flow(
+            board=board,
+            dims=board.dims,
+            gravity_axis=1,
+            visible_piece_cells=cells,
+            color_id=2,
+            lock_piece_points=5,
+            score_multiplier=1.0,
+            piece_id="domino",
+            actor_mode="human",
+            bot_mode="off",
+            grid_mode="full",
+            speed_level=3,
+            session_id="test-session",
+            seq=seq,
+            board_pre_plane_counts=board.level_counts(1),
+            board_pre_hash=board.zobrist_hash,
+        )
+
+    def test_restore_cleared_levels_inverts_collapse(self) -> None:
+        cells = {(0, 1): 1, (1, 2): 2, (0, 2): 3, (0, 4): 4, (1, 4): 5, (1, 3): 6}
+        collapsed, cleared = collapse_cleared_levels(
+            cells, axis_size=5, gravity_axis=1, levels=[2, 4]
+        )
+        restored = restore_cleared_levels(
+            collapsed,
+            axis_size=5,
+            gravity_axis=1,
+            levels=[2, 4],
+            cleared_cells=cleared,
+        )
+        self.assertEqual(restored, cells)
+
+    def test_lazy_analysis_matches_eager_board_copies(self) -> None:
+        pre = {(0, 3): 1, (1, 3): 1, (2, 3): 1, (0, 2): 1, (1, 1): 1}
+        board = BoardND((4, 4), cells=pre)
+        result = self._lock(board, ((3, 3), (3, 2)), seq=7)
+        self.assertIsInstance(result.analysis, LazyScoreAnalysis)
+        self.assertEqual(result.cleared, 1)
+        lazy = result.analysis.resolve()
+        reset_score_analyzer_runtime_state()
+        eager = analyze_lock_event(
+            board_pre=pre,
+            board_post=dict(board.cells),
+            dims=(4, 4),
+            gravity_axis=1,
+            locked_cells=((3, 3), (3, 2)),
+            cleared=1,
+            piece_id="domino",
+            actor_mode="human",
+            bot_mode="off",
+            grid_mode="full",
+            speed_level=3,
+            raw_points=result.raw_points,
+            final_points=result.awarded_points,
+            session_id="test-session",
+            seq=7,
+        )
+        assert lazy is not None
+        lazy.pop("timestamp_utc")
+        eager.pop("timestamp_utc")
+        self.assertEqual(lazy, eager)
+
+    def test_lazy_analysis_is_dropped_once_the_board_moves_on(self) -> None:
+        board = BoardND((4, 4), cells={(0, 3): 1})
+        first = self._lock(board, ((1, 3),), seq=1)
+        self._lock(board, ((2, 3),), seq=2)
+        self.assertIsNone(first.analysis.resolve())
+        self.assertEqual(hud_analysis_lines(first.analysis), ())
+
+    def test_every_nth_sampling_skips_other_locks(self) -> None:
+        board = BoardND((4, 6))
+        with mock.patch.object(
+            score_analyzer,
+            "_score_analyzer_config",
+            return_value=_sampling_config("every_nth", 3),
+        ):
+            analyses = [
+                self._lock(board, ((seq, 5),), seq=seq).analysis for seq in (1, 2, 3)
+            ]
+        self.assertIsNone(analyses[0])
+        self.assertIsNone(analyses[1])
+        self.assertIsInstance(analyses[2], LazyScoreAnalysis)
+        self.assertEqual(len(hud_analysis_lines(analyses[2])), 3)
+
+    def test_logging_resolves_eagerly_unless_hud_only(self) -> None:
+        score_analyzer.set_score_analyzer_logging_enabled(True)
+        for mode, logged in (("every_lock", True), ("hud_only", False)):
+            with self.subTest(mode=mode):
+                board = BoardND((4, 4), cells={(0, 3): 1})
+                with (
+                    mock.patch.object(
+                        score_analyzer,
+                        "_score_analyzer_config",
+                        return_value=_sampling_config(mode),
+                    ),
+                    mock.patch.object(
+                        lock_flow, "record_score_analysis_event"
+                    ) as record,
+                ):
+                    result = self._lock(board, ((1, 3),))
+                self.assertEqual(record.called, logged)
+                self.assertEqual(result.analysis.resolved, logged)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import random
+import unittest
+from unittest import mock
+
+from tet4d.engine.core.model import BoardND
+from tet4d.engine.runtime import score_analyzer
+from tet4d.engine.runtime.score_analyzer import (
+    analyze_lock_event,
+    reset_score_analyzer_runtime_state,
+)
+from tet4d.engine.runtime.score_analyzer_features import (
+    board_health_features,
+    tracked_board_health_features,
+)
+
+
+class TestScoreAnalysisFeatures(unittest.TestCase):
+    def test_board_plane_counts_match_recounted_features(self) -> None:
+        board_pre = {(0, 3): 1, (1, 3): 1, (1, 2): 1}
+        board_post = {(0, 3): 1, (1, 3): 1, (1, 2): 1, (2, 3): 1, (3, 2): 1}
+        kwargs: dict[str, object] = {
+            "board_pre": board_pre,
+            "board_post": board_post,
+            "dims": (4, 4),
+            "gravity_axis": 1,
+            "locked_cells": ((2, 3), (3, 2)),
+            "cleared": 0,
+            "piece_id": "domino",
+            "actor_mode": "human",
+            "bot_mode": "off",
+            "grid_mode": "full",
+            "speed_level": 3,
+            "raw_points": 10,
+            "final_points": 10,
+            "session_id": "test-session",
+            "seq": 1,
+        }
+        recounted = analyze_lock_event(**kwargs)
+        from_counters = analyze_lock_event(
+            **kwargs,
+            board_pre_plane_counts=(0, 0, 1, 2),
+            board_post_plane_counts=(0, 0, 2, 3),
+        )
+        recounted.pop("timestamp_utc")
+        from_counters.pop("timestamp_utc")
+        self.assertEqual(from_counters, recounted)
+
+    def test_board_hash_reuses_previous_post_features(self) -> None:
+        reset_score_analyzer_runtime_state()
+        self.addCleanup(reset_score_analyzer_runtime_state)
+        board_a = BoardND((4, 4), cells={(0, 3): 1, (1, 3): 1})
+        board_b = BoardND((4, 4), cells={(0, 3): 1, (1, 3): 1, (2, 3): 1})
+        board_c = BoardND((4, 4), cells={(0, 3): 1, (1, 3): 1, (2, 3): 1, (2, 2): 1})
+        common: dict[str, object] = {
+            "dims": (4, 4),
+            "gravity_axis": 1,
+            "cleared": 0,
+            "piece_id": "mono",
+            "actor_mode": "human",
+            "bot_mode": "off",
+            "grid_mode": "full",
+            "speed_level": 3,
+            "raw_points": 5,
+            "final_points": 5,
+            "session_id": "test-session",
+        }
+        with mock.patch.object(
+            score_analyzer,
+            "board_health_features",
+            wraps=score_analyzer.board_health_features,
+        ) as features:
+            first = analyze_lock_event(
+                **common,
+                board_pre=dict(board_a.cells),
+                board_post=dict(board_b.cells),
+                locked_cells=((2, 3),),
+                seq=1,
+                board_pre_hash=board_a.zobrist_hash,
+                board_post_hash=board_b.zobrist_hash,
+            )
+            second = analyze_lock_event(
+                **common,
+                board_pre=dict(board_b.cells),
+                board_post=dict(board_c.cells),
+                locked_cells=((2, 2),),
+                seq=2,
+                board_pre_hash=board_b.zobrist_hash,
+                board_post_hash=board_c.zobrist_hash,
+            )
+        self.assertEqual(features.call_count, 3)
+        self.assertEqual(second["board_pre"], first["board_post"])
+
+    def test_tracked_health_matches_full_recompute_through_locks(self) -> None:
+        for dims, gravity_axis in (((6, 8), 1), ((3, 6, 3), 1), ((3, 5, 2, 2), 1)):
+            with self.subTest(dims=dims):
+                rng = random.Random(len(dims))
+                board = BoardND(dims)
+                for step in range(160):
+                    if step % 23 == 22 and board.cells:
+                        board.cells.pop(rng.choice(sorted(board.cells)))
+                    else:
+                        column = [rng.randrange(size) for size in dims]
+                        levels = board.column_levels(gravity_axis).get(
+                            tuple(v for a, v in enumerate(column) if a != gravity_axis)
+                        )
+                        landing = (levels[0] if levels else dims[gravity_axis]) - 1
+                        if landing < 0:
+                            board.cells.clear()
+                            continue
+                        column[gravity_axis] = landing
+                        board.apply_lock((tuple(column),), 1, gravity_axis)
+                    if step % 7:
+                        continue
+                    expected = board_health_features(
+                        dict(board.cells), dims=dims, gravity_axis=gravity_axis
+                    )
+                    tracked = tracked_board_health_features(
+                        board, gravity_axis=gravity_axis
+                    )
+                    self.assertEqual(tracked, expected)
+
+    def test_tracked_health_matches_recompute_after_clear_over_gap(self) -> None:
+        cells = {(0, level): 1 for level in (5, 8, 9)}
+        cells.update({(1, level): 1 for level in range(5, 10)})
+        board = BoardND((2, 10), cells=cells)
+        board.health_tracker(1).totals()
+        self.assertEqual(board.clear_planes(1), 3)
+
+        tracked = board.health_tracker(1).totals()
+        fresh = BoardND((2, 10), cells=dict(board.cells)).health_tracker(1).totals()
+        self.assertEqual(tracked, fresh)
+        self.assertEqual((tracked.height_sum, tracked.roughness), (2, 2))
+
+    def test_lock_event_post_board_matches_cell_snapshot(self) -> None:
+        reset_score_analyzer_runtime_state()
+        self.addCleanup(reset_score_analyzer_runtime_state)
+        board = BoardND((4, 4), cells={(0, 3): 1, (1, 3): 1, (1, 2): 1})
+        pre = dict(board.cells)
+        board.apply_lock(((2, 3), (3, 3)), 2, 1)
+        kwargs: dict[str, object] = {
+            "board_pre": pre,
+            "board_post": dict(board.cells),
+            "dims": (4, 4),
+            "gravity_axis": 1,
+            "locked_cells": ((2, 3), (3, 3)),
+            "cleared": 1,
+            "piece_id": "domino",
+            "actor_mode": "human",
+            "bot_mode": "off",
+            "grid_mode": "full",
+            "speed_level": 3,
+            "raw_points": 10,
+            "final_points": 10,
+            "session_id": "test-session",
+            "seq": 1,
+        }
+        tracked = analyze_lock_event(**kwargs, post_board=board)
+        recounted = analyze_lock_event(**kwargs)
+        tracked.pop("timestamp_utc")
+        recounted.pop("timestamp_utc")
+        self.assertEqual(tracked, recounted)
+
+
+if __name__ == "__main__":
+    unittest.main()
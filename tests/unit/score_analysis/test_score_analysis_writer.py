@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import json
+import shutil
+import time
+import unittest
+from contextlib import contextmanager
+from unittest import mock
+from uuid import uuid4
+
+from tet4d.engine.runtime.project_config import (
+    state_dir_path,
+)
+from tet4d.engine.runtime.score_analysis import store as score_analysis_store
+from tet4d.engine.runtime.score_analysis.writer import (
+    ScoreAnalysisWriter,
+    ScoreEventRecord,
+)
+
+
+@contextmanager
+def _workspace_temp_dir(prefix: str):
+    root = state_dir_path() / "pytest_temp"
+    root.mkdir(parents=True, exist_ok=True)
+    tmp_path = root / f"{prefix}_{uuid4().hex}"
+    tmp_path.mkdir(parents=True, exist_ok=False)
+    try:
+        yield tmp_path
+    finally:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+
+
+class TestScoreAnalysisWriter(unittest.TestCase):
+    def test_writer_batches_lines_and_coalesces_summary_rewrites(self) -> None:
+        with _workspace_temp_dir("score_writer") as tmp_path:
+            events_path = tmp_path / "events.jsonl"
+            summary_path = tmp_path / "summary.json"
+            applied: list[int] = []
+
+            def update_summary(path, events):
+                self.assertEqual(path, summary_path)
+                applied.append(len(events))
+                return {"events": sum(applied)}
+
+            writer = ScoreAnalysisWriter(
+                update_summary=update_summary,
+                batch_events=4,
+                flush_interval_ms=60_000,
+                queue_capacity=16,
+            )
+            self.addCleanup(writer.close)
+            with mock.patch(
+                "tet4d.engine.runtime.score_analysis.writer.append_json_lines",
+                wraps=score_analysis_store.append_json_lines,
+            ) as append:
+                for seq in range(1, 11):
+                    writer.submit(
+                        ScoreEventRecord(events_path, summary_path, {"seq": seq})
+                    )
+                self.assertTrue(writer.flush(timeout=5.0))
+                writer.close()
+
+            lines = events_path.read_text(encoding="utf-8").splitlines()
+            self.assertEqual(
+                [json.loads(line)["seq"] for line in lines], list(range(1, 11))
+            )
+            self.assertEqual(append.call_count, 3)
+            self.assertEqual(applied, [4, 4, 2])
+            summary = json.loads(summary_path.read_text(encoding="utf-8"))
+            self.assertEqual(summary, {"events": 10})
+
+    def test_writer_flushes_partial_batch_after_interval(self) -> None:
+        with _workspace_temp_dir("score_writer") as tmp_path:
+            events_path = tmp_path / "events.jsonl"
+            writer = ScoreAnalysisWriter(
+                update_summary=lambda _path, events: {"events": len(events)},
+                batch_events=100,
+                flush_interval_ms=10,
+                queue_capacity=8,
+            )
+            self.addCleanup(writer.close)
+            writer.submit(
+                ScoreEventRecord(events_path, tmp_path / "summary.json", {"seq": 1})
+            )
+            for _ in range(200):
+                if events_path.exists():
+                    break
+                time.sleep(0.01)
+            self.assertTrue(events_path.exists())
+            self.assertTrue(writer.running)
+            self.assertTrue(writer.flush(timeout=5.0))
+
+    def test_close_before_first_submit_keeps_later_worker_alive(self) -> None:
+        with _workspace_temp_dir("score_writer") as tmp_path:
+            events_path = tmp_path / "events.jsonl"
+            summary_path = tmp_path / "summary.json"
+            writer = ScoreAnalysisWriter(
+                update_summary=lambda _path, events: {"events": len(events)},
+                batch_events=1,
+                flush_interval_ms=60_000,
+                queue_capacity=8,
+            )
+            self.addCleanup(writer.close)
+            writer.close()
+
+            writer.submit(ScoreEventRecord(events_path, summary_path, {"seq": 1}))
+            self.assertTrue(writer.flush(timeout=5.0))
+            worker = writer._thread
+            writer.submit(ScoreEventRecord(events_path, summary_path, {"seq": 2}))
+            self.assertTrue(writer.flush(timeout=5.0))
+
+            self.assertTrue(writer.running)
+            self.assertIs(writer._thread, worker)
+            lines = events_path.read_text(encoding="utf-8").splitlines()
+            self.assertEqual([json.loads(line)["seq"] for line in lines], [1, 2])
+
+    def test_writer_survives_failing_batch_and_commits_only_written(self) -> None:
+        with _workspace_temp_dir("score_writer") as tmp_path:
+            events_path = tmp_path / "events.jsonl"
+            summary_path = tmp_path / "summary.json"
+            committed: list[dict[str, object]] = []
+
+            def update_summary(_path, events):
+                if events[0]["seq"] == 1:
+                    raise ValueError("malformed summary")
+                return {"last": events[-1]["seq"]}
+
+            writer = ScoreAnalysisWriter(
+                update_summary=update_summary,
+                commit_summary=lambda _path, summary: committed.append(summary),
+                batch_events=1,
+                flush_interval_ms=60_000,
+                queue_capacity=4,
+            )
+            self.addCleanup(writer.close)
+            with self.assertLogs(
+                "tet4d.engine.runtime.score_analysis.writer", level="ERROR"
+            ):
+                writer.submit(ScoreEventRecord(events_path, summary_path, {"seq": 1}))
+                self.assertTrue(writer.flush(timeout=5.0))
+            self.assertTrue(writer.running)
+
+            with mock.patch(
+                "tet4d.engine.runtime.score_analysis.writer.atomic_write_summary_json",
+                side_effect=OSError("disk full"),
+            ):
+                writer.submit(ScoreEventRecord(events_path, summary_path, {"seq": 2}))
+                self.assertTrue(writer.flush(timeout=5.0))
+            self.assertEqual(committed, [])
+
+            writer.submit(ScoreEventRecord(events_path, summary_path, {"seq": 3}))
+            self.assertTrue(writer.flush(timeout=5.0))
+            self.assertEqual(committed, [{"last": 3}])
+            self.assertEqual(
+                len(events_path.read_text(encoding="utf-8").splitlines()), 3
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import unittest
+from dataclasses import replace
+from itertools import product
+
+from tet4d.engine.topology_explorer import (
+    PLAIN_TRANSLATION,
+    MoveStep,
+    build_explorer_transport_resolver,
+    movement_steps_for_dimension,
+)
+from tet4d.engine.topology_explorer.presets import (
+    axis_wrap_profile,
+    mobius_strip_profile_2d,
+    projective_space_profile_3d,
+    swap_xw_profile_4d,
+)
+
+
+class TestExplorerStepTable(unittest.TestCase):
+    def test_compiled_step_table_matches_direct_resolution(self) -> None:
+        for profile, dims in (
+            (mobius_strip_profile_2d(), (4, 5)),
+            (projective_space_profile_3d(), (3, 4, 3)),
+            (swap_xw_profile_4d(), (3, 3, 3, 3)),
+        ):
+            with self.subTest(dims=dims):
+                compiled = build_explorer_transport_resolver(profile, dims)
+                direct = replace(compiled, _step_table={})
+                for coord in product(*(range(size) for size in dims)):
+                    for step in movement_steps_for_dimension(len(dims)):
+                        self.assertEqual(
+                            compiled.resolve_cell_step(coord, step),
+                            direct.resolve_cell_step(coord, step),
+                        )
+
+    def test_interior_steps_share_results_and_identity_transforms(self) -> None:
+        resolver = build_explorer_transport_resolver(
+            axis_wrap_profile(dimension=3, wrapped_axes=(0, 2)),
+            (5, 6, 5),
+        )
+        step = MoveStep(axis=0, delta=1)
+        first = resolver.resolve_cell_step((1, 2, 1), step)
+        self.assertIs(resolver.resolve_cell_step([1, 2, 1], step), first)
+        other = resolver.resolve_cell_step((2, 3, 2), step)
+        self.assertIs(other.piece_frame_transform, first.piece_frame_transform)
+        self.assertEqual(first.frame_transform.translation, (1, 0, 0))
+
+        piece = resolver.resolve_piece_step(((1, 2, 1), (2, 2, 1), (1, 3, 1)), step)
+        self.assertEqual(piece.kind, PLAIN_TRANSLATION)
+        self.assertEqual(piece.moved_cells, ((2, 2, 1), (3, 2, 1), (2, 3, 1)))
+        self.assertIs(piece.frame_transform, first.piece_frame_transform)
+
+
+if __name__ == "__main__":
+    unittest.main()
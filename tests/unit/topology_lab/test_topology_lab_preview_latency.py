@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import tempfile
 import unittest
+from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import patch
 
@@ -11,6 +13,7 @@ from tet4d.engine.runtime.topology_playground_state import (
     PLAYABILITY_STATUS_PLAYABLE,
     TopologyPlaygroundPlayabilityAnalysis,
 )
+from tet4d.engine.runtime.topology_preview_compiler import TopologyPreviewCompiler
 from tet4d.engine.topology_explorer.presets import sphere_profile_2d
 from tet4d.ui.pygame.launch import topology_lab_menu
 from tet4d.ui.pygame.topology_lab import controls_panel as topology_lab_controls_panel
@@ -386,6 +389,71 @@ class TestTopologyLabPreviewLatency(unittest.TestCase):
         self.assertEqual(calls, [False, True])
         self.assertEqual(launch_gameplay.call_count, 2)
 
+    def test_background_compiler_publishes_preview_after_analyzing_state(
+        self,
+    ) -> None:
+        state = self._state(2)
+        settings = topology_lab_scene_state.current_play_settings(state)
+        assert settings is not None
+        with tempfile.TemporaryDirectory() as tmp:
+            compiler = TopologyPreviewCompiler(root_dir=Path(tmp))
+            state.scene_preview_compiler = compiler
+            try:
+                topology_lab_scene_state.replace_play_settings(
+                    state,
+                    topology_lab_menu.ExplorerPlaygroundSettings(
+                        board_dims=(
+                            settings.board_dims[0] + 1,
+                            settings.board_dims[1],
+                        ),
+                        piece_set_index=settings.piece_set_index,
+                        speed_level=settings.speed_level,
+                        random_mode_index=settings.random_mode_index,
+                        game_seed=settings.game_seed,
+                        rigid_play_mode=settings.rigid_play_mode,
+                    ),
+                )
+                topology_lab_scene_preview_state.refresh_explorer_scene_state(state)
+                runtime_state = topology_lab_scene_state.canonical_playground_state(
+                    state
+                )
+                assert runtime_state is not None
+                signature = state.scene_preview_signature
+                self.assertEqual(state.scene_preview_compile_signature, signature)
+                self.assertIsNone(state.scene_preview)
+                self.assertEqual(
+                    runtime_state.playability_analysis.status,
+                    PLAYABILITY_STATUS_ANALYZING,
+                )
+
+                topology_lab_scene_preview_state.settle_background_explorer_preview(
+                    state
+                )
+            finally:
+                compiler.close()
+
+        self.assertIsNone(state.scene_preview_compile_signature)
+        self.assertIsNotNone(state.scene_preview)
+        self.assertEqual(state.scene_preview_cache.signature, signature)
+        self.assertNotEqual(
+            runtime_state.playability_analysis.status,
+            PLAYABILITY_STATUS_ANALYZING,
+        )
+        phases = {
+            span.phase
+            for span in state.interaction_audit.spans
+            if span.action == "background_preview_compile"
+        }
+        self.assertLessEqual(
+            {
+                "preview_compile",
+                "movement_graph_build",
+                "component_count",
+                "playability_analysis",
+            },
+            phases,
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
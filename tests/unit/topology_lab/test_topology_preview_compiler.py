@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from tet4d.engine.runtime.topology_explorer_preview import (
+    compile_explorer_topology_preview,
+)
+from tet4d.engine.runtime.topology_playability_signal import (
+    derive_profile_playability_analysis,
+)
+from tet4d.engine.runtime.topology_playground_state import (
+    PLAYABILITY_STATUS_BLOCKED,
+    TOPOLOGY_VALIDITY_INVALID,
+)
+from tet4d.engine.runtime.topology_preview_compiler import TopologyPreviewCompiler
+from tet4d.engine.topology_explorer.presets import (
+    axis_wrap_profile,
+    projective_plane_profile_2d,
+    sphere_profile_2d,
+)
+
+
+class TestTopologyPreviewCompiler(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root_dir = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _gated_compile(self, started: threading.Event, release: threading.Event):
+        def _compile(profile, **kwargs):
+            started.set()
+            release.wait(5.0)
+            return compile_explorer_topology_preview(profile, **kwargs)
+
+        return _compile
+
+    def test_background_result_matches_synchronous_compile(self) -> None:
+        profile = projective_plane_profile_2d()
+        dims = (4, 4)
+        compiler = TopologyPreviewCompiler(root_dir=self.root_dir)
+        try:
+            generation = compiler.submit(profile, dims=dims, source="compiler_test")
+            result = compiler.wait(10.0)
+        finally:
+            compiler.close()
+
+        assert result is not None
+        expected = compile_explorer_topology_preview(
+            profile, dims=dims, source="compiler_test", use_local_cache=False
+        )
+        self.assertEqual(result.generation, generation)
+        self.assertEqual(result.preview, expected)
+        self.assertIsNone(result.preview_error)
+        self.assertEqual(
+            result.analysis,
+            derive_profile_playability_analysis(profile, dims=dims, preview=expected),
+        )
+        self.assertTrue(compiler.idle)
+        self.assertEqual(
+            [span.phase for span in result.audit.spans],
+            [
+                "movement_graph_build",
+                "component_count",
+                "preview_compile",
+                "playability_analysis",
+            ],
+        )
+
+    def test_latest_submit_wins_over_an_in_flight_compile(self) -> None:
+        started = threading.Event()
+        release = threading.Event()
+        compiler = TopologyPreviewCompiler(
+            compile_preview=self._gated_compile(started, release),
+            root_dir=self.root_dir,
+        )
+        latest = axis_wrap_profile(dimension=2, wrapped_axes=(0,))
+        try:
+            compiler.submit(projective_plane_profile_2d(), dims=(4, 4))
+            self.assertTrue(started.wait(5.0))
+            compiler.submit(
+                axis_wrap_profile(dimension=2, wrapped_axes=(1,)), dims=(4, 4)
+            )
+            generation = compiler.submit(latest, dims=(5, 4))
+            release.set()
+            result = compiler.wait(10.0)
+            self.assertIsNone(compiler.poll())
+        finally:
+            compiler.close()
+
+        assert result is not None
+        self.assertEqual(result.generation, generation)
+        self.assertEqual(result.profile, latest)
+        self.assertEqual(result.dims, (5, 4))
+
+    def test_cancel_drops_the_in_flight_result(self) -> None:
+        started = threading.Event()
+        release = threading.Event()
+        compiler = TopologyPreviewCompiler(
+            compile_preview=self._gated_compile(started, release),
+            root_dir=self.root_dir,
+        )
+        try:
+            compiler.submit(projective_plane_profile_2d(), dims=(4, 4))
+            self.assertTrue(started.wait(5.0))
+            compiler.cancel()
+            release.set()
+            self.assertIsNone(compiler.wait(10.0))
+            self.assertTrue(compiler.idle)
+        finally:
+            compiler.close()
+        with self.assertRaises(RuntimeError):
+            compiler.submit(projective_plane_profile_2d(), dims=(4, 4))
+
+    def test_invalid_topology_publishes_an_invalid_analysis(self) -> None:
+        compiler = TopologyPreviewCompiler(root_dir=self.root_dir)
+        try:
+            compiler.submit(sphere_profile_2d(), dims=(5, 4))
+            result = compiler.wait(10.0)
+        finally:
+            compiler.close()
+
+        assert result is not None
+        self.assertIsNone(result.preview)
+        self.assertIsNotNone(result.preview_error)
+        self.assertEqual(result.analysis.validity, TOPOLOGY_VALIDITY_INVALID)
+
+    def test_unexpected_compile_error_is_published_and_worker_survives(
+        self,
+    ) -> None:
+        def _raising_compile(_profile, **_kwargs):
+            raise RuntimeError("graph exploded")
+
+        compiler = TopologyPreviewCompiler(
+            compile_preview=_raising_compile, root_dir=self.root_dir
+        )
+        profile = projective_plane_profile_2d()
+        try:
+            generation = compiler.submit(profile, dims=(4, 4))
+            failed = compiler.wait(10.0)
+            with mock.patch(
+                "tet4d.engine.runtime.topology_preview_compiler."
+                "derive_profile_playability_analysis",
+                side_effect=RuntimeError("scan exploded"),
+            ):
+                compiler._compile_preview = compile_explorer_topology_preview
+                compiler.submit(profile, dims=(4, 4))
+                blocked = compiler.wait(10.0)
+        finally:
+            compiler.close()
+
+        assert failed is not None and blocked is not None
+        self.assertEqual(failed.generation, generation)
+        self.assertIsNone(failed.preview)
+        self.assertIn("RuntimeError: graph exploded", str(failed.preview_error))
+        self.assertEqual(failed.analysis.validity, TOPOLOGY_VALIDITY_INVALID)
+        self.assertIsNotNone(blocked.preview)
+        self.assertEqual(blocked.analysis.status, PLAYABILITY_STATUS_BLOCKED)
+        self.assertIn("scan exploded", blocked.analysis.validity_reason)
+
+
+if __name__ == "__main__":
+    unittest.main()
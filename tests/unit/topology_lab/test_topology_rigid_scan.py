@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from itertools import product
+from pathlib import Path
+from unittest import mock
+
+from tet4d.engine.runtime import topology_playability_signal as signal_module
+from tet4d.engine.runtime.topology_cache import read_cached_rigid_transport_scan
+from tet4d.engine.runtime.topology_playability_signal import (
+    clear_rigid_transport_scan_memo,
+    derive_profile_playability_analysis,
+    warm_rigid_transport_scan,
+)
+from tet4d.engine.runtime.topology_playground_state import (
+    RIGID_PLAYABILITY_BLOCKED,
+)
+from tet4d.engine.topology_explorer import (
+    movement_steps_for_dimension,
+)
+from tet4d.engine.topology_explorer.presets import (
+    axis_wrap_profile,
+    klein_bottle_profile_2d,
+    mobius_strip_profile_2d,
+    projective_plane_profile_2d,
+    swapped_xz_profile_3d,
+    twisted_y_profile_3d,
+)
+from tet4d.engine.topology_explorer.transport_resolver import (
+    build_explorer_transport_resolver,
+)
+
+
+def _every_adjacent_pair(dimension: int, dims: tuple[int, ...]):
+    steps = movement_steps_for_dimension(dimension)
+    for step_id in range(len(steps)):
+        for coord in product(*(range(size) for size in dims)):
+            for axis in range(dimension):
+                if coord[axis] + 1 < dims[axis]:
+                    neighbor = coord[:axis] + (coord[axis] + 1,) + coord[axis + 1 :]
+                    yield step_id, (coord, neighbor)
+
+
+class TestTopologyRigidScan(unittest.TestCase):
+    def test_seam_pair_scan_finds_the_full_scan_failure(self) -> None:
+        cases = (
+            ("torus", axis_wrap_profile(dimension=2, wrapped_axes=(1,)), (4, 4)),
+            ("mobius", mobius_strip_profile_2d(), (5, 3)),
+            ("klein", klein_bottle_profile_2d(), (4, 4)),
+            ("projective", projective_plane_profile_2d(), (4, 4)),
+            ("twisted_y", twisted_y_profile_3d(), (3, 4, 3)),
+            ("swapped_xz", swapped_xz_profile_3d(), (3, 4, 3)),
+        )
+        for label, profile, dims in cases:
+            with self.subTest(case=label):
+                resolver = build_explorer_transport_resolver(profile, dims)
+                full = signal_module._scan_rigid_transport_pairs(
+                    profile,
+                    dims,
+                    list(_every_adjacent_pair(profile.dimension, dims)),
+                    resolver,
+                )
+                seam_pairs = signal_module._seam_pairs(
+                    profile, dims=dims, resolver=resolver
+                )
+                self.assertEqual(
+                    signal_module._scan_rigid_transport_pairs(
+                        profile, dims, seam_pairs, resolver
+                    ),
+                    full,
+                )
+
+    def test_sharded_scan_reports_the_serial_failure(self) -> None:
+        profile = projective_plane_profile_2d()
+        dims = (6, 6)
+        resolver = build_explorer_transport_resolver(profile, dims)
+        pairs = signal_module._seam_pairs(profile, dims=dims, resolver=resolver)
+        serial = signal_module._scan_rigid_transport_pairs(
+            profile, dims, pairs, resolver
+        )
+
+        self.addCleanup(signal_module.shutdown_rigid_scan_pool)
+        sharded = signal_module._scan_rigid_transport_sharded(
+            profile, dims, pairs, workers=2
+        )
+        pool = signal_module._scan_pool
+        repeated = signal_module._scan_rigid_transport_sharded(
+            profile, dims, pairs, workers=2
+        )
+
+        self.assertIsNotNone(serial)
+        self.assertEqual(sharded, serial)
+        self.assertEqual(repeated, serial)
+        self.assertIsNotNone(pool)
+        self.assertIs(signal_module._scan_pool, pool)
+
+    def test_rigid_scan_is_persisted_per_profile_signature(self) -> None:
+        profile = projective_plane_profile_2d()
+        dims = (4, 4)
+        self.addCleanup(clear_rigid_transport_scan_memo)
+        with tempfile.TemporaryDirectory() as tmp:
+            root_dir = Path(tmp)
+            clear_rigid_transport_scan_memo()
+            warm_rigid_transport_scan(profile, dims=dims, root_dir=root_dir)
+            scanned = signal_module._first_rigid_transport_failure(profile, dims=dims)
+            self.assertIsNotNone(
+                read_cached_rigid_transport_scan(profile, dims=dims, root_dir=root_dir)
+            )
+            clear_rigid_transport_scan_memo()
+            with mock.patch.object(
+                signal_module,
+                "_scan_rigid_transport",
+                side_effect=AssertionError("scan should come from the cache"),
+            ):
+                warm_rigid_transport_scan(profile, dims=dims, root_dir=root_dir)
+                cached = signal_module._first_rigid_transport_failure(
+                    profile, dims=dims
+                )
+
+        self.assertIsNotNone(scanned)
+        self.assertEqual(cached, scanned)
+
+    def test_derive_analysis_never_touches_the_topology_cache(self) -> None:
+        self.addCleanup(clear_rigid_transport_scan_memo)
+        clear_rigid_transport_scan_memo()
+        off_disk = AssertionError("derive must not use the topology cache")
+        with (
+            mock.patch.object(
+                signal_module, "read_cached_rigid_transport_scan", side_effect=off_disk
+            ),
+            mock.patch.object(
+                signal_module, "write_cached_rigid_transport_scan", side_effect=off_disk
+            ),
+        ):
+            analysis = derive_profile_playability_analysis(
+                projective_plane_profile_2d(), dims=(4, 4)
+            )
+        self.assertEqual(analysis.rigid_playability, RIGID_PLAYABILITY_BLOCKED)
+
+    def test_scan_memo_evicts_least_recently_used_profile(self) -> None:
+        self.addCleanup(clear_rigid_transport_scan_memo)
+        clear_rigid_transport_scan_memo()
+        profiles = {
+            "a": (mobius_strip_profile_2d(), (5, 3)),
+            "b": (klein_bottle_profile_2d(), (4, 4)),
+            "c": (projective_plane_profile_2d(), (4, 4)),
+        }
+        with (
+            mock.patch.object(signal_module, "_RIGID_SCAN_MEMO_LIMIT", 2),
+            mock.patch.object(
+                signal_module, "_scan_rigid_transport", return_value=None
+            ) as scan,
+        ):
+            for name in ("a", "b", "a", "c", "a", "b"):
+                profile, dims = profiles[name]
+                signal_module._first_rigid_transport_failure(profile, dims=dims)
+        scanned = [call.args[0] for call in scan.call_args_list]
+        self.assertEqual(
+            scanned,
+            [profiles[name][0] for name in ("a", "b", "c", "b")],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
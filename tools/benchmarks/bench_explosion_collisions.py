@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import hashlib
+import itertools
+import json
+import math
+import sys
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from tet4d.ui.pygame.locked_cell_explosion import (
+    EXPLOSION_BOUNDARY_RESPONSE_BOUNCE,
+    EXPLOSION_PARTICLE_COLLISIONS_ON,
+    ExplosionSeedCell,
+    ExplosionTopologyInput,
+    StandaloneExplosionConfig,
+)
+from tet4d.ui.pygame.locked_cell_explosion.simulation import (
+    build_simulation,
+    step_simulation,
+)
+
+
+def _resolve_repo_local_path(raw: Path) -> Path:
+    candidate = (raw if raw.is_absolute() else (_REPO_ROOT / raw)).resolve()
+    root = _REPO_ROOT.resolve()
+    if candidate == root or root in candidate.parents:
+        return candidate
+    raise SystemExit(f"output path must stay within project root: {root}")
+
+
+def _parse_ints(raw: str, *, label: str) -> tuple[int, ...]:
+    try:
+        values = tuple(int(part) for part in raw.split(",") if part.strip())
+    except ValueError:
+        raise SystemExit(f"--{label} must be comma-separated integers") from None
+    if not values or min(values) <= 0:
+        raise SystemExit(f"--{label} must list positive integers")
+    return values
+
+
+def _config(
+    *, dimension: int, particles: int, seed: int, margin: int
+) -> StandaloneExplosionConfig:
+    # Particles start on a packed cube of unit cells inside a board with
+    # ``margin`` free cells on every side, so the swarm collides as it spreads.
+    side = math.ceil(particles ** (1.0 / dimension) - 1e-9)
+    cells = tuple(
+        ExplosionSeedCell(
+            source_coord=tuple(margin + value for value in coord),
+            color_id=1 + index % 7,
+        )
+        for index, coord in enumerate(
+            itertools.islice(
+                itertools.product(range(side), repeat=dimension), particles
+            )
+        )
+    )
+    return StandaloneExplosionConfig(
+        dimension=dimension,
+        topology=ExplosionTopologyInput(
+            board_dims=tuple(side + 2 * margin for _ in range(dimension))
+        ),
+        occupied_cells=cells,
+        random_seed=seed,
+        boundary_response=EXPLOSION_BOUNDARY_RESPONSE_BOUNCE,
+        particle_collisions=EXPLOSION_PARTICLE_COLLISIONS_ON,
+        diagnostics_mode="off",
+    )
+
+
+def _state_digest(state) -> str:
+    digest = hashlib.sha256()
+    for particle in state.particles:
+        digest.update(repr((particle.position_nd, particle.velocity_nd)).encode())
+    for event in state.last_step_events:
+        digest.update(repr(event).encode())
+    return digest.hexdigest()
+
+
+def _run_case(
+    *, dimension: int, particles: int, steps: int, dt_ms: float, seed: int, margin: int
+) -> tuple[list[float], int, str]:
+    state, adapter = build_simulation(
+        _config(dimension=dimension, particles=particles, seed=seed, margin=margin)
+    )
+    step_ms: list[float] = []
+    collisions = 0
+    for _ in range(steps):
+        started = time.perf_counter()
+        events = step_simulation(state, adapter=adapter, dt_ms=dt_ms, time_scale=1.0)
+        step_ms.append((time.perf_counter() - started) * 1000.0)
+        collisions += sum(1 for event in events if event.family == "collision")
+    return step_ms, collisions, _state_digest(state)
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, round(fraction * (len(ordered) - 1)))]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Stress the explosion particle-collision broad-phase in 2D-4D."
+    )
+    parser.add_argument("--dimensions", default="2,3,4", help="Comma-separated dims.")
+    parser.add_argument(
+        "--particles", default="50,200,1000", help="Comma-separated particle counts."
+    )
+    parser.add_argument("--steps", type=int, default=60, help="Steps per case.")
+    parser.add_argument("--dt-ms", type=float, default=16.0, help="Step size in ms.")
+    parser.add_argument("--seed", type=int, default=7, help="Launch seed.")
+    parser.add_argument(
+        "--margin", type=int, default=3, help="Free cells around the packed swarm."
+    )
+    parser.add_argument(
+        "--check-determinism",
+        action="store_true",
+        help="Run every case twice and fail if the final states differ.",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("state/bench/explosion_collision_stress_latest.json"),
+        help="JSON report output path (must be inside project root).",
+    )
+    args = parser.parse_args()
+
+    steps = max(1, args.steps)
+    results: list[dict[str, object]] = []
+    nondeterministic: list[str] = []
+    for dimension in _parse_ints(args.dimensions, label="dimensions"):
+        if not 2 <= dimension <= 4:
+            raise SystemExit("--dimensions must be within 2..4")
+        for particles in _parse_ints(args.particles, label="particles"):
+            case = {
+                "dimension": dimension,
+                "particles": particles,
+                "steps": steps,
+                "dt_ms": args.dt_ms,
+                "seed": args.seed,
+                "margin": max(0, args.margin),
+            }
+            step_ms, collisions, digest = _run_case(**case)
+            name = f"{dimension}d_{particles}"
+            entry: dict[str, object] = {
+                "name": name,
+                "dimension": dimension,
+                "particles": particles,
+                "avg_ms": round(sum(step_ms) / len(step_ms), 4),
+                "p95_ms": round(_percentile(step_ms, 0.95), 4),
+                "max_ms": round(max(step_ms), 4),
+                "collision_events": collisions,
+                "digest": digest,
+            }
+            if args.check_determinism:
+                _repeat_ms, _repeat_collisions, repeat_digest = _run_case(**case)
+                entry["deterministic"] = repeat_digest == digest
+                if repeat_digest != digest:
+                    nondeterministic.append(name)
+            results.append(entry)
+            print(
+                f"{name}: avg {entry['avg_ms']} ms/step, "
+                f"p95 {entry['p95_ms']} ms, {collisions} collisions"
+            )
+
+    summary = {
+        "generated_at_utc": datetime.now(UTC).isoformat(),
+        "tool": "tools/benchmarks/bench_explosion_collisions.py",
+        "version": 1,
+        "steps": steps,
+        "dt_ms": args.dt_ms,
+        "cases": results,
+    }
+    output_path = _resolve_repo_local_path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(summary, indent=2) + "\n", encoding="utf-8")
+    print(f"report written: {output_path}")
+    if nondeterministic:
+        print(f"determinism check failed: {', '.join(nondeterministic)}")
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
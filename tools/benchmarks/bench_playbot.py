@@ -21,9 +21,13 @@ from tet4d.ai.playbot import plan_best_2d_move, plan_best_nd_move
 from tet4d.ai.playbot.types import (
     BotPlannerAlgorithm,
     BotPlannerProfile,
+    PlanStats,
     default_planning_budget_ms,
 )
-from tet4d.engine.core.model import BoardND
+from tet4d.engine.core.model.board import (
+    BOARD_STORAGE_BITBOARD,
+    BOARD_STORAGE_SPARSE,
+)
 from tet4d.engine.gameplay.game2d import GameConfig, GameState
 from tet4d.engine.gameplay.game_nd import GameConfigND, GameStateND
 from tet4d.engine.gameplay.pieces2d import PIECE_SET_2D_CLASSIC
@@ -51,6 +55,17 @@ def _resolve_repo_local_path(raw: Path) -> Path:
 class BenchSample:
     ms: float
     candidates: int
+    transposition_hits: int = 0
+    transposition_misses: int = 0
+
+
+def _sample_from_plan(elapsed_ms: float, stats: PlanStats) -> BenchSample:
+    return BenchSample(
+        ms=elapsed_ms,
+        candidates=stats.candidate_count,
+        transposition_hits=stats.transposition_hits,
+        transposition_misses=stats.transposition_misses,
+    )
 
 
 def _nearest_rank_percentile(values: list[float], percentile: float) -> float:
@@ -67,12 +82,14 @@ def _bench_2d(
     runs: int,
     *,
     algorithm: BotPlannerAlgorithm,
+    board_storage: str = BOARD_STORAGE_SPARSE,
 ) -> list[BenchSample]:
     cfg = GameConfig(
         width=DIMS_2D[0],
         height=DIMS_2D[1],
         piece_set=PIECE_SET_2D_CLASSIC,
         speed_level=3,
+        board_storage=board_storage,
     )
     gc.collect()
     gc_was_enabled = gc.isenabled()
@@ -82,7 +99,7 @@ def _bench_2d(
         for i in range(BENCH_WARMUP_RUNS):
             warm_state = GameState(
                 config=cfg,
-                board=BoardND((cfg.width, cfg.height)),
+                board=cfg.new_board(),
                 rng=random.Random(100 + i),
             )
             plan_best_2d_move(
@@ -96,7 +113,7 @@ def _bench_2d(
         for i in range(runs):
             state = GameState(
                 config=cfg,
-                board=BoardND((cfg.width, cfg.height)),
+                board=cfg.new_board(),
                 rng=random.Random(100 + i),
             )
             t0 = time.perf_counter()
@@ -106,9 +123,7 @@ def _bench_2d(
             elapsed = (time.perf_counter() - t0) * 1000.0
             if plan is None:
                 continue
-            samples.append(
-                BenchSample(ms=elapsed, candidates=plan.stats.candidate_count)
-            )
+            samples.append(_sample_from_plan(elapsed, plan.stats))
         return samples
     finally:
         if gc_was_enabled:
@@ -122,6 +137,7 @@ def _bench_nd(
     *,
     ndim: int,
     algorithm: BotPlannerAlgorithm,
+    board_storage: str = BOARD_STORAGE_SPARSE,
 ) -> list[BenchSample]:
     if ndim == 3:
         cfg = GameConfigND(
@@ -129,6 +145,7 @@ def _bench_nd(
             gravity_axis=1,
             piece_set_id=PIECE_SET_3D_STANDARD,
             speed_level=3,
+            board_storage=board_storage,
         )
     else:
         cfg = GameConfigND(
@@ -136,6 +153,7 @@ def _bench_nd(
             gravity_axis=1,
             piece_set_id=PIECE_SET_4D_STANDARD,
             speed_level=3,
+            board_storage=board_storage,
         )
 
     gc.collect()
@@ -146,7 +164,7 @@ def _bench_nd(
         for i in range(BENCH_WARMUP_RUNS):
             warm_state = GameStateND(
                 config=cfg,
-                board=BoardND(cfg.dims),
+                board=cfg.new_board(),
                 rng=random.Random(200 + i),
             )
             plan_best_nd_move(
@@ -159,7 +177,7 @@ def _bench_nd(
         samples: list[BenchSample] = []
         for i in range(runs):
             state = GameStateND(
-                config=cfg, board=BoardND(cfg.dims), rng=random.Random(200 + i)
+                config=cfg, board=cfg.new_board(), rng=random.Random(200 + i)
             )
             t0 = time.perf_counter()
             plan = plan_best_nd_move(
@@ -168,9 +186,7 @@ def _bench_nd(
             elapsed = (time.perf_counter() - t0) * 1000.0
             if plan is None:
                 continue
-            samples.append(
-                BenchSample(ms=elapsed, candidates=plan.stats.candidate_count)
-            )
+            samples.append(_sample_from_plan(elapsed, plan.stats))
         return samples
     finally:
         if gc_was_enabled:
@@ -185,10 +201,14 @@ def _summary(samples: list[BenchSample]) -> dict[str, float | int]:
             "p95_ms": 0.0,
             "max_ms": 0.0,
             "avg_candidates": 0,
+            "transposition_hit_rate": 0.0,
+            "placements_per_s": 0.0,
         }
     ms_values = [sample.ms for sample in samples]
     p50 = statistics.median(ms_values)
     p95 = _nearest_rank_percentile(ms_values, 0.95)
+    hits = sum(sample.transposition_hits for sample in samples)
+    probes = hits + sum(sample.transposition_misses for sample in samples)
     return {
         "runs": len(samples),
         "p50_ms": round(p50, 3),
@@ -197,6 +217,11 @@ def _summary(samples: list[BenchSample]) -> dict[str, float | int]:
         "avg_candidates": round(
             statistics.mean(sample.candidates for sample in samples)
         ),
+        "transposition_hit_rate": round(hits / probes, 4) if probes else 0.0,
+        # Candidate placements simulated and scored per second of planning.
+        "placements_per_s": round(
+            sum(sample.candidates for sample in samples) * 1000.0 / sum(ms_values), 1
+        ),
     }
 
 
@@ -284,12 +309,31 @@ def main() -> int:
 
     results = {
         "2d": _summary(_bench_2d(profile, budget_2d, args.runs, algorithm=algorithm)),
+        "2d_bitboard": _summary(
+            _bench_2d(
+                profile,
+                budget_2d,
+                args.runs,
+                algorithm=algorithm,
+                board_storage=BOARD_STORAGE_BITBOARD,
+            )
+        ),
         "3d": _summary(
             _bench_nd(profile, budget_3d, args.runs, ndim=3, algorithm=algorithm)
         ),
         "4d": _summary(
             _bench_nd(profile, budget_4d, args.runs, ndim=4, algorithm=algorithm)
         ),
+        "4d_bitboard": _summary(
+            _bench_nd(
+                profile,
+                budget_4d,
+                args.runs,
+                ndim=4,
+                algorithm=algorithm,
+                board_storage=BOARD_STORAGE_BITBOARD,
+            )
+        ),
     }
     payload = {
         "algorithm": algorithm.value,
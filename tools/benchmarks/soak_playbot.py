@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tet4d.ai.playbot.soak import (
+    SoakCase,
+    SoakGameResult,
+    run_soak,
+    soak_games,
+    soak_worker_count,
+)
+from tet4d.ai.playbot.types import (
+    BotPlannerAlgorithm,
+    BotPlannerProfile,
+    default_planning_budget_ms,
+)
+from tet4d.engine.gameplay.pieces2d import PIECE_SET_2D_CLASSIC, PIECE_SET_2D_OPTIONS
+from tet4d.engine.gameplay.pieces_nd import (
+    PIECE_SET_3D_STANDARD,
+    PIECE_SET_4D_STANDARD,
+    piece_set_options_for_dimension,
+)
+
+_DEFAULT_PIECE_SETS = {
+    2: PIECE_SET_2D_CLASSIC,
+    3: PIECE_SET_3D_STANDARD,
+    4: PIECE_SET_4D_STANDARD,
+}
+
+
+def _resolve_repo_local_path(raw: Path) -> Path:
+    candidate = (raw if raw.is_absolute() else (ROOT / raw)).resolve()
+    root = ROOT.resolve()
+    if candidate == root or root in candidate.parents:
+        return candidate
+    raise SystemExit(f"output path must stay within project root: {root}")
+
+
+def _parse_csv_values(raw: str, *, allowed: set[str], label: str) -> list[str]:
+    parts = [item.strip().lower() for item in raw.split(",") if item.strip()]
+    if not parts:
+        raise SystemExit(f"{label} list must not be empty")
+    unknown = [item for item in parts if item not in allowed]
+    if unknown:
+        allowed_text = ", ".join(sorted(allowed))
+        raise SystemExit(
+            f"unsupported {label}: {', '.join(unknown)} (allowed: {allowed_text})"
+        )
+    return parts
+
+
+def _parse_dims(raw: str) -> list[tuple[int, ...]]:
+    dims_list: list[tuple[int, ...]] = []
+    for item in raw.split(","):
+        item = item.strip().lower()
+        if not item:
+            continue
+        try:
+            dims = tuple(int(part) for part in item.split("x"))
+        except ValueError:
+            raise SystemExit(f"invalid dims: {item} (expected e.g. 10x20)") from None
+        if not 2 <= len(dims) <= 4 or min(dims) <= 0:
+            raise SystemExit(f"invalid dims: {item} (2 to 4 positive sizes)")
+        dims_list.append(dims)
+    if not dims_list:
+        raise SystemExit("dims list must not be empty")
+    return dims_list
+
+
+def _piece_set_options(ndim: int) -> tuple[str, ...]:
+    if ndim == 2:
+        return tuple(PIECE_SET_2D_OPTIONS)
+    return tuple(piece_set_options_for_dimension(ndim))
+
+
+def _piece_sets_for(dims: tuple[int, ...], raw: str) -> list[str]:
+    ndim = len(dims)
+    if raw.strip().lower() == "default":
+        return [_DEFAULT_PIECE_SETS[ndim]]
+    options = _piece_set_options(ndim)
+    requested = [item.strip() for item in raw.split(",") if item.strip()]
+    # A piece-set list may mix dimensions; each board takes the ones it supports.
+    chosen = [item for item in requested if item in options]
+    if not chosen:
+        raise SystemExit(
+            f"no piece set in {raw!r} fits {ndim}D (allowed: {', '.join(options)})"
+        )
+    return chosen
+
+
+def _soak_cases(args: argparse.Namespace) -> list[SoakCase]:
+    profiles = _parse_csv_values(
+        args.profiles,
+        allowed={profile.value for profile in BotPlannerProfile},
+        label="profiles",
+    )
+    algorithms = _parse_csv_values(
+        args.algorithms,
+        allowed={algorithm.value for algorithm in BotPlannerAlgorithm},
+        label="algorithms",
+    )
+    cases: list[SoakCase] = []
+    for dims in _parse_dims(args.dims):
+        for piece_set in _piece_sets_for(dims, args.piece_sets):
+            for profile_name in profiles:
+                profile = BotPlannerProfile(profile_name)
+                base_budget = default_planning_budget_ms(len(dims), profile, dims=dims)
+                budget_ms = max(1, round(base_budget * args.budget_scale))
+                for algorithm_name in algorithms:
+                    cases.append(
+                        SoakCase(
+                            dims=dims,
+                            piece_set=piece_set,
+                            profile=profile,
+                            algorithm=BotPlannerAlgorithm(algorithm_name),
+                            budget_ms=budget_ms,
+                        )
+                    )
+    return cases
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Headless batch soak of seeded playbot games across a process pool.",
+    )
+    parser.add_argument(
+        "--dims",
+        default="10x20,6x18x6,6x18x6x4",
+        help="comma-separated boards, e.g. 10x20,6x18x6x4",
+    )
+    parser.add_argument(
+        "--piece-sets",
+        default="default",
+        help="comma-separated piece-set ids, or 'default' per dimension",
+    )
+    parser.add_argument(
+        "--profiles", default="balanced", help="comma-separated planner profiles"
+    )
+    parser.add_argument(
+        "--algorithms", default="auto", help="comma-separated planner algorithms"
+    )
+    parser.add_argument(
+        "--budget-scale", type=float, default=1.0, help="multiplier on default budgets"
+    )
+    parser.add_argument("--games", type=int, default=200, help="games per case")
+    parser.add_argument("--seed-start", type=int, default=1000, help="first seed")
+    parser.add_argument(
+        "--max-pieces", type=int, default=400, help="piece cap per game"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=0, help="processes (0 = CPU count - 1)"
+    )
+    parser.add_argument(
+        "--output-jsonl",
+        default="state/benchmarks/playbot_soak.jsonl",
+        help="JSONL output file (inside project root)",
+    )
+    args = parser.parse_args()
+
+    cases = _soak_cases(args)
+    games = soak_games(
+        cases,
+        games_per_case=args.games,
+        seed_start=args.seed_start,
+        max_pieces=args.max_pieces,
+    )
+    output_path = _resolve_repo_local_path(Path(args.output_jsonl))
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    workers = soak_worker_count(args.workers)
+    started = time.perf_counter()
+    with output_path.open("w", encoding="utf-8") as handle:
+
+        def write_game(result: SoakGameResult) -> None:
+            handle.write(json.dumps(result.to_json(), sort_keys=True) + "\n")
+
+        summaries = run_soak(games, workers=workers, on_result=write_game)
+        wall_s = time.perf_counter() - started
+        total_pieces = sum(int(summary["pieces"]) for summary in summaries)
+        run_record = {
+            "record": "run",
+            "generated_utc": datetime.now(UTC).isoformat(),
+            "cases": len(cases),
+            "games": len(games),
+            "workers": workers,
+            "wall_s": round(wall_s, 3),
+            "pieces_per_sec": round(total_pieces / wall_s, 3) if wall_s > 0 else 0.0,
+        }
+        for record in (*summaries, run_record):
+            handle.write(json.dumps(record, sort_keys=True) + "\n")
+
+    print(json.dumps({"run": run_record, "summaries": summaries}, indent=2))
+    print(f"wrote JSONL: {output_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())